@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    pgnreader_benchmark.py
+
+        Measure the parse throughput (games/s) of the cwc PGN reader
+        (wisteria/cwc/pgnreader/cwc_default.py) for each board class.
+
+        With --processes, each file is read in parallel by a process pool
+        (see ChessGames.read_pgnfile()).
+
+        With --stream, compare for each serializer the serialization of all
+        the games once read ('batch') with the serialization of each game as
+        soon as it has been read ('stream', see ChessGames.iter_pgn()).
+
+        See pgnreader_benchmark.py --help for more informations.
+"""
+import argparse
+import importlib
+import os.path
+import sys
+import time
+import tracemalloc
+
+from wisteria.cwc.pgnreader.cwc_default import ChessBoard, ChessBoard64, ChessGames
+from wisteria.dmfile import DMFile
+
+VERSION = "pgnreader_benchmark.py v.2/2021-11-03"
+
+# tests/game5.pgn is not a default file: it takes a (very) long time to read it.
+DEFAULT_PGNFILES = tuple(os.path.join("tests", f"game{number}.pgn")
+                         for number in (1, 2, 3, 4, 6, 7, 8, 9, 10, 11))
+
+BOARDCLASSES = {"chessboard": ChessBoard,
+                "chessboard64": ChessBoard64}
+
+# STREAM_SERIALIZERS[(str)serializer] = ((str)module name, (str)encoding function name)
+STREAM_SERIALIZERS = {"cloudpickle": ("cloudpickle", "dumps"),
+                      "dill": ("dill", "dumps"),
+                      "pickle": ("pickle", "dumps"),
+                      "pyyaml": ("yaml", "dump")}
+
+
+def read_command_line_arguments():
+    """
+        read_command_line_arguments()
+
+        Read the command line arguments.
+        ________________________________________________________________________
+
+
+        RETURNED VALUE
+                return the argparse object.
+    """
+    parser = argparse.ArgumentParser(
+        description="Measure the parse throughput (games/s) of the cwc PGN reader",
+        epilog=VERSION,
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument('--version', '-v',
+                        action='version',
+                        version=VERSION,
+                        help="Show the version and exit")
+
+    parser.add_argument(
+        "pgnfiles",
+        action="store",
+        nargs="*",
+        default=DEFAULT_PGNFILES,
+        help="the .pgn files to be read",
+    )
+
+    parser.add_argument(
+        "--boards",
+        action="store",
+        default="chessboard;chessboard64",
+        help="The board classes on which the moves are played, separated by a semicolon; "
+             f"choose among {tuple(BOARDCLASSES)}",
+    )
+
+    parser.add_argument(
+        "--repeat",
+        action="store",
+        type=int,
+        default=3,
+        help="Each file is read <repeat> times; the best time is kept",
+    )
+
+    parser.add_argument(
+        "--processes",
+        action="store",
+        type=int,
+        default=None,
+        help="Each file is read in parallel by <processes> processes; "
+             "0 for one process per CPU",
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store",
+        default=None,
+        help="Serializers separated by a semicolon: instead of the parse throughput, "
+             "compare the serialization of all the games once read ('batch') with the "
+             "serialization of each game as soon as it has been read ('stream'); "
+             f"choose among {tuple(STREAM_SERIALIZERS)}",
+    )
+    return parser.parse_args()
+
+
+def parse_benchmark(boardname):
+    """
+        parse_benchmark()
+
+        Print the parse throughput (games/s) for the board class <boardname>.
+        ________________________________________________________________________
+
+        ARGUMENT: (str)boardname, a key of BOARDCLASSES
+    """
+    timings = []
+    for _ in range(ARGS.repeat):
+        start = time.perf_counter()
+        games_number = read_pgnfiles(ARGS.pgnfiles, BOARDCLASSES[boardname], ARGS.processes)
+        timings.append(time.perf_counter() - start)
+
+    print(f"{boardname:>12}: {games_number} games read in {min(timings):.3f}s "
+          f"(best of {ARGS.repeat}): {games_number/min(timings):.1f} games/s")
+
+
+def read_pgnfiles(pgnfilenames,
+                  boardclass,
+                  processes=None):
+    """
+        read_pgnfiles()
+
+        Read <pgnfilenames> and return the number of games read.
+        ________________________________________________________________________
+
+        ARGUMENTS:
+        o  (iterable of str)pgnfilenames
+        o  (type)boardclass      : see ChessGames.read_pgn()
+        o  (None|int)processes   : None if the files are read by the main
+                                   process, otherwise see --processes.
+
+        RETURNED VALUE: (int)number of games
+    """
+    games_number = 0
+    for pgnfilename in pgnfilenames:
+        games = ChessGames()
+        if processes is None:
+            with open(pgnfilename, encoding="utf-8") as src:
+                success = games.read_pgn(src, boardclass)
+        else:
+            success = games.read_pgnfile(pgnfilename, processes or None, boardclass)
+        if not success:
+            print(f"[{boardclass.__name__}] can't read '{pgnfilename}'.")
+        games_number += len(games)
+    return games_number
+
+
+def serialize_pgnfiles(pgnfilenames,
+                       encode,
+                       stream):
+    """
+        serialize_pgnfiles()
+
+        Read and serialize the games of <pgnfilenames>.
+        ________________________________________________________________________
+
+        ARGUMENTS:
+        o  (iterable of str)pgnfilenames
+        o  (callable)encode: encoding function of the serializer
+        o  (bool)stream    : True if each game is serialized as soon as it has
+                             been read, False if all the games of a file are
+                             read then serialized.
+
+        RETURNED VALUE: ((int)number of games, (int)Σ encoded string lengths)
+    """
+    games_number = 0
+    strlen = 0
+    for pgnfilename in pgnfilenames:
+        with DMFile(pgnfilename) as src:
+            if stream:
+                for game in ChessGames.iter_pgn(src):
+                    strlen += len(encode(game))
+                    games_number += 1
+            else:
+                games = ChessGames()
+                games.read_pgn(src)
+                strlen += len(encode(games))
+                games_number += len(games)
+    return games_number, strlen
+
+
+def stream_benchmark(serializer):
+    """
+        stream_benchmark()
+
+        Print for <serializer> the 'batch' and 'stream' throughputs (games/s),
+        encoded string lengths and peaks of traced memory.
+        ________________________________________________________________________
+
+        ARGUMENT: (str)serializer, a key of STREAM_SERIALIZERS
+    """
+    module_name, function_name = STREAM_SERIALIZERS[serializer]
+    try:
+        encode = getattr(importlib.import_module(module_name), function_name)
+    except ImportError:
+        print(f"{serializer:>12}: module '{module_name}' can't be imported.")
+        return
+
+    for stream in (False, True):
+        timings = []
+        for _ in range(ARGS.repeat):
+            start = time.perf_counter()
+            games_number, strlen = serialize_pgnfiles(ARGS.pgnfiles, encode, stream)
+            timings.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        serialize_pgnfiles(ARGS.pgnfiles, encode, stream)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print(f"{serializer:>12} ({'stream' if stream else 'batch'}): "
+              f"{games_number} games ({strlen} bytes) in {min(timings):.3f}s "
+              f"(best of {ARGS.repeat}): {games_number/min(timings):.1f} games/s; "
+              f"memory peak: {peak} bytes")
+
+
+ARGS = read_command_line_arguments()
+
+if ARGS.stream is not None:
+    for serializer_name in ARGS.stream.split(";"):
+        if serializer_name not in STREAM_SERIALIZERS:
+            print(f"Unknown serializer '{serializer_name}'; "
+                  f"choose among {tuple(STREAM_SERIALIZERS)}.")
+            sys.exit(1)
+        stream_benchmark(serializer_name)
+    sys.exit(0)
+
+for board_name in ARGS.boards.split(";"):
+    if board_name not in BOARDCLASSES:
+        print(f"Unknown board class '{board_name}'; choose among {tuple(BOARDCLASSES)}.")
+        sys.exit(1)
+    parse_benchmark(board_name)
+
+sys.exit(0)
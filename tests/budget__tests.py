@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : tests/budget__tests.py
+
+    Test of wisteria/cmdline_budget.py and of the --budget part of
+    wisteria/results.py and of wisteria/jobs.py
+
+    ___________________________________________________________________________
+
+    o  Budget class
+"""
+import argparse
+import time
+import unittest
+import unittest.mock
+
+# Pylint is wrong: we can import wisteria.jobs.
+#   pylint: disable=import-error, no-name-in-module
+import wisteria.globs
+from wisteria.cmdline_budget import parse_budget_argument
+from wisteria.jobs import iter_transcodings_in_subprocesses
+from wisteria.results import sort_transcodings_by_cost
+
+
+def slow_transcoding(*_):
+    """
+        slow_transcoding()
+
+        Fake func_serialize(): lasts far longer than the budget.
+    """
+    time.sleep(60)
+
+
+class Budget(unittest.TestCase):
+    """
+        Budget class
+
+        Test of wisteria/cmdline_budget.py and of the --budget part of
+        wisteria/results.py and of wisteria/jobs.py
+
+        _______________________________________________________________________
+
+        o  setUp(self)
+        o  tearDown(self)
+        o  test_budget_exhausted(self)
+        o  test_parse_budget_argument(self)
+        o  test_sort_transcodings_by_cost(self)
+    """
+    def setUp(self):
+        """
+            Budget.setUp()
+        """
+        self.old_args = wisteria.globs.ARGS
+        self.old_data = wisteria.globs.DATA
+        wisteria.globs.ARGS = argparse.Namespace(verbosity=0)
+
+    def tearDown(self):
+        """
+            Budget.tearDown()
+        """
+        wisteria.globs.ARGS = self.old_args
+        wisteria.globs.DATA = self.old_data
+
+    def test_budget_exhausted(self):
+        """
+            Budget.test_budget_exhausted()
+
+            test of iter_transcodings_in_subprocesses() once the budget is exhausted
+        """
+        planned_transcodings = [("json", "int", "fingerprint1"),
+                                ("json", "str", "fingerprint2"),
+                                ("json", "list", "fingerprint3")]
+        with unittest.mock.patch("wisteria.jobs.func_serialize", slow_transcoding):
+            start = time.monotonic()
+            res = list(iter_transcodings_in_subprocesses(planned_transcodings,
+                                                         jobs=1, cpus=None,
+                                                         budget_deadline=start+1))
+        self.assertLess(time.monotonic()-start, 30)
+        self.assertEqual(sorted(planned_transcoding for planned_transcoding, _ in res),
+                         sorted(planned_transcodings))
+        for _, result in res:
+            self.assertEqual(result.interruption, "budget")
+
+    def test_parse_budget_argument(self):
+        """
+            Budget.test_parse_budget_argument()
+
+            test of parse_budget_argument()
+        """
+        self.assertEqual(parse_budget_argument("none"), (True, {}))
+        self.assertEqual(parse_budget_argument("total=600"),
+                         (True, {"total": 600.0, "order": "cheapest"}))
+        self.assertEqual(parse_budget_argument(" order = planned ; total=2.5 ;"),
+                         (True, {"total": 2.5, "order": "planned"}))
+        with unittest.mock.patch("wisteria.cmdline_budget.msgerror"):
+            for budget_string in ("total=inf", "total=nan", "total=-inf", "total=0",
+                                  "total=ten", "order=random"):
+                self.assertEqual(parse_budget_argument(budget_string), (False, None))
+
+    def test_sort_transcodings_by_cost(self):
+        """
+            Budget.test_sort_transcodings_by_cost()
+
+            test of sort_transcodings_by_cost()
+        """
+        wisteria.globs.DATA = {"big": list(range(10000)),
+                               "small": 1,
+                               "unpicklable": lambda: None}
+        planned_transcodings = [(serializer, data_name, serializer+data_name)
+                                for serializer in ("json", "pickle")
+                                for data_name in ("big", "small", "unpicklable")]
+        self.assertEqual(
+            [planned_transcoding[:2]
+             for planned_transcoding in sort_transcodings_by_cost(planned_transcodings)],
+            [("json", "small"), ("pickle", "small"),
+             ("json", "unpicklable"), ("pickle", "unpicklable"),
+             ("json", "big"), ("pickle", "big")])
+
+        # each data object is pickled once:
+        with unittest.mock.patch("wisteria.results.get_data_cost", return_value=0) as get_cost:
+            sort_transcodings_by_cost(planned_transcodings)
+        self.assertEqual(sorted(call.args[0] for call in get_cost.call_args_list),
+                         ["big", "small", "unpicklable"])
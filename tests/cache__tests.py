@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : tests/cache__tests.py
+
+    Test of wisteria/cache.py and of wisteria/cmdline_cache.py
+
+    ___________________________________________________________________________
+
+    o  Cache class
+"""
+import argparse
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+import unittest
+import unittest.mock
+
+# Pylint is wrong: we can import wisteria.cache.
+#   pylint: disable=import-error, no-name-in-module
+import wisteria.globs
+from wisteria.cache import evict_cache, get_cache_key, get_data_fingerprint, get_isolation
+from wisteria.cache import read_cached_results
+from wisteria.cmdline_cache import parse_cache_argument
+
+
+class Cache(unittest.TestCase):
+    """
+        Cache class
+
+        Test of wisteria/cache.py and of wisteria/cmdline_cache.py
+
+        _______________________________________________________________________
+
+        o  test_evict_cache(self)
+        o  test_get_cache_key(self)
+        o  test_get_data_fingerprint(self)
+        o  test_get_data_fingerprint__hashseed(self)
+        o  test_get_isolation(self)
+        o  test_parse_cache_argument(self)
+        o  test_read_cached_results(self)
+    """
+    def test_evict_cache(self):
+        """
+            Cache.test_evict_cache()
+
+            test of evict_cache(): VACUUM only if results have been removed
+        """
+        old_cache = wisteria.globs.CACHE
+        wisteria.globs.CACHE = {"mode": "use", "maxage": 1, "maxsize": 100}
+        connection = sqlite3.connect(":memory:")
+        try:
+            connection.execute("CREATE TABLE results "
+                               "(key TEXT PRIMARY KEY, serializer TEXT, data_name TEXT, "
+                               "created REAL, result BLOB)")
+            connection.execute("INSERT INTO results VALUES ('new', 'json', 'int', ?, 'blob')",
+                               (time.time(),))
+            statements = []
+            connection.set_trace_callback(statements.append)
+
+            evict_cache(connection)
+            self.assertNotIn("VACUUM", statements)
+
+            connection.execute("INSERT INTO results VALUES ('old', 'json', 'str', 0, 'blob')")
+            evict_cache(connection)
+            self.assertIn("VACUUM", statements)
+            self.assertEqual(connection.execute("SELECT key FROM results").fetchall(),
+                             [("new",)])
+        finally:
+            connection.close()
+            wisteria.globs.CACHE = old_cache
+
+    def test_get_cache_key(self):
+        """
+            Cache.test_get_cache_key()
+
+            test of get_cache_key(): --pinworkers is a part of the key
+        """
+        old = (wisteria.globs.ARGS, wisteria.globs.SANDBOX, wisteria.globs.SERIALIZERS)
+        try:
+            wisteria.globs.SANDBOX = {"mode": "off"}
+            wisteria.globs.SERIALIZERS = {"json": argparse.Namespace(version="1.0")}
+            with unittest.mock.patch("wisteria.cache.get_data_fingerprint",
+                                     return_value="fingerprint"):
+                wisteria.globs.ARGS = argparse.Namespace(jobs=4, pinworkers=False)
+                key = get_cache_key("json", "int")
+                self.assertEqual(get_cache_key("json", "int"), key)
+                wisteria.globs.ARGS = argparse.Namespace(jobs=4, pinworkers=True)
+                self.assertNotEqual(get_cache_key("json", "int"), key)
+        finally:
+            wisteria.globs.ARGS, wisteria.globs.SANDBOX, wisteria.globs.SERIALIZERS = old
+
+    def test_get_data_fingerprint(self):
+        """
+            Cache.test_get_data_fingerprint()
+
+            test of get_data_fingerprint()
+        """
+        old_data = wisteria.globs.DATA
+        wisteria.globs.DATA = {"a": [1, 2, 3],
+                               "b": [1, 2, 3],
+                               "c": [1, 2, 4],
+                               "d": (1, 2, 3),
+                               "e": lambda: None}
+        try:
+            self.assertEqual(get_data_fingerprint("a"), get_data_fingerprint("b"))
+            self.assertNotEqual(get_data_fingerprint("a"), get_data_fingerprint("c"))
+            self.assertNotEqual(get_data_fingerprint("a"), get_data_fingerprint("d"))
+            self.assertIsNone(get_data_fingerprint("e"))
+
+            # the data object is pickled once:
+            wisteria.globs.DATA = {"a": [1, 2, 3]}
+            fingerprint = get_data_fingerprint("a")
+            with unittest.mock.patch("wisteria.cache.pickle.dumps") as dumps:
+                self.assertEqual(get_data_fingerprint("a"), fingerprint)
+            dumps.assert_not_called()
+        finally:
+            wisteria.globs.DATA = old_data
+
+    def test_get_data_fingerprint__hashseed(self):
+        """
+            Cache.test_get_data_fingerprint__hashseed()
+
+            test of get_data_fingerprint(): the fingerprint of a set doesn't
+            depend on PYTHONHASHSEED.
+        """
+        code = ("import wisteria.globs;"
+                "from wisteria.cache import get_data_fingerprint;"
+                "wisteria.globs.DATA = {'set': [{str(i) for i in range(50)}, "
+                "{'key': frozenset('abcdefgh')}]};"
+                "print(get_data_fingerprint('set'))")
+        fingerprints = {subprocess.run([sys.executable, "-c", code],
+                                       env=dict(os.environ, PYTHONHASHSEED=str(seed)),
+                                       capture_output=True, text=True, check=True).stdout
+                        for seed in range(1, 4)}
+        self.assertEqual(len(fingerprints), 1)
+
+    def test_get_isolation(self):
+        """
+            Cache.test_get_isolation()
+
+            test of get_isolation()
+        """
+        old_args, old_sandbox = wisteria.globs.ARGS, wisteria.globs.SANDBOX
+        try:
+            wisteria.globs.ARGS = argparse.Namespace(jobs=1)
+            wisteria.globs.SANDBOX = {"mode": "off"}
+            self.assertEqual(get_isolation(), "main")
+            wisteria.globs.SANDBOX = {"mode": "on"}
+            self.assertEqual(get_isolation(), "subprocess")
+            wisteria.globs.ARGS = argparse.Namespace(jobs=4)
+            wisteria.globs.SANDBOX = {"mode": "off"}
+            self.assertEqual(get_isolation(), "subprocess")
+        finally:
+            wisteria.globs.ARGS, wisteria.globs.SANDBOX = old_args, old_sandbox
+
+    def test_parse_cache_argument(self):
+        """
+            Cache.test_parse_cache_argument()
+
+            test of parse_cache_argument()
+        """
+        self.assertEqual(parse_cache_argument("off"),
+                         (True, {"mode": "off", "maxage": 30, "maxsize": 100}))
+        self.assertEqual(parse_cache_argument("use;maxage=7"),
+                         (True, {"mode": "use", "maxage": 7.0, "maxsize": 100}))
+        self.assertEqual(parse_cache_argument(" refresh ; maxsize=0.5 ;"),
+                         (True, {"mode": "refresh", "maxage": 30, "maxsize": 0.5}))
+
+    def test_read_cached_results(self):
+        """
+            Cache.test_read_cached_results()
+
+            test of read_cached_results(): a row that can't be unpickled anymore
+            (here, its class' module doesn't exist) only disables the cache.
+        """
+        old_args, old_cache = wisteria.globs.ARGS, wisteria.globs.CACHE
+        connection = sqlite3.connect(":memory:")
+        try:
+            wisteria.globs.ARGS = argparse.Namespace(verbosity=0)
+            wisteria.globs.CACHE = {"mode": "use", "maxage": 30, "maxsize": 100}
+            connection.execute("CREATE TABLE results "
+                               "(key TEXT PRIMARY KEY, serializer TEXT, data_name TEXT, "
+                               "created REAL, result BLOB)")
+            connection.execute("INSERT INTO results VALUES ('key', 'json', 'int', 0, ?)",
+                               (b"cwisteria_renamed_module\nSerializationResult\n.",))
+            planned_transcodings = [("json", "int", "1")]
+            with unittest.mock.patch("wisteria.cache.open_cache", return_value=connection), \
+                 unittest.mock.patch("wisteria.cache.get_cache_key", return_value="key"), \
+                 unittest.mock.patch("wisteria.cache.msgwarning") as msgwarning:
+                self.assertEqual(read_cached_results(planned_transcodings),
+                                 ([], planned_transcodings))
+            msgwarning.assert_called_once()
+        finally:
+            connection.close()
+            wisteria.globs.ARGS, wisteria.globs.CACHE = old_args, old_cache
@@ -29,11 +29,14 @@
 """
 import os
 import os.path
+import pickle
+import tempfile
 import unittest
 
 # Pylint is wrong: we can import wisteria.cwc.pgnreader.cwc_default.
 #   pylint: disable=import-error, no-name-in-module
-from wisteria.cwc.pgnreader.cwc_default import ChessGames
+from wisteria.cwc.pgnreader.cwc_default import ChessBoard, ChessBoard64, ChessGames, ChessMove
+from wisteria.cwc.pgnreader.cwc_default import ChessPiece, get_chesspiece
 from wisteria.dmfile import DMFile
 
 
@@ -118,6 +121,12 @@ class CWCPgnreader(unittest.TestCase):
 
         _______________________________________________________________________
 
+        o  test_chessboard64(self)
+        o  test_chessmove(self)
+        o  test_chesspiece(self)
+        o  test_is_kingpinned(self)
+        o  test_iter_pgn(self)
+        o  test_read_pgnfile(self)
         o  test_read_pgngames(self)
         o  test_read_game1pgn_tags(self)
         o  test_read_game1xpgn(self)
@@ -126,6 +135,152 @@ class CWCPgnreader(unittest.TestCase):
         o  test_readwrite_pgngames(self)
     """
 
+    def test_chessboard64(self):
+        """
+            CWCPgnreader.test_chessboard64()
+        """
+        board, board64 = ChessBoard(), ChessBoard64()
+        self.assertEqual(board, board64)
+        self.assertEqual(board64, board)
+        self.assertEqual(board64.human_repr(), board.human_repr())
+        self.assertEqual(board64.get_king_coord(1), board.get_king_coord(1))
+        board64.set_xy_empty((0, 0))
+        self.assertNotEqual(board, board64)
+        self.assertNotEqual(board64.copy(), ChessBoard64())
+
+        # whatever the board class, the games read are the same ChessGames objects:
+        for pgnfilename in ('game1.pgn', 'game1x.pgn', 'game6.pgn', 'game10.pgn'):
+            res = []
+            for boardclass in (ChessBoard, ChessBoard64):
+                games = ChessGames()
+                with open(os.path.join("tests", pgnfilename), encoding="utf-8") as src:
+                    res.append((games.read_pgn(src, boardclass), pickle.dumps(games)))
+            self.assertEqual(res[0], res[1])
+
+    def test_chessmove(self):
+        """
+            CWCPgnreader.test_chessmove()
+        """
+        move = ChessMove(beforeafter_coord_piece1=((4, 6), (4, 4)),
+                         beforeafter_coord_piece2=(None, None))
+        self.assertFalse(hasattr(move, "__dict__"))
+        self.assertEqual(move.__getstate__(),
+                         {"beforeafter_coord_piece1": ((4, 6), (4, 4)),
+                          "beforeafter_coord_piece2": (None, None),
+                          "movetype": 0, "promotion": None, "enpassant": False,
+                          "str_game_result": None})
+        self.assertEqual(pickle.loads(pickle.dumps(move)), move)
+
+    def test_chesspiece(self):
+        """
+            CWCPgnreader.test_chesspiece()
+        """
+        piece = ChessPiece.from_unicode_string("♙")
+        self.assertIs(piece, get_chesspiece(color=1, nature=1))
+        self.assertIs(pickle.loads(pickle.dumps(piece)), piece)
+        self.assertEqual(ChessPiece(color=1, nature=1), piece)
+        with self.assertRaises(AttributeError):
+            piece.color = 2
+
+        # the squares of the boards share the same ChessPiece objects:
+        games = ChessGames()
+        with open(os.path.join("tests", "game1.pgn"), encoding="utf-8") as src:
+            self.assertTrue(games.read_pgn(src))
+        games = pickle.loads(pickle.dumps(games))
+        self.assertIs(games[0].board.get_xy((0, 0)), get_chesspiece())
+
+    def test_is_kingpinned(self):
+        """
+            CWCPgnreader.test_is_kingpinned()
+        """
+        for boardclass in (ChessBoard, ChessBoard64):
+            board = boardclass()
+            board.init_from_unicode_string("____♜___"
+                                           "________"
+                                           "________"
+                                           "________"
+                                           "________"
+                                           "_______♝"
+                                           "___♖♘___"
+                                           "____♔___")
+            # the knight can't leave the e-file:
+            self.assertTrue(board.is_kingpinned((4, 6), (2, 5)))
+            # the rook is free:
+            self.assertFalse(board.is_kingpinned((3, 6), (3, 0)))
+            # the king can't go in front of the rook, nor on the diagonal of the bishop:
+            self.assertTrue(board.is_kingpinned((4, 7), (5, 7)))
+            self.assertFalse(board.is_kingpinned((4, 7), (3, 7)))
+            self.assertEqual(board.get_king_coord(1), (4, 7))
+
+            # the white rook goes to e3: neither the knight nor the rook is pinned...
+            board.set_xy_empty((3, 6))
+            board.set_xy((4, 5), ChessPiece.from_unicode_string("♖"))
+            self.assertFalse(board.is_kingpinned((4, 6), (2, 5)))
+            self.assertFalse(board.is_kingpinned((4, 5), (3, 5)))
+            # ... till the knight leaves e2:
+            board.set_xy_empty((4, 6))
+            self.assertTrue(board.is_kingpinned((4, 5), (3, 5)))
+            self.assertFalse(board.is_kingpinned((4, 5), (4, 0)))
+
+    def test_iter_pgn(self):
+        """
+            CWCPgnreader.test_iter_pgn()
+        """
+        with open(os.path.join("tests", "game6.pgn"), encoding="utf-8") as src:
+            lines = src.read().split("\n")
+
+        def iter_lines():
+            yield from lines
+            raise AssertionError("the end of the file shouldn't be reached.")
+
+        # the first game is yielded before the end of the file has been read:
+        game = next(ChessGames.iter_pgn(iter_lines()))
+        self.assertEqual(game.board.human_repr(), FINAL_POSITIONS['game3.pgn'])
+
+        with DMFile(":game6.pgn:") as src:
+            src.write("\n".join(lines))
+            self.assertEqual(list(src), lines)
+
+            games = ChessGames()
+            self.assertTrue(games.read_pgn(src))
+            self.assertEqual(list(ChessGames.iter_pgn(src)), games)
+            self.assertEqual(len(games), 2)
+
+    def test_read_pgnfile(self):
+        """
+            CWCPgnreader.test_read_pgnfile()
+        """
+        with open(os.path.join("tests", "game6.pgn"), "rb") as src:
+            data = src.read()
+        self.assertEqual(ChessGames.get_pgnfile_offsets(os.path.join("tests", "game6.pgn")),
+                         [0, data.index(b'[Event "Vienna"]')])
+
+        with tempfile.TemporaryDirectory() as directory:
+            # an archive of 20 games, the last one having no header:
+            pgnfilename = os.path.join(directory, "games.pgn")
+            with open(pgnfilename, "wb") as dest:
+                dest.write(data*9)
+                with open(os.path.join("tests", "game8.pgn"), "rb") as src:
+                    dest.write(src.read())
+
+            games = ChessGames()
+            with open(pgnfilename, encoding="utf-8") as src:
+                self.assertTrue(games.read_pgn(src))
+            self.assertEqual(len(games), 20)
+            self.assertEqual(len(ChessGames.get_pgnfile_offsets(pgnfilename)), 20)
+
+            for processes in (1, 2):
+                games2 = ChessGames()
+                self.assertTrue(games2.read_pgnfile(pgnfilename, processes=processes))
+                self.assertEqual(games2, games)
+
+            # an empty file:
+            with open(pgnfilename, "wb"):
+                pass
+            games = ChessGames()
+            self.assertTrue(games.read_pgnfile(pgnfilename))
+            self.assertEqual(games, [])
+
     def test_read_pgngames(self):
         """
             CWCPgnreader.test_read_pgngames()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : tests/datagen__tests.py
+
+    Test of wisteria/datagen.py
+
+    ___________________________________________________________________________
+
+    o  Datagen class
+"""
+import unittest
+
+# Pylint is wrong: we can import wisteria.datagen.
+#   pylint: disable=import-error, no-name-in-module
+from wisteria.datagen import GENERATORS, fit_throughput
+from wisteria.datagen import generated_data_name, parse_generated_data_name
+
+
+class Datagen(unittest.TestCase):
+    """
+        Datagen class
+
+        Test of wisteria/datagen.py
+
+        _______________________________________________________________________
+
+        o  test_fit_throughput(self)
+        o  test_generators(self)
+        o  test_generated_data_name(self)
+    """
+    def test_fit_throughput(self):
+        """
+            Datagen.test_fit_throughput()
+
+            test of fit_throughput()
+        """
+        # 1 µs per byte + 0.5s per call = 1 MB/s
+        self.assertAlmostEqual(
+            fit_throughput(((10, 0.5+10e-6), (1000, 0.5+1000e-6), (None, 3.0))),
+            1.0)
+        self.assertIsNone(fit_throughput(((10, 0.5), (10, 0.6))))
+        self.assertIsNone(fit_throughput(((10, 0.5), (1000, 0.4))))
+
+    def test_generators(self):
+        """
+            Datagen.test_generators()
+
+            test of the GENERATORS functions
+        """
+        self.assertEqual(len(GENERATORS["bytes"][0](1000)), 1000)
+        self.assertEqual(len(GENERATORS["chessgames"][0](5)), 5)
+        self.assertEqual(len(GENERATORS["dict(str->float)"][0](100)), 100)
+        self.assertEqual(len(GENERATORS["list(int)"][0](100)), 100)
+        self.assertEqual(len(GENERATORS["record(wide)"][0](100)), 100)
+        self.assertEqual(GENERATORS["tree(depth)"][0](3),
+                         {"value": 3, "children": [
+                             {"value": 2, "children": [{"value": 1, "children": []},
+                                                       {"value": 1, "children": []}]},
+                             {"value": 2, "children": [{"value": 1, "children": []},
+                                                       {"value": 1, "children": []}]}]})
+
+    def test_generated_data_name(self):
+        """
+            Datagen.test_generated_data_name()
+
+            test of generated_data_name() and of parse_generated_data_name()
+        """
+        self.assertEqual(generated_data_name("dict(str->float)", 100),
+                         "datagen:dict(str->float)[100]")
+        self.assertEqual(parse_generated_data_name("datagen:dict(str->float)[100]"),
+                         ("dict(str->float)", 100))
+        self.assertIsNone(parse_generated_data_name("dict(keys/str)"))
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : tests/exportresults__tests.py
+
+    Test of wisteria/exportresults.py
+
+    ___________________________________________________________________________
+
+    o  ExportResults class
+"""
+import math
+import os.path
+import tempfile
+import unittest
+
+# Pylint is wrong: we can import wisteria.exportresults.
+#   pylint: disable=import-error, no-name-in-module
+from wisteria.exportresults import ResultsExporter, read_columnar_table
+from wisteria.exportresults import parse_exportresults_argument
+
+
+class ExportResults(unittest.TestCase):
+    """
+        ExportResults class
+
+        Test of wisteria/exportresults.py
+
+        _______________________________________________________________________
+
+        o  test_columnar(self)
+        o  test_parse_exportresults_argument(self)
+    """
+    def test_columnar(self):
+        """
+            ExportResults.test_columnar()
+
+            test of ResultsExporter (columnar format) and of read_columnar_table()
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            exporter = ResultsExporter("columnar", directory)
+            exporter.write_rows("hall",
+                                [{"attribute": "encoding_time", "index": 0, "rank": 0,
+                                  "value": 0.5, "serializer": "pickle"},
+                                 {"attribute": "encoding_time", "index": 1, "rank": 0,
+                                  "value": None, "serializer": "json"}])
+            exporter.close(None)
+
+            hall = read_columnar_table(directory, "hall")
+            self.assertEqual(hall["serializer"], ["pickle", "json"])
+            self.assertEqual(list(hall["rank"]), [0, 0])
+            self.assertEqual(hall["value"][0], 0.5)
+            self.assertTrue(math.isnan(hall["value"][1]))
+            self.assertEqual(len(read_columnar_table(directory, "results")["dataobj"]), 0)
+
+    def test_parse_exportresults_argument(self):
+        """
+            ExportResults.test_parse_exportresults_argument()
+
+            test of parse_exportresults_argument()
+        """
+        self.assertEqual(parse_exportresults_argument("no export"), (True, ()))
+        self.assertEqual(parse_exportresults_argument("jsonl"),
+                         (True, ("jsonl", os.path.join(".", "results.jsonl"))))
+        self.assertEqual(parse_exportresults_argument("csv=my.csv"),
+                         (True, ("csv", os.path.join(".", "my.csv"))))
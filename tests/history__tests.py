@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : tests/history__tests.py
+
+    Test of wisteria/history.py and of wisteria/cmdline_history.py
+
+    ___________________________________________________________________________
+
+    o  History class
+"""
+import types
+import unittest
+
+# Pylint is wrong: we can import wisteria.history.
+#   pylint: disable=import-error, no-name-in-module
+import wisteria.globs
+from wisteria.history import compare_runs, get_current_run, open_history, read_run, record_run
+from wisteria.jobs import get_interrupted_result
+from wisteria.serializers_classes import SerializationResult, SerializationResults
+from wisteria.cmdline_history import parse_comparewith_argument, parse_history_argument
+
+
+def get_run(encoding_time=1.0,
+            encoding_time_ci=(0.9, 1.1),
+            encoding_strlen=100,
+            reversibility=True,
+            version="1.0"):
+    """
+        get_run()
+
+        Return a run with a single transcoding ('json', 'int').
+    """
+    return {"run_id": None,
+            "created": 0.0,
+            "machine": "machine",
+            "python": "CPython 3.11",
+            "versions": {"json": version},
+            "transcodings": {("json", "int"): {
+                "encoding_success": True,
+                "encoding_time": encoding_time,
+                "encoding_time_ci_low": encoding_time_ci[0],
+                "encoding_time_ci_high": encoding_time_ci[1],
+                "encoding_strlen": encoding_strlen,
+                "decoding_success": True,
+                "decoding_time": 1.0,
+                "decoding_time_ci_low": 0.9,
+                "decoding_time_ci_high": 1.1,
+                "reversibility": reversibility}}}
+
+
+class History(unittest.TestCase):
+    """
+        History class
+
+        Test of wisteria/history.py and of wisteria/cmdline_history.py
+
+        _______________________________________________________________________
+
+        o  test_compare_runs(self)
+        o  test_get_current_run(self)
+        o  test_parse_arguments(self)
+        o  test_record_and_read_run(self)
+    """
+    def test_compare_runs(self):
+        """
+            History.test_compare_runs()
+
+            test of compare_runs()
+        """
+        reference = get_run()
+        reference["run_id"] = 1
+
+        comparison = compare_runs(reference, get_run(), threshold=5)
+        self.assertEqual(comparison.compared, 1)
+        self.assertEqual(comparison.regressions, [])
+        self.assertEqual(comparison.versions, {})
+        self.assertTrue(comparison.same_machine)
+
+        # slower, but the confidence intervals overlap: not a regression
+        comparison = compare_runs(reference,
+                                  get_run(encoding_time=1.2, encoding_time_ci=(1.0, 1.4)),
+                                  threshold=5)
+        self.assertEqual(comparison.regressions, [])
+
+        # slower, without overlap, and bigger:
+        comparison = compare_runs(reference,
+                                  get_run(encoding_time=1.5, encoding_time_ci=(1.4, 1.6),
+                                          encoding_strlen=110, version="2.0"),
+                                  threshold=5)
+        self.assertEqual([regression.attribute for regression in comparison.regressions],
+                         ["encoding_strlen", "encoding_time"])
+        self.assertEqual(comparison.versions, {"json": ("1.0", "2.0")})
+
+        # slower, without overlap, but below the threshold:
+        comparison = compare_runs(reference,
+                                  get_run(encoding_time=1.5, encoding_time_ci=(1.4, 1.6)),
+                                  threshold=60)
+        self.assertEqual(comparison.regressions, [])
+
+        comparison = compare_runs(reference, get_run(reversibility=False), threshold=5)
+        self.assertEqual([regression.attribute for regression in comparison.regressions],
+                         ["reversibility"])
+
+    def test_get_current_run(self):
+        """
+            History.test_get_current_run()
+
+            test of get_current_run(): the interrupted transcodings are skipped
+        """
+        old_serializers = wisteria.globs.SERIALIZERS
+        wisteria.globs.SERIALIZERS = {"json": types.SimpleNamespace(version="1.0")}
+        try:
+            results = SerializationResults()
+            results.serializers = ["json"]
+            result = SerializationResult()
+            result.encoding_success = result.decoding_success = result.reversibility = True
+            results["json"] = {"int": result,
+                               "str": get_interrupted_result("timeout"),
+                               "list": get_interrupted_result("budget"),
+                               "dict": None}
+
+            current = get_current_run(results)
+            self.assertEqual(list(current["transcodings"]), [("json", "int")])
+            self.assertEqual(current["versions"], {"json": "1.0"})
+
+            # an interrupted transcoding is not a regression:
+            reference = get_run()
+            reference["run_id"] = 1
+            reference["transcodings"][("json", "str")] = reference["transcodings"][("json", "int")]
+            comparison = compare_runs(reference, current, threshold=5)
+            self.assertEqual(comparison.compared, 1)
+            self.assertEqual(comparison.regressions, [])
+        finally:
+            wisteria.globs.SERIALIZERS = old_serializers
+
+    def test_parse_arguments(self):
+        """
+            History.test_parse_arguments()
+
+            test of parse_history_argument() and of parse_comparewith_argument()
+        """
+        self.assertEqual(parse_history_argument("record"), (True, "record"))
+        self.assertEqual(parse_comparewith_argument("none"), (True, {}))
+        self.assertEqual(parse_comparewith_argument("baseline"),
+                         (True, {"run": "baseline", "threshold": 10}))
+        self.assertEqual(parse_comparewith_argument("12; threshold=10"),
+                         (True, {"run": 12, "threshold": 10.0}))
+
+    def test_record_and_read_run(self):
+        """
+            History.test_record_and_read_run()
+
+            test of record_run() and of read_run()
+        """
+        old_historyfile_name = wisteria.globs.HISTORYFILE_NAME
+        wisteria.globs.HISTORYFILE_NAME = ":memory:"
+        connection = open_history()
+        try:
+            self.assertIsNone(read_run(connection, "last"))
+            run_id1 = record_run(connection, get_run(), baseline=True)
+            run_id2 = record_run(connection, get_run(encoding_time=2.0), baseline=False)
+
+            self.assertEqual(read_run(connection, "baseline")["run_id"], run_id1)
+            last = read_run(connection, "last")
+            self.assertEqual(last["run_id"], run_id2)
+            self.assertEqual(last["transcodings"][("json", "int")]["encoding_time"], 2.0)
+            self.assertEqual(last["versions"], {"json": "1.0"})
+            self.assertIsNone(read_run(connection, run_id2+1))
+        finally:
+            connection.close()
+            wisteria.globs.HISTORYFILE_NAME = old_historyfile_name
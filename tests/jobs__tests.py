@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : tests/jobs__tests.py
+
+    Test of wisteria/jobs.py and of the --jobs part of wisteria/utils.py
+
+    ___________________________________________________________________________
+
+    o  Jobs class
+"""
+import argparse
+import os
+import time
+import unittest
+import unittest.mock
+
+import psutil  # pylint: disable=import-error
+
+# Pylint is wrong: we can import wisteria.jobs.
+#   pylint: disable=import-error, no-name-in-module
+import wisteria.globs
+from wisteria.jobs import get_jobs_number, get_physical_cores_cpus, pin_current_process
+from wisteria.jobs import iter_transcodings_in_subprocesses
+from wisteria.serializers_classes import SerializationResult
+from wisteria.utils import nonnegative_int
+from wisteria.wisteriaerror import WisteriaError
+
+CPU_AFFINITY = hasattr(psutil.Process(), "cpu_affinity")
+
+
+def fake_transcode_in_subprocess(connection,
+                                 planned_transcoding,
+                                 cpu):  # pylint: disable=unused-argument
+    """
+        fake_transcode_in_subprocess()
+
+        Replace transcode_in_subprocess(): the serializer named 'dies' kills its
+        process, 'quick' sends a result at once and the others last one minute.
+    """
+    if planned_transcoding[0] == "dies":
+        os._exit(1)  # pylint: disable=protected-access
+    if planned_transcoding[0] == "quick":
+        connection.send((SerializationResult(), None))
+        connection.close()
+        return
+    time.sleep(60)
+
+
+class Jobs(unittest.TestCase):
+    """
+        Jobs class
+
+        Test of wisteria/jobs.py and of the --jobs part of wisteria/utils.py
+
+        _______________________________________________________________________
+
+        o  setUp(self)
+        o  tearDown(self)
+        o  test_get_jobs_number(self)
+        o  test_get_physical_cores_cpus(self)
+        o  test_iter_transcodings_in_subprocesses(self)
+        o  test_nonnegative_int(self)
+        o  test_pin_current_process(self)
+    """
+    def setUp(self):
+        """
+            Jobs.setUp()
+        """
+        self.old_args = wisteria.globs.ARGS
+        self.old_sandbox = wisteria.globs.SANDBOX
+        wisteria.globs.SANDBOX = {"mode": "off"}
+
+    def tearDown(self):
+        """
+            Jobs.tearDown()
+        """
+        wisteria.globs.ARGS = self.old_args
+        wisteria.globs.SANDBOX = self.old_sandbox
+
+    def test_get_jobs_number(self):
+        """
+            Jobs.test_get_jobs_number()
+
+            test of get_jobs_number()
+        """
+        wisteria.globs.ARGS = argparse.Namespace(jobs=3, pinworkers=False, verbosity=0)
+        self.assertEqual(get_jobs_number(), (3, None))
+
+        # one process per physical core:
+        wisteria.globs.ARGS = argparse.Namespace(jobs=0, pinworkers=False, verbosity=0)
+        self.assertEqual(get_jobs_number(), (psutil.cpu_count(logical=False) or 1, None))
+
+        # --pinworkers: no more processes than physical cores.
+        if CPU_AFFINITY:
+            wisteria.globs.ARGS = argparse.Namespace(jobs=1000, pinworkers=True, verbosity=0)
+            with unittest.mock.patch("wisteria.jobs.msgwarning"):
+                jobs, cpus = get_jobs_number()
+            self.assertEqual(cpus, get_physical_cores_cpus())
+            self.assertEqual(jobs, len(cpus))
+
+            wisteria.globs.ARGS = argparse.Namespace(jobs=1, pinworkers=True, verbosity=0)
+            self.assertEqual(get_jobs_number(), (1, get_physical_cores_cpus()))
+
+    @unittest.skipUnless(CPU_AFFINITY, "the cpu affinity of a process can't be set")
+    def test_get_physical_cores_cpus(self):
+        """
+            Jobs.test_get_physical_cores_cpus()
+
+            test of get_physical_cores_cpus()
+        """
+        available_cpus = sorted(psutil.Process().cpu_affinity())
+
+        cpus = get_physical_cores_cpus()
+        self.assertTrue(cpus)
+        self.assertEqual(cpus, sorted(set(cpus)))
+        self.assertTrue(set(cpus) <= set(available_cpus))
+
+        # two logical cpus per core, described by the topology files:
+        def read_siblings(filename, **_):
+            cpu = int(filename.split("/cpu")[-1].split("/")[0])
+            return unittest.mock.mock_open(read_data=f"{cpu//2*2},{cpu//2*2+1}\n")()
+
+        with unittest.mock.patch("wisteria.jobs.os.path.exists", return_value=True), \
+             unittest.mock.patch("wisteria.jobs.open", read_siblings, create=True):
+            self.assertEqual(get_physical_cores_cpus(),
+                             [cpu for cpu in available_cpus
+                              if cpu % 2 == 0 or cpu-1 not in available_cpus])
+
+        # no topology: the first logical cpus are kept.
+        with unittest.mock.patch("wisteria.jobs.os.path.exists", return_value=False), \
+             unittest.mock.patch("wisteria.jobs.psutil.cpu_count", return_value=1):
+            self.assertEqual(get_physical_cores_cpus(), available_cpus[:1])
+
+    def test_iter_transcodings_in_subprocesses(self):
+        """
+            Jobs.test_iter_transcodings_in_subprocesses()
+
+            test of iter_transcodings_in_subprocesses(): no process survives an error
+            or a consumer stopping the iteration.
+        """
+        wisteria.globs.ARGS = argparse.Namespace(verbosity=0)
+
+        with unittest.mock.patch("wisteria.jobs.transcode_in_subprocess",
+                                 fake_transcode_in_subprocess):
+            # a process dies, without --sandbox:
+            with self.assertRaises(WisteriaError):
+                for _ in iter_transcodings_in_subprocesses(
+                        [("sleeps", "int", "1"), ("dies", "int", "2"), ("sleeps", "int", "3")],
+                        jobs=3,
+                        cpus=None):
+                    pass
+            self.assertEqual(psutil.Process().children(), [])
+
+            # the consumer stops the iteration:
+            transcodings = iter_transcodings_in_subprocesses(
+                [("sleeps", "int", "1"), ("quick", "int", "2"), ("sleeps", "int", "3")],
+                jobs=3,
+                cpus=None)
+            planned_transcoding, result = next(transcodings)
+            self.assertEqual(planned_transcoding, ("quick", "int", "2"))
+            self.assertIsNone(result.interruption)
+            transcodings.close()
+            self.assertEqual(psutil.Process().children(), [])
+
+    def test_nonnegative_int(self):
+        """
+            Jobs.test_nonnegative_int()
+
+            test of nonnegative_int(), the argparse type of --jobs
+        """
+        self.assertEqual(nonnegative_int("0"), 0)
+        self.assertEqual(nonnegative_int("4"), 4)
+        for string in ("-2", "two", "1.5", ""):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                nonnegative_int(string)
+
+    @unittest.skipUnless(CPU_AFFINITY, "the cpu affinity of a process can't be set")
+    def test_pin_current_process(self):
+        """
+            Jobs.test_pin_current_process()
+
+            test of pin_current_process()
+        """
+        wisteria.globs.ARGS = argparse.Namespace(verbosity=0)
+        old_affinity = psutil.Process().cpu_affinity()
+        cpu = get_physical_cores_cpus()[-1]
+        try:
+            pin_current_process(cpu)
+            self.assertEqual(psutil.Process().cpu_affinity(), [cpu])
+        finally:
+            psutil.Process().cpu_affinity(old_affinity)
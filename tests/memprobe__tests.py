@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : tests/memprobe__tests.py
+
+    Test of wisteria/memprobe.py
+
+    ___________________________________________________________________________
+
+    o  Memprobe class
+"""
+import json
+import operator
+import tracemalloc
+import unittest
+
+# Pylint is wrong: we can import wisteria.memprobe.
+#   pylint: disable=import-error, no-name-in-module
+import wisteria.globs
+from wisteria.memprobe import is_memprobe_available, measure_memory
+from wisteria.memprobe import probe_fork, probe_rss, probe_tracemalloc
+
+# size of the known allocation, in bytes:
+SIZE = 20*10**6
+
+
+def allocate():
+    """
+        allocate()
+
+        Allocate (and write) SIZE bytes, kept until the end of the measure.
+    """
+    return b"x"*SIZE
+
+
+def allocate_and_free():
+    """
+        allocate_and_free()
+
+        Allocate (and write) SIZE bytes, freed before the end of the call.
+    """
+    return len(b"x"*SIZE)
+
+
+class Memprobe(unittest.TestCase):
+    """
+        Memprobe class
+
+        Test of wisteria/memprobe.py
+
+        _______________________________________________________________________
+
+        o  setUp(self)
+        o  tearDown(self)
+        o  assertAboutSize(self, value)
+        o  test_measure_memory(self)
+        o  test_probe_fork(self)
+        o  test_probe_fork__freed_memory(self)
+        o  test_probe_rss(self)
+        o  test_probe_tracemalloc(self)
+        o  test_probe_tracemalloc__was_tracing(self)
+    """
+    def setUp(self):
+        """
+            Memprobe.setUp()
+        """
+        self.old_method = wisteria.globs.METHOD
+
+    def tearDown(self):
+        """
+            Memprobe.tearDown()
+        """
+        wisteria.globs.METHOD = self.old_method
+
+    def assertAboutSize(self, value):  # pylint: disable=invalid-name
+        """
+            Memprobe.assertAboutSize()
+
+            Check that <value> is SIZE bytes, give or take the memory used by
+            the interpreter itself.
+        """
+        self.assertIsNotNone(value)
+        self.assertGreaterEqual(value, SIZE*0.95)
+        self.assertLessEqual(value, SIZE*1.5)
+
+    def test_measure_memory(self):
+        """
+            Memprobe.test_measure_memory()
+
+            test of measure_memory() and of is_memprobe_available()
+        """
+        self.assertTrue(is_memprobe_available("tracemalloc"))
+        self.assertTrue(is_memprobe_available("rss"))
+
+        for memprobe in ("tracemalloc", "rss", "fork"):
+            if is_memprobe_available(memprobe):
+                wisteria.globs.METHOD = dict(wisteria.globs.METHOD_DEFAULTS, memprobe=memprobe)
+                self.assertAboutSize(measure_memory(operator.mul, b"x", SIZE).peak)
+
+    @unittest.skipUnless(is_memprobe_available("fork"), "processes can't be forked")
+    def test_probe_fork(self):
+        """
+            Memprobe.test_probe_fork()
+
+            test of probe_fork()
+        """
+        memoryusage = probe_fork(allocate)
+        self.assertAboutSize(memoryusage.peak)
+        self.assertAboutSize(memoryusage.net)
+
+        # the peak is seen even if the memory has been freed:
+        memoryusage = probe_fork(allocate_and_free)
+        self.assertAboutSize(memoryusage.peak)
+        self.assertLessEqual(memoryusage.net, memoryusage.peak)
+
+    @unittest.skipUnless(is_memprobe_available("fork"), "processes can't be forked")
+    def test_probe_fork__freed_memory(self):
+        """
+            Memprobe.test_probe_fork__freed_memory()
+
+            test of probe_fork(): the memory freed by the previous calls (still
+            resident in the main process) doesn't hide the memory used by the call.
+        """
+        obj = [{"key": index, "value": str(index)*10} for index in range(20000)]
+        probe_tracemalloc(lambda: json.dumps(obj))
+        probe_tracemalloc(lambda: list(range(3*10**6)))
+
+        self.assertAboutSize(probe_fork(allocate).peak)
+        self.assertGreaterEqual(probe_fork(lambda: json.dumps(obj)).peak, len(json.dumps(obj)))
+        # at least the 3*10**6 pointers of the list:
+        self.assertGreaterEqual(probe_fork(lambda: list(range(3*10**6))).peak,
+                                3*10**6*8)
+
+    def test_probe_rss(self):
+        """
+            Memprobe.test_probe_rss()
+
+            test of probe_rss()
+        """
+        # the memory freed by a previous call doesn't hide the allocation:
+        probe_rss(allocate_and_free)
+        memoryusage = probe_rss(allocate)
+        self.assertAboutSize(memoryusage.peak)
+        self.assertGreaterEqual(memoryusage.peak, memoryusage.net)
+
+    def test_probe_tracemalloc(self):
+        """
+            Memprobe.test_probe_tracemalloc()
+
+            test of probe_tracemalloc()
+        """
+        memoryusage = probe_tracemalloc(allocate)
+        self.assertAboutSize(memoryusage.peak)
+        self.assertAboutSize(memoryusage.net)
+
+        memoryusage = probe_tracemalloc(allocate_and_free)
+        self.assertAboutSize(memoryusage.peak)
+        self.assertLess(memoryusage.net, 1000)
+
+    def test_probe_tracemalloc__was_tracing(self):
+        """
+            Memprobe.test_probe_tracemalloc__was_tracing()
+
+            test of probe_tracemalloc() when tracemalloc is already tracing:
+            the traces of the caller are kept.
+        """
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            kept = allocate()
+            traced_before, _ = tracemalloc.get_traced_memory()
+            self.assertGreaterEqual(traced_before, SIZE)
+
+            memoryusage = probe_tracemalloc(allocate)
+            self.assertAboutSize(memoryusage.peak)
+            self.assertAboutSize(memoryusage.net)
+
+            memoryusage = probe_tracemalloc(allocate_and_free)
+            self.assertAboutSize(memoryusage.peak)
+            self.assertLess(memoryusage.net, 1000)
+
+            self.assertTrue(tracemalloc.is_tracing())
+            self.assertGreaterEqual(tracemalloc.get_traced_memory()[0], SIZE)
+            del kept
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : tests/resultsmatrix__tests.py
+
+    Test of wisteria/resultsmatrix.py
+
+    ___________________________________________________________________________
+
+    o  ResultsMatrixTests class
+"""
+import unittest
+
+# Pylint is wrong: we can import wisteria.resultsmatrix.
+#   pylint: disable=import-error, no-name-in-module
+from wisteria.resultsmatrix import ResultsMatrix, and_flags
+from wisteria.serializers_classes import SerializationResult, SerializationResults
+
+
+def get_result(encoding_time,
+               decoding_time=None):
+    """
+        get_result()
+
+        Return a SerializationResult; decoding failed if <decoding_time> is None.
+    """
+    res = SerializationResult()
+    res.encoding_success = True
+    res.encoding_time = encoding_time
+    res.encoding_strlen = 10
+    res.mem_usage = 100
+    res.decoding_success = decoding_time is not None
+    res.decoding_time = decoding_time
+    res.reversibility = decoding_time is not None
+    return res
+
+
+class ResultsMatrixTests(unittest.TestCase):
+    """
+        ResultsMatrixTests class
+
+        Test of wisteria/resultsmatrix.py
+
+        _______________________________________________________________________
+
+        o  test_add(self)
+        o  test_and_flags(self)
+        o  test_reductions(self)
+        o  test_reductions__interrupted(self)
+    """
+    def test_add(self):
+        """
+            ResultsMatrixTests.test_add()
+
+            The memoized values and the matrix are forgotten when a result is added.
+        """
+        results = SerializationResults()
+        results.add("json", "int", get_result(1.0, 2.0))
+        self.assertEqual(results.total_encoding_time(dataobj="int", output="value"), 1.0)
+
+        results.add("pickle", "int", get_result(0.5, 0.5))
+        self.assertEqual(results.total_encoding_time(dataobj="int", output="value"), 1.5)
+        self.assertEqual(results.get_matrix().serializers, ["json", "pickle"])
+
+    def test_and_flags(self):
+        """
+            ResultsMatrixTests.test_and_flags()
+        """
+        self.assertEqual(and_flags(bytearray(b"\x01\x01\x00\x01"),
+                                   bytearray(b"\x01\x00\x00\x01"),
+                                   b"\x00\x01\x01\x01"),
+                         b"\x00\x00\x00\x01")
+        self.assertEqual(and_flags(b"\x00\x00"), b"\x00\x00")
+        self.assertEqual(and_flags(b""), b"")
+
+    def test_reductions(self):
+        """
+            ResultsMatrixTests.test_reductions()
+        """
+        results = SerializationResults()
+        results["json"] = {"int": get_result(1.0, 2.0),
+                           "str": get_result(3.0)}
+        results["pickle"] = {"int": get_result(0.5, 0.5),
+                             "str": None}
+        matrix = ResultsMatrix(results)
+
+        self.assertEqual(matrix.dataobjs, ["int", "str"])
+
+        # a row: the failed decoding isn't taken into account.
+        self.assertEqual(matrix.rows["json"]["encoding_time"], 4.0)
+        self.assertEqual(matrix.rows["json"]["decoding_time"], 2.0)
+        self.assertEqual(matrix.rows["json"]["decoding_success"], 1)
+        self.assertEqual(matrix.rows["json"]["encoding_strlen"], 20)
+
+        # a row with a None result: nothing can be computed.
+        self.assertIsNone(matrix.rows["pickle"]["encoding_time"])
+        self.assertIsNone(matrix.rows["pickle"]["reversibility"])
+
+        # a column:
+        self.assertEqual(matrix.columns["int"]["compatible"], 2)
+        self.assertEqual(matrix.columns["int"]["encoding_time"], 1.5)
+        self.assertEqual(matrix.columns["int"]["mem_usage"], 200)
+        self.assertIsNone(matrix.columns["str"]["encoding_time"])
+
+        # the accessors of SerializationResults read the same values:
+        self.assertEqual(results.total_encoding_time(dataobj="int", output="value"), 1.5)
+
+    def test_reductions__interrupted(self):
+        """
+            ResultsMatrixTests.test_reductions__interrupted()
+
+            A cell interrupted by --budget is only counted as 'interrupted':
+            the totals of its row are still computed.
+        """
+        interrupted = SerializationResult()
+        interrupted.interruption = "budget"
+
+        results = SerializationResults()
+        results["json"] = {"int": get_result(1.0, 2.0),
+                           "str": interrupted}
+        results["pickle"] = {"int": get_result(0.5, 0.5),
+                             "str": get_result(3.0, 4.0)}
+        matrix = ResultsMatrix(results)
+
+        self.assertEqual(matrix.rows["json"]["interrupted"], 1)
+        self.assertEqual(matrix.rows["json"]["compatible"], 2)
+        self.assertEqual(matrix.rows["json"]["encoding_success"], 1)
+        self.assertEqual(matrix.rows["json"]["encoding_time"], 1.0)
+        self.assertEqual(matrix.rows["json"]["decoding_time"], 2.0)
+        self.assertEqual(matrix.rows["json"]["encoding_strlen"], 10)
+        self.assertEqual(matrix.rows["json"]["mem_usage"], 100)
+        self.assertEqual(matrix.rows["pickle"]["interrupted"], 0)
+        self.assertEqual(matrix.rows["pickle"]["encoding_time"], 3.5)
+
+        self.assertEqual(matrix.columns["str"]["interrupted"], 1)
+        self.assertEqual(matrix.columns["str"]["encoding_time"], 3.0)
+        self.assertEqual(results.total_encoding_time(serializer="json", output="value"), 1.0)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : tests/sandbox__tests.py
+
+    Test of wisteria/cmdline_sandbox.py and of the --sandbox part of
+    wisteria/jobs.py
+
+    ___________________________________________________________________________
+
+    o  Sandbox class
+"""
+import argparse
+import os
+import time
+import unittest
+import unittest.mock
+
+# Pylint is wrong: we can import wisteria.jobs.
+#   pylint: disable=import-error, no-name-in-module
+import wisteria.globs
+from wisteria.cmdline_sandbox import parse_sandbox_argument
+from wisteria.jobs import iter_transcodings_in_subprocesses
+
+
+def crashing_transcoding(*_):
+    """
+        crashing_transcoding()
+
+        Fake func_serialize(): the process dies without any result.
+    """
+    os._exit(1)  # pylint: disable=protected-access
+
+
+def memory_eating_transcoding(*_):
+    """
+        memory_eating_transcoding()
+
+        Fake func_serialize(): allocate far more memory than SANDBOX['maxmemory'].
+    """
+    return bytearray(2**31)
+
+
+def sleeping_transcoding(*_):
+    """
+        sleeping_transcoding()
+
+        Fake func_serialize(): never ends before SANDBOX['timeout'].
+    """
+    time.sleep(60)
+
+
+class Sandbox(unittest.TestCase):
+    """
+        Sandbox class
+
+        Test of wisteria/cmdline_sandbox.py and of the --sandbox part of
+        wisteria/jobs.py
+
+        _______________________________________________________________________
+
+        o  setUp(self)
+        o  tearDown(self)
+        o  test_interruptions(self)
+        o  test_parse_sandbox_argument(self)
+    """
+    def setUp(self):
+        """
+            Sandbox.setUp()
+        """
+        self.old_args = wisteria.globs.ARGS
+        self.old_sandbox = wisteria.globs.SANDBOX
+        wisteria.globs.ARGS = argparse.Namespace(verbosity=0)
+        wisteria.globs.SANDBOX = {"mode": "on", "timeout": 1, "maxmemory": 100}
+
+    def tearDown(self):
+        """
+            Sandbox.tearDown()
+        """
+        wisteria.globs.ARGS = self.old_args
+        wisteria.globs.SANDBOX = self.old_sandbox
+
+    def test_interruptions(self):
+        """
+            Sandbox.test_interruptions()
+
+            test of iter_transcodings_in_subprocesses() when --sandbox is 'on'
+        """
+        for func, interruption in ((crashing_transcoding, "crash"),
+                                   (sleeping_transcoding, "timeout"),
+                                   (memory_eating_transcoding, "memory")):
+            with unittest.mock.patch("wisteria.jobs.func_serialize", func):
+                start = time.monotonic()
+                res = list(iter_transcodings_in_subprocesses(
+                    [("json", "int", "fingerprint")], jobs=1, cpus=None))
+                self.assertLess(time.monotonic()-start, 30)
+                self.assertEqual(len(res), 1)
+                planned_transcoding, result = res[0]
+                self.assertEqual(planned_transcoding, ("json", "int", "fingerprint"))
+                self.assertEqual(result.interruption, interruption)
+                self.assertFalse(result.encoding_success)
+
+    def test_parse_sandbox_argument(self):
+        """
+            Sandbox.test_parse_sandbox_argument()
+
+            test of parse_sandbox_argument()
+        """
+        self.assertEqual(parse_sandbox_argument("off"),
+                         (True, {"mode": "off", "timeout": 60, "maxmemory": None}))
+        self.assertEqual(parse_sandbox_argument("on"),
+                         (True, {"mode": "on", "timeout": 60, "maxmemory": None}))
+        self.assertEqual(parse_sandbox_argument(" timeout=2.5 ; maxmemory=500 ;"),
+                         (True, {"mode": "on", "timeout": 2.5, "maxmemory": 500.0}))
+        with unittest.mock.patch("wisteria.cmdline_sandbox.msgerror"):
+            for sandbox_string in ("timeout=inf", "timeout=nan", "maxmemory=nan",
+                                   "timeout=0", "maxmemory=-1", "timeout=ten"):
+                self.assertEqual(parse_sandbox_argument(sandbox_string), (False, None))
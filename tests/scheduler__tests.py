@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : tests/scheduler__tests.py
+
+    Test of wisteria/scheduler.py
+
+    ___________________________________________________________________________
+
+    o  Scheduler class
+"""
+import unittest
+
+# Pylint is wrong: we can import wisteria.scheduler.
+#   pylint: disable=import-error, no-name-in-module
+from wisteria.scheduler import get_median_result, get_schedule, summarize_rounds
+from wisteria.serializers_classes import SerializationResult
+
+
+def get_result(total_time, interruption=None):
+    """
+        get_result()
+
+        Return a successful SerializationResult whose encoding+decoding time
+        is <total_time>.
+    """
+    result = SerializationResult()
+    result.encoding_success = result.decoding_success = True
+    result.encoding_time = result.decoding_time = total_time/2
+    result.interruption = interruption
+    return result
+
+
+PLANNED_TRANSCODINGS = [(serializer, data_name, serializer+data_name)
+                        for serializer in ("json", "marshal", "pickle")
+                        for data_name in ("int", "list", "str")]
+
+
+class Scheduler(unittest.TestCase):
+    """
+        Scheduler class
+
+        Test of wisteria/scheduler.py
+
+        _______________________________________________________________________
+
+        o  test_get_median_result(self)
+        o  test_get_schedule(self)
+        o  test_summarize_rounds(self)
+    """
+    def test_get_median_result(self):
+        """
+            Scheduler.test_get_median_result()
+
+            test of get_median_result()
+        """
+        results = [get_result(3), get_result(1), get_result(2), get_result(0, "timeout")]
+        self.assertIs(get_median_result(results), results[2])
+        self.assertIs(get_median_result(results[3:]), results[3])
+
+    def test_get_schedule(self):
+        """
+            Scheduler.test_get_schedule()
+
+            test of get_schedule()
+        """
+        self.assertEqual(get_schedule(PLANNED_TRANSCODINGS, "sorted", 2, 0),
+                         [PLANNED_TRANSCODINGS, PLANNED_TRANSCODINGS])
+
+        schedule = get_schedule(PLANNED_TRANSCODINGS, "shuffle", 3, 123)
+        self.assertEqual(schedule, get_schedule(PLANNED_TRANSCODINGS, "shuffle", 3, 123))
+        for round_transcodings in schedule:
+            self.assertEqual(sorted(round_transcodings), PLANNED_TRANSCODINGS)
+
+        schedule = get_schedule(PLANNED_TRANSCODINGS, "roundrobin", 2, 0)
+        self.assertEqual([serializer for serializer, _, _ in schedule[0]],
+                         ["json", "marshal", "pickle",
+                          "marshal", "pickle", "json",
+                          "pickle", "json", "marshal"])
+        self.assertEqual(schedule[0], schedule[1])
+
+        # after 3 rounds, each serializer has been computed at each position
+        # for each data object:
+        schedule = get_schedule(PLANNED_TRANSCODINGS, "latinsquare", 3, 0)
+        for data_index in range(3):
+            for position in range(3):
+                self.assertEqual(
+                    sorted(round_transcodings[3*data_index+position][0]
+                           for round_transcodings in schedule),
+                    ["json", "marshal", "pickle"])
+
+    def test_summarize_rounds(self):
+        """
+            Scheduler.test_summarize_rounds()
+
+            test of summarize_rounds()
+        """
+        schedule = [PLANNED_TRANSCODINGS]*5
+        # the second round is twice slower, the fourth one only during its second half:
+        rounds_results = [{transcoding: get_result(1) for transcoding in PLANNED_TRANSCODINGS}
+                          for _ in range(5)]
+        rounds_results[1] = {transcoding: get_result(2) for transcoding in PLANNED_TRANSCODINGS}
+        rounds_results[3] = {transcoding: get_result(1 if index < 4.5 else 2)
+                             for index, transcoding in enumerate(PLANNED_TRANSCODINGS)}
+        summaries = summarize_rounds(schedule, rounds_results)
+
+        self.assertEqual([summary["transcodings"] for summary in summaries], [9]*5)
+        self.assertAlmostEqual(summaries[0]["time"], 9)
+        self.assertAlmostEqual(summaries[1]["time"], 18)
+        self.assertAlmostEqual(summaries[0]["drift"], 1)
+        self.assertAlmostEqual(summaries[1]["drift"], 2)
+        self.assertAlmostEqual(summaries[3]["first_half"], 1)
+        self.assertAlmostEqual(summaries[3]["second_half"], 2)
+
+        # a single round: no drift
+        summaries = summarize_rounds(schedule[:1], rounds_results[:1])
+        self.assertIsNone(summaries[0]["drift"])
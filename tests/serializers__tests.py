@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : tests/serializers__tests.py
+
+    Test of the pickle variants (and of their selection) and of _len() defined in
+    wisteria/serializers.py
+
+    ___________________________________________________________________________
+
+    o  Serializers class
+"""
+import argparse
+import array
+import datetime
+import decimal
+import json
+import pickle
+import unittest
+from unittest import mock
+
+# Pylint is wrong: we can import wisteria.serializers.
+#   pylint: disable=import-error, no-name-in-module
+import wisteria.globs
+from wisteria.serializers import PICKLE_VARIANTS, UTF8LEN_CHUNKSIZE, _len
+from wisteria.serializers import pickle_optimized_dumps
+from wisteria.serializers import pickle_outofband_dumps, pickle_outofband_loads
+from wisteria.serializers import init_serializers, func_serialize
+from wisteria.results import get_serializers_selection
+
+# small objects given to each serializer by test_transcode():
+TRANSCODE_OBJECTS = {"dict": {"a": [1, 2.5, "x"], "b": None},
+                     "set": {1, 2},
+                     "bytes": b"abc",
+                     "complex": 1+2j,
+                     "decimal": decimal.Decimal("1.5"),
+                     "date": datetime.date(2021, 1, 1),
+                     "intkeys": {1: "one"},
+                     "tuple": (1, 2)}
+
+# TRANSCODE_EXPECTED[(str)serializer] = ((set)objects that can't be encoded,
+#                                        (set)objects encoded/decoded but not reversible)
+# i.e. what the serializer_xxx() functions returned before they shared transcode();
+# the pickle variants behave like 'pickle'.
+TRANSCODE_EXPECTED = {
+    "json": ({"set", "bytes", "complex", "decimal", "date"}, {"intkeys", "tuple"}),
+    "jsonpickle": (set(), {"intkeys"}),
+    "jsonpickle_keystrue": (set(), set()),
+    "marshal": ({"decimal", "date"}, set()),
+    "pickle": (set(), set()),
+    "pyyaml": (set(), set()),
+}
+
+
+class Serializers(unittest.TestCase):
+    """
+        Serializers class
+
+        Test of the pickle variants (and of their selection) and of _len() defined in
+        wisteria/serializers.py
+
+        _______________________________________________________________________
+
+        o  test_func_serialize__transcoding_check(self)
+        o  test_get_serializers_selection(self)
+        o  test_len(self)
+        o  test_pickle_optimized_dumps(self)
+        o  test_pickle_outofband(self)
+        o  test_pickle_variants(self)
+        o  test_transcode(self)
+    """
+    def test_func_serialize__transcoding_check(self):
+        """
+            Serializers.test_func_serialize__transcoding_check()
+
+            test of func_serialize(): the check memoized by the --filter pre-pass
+            is popped from TRANSCODING_CHECKS and the untimed encoding/decoding
+            isn't computed again; without its encoded object (see
+            TRANSCODING_CHECKS_MAXLEN), the object is encoded again but not decoded.
+        """
+        old = (wisteria.globs.ARGS,
+               wisteria.globs.DATA,
+               wisteria.globs.SERIALIZERS,
+               wisteria.globs.UNAVAILABLE_SERIALIZERS)
+        try:
+            wisteria.globs.ARGS = argparse.Namespace(verbosity=0)
+            wisteria.globs.DATA = {"dict": TRANSCODE_OBJECTS["dict"]}
+            wisteria.globs.SERIALIZERS = {}
+            wisteria.globs.UNAVAILABLE_SERIALIZERS = {}
+            init_serializers()
+
+            # the timed encodings/decodings don't call json.dumps()/json.loads():
+            with mock.patch("wisteria.serializers.measure_time",
+                            return_value=mock.Mock(median=1.0)), \
+                 mock.patch("wisteria.serializers.measure_memory"):
+                for keep_encoded_object, expected_calls in ((True, (0, 0)),
+                                                            (False, (1, 0)),
+                                                            (None, (1, 1))):
+                    if keep_encoded_object is not None:
+                        check = func_serialize("json", "dict", action="check")
+                        if not keep_encoded_object:
+                            check.encoded_object = None
+                        wisteria.globs.TRANSCODING_CHECKS[("json", "dict")] = check
+
+                    with mock.patch.object(json, "dumps", wraps=json.dumps) as dumps, \
+                         mock.patch.object(json, "loads", wraps=json.loads) as loads:
+                        res = func_serialize("json", "dict")
+                    self.assertEqual((dumps.call_count, loads.call_count), expected_calls)
+                    self.assertNotIn(("json", "dict"), wisteria.globs.TRANSCODING_CHECKS)
+                    self.assertEqual(res.encoded_object, json.dumps(TRANSCODE_OBJECTS["dict"]))
+                    self.assertTrue(res.reversibility)
+        finally:
+            wisteria.globs.TRANSCODING_CHECKS.clear()
+            (wisteria.globs.ARGS,
+             wisteria.globs.DATA,
+             wisteria.globs.SERIALIZERS,
+             wisteria.globs.UNAVAILABLE_SERIALIZERS) = old
+
+    def test_get_serializers_selection(self):
+        """
+            Serializers.test_get_serializers_selection()
+
+            test of get_serializers_selection(): 'all' doesn't select the pickle variants.
+        """
+        old = (wisteria.globs.ARGS,
+               wisteria.globs.SERIALIZERS,
+               wisteria.globs.UNAVAILABLE_SERIALIZERS)
+        try:
+            wisteria.globs.ARGS = argparse.Namespace(verbosity=0)
+            wisteria.globs.SERIALIZERS = {}
+            wisteria.globs.UNAVAILABLE_SERIALIZERS = {}
+            init_serializers()
+            self.assertTrue(set(PICKLE_VARIANTS) <= set(wisteria.globs.SERIALIZERS))
+
+            selection = get_serializers_selection("all", "all")
+            self.assertIn("pickle", selection)
+            self.assertIn("json", selection)
+            self.assertFalse(set(selection) & set(PICKLE_VARIANTS))
+
+            # a pickle variant is selected by its name:
+            self.assertEqual(set(get_serializers_selection("pickle_p2_opt", "all")),
+                             set(selection) | {"pickle_p2_opt"})
+            self.assertEqual(set(get_serializers_selection("pickle_p5_oob", "pickle_p4")),
+                             {"pickle_p5_oob", "pickle_p4"})
+        finally:
+            (wisteria.globs.ARGS,
+             wisteria.globs.SERIALIZERS,
+             wisteria.globs.UNAVAILABLE_SERIALIZERS) = old
+
+    def test_len(self):
+        """
+            Serializers.test_len()
+
+            test of _len()
+        """
+        old_method = wisteria.globs.METHOD
+        try:
+            wisteria.globs.METHOD = dict(wisteria.globs.METHOD_DEFAULTS, lenmethod="bytes")
+            for string in ("", "ascii", "é", "日本語"*UTF8LEN_CHUNKSIZE, "a€𝄞"*1000):
+                self.assertEqual(_len(string), len(string.encode("utf-8")))
+            self.assertEqual(_len(b"\xe9"), 1)
+
+            wisteria.globs.METHOD = dict(wisteria.globs.METHOD_DEFAULTS, lenmethod="str")
+            self.assertEqual(_len("日本語"), 3)
+            self.assertEqual(_len(b"\xe9"), 1)
+        finally:
+            wisteria.globs.METHOD = old_method
+
+    def test_pickle_optimized_dumps(self):
+        """
+            Serializers.test_pickle_optimized_dumps()
+
+            test of pickle_optimized_dumps()
+        """
+        obj = {"key": ["value"]*10}
+        for protocol in range(6):
+            data = pickle_optimized_dumps(pickle, protocol, obj)
+            self.assertEqual(pickle.loads(data), obj)
+            self.assertLessEqual(len(data), len(pickle.dumps(obj, protocol=protocol)))
+
+    def test_pickle_outofband(self):
+        """
+            Serializers.test_pickle_outofband()
+
+            test of pickle_outofband_dumps() and of pickle_outofband_loads()
+        """
+        big = array.array('d', range(100000))
+        obj = {"array": big, "memoryview": memoryview(b"abc"), "bytes": b"123"}
+
+        for optimize in (False, True):
+            encoded = pickle_outofband_dumps(optimize, obj)
+            self.assertEqual(pickle_outofband_loads(pickle, encoded), obj)
+            self.assertEqual(len(encoded.buffers), 2)
+            # the content of the array is not copied into the pickle stream:
+            self.assertLess(encoded.copied_strlen, 1000)
+            self.assertEqual(len(encoded), encoded.copied_strlen + big.itemsize*len(big) + 3)
+
+        # objects without any buffer:
+        encoded = pickle_outofband_dumps(False, [1, "2", b"3", bytearray(b"4")])
+        self.assertEqual(encoded.buffers, [])
+        self.assertEqual(len(encoded), encoded.copied_strlen)
+
+    def test_pickle_variants(self):
+        """
+            Serializers.test_pickle_variants()
+
+            test of PICKLE_VARIANTS
+        """
+        self.assertEqual(len(PICKLE_VARIANTS), 14)
+        self.assertEqual(PICKLE_VARIANTS["pickle_p0"], (0, False, False))
+        self.assertEqual(PICKLE_VARIANTS["pickle_p5_oob_opt"], (5, True, True))
+        self.assertNotIn("pickle_p4_oob", PICKLE_VARIANTS)
+
+    def test_transcode(self):
+        """
+            Serializers.test_transcode()
+
+            test of transcode() through the serializer_xxx() function of each
+            serializer registered by init_serializers(): success/reversibility
+            flags and throughputs.
+        """
+        old = (wisteria.globs.ARGS,
+               wisteria.globs.METHOD,
+               wisteria.globs.SERIALIZERS,
+               wisteria.globs.UNAVAILABLE_SERIALIZERS)
+        try:
+            wisteria.globs.ARGS = argparse.Namespace(verbosity=0)
+            wisteria.globs.METHOD = dict(wisteria.globs.METHOD_DEFAULTS,
+                                         repeat=1, mintime=0.0001)
+            wisteria.globs.SERIALIZERS = {}
+            wisteria.globs.UNAVAILABLE_SERIALIZERS = {}
+            init_serializers()
+
+            for serializer, serializerdata in wisteria.globs.SERIALIZERS.items():
+                expected = TRANSCODE_EXPECTED.get(
+                    "pickle" if serializer in PICKLE_VARIANTS else serializer)
+                for data_name, obj in TRANSCODE_OBJECTS.items():
+                    res = serializerdata.transcodefunc(action="serialize",
+                                                       obj=obj,
+                                                       obj_data_name=data_name,
+                                                       strictmute=True)
+                    if expected is not None:
+                        self.assertEqual(
+                            (res.encoding_success, res.decoding_success, res.reversibility),
+                            (data_name not in expected[0],)*2 +
+                            (data_name not in expected[0] | expected[1],),
+                            (serializer, data_name))
+
+                    if not res.decoding_success:
+                        self.assertIsNone(res.ops_throughput)
+                        continue
+                    self.assertAlmostEqual(
+                        res.encoding_throughput,
+                        res.encoding_strlen / res.encoding_time / 10**6)
+                    self.assertAlmostEqual(
+                        res.decoding_throughput,
+                        res.encoding_strlen / res.decoding_time / 10**6)
+                    self.assertAlmostEqual(
+                        res.ops_throughput,
+                        1 / (res.encoding_time + res.decoding_time))
+                    self.assertGreater(res.ops_throughput, 0)
+        finally:
+            (wisteria.globs.ARGS,
+             wisteria.globs.METHOD,
+             wisteria.globs.SERIALIZERS,
+             wisteria.globs.UNAVAILABLE_SERIALIZERS) = old
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : tests/stages__tests.py
+
+    Test of wisteria/stage_stream.py, wisteria/stage_mmap.py,
+    wisteria/stage_compress.py and of wisteria/cmdline_stages.py
+
+    ___________________________________________________________________________
+
+    o  Stages class
+"""
+import functools
+import json
+import os
+import pickle
+import unittest
+
+# Pylint is wrong: we can import wisteria.stage_stream.
+#   pylint: disable=import-error, no-name-in-module
+import wisteria.globs
+from wisteria.cmdline_stages import parse_stages_argument
+from wisteria.serializers import jsonlines_dump, jsonlines_load
+from wisteria.serializers import pickle_outofband_dumps
+from wisteria.serializers_classes import TranscodingAdapter
+from wisteria.stage_compress import measure_compress
+from wisteria.stage_mmap import measure_mmap
+from wisteria.stage_stream import dump_into, measure_stream
+from wisteria.utils import get_stage_tmpfilename
+
+
+JSON_ADAPTER = TranscodingAdapter(module=json,
+                                  version="",
+                                  encode=json.dumps,
+                                  decode=json.loads,
+                                  encoding_errors=(TypeError,),
+                                  decoding_errors=(TypeError,),
+                                  dump=json.dump,
+                                  load=json.load,
+                                  dump_all=functools.partial(jsonlines_dump, json),
+                                  load_all=functools.partial(jsonlines_load, json),
+                                  textstream=True)
+
+PICKLE_ADAPTER = TranscodingAdapter(module=pickle,
+                                    version="",
+                                    encode=pickle.dumps,
+                                    decode=pickle.loads,
+                                    encoding_errors=(TypeError,),
+                                    decoding_errors=(TypeError,),
+                                    dump=pickle.dump,
+                                    load=pickle.load,
+                                    decode_buffer=pickle.loads)
+
+
+class Stages(unittest.TestCase):
+    """
+        Stages class
+
+        Test of wisteria/stage_stream.py, wisteria/stage_mmap.py,
+        wisteria/stage_compress.py and of wisteria/cmdline_stages.py
+
+        _______________________________________________________________________
+
+        o  setUp(self)
+        o  tearDown(self)
+        o  test_dump_into(self)
+        o  test_measure_compress(self)
+        o  test_measure_mmap(self)
+        o  test_measure_stream(self)
+        o  test_parse_stages_argument(self)
+    """
+    def setUp(self):
+        """
+            Stages.setUp()
+        """
+        self.old_method = wisteria.globs.METHOD
+        wisteria.globs.METHOD = dict(wisteria.globs.METHOD_DEFAULTS,
+                                     timeitnumber=1, repeat=2, warmup=0)
+
+    def tearDown(self):
+        """
+            Stages.tearDown()
+        """
+        wisteria.globs.METHOD = self.old_method
+
+    def test_dump_into(self):
+        """
+            Stages.test_dump_into()
+
+            test of dump_into(): the time-to-first-byte is measured during the
+            dump itself.
+        """
+        obj = [{"key": index, "value": str(index)*100} for index in range(2000)]
+        for medium in ("bytesio", "file", "pipe"):
+            counter, data = dump_into(medium, pickle.dump, obj, False,
+                                      get_stage_tmpfilename("stream"))
+            self.assertEqual(counter.strlen, len(pickle.dumps(obj)))
+            self.assertLessEqual(counter.dump_start, counter.first_write)
+            self.assertLessEqual(counter.first_write, counter.dump_end)
+            if medium == "bytesio":
+                self.assertEqual(pickle.loads(data), obj)
+        os.remove(get_stage_tmpfilename("stream"))
+
+    def test_measure_compress(self):
+        """
+            Stages.test_measure_compress()
+
+            test of measure_compress()
+        """
+        obj = [{"key": index, "value": str(index)*100} for index in range(2000)]
+        codecs = ("zlib1", "zlib9", "bz2", "lzma")
+
+        res = measure_compress(PICKLE_ADAPTER, obj, codecs, pickle.dumps(obj), strictmute=True)
+        self.assertEqual(tuple(res), codecs)
+        for compressionresult in res.values():
+            self.assertTrue(compressionresult.success)
+            self.assertEqual(compressionresult.strlen, len(pickle.dumps(obj)))
+            self.assertLess(compressionresult.compressed_strlen, compressionresult.strlen)
+        self.assertLessEqual(res["zlib9"].compressed_strlen, res["zlib1"].compressed_strlen)
+
+        # a str is compressed once encoded in UTF-8:
+        res = measure_compress(JSON_ADAPTER, obj, ("zlib0",), json.dumps(obj), strictmute=True)
+        self.assertTrue(res["zlib0"].success)
+        self.assertEqual(res["zlib0"].strlen, len(json.dumps(obj).encode("utf-8")))
+
+        # out-of-band buffers are compressed with the pickle stream:
+        encoded_object = pickle_outofband_dumps(False, memoryview(b"buffer"*1000))
+        res = measure_compress(PICKLE_ADAPTER, obj, ("zlib6",), encoded_object, strictmute=True)
+        self.assertTrue(res["zlib6"].success)
+        self.assertEqual(res["zlib6"].strlen, len(encoded_object))
+
+        # nothing to be compressed:
+        self.assertIsNone(measure_compress(PICKLE_ADAPTER, obj, codecs, None, strictmute=True))
+
+    def test_measure_mmap(self):
+        """
+            Stages.test_measure_mmap()
+
+            test of measure_mmap()
+        """
+        obj = [{"key": index, "value": str(index)*100} for index in range(2000)]
+
+        # pickle directly decodes the mmap-backed buffer:
+        res = measure_mmap(PICKLE_ADAPTER, obj, (), pickle.dumps(obj), strictmute=True)
+        self.assertTrue(res.success)
+        self.assertTrue(res.buffer_decoding)
+        self.assertFalse(res.copied)
+        self.assertEqual(res.strlen, len(pickle.dumps(obj)))
+
+        # json decodes a copy of the buffer:
+        res = measure_mmap(JSON_ADAPTER, obj, ("fsync",), json.dumps(obj), strictmute=True)
+        self.assertTrue(res.success)
+        self.assertFalse(res.buffer_decoding)
+        self.assertTrue(res.copied)
+
+        # a decoder copying the buffer:
+        adapter = TranscodingAdapter(module=pickle,
+                                     version="",
+                                     encode=pickle.dumps,
+                                     decode=pickle.loads,
+                                     encoding_errors=(TypeError,),
+                                     decoding_errors=(TypeError,),
+                                     decode_buffer=lambda buffer: pickle.loads(bytes(buffer)))
+        res = measure_mmap(adapter, obj, (), pickle.dumps(obj), strictmute=True)
+        self.assertTrue(res.success)
+        self.assertTrue(res.copied)
+
+        # the decoding fails:
+        res = measure_mmap(PICKLE_ADAPTER, obj, (), b"not a pickle", strictmute=True)
+        self.assertFalse(res.success)
+
+    def test_measure_stream(self):
+        """
+            Stages.test_measure_stream()
+
+            test of measure_stream()
+        """
+        obj = [{"key": index, "value": str(index)*100} for index in range(2000)]
+        media = ("bytesio", "file", "pipe")
+
+        res = measure_stream(PICKLE_ADAPTER, obj, media, strictmute=True)
+        self.assertEqual(sorted(res), [(medium, False) for medium in sorted(media)])
+        for streamresult in res.values():
+            self.assertTrue(streamresult.success)
+            self.assertEqual(streamresult.strlen, len(pickle.dumps(obj)))
+            self.assertGreater(streamresult.ttfb, 0)
+
+        # JSON Lines:
+        res = measure_stream(JSON_ADAPTER, obj, ("pipe",), strictmute=True)
+        self.assertTrue(res[("pipe", False)].success)
+        self.assertTrue(res[("pipe", True)].success)
+        self.assertEqual(res[("pipe", True)].strlen,
+                         sum(len(json.dumps(item))+1 for item in obj))
+
+        # the encoding fails:
+        res = measure_stream(JSON_ADAPTER, b"bytes", ("bytesio",), strictmute=True)
+        self.assertFalse(res[("bytesio", False)].success)
+
+        # no stream functions:
+        adapter = TranscodingAdapter(module=json,
+                                     version="",
+                                     encode=json.dumps,
+                                     decode=json.loads,
+                                     encoding_errors=(TypeError,),
+                                     decoding_errors=(TypeError,))
+        self.assertIsNone(measure_stream(adapter, obj, media, strictmute=True))
+
+    def test_parse_stages_argument(self):
+        """
+            Stages.test_parse_stages_argument()
+
+            test of parse_stages_argument()
+        """
+        self.assertEqual(parse_stages_argument("none"), (True, {}))
+        self.assertEqual(parse_stages_argument("stream"),
+                         (True, {"stream": ("bytesio", "file", "pipe")}))
+        self.assertEqual(parse_stages_argument("stream = pipe, file;"),
+                         (True, {"stream": ("pipe", "file")}))
+        self.assertEqual(parse_stages_argument("mmap;stream=pipe"),
+                         (True, {"mmap": (), "stream": ("pipe",)}))
+        self.assertEqual(parse_stages_argument("mmap=fsync"),
+                         (True, {"mmap": ("fsync",)}))
+        self.assertEqual(parse_stages_argument("compress"),
+                         (True, {"compress": ("zlib6", "bz2", "lzma")}))
+        self.assertEqual(parse_stages_argument("compress=zlib9,lzma;mmap"),
+                         (True, {"compress": ("zlib9", "lzma"), "mmap": ()}))
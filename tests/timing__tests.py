@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : tests/timing__tests.py
+
+    Test of wisteria/timing.py
+
+    ___________________________________________________________________________
+
+    o  Timing class
+"""
+import gc
+import unittest
+import unittest.mock
+
+# Pylint is wrong: we can import wisteria.timing.
+#   pylint: disable=import-error, no-name-in-module
+import wisteria.globs
+from wisteria.cmdline_method import parse_method_argument
+from wisteria.timing import compute_timingstats, measure_time, timeloop
+
+
+def fake_timeloop(func, loops):
+    """
+        fake_timeloop()
+
+        Fake timeloop(): each call of <func> lasts exactly 1 ms.
+    """
+    for _ in range(loops):
+        func()
+    return loops*0.001
+
+
+class Timing(unittest.TestCase):
+    """
+        Timing class
+
+        Test of wisteria/timing.py
+
+        _______________________________________________________________________
+
+        o  setUp(self)
+        o  tearDown(self)
+        o  func(self, *args, **kwargs)
+        o  test_calibration(self)
+        o  test_compute_timingstats(self)
+        o  test_mintime(self)
+        o  test_repeat_and_warmup(self)
+        o  test_timeloop(self)
+    """
+    def setUp(self):
+        """
+            Timing.setUp()
+        """
+        self.old_method = wisteria.globs.METHOD
+        self.calls = []
+
+    def tearDown(self):
+        """
+            Timing.tearDown()
+        """
+        wisteria.globs.METHOD = self.old_method
+
+    def func(self, *args, **kwargs):
+        """
+            Timing.func()
+
+            Function whose calls are measured.
+        """
+        self.calls.append((args, kwargs))
+
+    def test_calibration(self):
+        """
+            Timing.test_calibration()
+
+            test of measure_time() with timeitnumber='auto'
+        """
+        # each call lasting 1 ms, 1, 2, 5 then 10 calls are made before a sample
+        # lasts at least 'mintime':
+        wisteria.globs.METHOD = dict(wisteria.globs.METHOD_DEFAULTS,
+                                     timeitnumber=None, mintime=0.01, repeat=3, warmup=0)
+        with unittest.mock.patch("wisteria.timing.timeloop", fake_timeloop):
+            timingstats = measure_time(self.func)
+        self.assertEqual(timingstats.loops, 10)
+        self.assertEqual(len(self.calls), 1+2+5+10 + 3*10)
+        self.assertEqual(timingstats.samples, (0.001,)*3)
+
+        # a call lasting more than 'mintime': one call per sample.
+        self.calls.clear()
+        wisteria.globs.METHOD["mintime"] = 0.0005
+        with unittest.mock.patch("wisteria.timing.timeloop", fake_timeloop):
+            timingstats = measure_time(self.func)
+        self.assertEqual(timingstats.loops, 1)
+        self.assertEqual(len(self.calls), 1 + 3)
+
+    def test_compute_timingstats(self):
+        """
+            Timing.test_compute_timingstats()
+
+            test of compute_timingstats()
+        """
+        timingstats = compute_timingstats([0.5], 10)
+        self.assertEqual(timingstats.loops, 10)
+        self.assertEqual(timingstats.median, 0.5)
+        self.assertEqual(timingstats.stddev, 0.0)
+        self.assertEqual(timingstats.ci95, (0.5, 0.5))
+
+        timingstats = compute_timingstats([5, 1, 4, 2, 3], 1)
+        self.assertEqual(timingstats.samples, (5, 1, 4, 2, 3))
+        self.assertEqual(timingstats.min, 1)
+        self.assertEqual(timingstats.median, 3)
+        self.assertEqual(timingstats.mean, 3)
+        self.assertEqual(timingstats.p95, 5)
+        self.assertEqual(timingstats.ci95, (1, 5))
+
+        timingstats = compute_timingstats(list(range(1, 101)), 1)
+        self.assertEqual(timingstats.median, 50.5)
+        self.assertEqual(timingstats.p95, 95)
+        self.assertEqual(timingstats.ci95, (41, 60))
+
+    def test_mintime(self):
+        """
+            Timing.test_mintime()
+
+            test of the 'mintime' key of --method: the calibration would never
+            end if 'mintime' weren't a finite number.
+        """
+        self.assertEqual(parse_method_argument("mintime=0.5")[1]["mintime"], 0.5)
+        with unittest.mock.patch("wisteria.cmdline_method.msgerror"):
+            for method_string in ("mintime=inf", "mintime=nan", "mintime=0", "mintime=-1"):
+                self.assertEqual(parse_method_argument(method_string), (False, None))
+
+    def test_repeat_and_warmup(self):
+        """
+            Timing.test_repeat_and_warmup()
+
+            test of measure_time() with a given timeitnumber
+        """
+        wisteria.globs.METHOD = dict(wisteria.globs.METHOD_DEFAULTS,
+                                     timeitnumber=3, repeat=4, warmup=2)
+        gc.enable()
+        timingstats = measure_time(self.func, 1, key="value")
+        self.assertTrue(gc.isenabled())
+        self.assertEqual(self.calls, [((1,), {"key": "value"})]*(2 + 3*4))
+        self.assertEqual(timingstats.loops, 3)
+        self.assertEqual(len(timingstats.samples), 4)
+        self.assertLessEqual(timingstats.min, timingstats.median)
+        self.assertLessEqual(timingstats.median, timingstats.p95)
+
+        # no warm-up:
+        self.calls.clear()
+        wisteria.globs.METHOD["warmup"] = 0
+        measure_time(self.func)
+        self.assertEqual(len(self.calls), 3*4)
+
+    def test_timeloop(self):
+        """
+            Timing.test_timeloop()
+
+            test of timeloop()
+        """
+        self.assertGreaterEqual(timeloop(self.func, 7), 0)
+        self.assertEqual(len(self.calls), 7)
@@ -268,10 +268,112 @@ that contain the special TIMESTAMP string (replaced by int(time.time())):
 
     which will be create a file named (e.g.) myreportfile_1635672267.any
 
+You want to use all the physical cores of your machine, one process per core:
+
+    --jobs=0 --pinworkers
+
+You want more timing samples, each of them lasting at least 10ms:
+
+    --method="timeitnumber=auto;mintime=0.01;repeat=11"
+
+You want to measure the memory peak of the whole process (resident set size),
+each measure being made by a new process:
+
+    --method="memprobe=fork"
+
 You just want to see what the encoded string look like:
 
     --cmp="all" --report="titles;B3"
 
+You want to see how the serializers scale with the size N of the data:
+uncomment some lines of the `[data generators]` section in wisteria.ini
+(e.g. `list(int) = 1e2;1e4;1e6`), then:
+
+    --cmp="all vs all (ini)" --report="titles;B4;graphs"
+
+You don't want to compute again the results that haven't changed since the
+previous run (same serializers versions, same data, same machine, same --method);
+the results are stored in a cache file in the report directory:
+
+    --cache="use"
+
+    and, to compute everything again while keeping the cache up to date:
+
+    --cache="refresh;maxage=7"
+
+You want to read the results from another program (dashboards, notebooks):
+
+    --exportresults="jsonl"
+    --exportresults="csv=myresults.csv"
+    --exportresults="columnar"
+
+    'columnar' writes one binary file per column; see exportresults.py:read_columnar_table().
+
+You want to catch the performance regressions of your nightly runs: record a
+baseline once, then compare each run with it (exit code 12 if a serializer
+has become slower, bigger or less reliable, see report section B5):
+
+    --history="baseline"
+    --history="record" --comparewith="baseline"
+    --comparewith="12;threshold=20"
+
+You want to know how the serializers behave when they write into a file, a
+pipe or a socket-like object instead of returning a string: the 'stream' stage
+measures dump(obj, fp)/load(fp) through io.BytesIO, a file and a pipe (time-to-first-byte,
+throughput and peak memory, see report section B6):
+
+    --stages="stream"
+    --stages="stream=file,pipe"
+
+You want to know what it costs to read the encoded objects back from the disk
+without copying them: the 'mmap' stage writes each encoded object into a file
+and decodes it from a mmap-backed memoryview (write time, decode time and
+buffer copies, see report section B7):
+
+    --stages="mmap"
+    --stages="mmap=fsync;stream"
+
+You want to choose a pickle protocol: each protocol (0 to 5) is also known as a
+distinct serializer ('pickle_p0' ... 'pickle_p5'), with pickletools.optimize()
+('_opt' suffix) and, for protocol 5, with out-of-band buffers ('_oob' suffix: the
+content of the array.array and memoryview objects is not copied, see the memory
+used by the encodings). These variants are only selected by their name, 'all'
+doesn't select them:
+
+    --cmp="pickle_p5_oob vs pickle_p4"
+    --cmp="pickle_p2_opt vs all"
+
+You want to know what the encoded objects would weigh once compressed: the
+'compress' stage runs each encoded object through zlib, bz2 and lzma (compressed
+length, ratio, compression and decompression throughputs, see report section B8;
+the first codec is also used by the hall of fame and by the graphs):
+
+    --stages="compress"
+    --stages="compress=zlib1,zlib9,lzma"
+
+You want to compare serializers that may crash the interpreter, hang or eat all
+the memory on some data objects: each transcoding is computed by its own process,
+killed after a timeout; crashes, timeouts and memory exhaustions are reported as
+results (see report sections B1a and B2a) instead of stopping the program:
+
+    --sandbox="on"
+    --sandbox="timeout=10;maxmemory=500"
+
+You want the results within a given time, e.g. in a CI job: the cheapest
+transcodings are computed first and, once the budget is exhausted, the reports
+are written from the partial results (the missing ones are marked 'budget'):
+
+    --budget="total=600"
+    --budget="total=600" --sandbox="timeout=30"
+
+You fear that the cpu frequency scaling or the thermal throttling of your machine
+favours the serializers computed first: interleave the transcodings and compute
+them several times; each transcoding keeps its median result and the drift of
+each round is shown in report section B9:
+
+    --method="order=latinsquare;rounds=3"
+    --method="order=shuffle;rounds=5;seed=42"
+
   |
   | (pimydoc)command line help for --cmp(full version)
   | ⋅Comparisons details.
@@ -300,6 +402,7 @@ ata types(d).
   | ⋅NB: You may use 'vs' as well as 'against', as in:
   | ⋅    --cmp="json vs pickle (cwc)"
   | ⋅NB: globs.py::REGEX_CMP defines exactly the expected format
+  | ⋅NB: 'all' doesn't select the pickle variants ('pickle_p0', ...): give their name.
   |
 
   |
@@ -1110,7 +1213,7 @@ fault values
   | ⋅- (B/07) msgxxx() functions can be used
   | ⋅- (B/08) check STR2REPORTSECTION_KEYS and STR2REPORTSECTION
   | ⋅- (B/09) project name & version
-  | ⋅- (B/10) ARGS.report interpretation
+  | ⋅- (B/10) ARGS.report/method/cache/exportresults/history/comparewith/stages/sandbox/budget
   | ⋅- (B/11) exit handler installation
   | ⋅- (B/12) serializers import
   | ⋅- (B/13) temp file opening
@@ -1126,7 +1229,8 @@ fault values
   | ⋅       - (C/18.3) main(): config file reading
   | ⋅       - (C/18.4) main(): PLANNED_TRANSCODINGS initialization
   | ⋅       - (C/18.5) main(): results computing
-  | ⋅       - (C/18.6) main(): report
+  | ⋅       - (C/18.6) main(): history
+  | ⋅       - (C/18.7) main(): report
   | ⋅
   | ⋅step D: exit_handler()
   | ⋅- (D/01) exported report
@@ -1160,6 +1264,15 @@ fault values
 ⋅*    4: error, missing required module
 ⋅*    5: error: an inconsistency between the data has been detected
 ⋅*    6: error: can't open/create report file
+⋅*    7: error, ill-formed --method string
+⋅*    8: error, ill-formed --cache string
+⋅*    9: error, ill-formed --exportresults string
+⋅*   10: error, ill-formed --history string
+⋅*   11: error, ill-formed --comparewith string
+⋅*   12: a regression has been found by --comparewith
+⋅*   13: error, ill-formed --stages string
+⋅*   14: error, ill-formed --sandbox string
+⋅*   15: error, ill-formed --budget string
 ⋅*  100: internal error, data can't be loaded
 ⋅*  101: internal error, an error occured while computing the results
 ⋅*  102: internal error, an error occured in main()
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/cache.py
+
+    Persistent cache of the results: a SQLite database (CACHEFILE_NAME) in
+    which each SerializationResult is stored under a key depending on:
+
+    * the serializer name and version;
+    * the content of the data object (or the source code of the cwc module);
+    * the Python version and the machine;
+    * the --method and --stages strings and the Wisteria version;
+    * the process computing the transcodings (main process or a forked one,
+      see --jobs and --sandbox): the memory measures differ.
+
+    If anything changes, the key changes and the result is computed again.
+    See (pimydoc)command line help for --cache(full version).
+    ___________________________________________________________________________
+
+    o  evict_cache(connection)
+    o  get_cache_key(serializer, data_name)
+    o  get_canonical_form(obj)
+    o  get_data_fingerprint(data_name)
+    o  get_isolation()
+    o  get_machine_fingerprint()
+    o  open_cache()
+    o  read_cached_results(planned_transcodings)
+    o  write_results_to_cache(computed_results)
+"""
+import copy
+import hashlib
+import inspect
+import os
+import pickle
+import platform
+import re
+import sqlite3
+import time
+
+import wisteria.globs
+from wisteria.aboutproject import __version__
+from wisteria.globs import VERBOSITY_DEBUG, VERBOSITY_DETAILS
+from wisteria.msg import msgdebug, msginfo, msgwarning
+from wisteria.cwc.cwc_utils import is_a_cwc_name, moduleininame_to_modulefullrealname
+from wisteria.cwc.cwc_utils import modulefullrealname_to_modulerealname
+from wisteria.cwc.cwc_utils import modulefullrealname_to_waemodulename
+
+
+# e.g. '<object object at 0x7f3c2a1b4e40>': such an address changes at each run.
+ADDRESS_REGEX = re.compile(r"0x[0-9a-fA-F]{6,}")
+
+# fingerprints already computed by get_data_fingerprint():
+#   DATA_FINGERPRINTS[(str)data_name] = (data object, (None|str)fingerprint)
+DATA_FINGERPRINTS = {}
+
+# types of the objects which can't contain a set, see get_canonical_form()
+SCALAR_TYPES = (bool, bytes, complex, float, int, str, type(None))
+
+
+def evict_cache(connection):
+    """
+        evict_cache()
+
+        Remove from the cache the results older than CACHE['maxage'] days, then
+        the oldest results as long as the cache is bigger than CACHE['maxsize'] MB.
+        _______________________________________________________________________
+
+        ARGUMENT: (sqlite3.Connection)connection, the value returned by open_cache()
+    """
+    removed = connection.execute("DELETE FROM results WHERE created < ?",
+                                 (time.time() - wisteria.globs.CACHE["maxage"]*86400,)).rowcount
+
+    maxsize = wisteria.globs.CACHE["maxsize"] * 10**6
+    (size,) = connection.execute("SELECT COALESCE(SUM(LENGTH(result)), 0) FROM results").fetchone()
+    if size > maxsize:
+        to_be_removed = []
+        for key, length in connection.execute("SELECT key, LENGTH(result) FROM results "
+                                              "ORDER BY created"):
+            if size <= maxsize:
+                break
+            to_be_removed.append((key,))
+            size -= length
+        connection.executemany("DELETE FROM results WHERE key = ?", to_be_removed)
+        removed += len(to_be_removed)
+    connection.commit()
+
+    # the file doesn't shrink by itself, but VACUUM rewrites the whole file:
+    if removed:
+        connection.execute("VACUUM")
+
+
+def get_cache_key(serializer,
+                  data_name):
+    """
+        get_cache_key()
+
+        Return the key under which the result of (<serializer>, <data_name>)
+        is stored in the cache.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (str)serializer
+        o  (str)data_name
+
+        RETURNED VALUE: (None|str)the key or None if the data object can't be
+                        fingerprinted.
+    """
+    data_fingerprint = get_data_fingerprint(data_name)
+    if data_fingerprint is None:
+        return None
+
+    method = wisteria.globs.METHOD or wisteria.globs.METHOD_DEFAULTS
+    return hashlib.sha256(
+        repr((serializer,
+              wisteria.globs.SERIALIZERS[serializer].version,
+              data_name,
+              data_fingerprint,
+              platform.python_version(),
+              platform.python_implementation(),
+              get_machine_fingerprint(),
+              sorted(method.items()),
+              sorted(wisteria.globs.STAGES.items()),
+              get_isolation(),
+              getattr(wisteria.globs.ARGS, "pinworkers", False),
+              __version__)).encode()).hexdigest()
+
+
+def get_canonical_form(obj):
+    """
+        get_canonical_form()
+
+        Return <obj> where each set or frozenset is replaced by a tuple of its
+        sorted items: the order of the items of a set depends on PYTHONHASHSEED
+        and so does the pickled set.
+
+        Only lists, tuples, dicts, sets and frozensets are explored.
+        _______________________________________________________________________
+
+        ARGUMENT: obj, the object to be converted
+
+        RETURNED VALUE: <obj> or its canonical form
+    """
+    if isinstance(obj, (set, frozenset)):
+        return (type(obj).__qualname__,
+                tuple(sorted((get_canonical_form(item) for item in obj), key=repr)))
+
+    # pylint: disable=unidiomatic-typecheck
+    if type(obj) in (list, tuple):
+        if all(type(item) in SCALAR_TYPES for item in obj):
+            return obj
+        return type(obj)(get_canonical_form(item) for item in obj)
+
+    if type(obj) is dict:
+        if all(type(key) in SCALAR_TYPES and type(value) in SCALAR_TYPES
+               for key, value in obj.items()):
+            return obj
+        return {get_canonical_form(key): get_canonical_form(value)
+                for key, value in obj.items()}
+
+    return obj
+
+
+def get_data_fingerprint(data_name):
+    """
+        get_data_fingerprint()
+
+        Return a fingerprint of the content of the data object <data_name>:
+        the pickled canonical form of the object (see get_canonical_form())
+        or, if it can't be pickled, its repr(). For a cwc data object, the
+        source code of its modules is used instead.
+
+        The fingerprint is computed once per data object (see DATA_FINGERPRINTS).
+        _______________________________________________________________________
+
+        ARGUMENT: (str)data_name
+
+        RETURNED VALUE: (None|str)the fingerprint or None if the data object
+                        can't be fingerprinted.
+    """
+    if is_a_cwc_name(data_name):
+        modulefullrealname = moduleininame_to_modulefullrealname(data_name)
+        try:
+            content = "".join(
+                inspect.getsource(wisteria.globs.MODULES[modulename])
+                for modulename in (modulefullrealname_to_modulerealname(modulefullrealname),
+                                   modulefullrealname_to_waemodulename(modulefullrealname)))
+        except (KeyError, OSError, TypeError):
+            return None
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    obj = wisteria.globs.DATA[data_name]
+    if data_name in DATA_FINGERPRINTS and DATA_FINGERPRINTS[data_name][0] is obj:
+        return DATA_FINGERPRINTS[data_name][1]
+
+    canonical_form = get_canonical_form(obj)
+    try:
+        content = pickle.dumps(canonical_form, protocol=4)
+    except Exception:  # pylint: disable=broad-except
+        representation = repr(canonical_form)
+        content = None if ADDRESS_REGEX.search(representation) else representation.encode()
+
+    res = None
+    if content is not None:
+        res = hashlib.sha256(type(obj).__qualname__.encode() + content).hexdigest()
+    DATA_FINGERPRINTS[data_name] = (obj, res)
+    return res
+
+
+def get_isolation():
+    """
+        get_isolation()
+
+        Return 'subprocess' if the transcodings are computed by forked processes
+        (see --jobs and --sandbox), 'main' otherwise: the memory measures made
+        in a fresh process can't be mixed with those made in the main process.
+        _______________________________________________________________________
+
+        RETURNED VALUE: (str)'subprocess' or 'main'
+    """
+    if getattr(wisteria.globs.ARGS, "jobs", 1) != 1 or \
+       wisteria.globs.SANDBOX.get("mode", "off") == "on":
+        return "subprocess"
+    return "main"
+
+
+def get_machine_fingerprint():
+    """
+        get_machine_fingerprint()
+
+        Return a string describing the machine: the timings computed on
+        another machine can't be used.
+        _______________________________________________________________________
+
+        RETURNED VALUE: (str)the machine fingerprint
+    """
+    return ";".join((platform.node(),
+                     platform.system(),
+                     platform.machine(),
+                     platform.processor(),
+                     str(os.cpu_count())))
+
+
+def open_cache():
+    """
+        open_cache()
+
+        Open (or create) the cache file CACHEFILE_NAME.
+        _______________________________________________________________________
+
+        RETURNED VALUE: (None|sqlite3.Connection)None if the cache can't be opened
+    """
+    try:
+        connection = sqlite3.connect(wisteria.globs.CACHEFILE_NAME)
+        connection.execute("CREATE TABLE IF NOT EXISTS results "
+                           "(key TEXT PRIMARY KEY, serializer TEXT, data_name TEXT, "
+                           "created REAL, result BLOB)")
+    except sqlite3.Error as exception:
+        msgwarning(f"Can't open the cache file '{wisteria.globs.CACHEFILE_NAME}' "
+                   f"({exception}): the cache won't be used.")
+        return None
+    return connection
+
+
+def read_cached_results(planned_transcodings):
+    """
+        read_cached_results()
+
+        Search in the cache the results of <planned_transcodings>.
+
+        Nothing is read if CACHE['mode'] isn't 'use'.
+        _______________________________________________________________________
+
+        ARGUMENT: (list)planned_transcodings   : see (pimydoc)PLANNED_TRANSCODINGS
+
+        RETURNED VALUE: (cached_results, remaining_transcodings)
+            o  cached_results: list of ((serializer, data_name, fingerprint),
+                                        SerializationResult)
+            o  remaining_transcodings: planned transcodings that have not been
+                                       found in the cache
+    """
+    if wisteria.globs.CACHE.get("mode", "off") != "use":
+        return [], list(planned_transcodings)
+
+    connection = open_cache()
+    if connection is None:
+        return [], list(planned_transcodings)
+
+    cached_results = []
+    remaining_transcodings = []
+    try:
+        for planned_transcoding in planned_transcodings:
+            serializer, data_name, _ = planned_transcoding
+            key = get_cache_key(serializer, data_name)
+            row = None
+            if key is not None:
+                row = connection.execute("SELECT result FROM results WHERE key = ?",
+                                         (key,)).fetchone()
+            if row is None:
+                remaining_transcodings.append(planned_transcoding)
+            else:
+                cached_results.append((planned_transcoding, pickle.loads(row[0])))
+    except Exception as exception:  # pylint: disable=broad-except
+        # sqlite3.Error, or a stale row that can't be unpickled anymore (e.g. a renamed
+        # class: ModuleNotFoundError, AttributeError, TypeError...):
+        msgwarning(f"Can't read the cache file '{wisteria.globs.CACHEFILE_NAME}' "
+                   f"({exception}): the cache won't be used.")
+        return [], list(planned_transcodings)
+    finally:
+        connection.close()
+
+    if wisteria.globs.ARGS.verbosity >= VERBOSITY_DETAILS:
+        msginfo(f"{len(cached_results)} result(s) read from the cache, "
+                f"{len(remaining_transcodings)} result(s) to be computed.")
+
+    return cached_results, remaining_transcodings
+
+
+def write_results_to_cache(computed_results):
+    """
+        write_results_to_cache()
+
+        Write <computed_results> into the cache and evict the old results.
+
+        Nothing is written if CACHE['mode'] is 'off'; the interrupted results
+        (see --sandbox) are never written.
+        _______________________________________________________________________
+
+        ARGUMENT: (list of ((serializer, data_name, fingerprint), SerializationResult))
+                  computed_results
+    """
+    if wisteria.globs.CACHE.get("mode", "off") == "off":
+        return
+
+    connection = open_cache()
+    if connection is None:
+        return
+
+    try:
+        for (serializer, data_name, _), result in computed_results:
+            key = get_cache_key(serializer, data_name)
+            if key is None or result.interruption is not None:
+                # an interrupted transcoding (see --sandbox) has to be computed again:
+                continue
+            try:
+                blob = pickle.dumps(result)
+            except (pickle.PicklingError, TypeError, AttributeError):
+                # the encoded object can't be pickled; its representation is enough
+                # for the report:
+                result = copy.copy(result)
+                result.encoded_object = repr(result.encoded_object)
+                blob = pickle.dumps(result)
+            connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                               (key, serializer, data_name, time.time(), blob))
+        connection.commit()
+        evict_cache(connection)
+    except sqlite3.Error as exception:
+        msgwarning(f"Can't write into the cache file '{wisteria.globs.CACHEFILE_NAME}' "
+                   f"({exception}).")
+    finally:
+        connection.close()
+
+    if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+        msgdebug(f"{len(computed_results)} result(s) written into the cache "
+                 f"'{wisteria.globs.CACHEFILE_NAME}'.")
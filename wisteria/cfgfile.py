@@ -37,6 +37,7 @@ from wisteria.globs import DEFAULT_CONFIGFILE_NAME, DEFAULT_CONFIGFILE_URL
 from wisteria.globs import VERBOSITY_NORMAL, VERBOSITY_DETAILS, VERBOSITY_DEBUG
 from wisteria.utils import normpath
 from wisteria.msg import msginfo, msgerror, msgdebug
+from wisteria.datagen import read_datagen_sizes
 import wisteria.globs
 
 
@@ -95,6 +96,9 @@ def read_cfgfile(filename):
             ⋅    set1 = yes or false             〖"data objects"〗〖"set1"〗 = (bool)True/False
             ⋅    set2 = yes or false
             ⋅    ...
+            ⋅data generators (optional)         〖"data generators"〗= {}
+            ⋅    list(int) = 100;1e4;1e6         〖"data generators"〗〖"list(int)"〗 = (tuple)sizes
+            ⋅    ...
     """
     if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
         msgdebug(f"Trying to read '{filename}' ({normpath(filename)}) as a config file.")
@@ -107,6 +111,7 @@ def read_cfgfile(filename):
     res = {"data selection": {},
            "data sets": {},
            "data objects": {},
+           "data generators": {},
            }
 
     # ------------------------------------------------------------------
@@ -166,6 +171,14 @@ def read_cfgfile(filename):
                          f"'{data_set__subitem}', not defined in \\[data objects].")
                 return None
 
+    # the [data generators] section is optional:
+    if "data generators" in config:
+        for family in config["data generators"]:
+            sizes = read_datagen_sizes(family, config["data generators"][family])
+            if sizes is None:
+                return None
+            res["data generators"][family] = sizes
+
     # --------------------------------------------------------
     # (3/3) if everything is in order, let's initialize <res>.
     # --------------------------------------------------------
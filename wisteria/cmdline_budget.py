@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/cmdline_budget.py
+
+    Just the parsing of the --budget argument.
+    ___________________________________________________________________________
+
+    o  parse_budget_argument(budget_string)
+"""
+import math
+
+from wisteria.globs import BUDGET_DEFAULTS
+from wisteria.msg import msgerror
+
+
+# accepted values for the 'order' of --budget:
+BUDGET_ORDERS = ("cheapest", "planned")
+
+
+def parse_budget_argument(budget_string):
+    """
+        parse_budget_argument()
+
+        Parse the --budget string <budget_string>.
+
+        (pimydoc)command line help for --budget(full version)
+        ⋅A string like 'key=value;key=value' limiting the time spent computing
+        ⋅the transcodings:
+        ⋅- default value: "none", i.e. no limit, the transcodings being computed
+        ⋅  in the order of PLANNED_TRANSCODINGS
+        ⋅
+        ⋅Accepted keys are (default values between brackets):
+        ⋅* 'total': wall-clock budget, in seconds, of all the transcodings [no limit].
+        ⋅  Once it is exhausted, the transcodings computed by other processes (see
+        ⋅  --jobs and --sandbox) are killed and the remaining ones aren't computed:
+        ⋅  their results are marked 'budget' in report sections B1a and B2a and the
+        ⋅  reports are written from the partial results.
+        ⋅* 'order': 'cheapest' to compute first the transcodings of the smallest data
+        ⋅  objects, all serializers in turn, or 'planned' [cheapest]
+        ⋅
+        ⋅The timeout of each transcoding is set by --sandbox.
+        ⋅
+        ⋅e.g. --budget="total=600"
+        ⋅     --budget="total=300;order=planned"
+        _______________________________________________________________________
+
+        ARGUMENT: (str)budget_string, the --budget string
+
+        RETURNED VALUE: ((bool)parsing_success, (None|dict)BUDGET)
+
+                        (pimydoc)BUDGET format
+                        ⋅BUDGET[(str)key] = value; keys are those of BUDGET_DEFAULTS.
+                        ⋅Initialized by cmdline_budget.py:parse_budget_argument();
+                        ⋅{} if there's no time budget.
+                        ⋅- 'total': (None|float) wall-clock budget (seconds) of all the
+                        ⋅           transcodings; None if there's no limit
+                        ⋅- 'order': (str) 'cheapest' (see results.py:sort_transcodings_by_cost())
+                        ⋅           or 'planned' (order of PLANNED_TRANSCODINGS)
+    """
+    if budget_string.strip() == "none":
+        return True, {}
+
+    budget = dict(BUDGET_DEFAULTS)
+
+    for item in budget_string.split(";"):
+        item = item.strip()
+        if not item:
+            continue
+
+        key, _, value = (part.strip() for part in item.partition("="))
+
+        if key == "order":
+            if value not in BUDGET_ORDERS:
+                msgerror(f"(ERRORID080) Ill-formed --budget string: unknown order '{value}'. "
+                         f"Known orders are {BUDGET_ORDERS} .")
+                return False, None
+            budget[key] = value
+            continue
+
+        if key != "total":
+            msgerror(f"(ERRORID081) Ill-formed --budget string: unknown key '{key}'. "
+                     "Known keys are ('total', 'order') .")
+            return False, None
+
+        try:
+            budget[key] = float(value)
+        except ValueError:
+            budget[key] = None
+        # 'inf' and 'nan' are accepted by float() but can't give a deadline:
+        if budget[key] is None or not math.isfinite(budget[key]) or budget[key] <= 0:
+            msgerror(f"(ERRORID082) Ill-formed --budget string: '{key}' must be "
+                     f"a strictly positive finite number, not '{value}'.")
+            return False, None
+
+    return True, budget
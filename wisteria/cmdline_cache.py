@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/cmdline_cache.py
+
+    Just the parsing of the --cache argument.
+    ___________________________________________________________________________
+
+    o  parse_cache_argument(cache_string)
+"""
+from wisteria.globs import CACHE_DEFAULTS
+from wisteria.msg import msgerror
+
+
+# accepted values for the 'mode' of --cache:
+CACHE_MODES = ("off", "use", "refresh")
+
+
+def parse_cache_argument(cache_string):
+    """
+        parse_cache_argument()
+
+        Parse the --cache string <cache_string>.
+
+        (pimydoc)command line help for --cache(full version)
+        ⋅A string like 'mode;key=value;key=value' describing how the results
+        ⋅are stored in the cache file, a SQLite database created in the
+        ⋅report directory. Accepted modes are:
+        ⋅* 'off': the cache is neither read nor written;
+        ⋅* 'use': the results found in the cache are not computed again, the
+        ⋅  other ones are computed and written into the cache;
+        ⋅* 'refresh': all results are computed and written into the cache.
+        ⋅
+        ⋅A cached result is only used if the serializer (name and version), the
+        ⋅data object content, the Python version, the machine and --method are
+        ⋅the same.
+        ⋅
+        ⋅Accepted keys are (default values between brackets):
+        ⋅* 'maxage': results older than 'maxage' days are removed [30]
+        ⋅* 'maxsize': if the cache file is bigger than 'maxsize' MB, the oldest
+        ⋅  results are removed [100]
+        ⋅
+        ⋅e.g. --cache="use"
+        ⋅     --cache="refresh;maxage=7;maxsize=20"
+        _______________________________________________________________________
+
+        ARGUMENT: (str)cache_string, the --cache string
+
+        RETURNED VALUE: ((bool)parsing_success, (None|dict)CACHE)
+
+                        (pimydoc)CACHE format
+                        ⋅CACHE[(str)key] = value; keys are those of CACHE_DEFAULTS.
+                        ⋅Initialized by cmdline_cache.py:parse_cache_argument().
+                        ⋅- 'mode'   : (str) 'off' (no cache), 'use' (read and write the cache) or
+                        ⋅             'refresh' (don't read the cache but write into it)
+                        ⋅- 'maxage' : (float) results older than 'maxage' days are removed
+                        ⋅- 'maxsize': (float) if the cache file is bigger than 'maxsize' MB,
+                        ⋅             the oldest results are removed
+    """
+    cache = dict(CACHE_DEFAULTS)
+
+    for item in cache_string.split(";"):
+        item = item.strip()
+        if not item:
+            continue
+
+        if "=" not in item:
+            if item not in CACHE_MODES:
+                msgerror(f"(ERRORID065) Ill-formed --cache string: unknown mode '{item}'. "
+                         f"Known modes are {CACHE_MODES} .")
+                return False, None
+            cache["mode"] = item
+            continue
+
+        key, value = (part.strip() for part in item.split("=", 1))
+
+        if key not in ("maxage", "maxsize"):
+            msgerror(f"(ERRORID066) Ill-formed --cache string: unknown key '{key}'. "
+                     "Known keys are ('maxage', 'maxsize') .")
+            return False, None
+
+        try:
+            cache[key] = float(value)
+        except ValueError:
+            cache[key] = None
+        if cache[key] is None or cache[key] <= 0:
+            msgerror(f"(ERRORID067) Ill-formed --cache string: '{key}' must be "
+                     f"a strictly positive number, not '{value}'.")
+            return False, None
+
+    return True, cache
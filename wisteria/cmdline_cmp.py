@@ -65,6 +65,7 @@ def read_cmpstring(cmpstring):
         ⋅NB: You may use 'vs' as well as 'against', as in:
         ⋅    --cmp="json vs pickle (cwc)"
         ⋅NB: globs.py::REGEX_CMP defines exactly the expected format
+        ⋅NB: 'all' doesn't select the pickle variants ('pickle_p0', ...): give their name.
         _______________________________________________________________________
 
         ARGUMENT: (str)cmpstring, the source string to be read.
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/cmdline_history.py
+
+    Just the parsing of the --history and --comparewith arguments.
+    ___________________________________________________________________________
+
+    o  parse_comparewith_argument(comparewith_string)
+    o  parse_history_argument(history_string)
+"""
+from wisteria.globs import COMPAREWITH_DEFAULTS
+from wisteria.msg import msgerror
+
+
+# accepted values for --history:
+HISTORY_MODES = ("off", "record", "baseline")
+
+
+def parse_comparewith_argument(comparewith_string):
+    """
+        parse_comparewith_argument()
+
+        Parse the --comparewith string <comparewith_string>.
+
+        (pimydoc)command line help for --comparewith(full version)
+        ⋅Compare the current results with the results of a previous run stored
+        ⋅in the history file (see --history), a string like 'run;threshold=10':
+        ⋅- default value: "none", i.e. no comparison
+        ⋅- 'run' is 'last' (the last recorded run), 'baseline' (the last run
+        ⋅  recorded with --history=baseline) or a run id (an integer).
+        ⋅
+        ⋅A regression is reported for a (serializer, data object) if:
+        ⋅* its encoding/decoding time has grown by more than 'threshold' % and
+        ⋅  the 95% confidence intervals of both medians don't overlap;
+        ⋅* its encoded string length has grown by more than 'threshold' %;
+        ⋅* its encoding/decoding/reversibility succeeded and now fails.
+        ⋅
+        ⋅Accepted key is (default value between brackets):
+        ⋅* 'threshold': minimal growth, in % [10]
+        ⋅  (on a noisy machine, increase it or the 'repeat' key of --method)
+        ⋅
+        ⋅The comparison is shown in report section B5; if a regression has been
+        ⋅found, the exit code is 12.
+        ⋅
+        ⋅e.g. --comparewith="baseline"
+        ⋅     --comparewith="12;threshold=20"
+        _______________________________________________________________________
+
+        ARGUMENT: (str)comparewith_string, the --comparewith string
+
+        RETURNED VALUE: ((bool)parsing_success, (None|dict)COMPAREWITH)
+
+                        (pimydoc)COMPAREWITH format
+                        ⋅COMPAREWITH[(str)key] = value; keys are those of COMPAREWITH_DEFAULTS.
+                        ⋅Initialized by cmdline_history.py:parse_comparewith_argument();
+                        ⋅{} if there's no comparison with a previous run.
+                        ⋅- 'run'      : (str|int) 'last', 'baseline' or a run id
+                        ⋅- 'threshold': (float) minimal growth (in %) of a time or of an encoded
+                        ⋅               string length to be reported as a regression
+    """
+    if comparewith_string.strip() == "none":
+        return True, {}
+
+    comparewith = dict(COMPAREWITH_DEFAULTS)
+
+    for index, item in enumerate(comparewith_string.split(";")):
+        item = item.strip()
+        if index == 0:
+            if item in ("last", "baseline"):
+                comparewith["run"] = item
+            elif item.isdigit():
+                comparewith["run"] = int(item)
+            else:
+                msgerror(f"(ERRORID071) Ill-formed --comparewith string: '{item}' is "
+                         "neither 'last', nor 'baseline', nor a run id.")
+                return False, None
+            continue
+        if not item:
+            continue
+
+        key, _, value = (part.strip() for part in item.partition("="))
+        if key != "threshold":
+            msgerror(f"(ERRORID072) Ill-formed --comparewith string: unknown key '{key}'. "
+                     "Known key is 'threshold' .")
+            return False, None
+
+        try:
+            comparewith[key] = float(value)
+        except ValueError:
+            comparewith[key] = None
+        if comparewith[key] is None or comparewith[key] < 0:
+            msgerror(f"(ERRORID073) Ill-formed --comparewith string: '{key}' must be "
+                     f"a positive number, not '{value}'.")
+            return False, None
+
+    return True, comparewith
+
+
+def parse_history_argument(history_string):
+    """
+        parse_history_argument()
+
+        Parse the --history string <history_string>.
+
+        (pimydoc)command line help for --history(full version)
+        ⋅Append the current run to the history file, a SQLite database created
+        ⋅in the report directory; each run is stored with the machine, the
+        ⋅Python version, the serializers versions and the statistics of each
+        ⋅transcoding. Accepted values are:
+        ⋅* 'off': the history file is not modified;
+        ⋅* 'record': the run is appended to the history file;
+        ⋅* 'baseline': the run is appended to the history file and becomes
+        ⋅  the baseline, i.e. the run used by --comparewith="baseline".
+        ⋅The id of the recorded run is displayed once it has been recorded.
+        ⋅
+        ⋅e.g. --history="baseline"
+        _______________________________________________________________________
+
+        ARGUMENT: (str)history_string, the --history string
+
+        RETURNED VALUE: ((bool)parsing_success, (None|str)HISTORY)
+    """
+    history = history_string.strip()
+    if history not in HISTORY_MODES:
+        msgerror(f"(ERRORID070) Ill-formed --history string: unknown mode '{history}'. "
+                 f"Known modes are {HISTORY_MODES} .")
+        return False, None
+    return True, history
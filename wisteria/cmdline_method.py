@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/cmdline_method.py
+
+    Just the parsing of the --method argument.
+    ___________________________________________________________________________
+
+    o  parse_method_argument(method_string)
+    o  read_positive_int(key, value, minimum)
+"""
+import math
+
+from wisteria.globs import METHOD_DEFAULTS
+from wisteria.memprobe import MEMPROBES, is_memprobe_available
+from wisteria.msg import msgerror
+from wisteria.scheduler import SCHEDULE_ORDERS
+
+
+def parse_method_argument(method_string):
+    """
+        parse_method_argument()
+
+        Parse the --method string <method_string>.
+
+        (pimydoc)command line help for --method(full version)
+        ⋅A string like 'key=value;key=value;...' describing how the measures
+        ⋅are made. Accepted keys are (default values between brackets):
+        ⋅* 'timeitnumber': number of calls of the encoding/decoding function for
+        ⋅  each timing sample; 'auto' to calibrate this number so that each sample
+        ⋅  lasts at least 'mintime' seconds, like timeit.Timer.autorange() does
+        ⋅  ['auto']
+        ⋅* 'mintime': see 'timeitnumber' [0.001]
+        ⋅* 'repeat': number of timing samples [5]
+        ⋅* 'warmup': number of calls before the first timing sample [1]
+        ⋅* 'memprobe': how the memory used by each encoding/decoding is measured
+        ⋅  ['tracemalloc']:
+        ⋅  - 'tracemalloc': peak of the memory allocated through Python's allocator
+        ⋅    (memory allocated directly by C libraries is not seen);
+        ⋅  - 'rss': peak of the resident set size, sampled by a background thread;
+        ⋅  - 'fork': like 'rss' but each measure is made by a new forked process.
+        ⋅* 'lenmethod': how the length of a string encoded into a str is measured
+        ⋅  ['bytes']:
+        ⋅  - 'bytes': length of its UTF-8 encoding, computed without copying the
+        ⋅    whole string;
+        ⋅  - 'str': number of characters.
+        ⋅  The strings encoded into bytes are not concerned.
+        ⋅* 'order': order in which the transcodings are computed ['sorted']:
+        ⋅  - 'sorted': serializer after serializer (see also --budget);
+        ⋅  - 'shuffle': a random order, different for each round;
+        ⋅  - 'roundrobin': data object after data object, the serializers being
+        ⋅    rotated from one data object to the next one;
+        ⋅  - 'latinsquare': like 'roundrobin', the rotation being also shifted
+        ⋅    from one round to the next one.
+        ⋅* 'rounds': number of times each transcoding is computed; its result is
+        ⋅  the one of the round with the median time. The drift of each round is
+        ⋅  shown in report section B9 [1]
+        ⋅* 'seed': seed of the random generator used by 'shuffle' [0]
+        ⋅
+        ⋅The encoding/decoding time is the median of the samples; min, mean,
+        ⋅stddev, 95th percentile and a 95% confidence interval of the median are
+        ⋅computed as well. The serializers are ranked upon the median; two
+        ⋅serializers whose confidence intervals overlap share the same rank.
+        ⋅
+        ⋅e.g. --method="timeitnumber=auto;repeat=7;warmup=2"
+        ⋅     --method="timeitnumber=1;repeat=1;warmup=0" (a single call, no statistics)
+        ⋅     --method="lenmethod=str"
+        ⋅     --method="order=latinsquare;rounds=3"
+        _______________________________________________________________________
+
+        ARGUMENT: (str)method_string, the --method string
+
+        RETURNED VALUE: ((bool)parsing_success, (None|dict)METHOD)
+
+                        (pimydoc)METHOD format
+                        ⋅METHOD[(str)key] = value; keys are those of METHOD_DEFAULTS.
+                        ⋅Initialized by cmdline_method.py:parse_method_argument() from --method.
+                        ⋅- 'timeitnumber': (None|int) number of calls per timing sample; None for
+                        ⋅                  an automatic calibration ('auto' in --method)
+                        ⋅- 'mintime'     : (float) minimal duration of a sample, in seconds,
+                        ⋅                  if 'timeitnumber' is None
+                        ⋅- 'repeat'      : (int) number of timing samples
+                        ⋅- 'warmup'      : (int) number of calls made before the first timing sample
+                        ⋅- 'memprobe'    : (str) 'tracemalloc', 'rss' or 'fork', see memprobe.py
+                        ⋅- 'lenmethod'   : (str) 'bytes' (UTF-8 length) or 'str' (characters),
+                        ⋅                  length of an encoded str, see serializers.py:_len()
+                        ⋅- 'order'       : (str) 'sorted', 'shuffle', 'roundrobin' or 'latinsquare',
+                        ⋅                  see scheduler.py
+                        ⋅- 'rounds'      : (int) number of rounds, see scheduler.py
+                        ⋅- 'seed'        : (int) seed of the random generator used by 'shuffle'
+    """
+    method = dict(METHOD_DEFAULTS)
+
+    for item in method_string.split(";"):
+        item = item.strip()
+        if not item:
+            continue
+
+        if "=" not in item:
+            msgerror(f"(ERRORID057) Ill-formed --method string: what is '{item}' ? "
+                     "Expected format is 'key=value'.")
+            return False, None
+
+        key, value = (part.strip() for part in item.split("=", 1))
+
+        if key not in METHOD_DEFAULTS:
+            msgerror(f"(ERRORID058) Ill-formed --method string: unknown key '{key}'. "
+                     f"Known keys are {tuple(METHOD_DEFAULTS)} .")
+            return False, None
+
+        if key == "timeitnumber" and value == "auto":
+            method[key] = None
+        elif key in ("timeitnumber", "repeat", "rounds"):
+            method[key] = read_positive_int(key, value, minimum=1)
+        elif key in ("warmup", "seed"):
+            method[key] = read_positive_int(key, value, minimum=0)
+        elif key == "mintime":
+            try:
+                method[key] = float(value)
+            except ValueError:
+                method[key] = None
+            # with 'inf' or 'nan', the calibration (see timing.py) would never end:
+            if method[key] is None or not math.isfinite(method[key]) or method[key] <= 0:
+                msgerror(f"(ERRORID059) Ill-formed --method string: '{key}' must be "
+                         f"a strictly positive finite number, not '{value}'.")
+                method[key] = None
+        elif key == "memprobe":
+            if value not in MEMPROBES:
+                msgerror(f"(ERRORID061) Ill-formed --method string: '{key}' must be "
+                         f"one of {MEMPROBES}, not '{value}'.")
+                return False, None
+            if not is_memprobe_available(value):
+                msgerror(f"(ERRORID062) Ill-formed --method string: '{key}={value}' "
+                         "can't be used on this platform.")
+                return False, None
+            method[key] = value
+        elif key == "lenmethod":
+            if value not in ("bytes", "str"):
+                msgerror(f"(ERRORID076) Ill-formed --method string: '{key}' must be "
+                         f"'bytes' or 'str', not '{value}'.")
+                return False, None
+            method[key] = value
+        elif key == "order":
+            if value not in SCHEDULE_ORDERS:
+                msgerror(f"(ERRORID083) Ill-formed --method string: '{key}' must be "
+                         f"one of {SCHEDULE_ORDERS}, not '{value}'.")
+                return False, None
+            method[key] = value
+
+        if method[key] is None and not (key == "timeitnumber" and value == "auto"):
+            return False, None
+
+    return True, method
+
+
+def read_positive_int(key,
+                      value,
+                      minimum):
+    """
+        read_positive_int()
+
+        Convert <value> into an integer greater or equal to <minimum>.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (str)key    : --method key, only used by the error message
+        o  (str)value  : the string to be converted
+        o  (int)minimum: minimal accepted value
+
+        RETURNED VALUE: (None|int)the integer or None if <value> can't be accepted.
+    """
+    try:
+        res = int(value)
+    except ValueError:
+        res = None
+
+    if res is None or res < minimum:
+        msgerror(f"(ERRORID060) Ill-formed --method string: '{key}' must be "
+                 f"an integer greater or equal to {minimum}, not '{value}'.")
+        return None
+
+    return res
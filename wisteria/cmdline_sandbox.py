@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/cmdline_sandbox.py
+
+    Just the parsing of the --sandbox argument.
+    ___________________________________________________________________________
+
+    o  parse_sandbox_argument(sandbox_string)
+"""
+import math
+
+from wisteria.globs import SANDBOX_DEFAULTS
+from wisteria.msg import msgerror
+
+
+# accepted values for the 'mode' of --sandbox:
+SANDBOX_MODES = ("off", "on")
+
+
+def parse_sandbox_argument(sandbox_string):
+    """
+        parse_sandbox_argument()
+
+        Parse the --sandbox string <sandbox_string>.
+
+        (pimydoc)command line help for --sandbox(full version)
+        ⋅A string like 'mode;key=value;key=value' describing how the
+        ⋅transcodings are isolated from each other. Accepted modes are:
+        ⋅* 'off': the transcodings are computed by the main process (or by the
+        ⋅  processes of --jobs): a serializer crashing the interpreter stops the
+        ⋅  program;
+        ⋅* 'on': each transcoding is computed by a new forked process, killed if it
+        ⋅  lasts too long: crashes, timeouts and memory exhaustions become results
+        ⋅  (see report sections B1a and B2a), the other transcodings going on.
+        ⋅Setting a key implies 'on'.
+        ⋅
+        ⋅Accepted keys are (default values between brackets):
+        ⋅* 'timeout': a transcoding lasting more than 'timeout' seconds is killed [60]
+        ⋅* 'maxmemory': maximal memory (MB) a transcoding may allocate, see
+        ⋅  resource.setrlimit(RLIMIT_AS) (Unix only) [no limit]
+        ⋅
+        ⋅e.g. --sandbox="on"
+        ⋅     --sandbox="timeout=10;maxmemory=500"
+        _______________________________________________________________________
+
+        ARGUMENT: (str)sandbox_string, the --sandbox string
+
+        RETURNED VALUE: ((bool)parsing_success, (None|dict)SANDBOX)
+
+                        (pimydoc)SANDBOX format
+                        ⋅SANDBOX[(str)key] = value; keys are those of SANDBOX_DEFAULTS.
+                        ⋅Initialized by cmdline_sandbox.py:parse_sandbox_argument().
+                        ⋅- 'mode'     : (str) 'off' (no sandbox) or 'on' (each transcoding is
+                        ⋅               computed by a new process, see jobs.py)
+                        ⋅- 'timeout'  : (float) a sandboxed transcoding lasting more than
+                        ⋅               'timeout' seconds is killed
+                        ⋅- 'maxmemory': (None|float) maximal memory (MB) a sandboxed transcoding
+                        ⋅               may allocate; None if there's no limit
+    """
+    sandbox = dict(SANDBOX_DEFAULTS)
+
+    for item in sandbox_string.split(";"):
+        item = item.strip()
+        if not item:
+            continue
+
+        if "=" not in item:
+            if item not in SANDBOX_MODES:
+                msgerror(f"(ERRORID077) Ill-formed --sandbox string: unknown mode '{item}'. "
+                         f"Known modes are {SANDBOX_MODES} .")
+                return False, None
+            sandbox["mode"] = item
+            continue
+
+        key, value = (part.strip() for part in item.split("=", 1))
+
+        if key not in ("timeout", "maxmemory"):
+            msgerror(f"(ERRORID078) Ill-formed --sandbox string: unknown key '{key}'. "
+                     "Known keys are ('timeout', 'maxmemory') .")
+            return False, None
+
+        try:
+            sandbox[key] = float(value)
+        except ValueError:
+            sandbox[key] = None
+        # 'inf' and 'nan' are accepted by float() but can't be used as a timeout or a limit:
+        if sandbox[key] is None or not math.isfinite(sandbox[key]) or sandbox[key] <= 0:
+            msgerror(f"(ERRORID079) Ill-formed --sandbox string: '{key}' must be "
+                     f"a strictly positive finite number, not '{value}'.")
+            return False, None
+        sandbox["mode"] = "on"
+
+    return True, sandbox
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/cmdline_stages.py
+
+    Just the parsing of the --stages argument.
+    ___________________________________________________________________________
+
+    o  parse_stages_argument(stages_string)
+"""
+from wisteria.globs import STAGES_DEFAULTS
+from wisteria.msg import msgerror
+
+
+# accepted parameters for each stage:
+STAGES_PARAMETERS = {
+    "compress": tuple(f"zlib{level}" for level in range(10)) + ("bz2", "lzma"),
+    "mmap": ("fsync",),
+    "stream": ("bytesio", "file", "pipe"),
+}
+
+
+def parse_stages_argument(stages_string):
+    """
+        parse_stages_argument()
+
+        Parse the --stages string <stages_string>.
+
+        (pimydoc)command line help for --stages(full version)
+        ⋅Extra measures made after each transcoding, a string like
+        ⋅'stage;stage=parameter,parameter':
+        ⋅- default value: "none", i.e. no extra measure
+        ⋅
+        ⋅Accepted stages are (default parameters between brackets):
+        ⋅* 'compress': the encoded object is compressed then decompressed by
+        ⋅  each codec [zlib6,bz2,lzma]:
+        ⋅  - 'zlib0' ... 'zlib9': zlib with this compression level;
+        ⋅  - 'bz2', 'lzma': the bz2 and lzma modules with their default settings.
+        ⋅  Compressed length, ratio and (de)compression times are shown in report
+        ⋅  section B8; the first codec is used by the hall of fame and the graphs.
+        ⋅* 'mmap': the encoded object is written into a temp file and decoded
+        ⋅  from a memoryview of this file mapped in memory by mmap [no parameter]:
+        ⋅  - 'fsync': os.fsync() is called by each write.
+        ⋅  Only marshal and pickle directly decode the mmap-backed buffer; the
+        ⋅  other serializers decode a bytes copy of it. Write time, decode time
+        ⋅  and buffer copies are shown in report section B7.
+        ⋅* 'stream': the object is written by dump(obj, fp) and read back by
+        ⋅  load(fp) through each medium [bytesio,file,pipe]:
+        ⋅  - 'bytesio': an io.BytesIO object;
+        ⋅  - 'file': a temporary file on disk;
+        ⋅  - 'pipe': a pipe whose other end is read/written by another thread.
+        ⋅  Lists and tuples are also written as a stream of documents if the
+        ⋅  serializer can do it (JSON Lines, yaml dump_all(), Ion streams).
+        ⋅  Only json, marshal, pickle, pyyaml and simpleion have such functions.
+        ⋅  Time-to-first-byte, throughput and peak memory are shown in report
+        ⋅  section B6.
+        ⋅
+        ⋅e.g. --stages="stream"
+        ⋅     --stages="stream=bytesio,pipe"
+        ⋅     --stages="mmap=fsync;stream"
+        ⋅     --stages="compress=zlib1,zlib9,lzma"
+        _______________________________________________________________________
+
+        ARGUMENT: (str)stages_string, the --stages string
+
+        RETURNED VALUE: ((bool)parsing_success, (None|dict)STAGES)
+
+                        (pimydoc)STAGES format
+                        ⋅STAGES[(str)stage] = (tuple of str)parameters; the stages are the keys
+                        ⋅of STAGES_DEFAULTS.
+                        ⋅Initialized by cmdline_stages.py:parse_stages_argument() from --stages;
+                        ⋅{} if no extra stage has to be measured.
+                        ⋅- 'compress': (tuple of str) codecs among 'zlib0'...'zlib9', 'bz2', 'lzma',
+                        ⋅              see stage_compress.py
+                        ⋅- 'mmap'  : (tuple of str) () or ('fsync',), see stage_mmap.py
+                        ⋅- 'stream': (tuple of str) media among 'bytesio', 'file' and 'pipe',
+                        ⋅            see stage_stream.py
+    """
+    if stages_string.strip() == "none":
+        return True, {}
+
+    stages = {}
+
+    for item in stages_string.split(";"):
+        item = item.strip()
+        if not item:
+            continue
+
+        stage, _, parameters = (part.strip() for part in item.partition("="))
+
+        if stage not in STAGES_DEFAULTS:
+            msgerror(f"(ERRORID074) Ill-formed --stages string: unknown stage '{stage}'. "
+                     f"Known stages are {tuple(STAGES_DEFAULTS)} .")
+            return False, None
+
+        if not parameters:
+            stages[stage] = STAGES_DEFAULTS[stage]
+            continue
+
+        stages[stage] = tuple(parameter.strip() for parameter in parameters.split(",")
+                              if parameter.strip())
+        for parameter in stages[stage]:
+            if parameter not in STAGES_PARAMETERS[stage]:
+                msgerror(f"(ERRORID075) Ill-formed --stages string: unknown parameter "
+                         f"'{parameter}' for stage '{stage}'. "
+                         f"Known parameters are {STAGES_PARAMETERS[stage]} .")
+                return False, None
+
+    return True, stages
@@ -30,7 +30,8 @@
     PGN reader+writer (https://en.wikipedia.org/wiki/Portable_Game_Notation).
     Regular chess only; no sophisticated rules (but castling, en passant and
     promotion are known). This is a very simple version of what a real PGN reader/writer might
-    look like: no optimized storage, no move validation.
+    look like: no optimized storage (but see ChessBoard64, used while reading), no move
+    validation.
 
     With this module you can read a .pgn file, play the game move by move and write the game in
     another file. PGN-files containing several games are correctly read and written.
@@ -53,12 +54,16 @@
     o  ChessError class
     o  ChessGameTags class
     o  ChessPiece class
+    o  CHESSPIECES
+    o  get_chesspiece(color=COLOR_NOCOLOR, nature=PIECENATURE_NOPIECE)
     o  ChessMove class
     o  ChessListOfMoves class
     o  ChessGameStatus class
     o  ChessBoard class
+    o  ChessBoard64 class
     o  ChessGame class
     o  ChessGames class
+    o  read_pgnfile__shard(pgnfilename, start, end, boardclass)
 
     o  fill(obj)
     o  works_as_expected()
@@ -68,7 +73,10 @@
 #   pylint: disable=too-few-public-methods
 #   pylint: disable=too-many-nested-blocks
 #   pylint: disable=too-many-arguments
+import bisect
 import copy
+import mmap
+import multiprocessing
 import re
 from dataclasses import dataclass
 
@@ -167,6 +175,11 @@ class ChessGameTags(dict, Iaswn):
 class ChessPiece(Iaswn):
     """
         ChessPiece class
+
+        All boards share the 13 ChessPiece objects returned by get_chesspiece()
+        (flyweight pattern). Unlike cwc_default.py:ChessPiece, ChessPiece
+        objects have a __dict__ and aren't immutable: Iaswn encodes the
+        __dict__ of an object and decodes it by setting its attributes.
         _______________________________________________________________________
 
         o  piece2unicode/unicode2piece
@@ -175,6 +188,7 @@ class ChessPiece(Iaswn):
         o  (int)nature, e.g. PIECENATURE_PAWN
 
         o  __eq__(self, other)
+        o  from_unicode_string(string)
     """
     color: int = COLOR_NOCOLOR
     nature: int = PIECENATURE_NOPIECE
@@ -205,21 +219,41 @@ class ChessPiece(Iaswn):
         """ChessPiece.__repr__()"""
         return f"ChessPiece: {self.color=}; {self.nature=}"
 
+    @staticmethod
+    def from_unicode_string(string):
+        """
+            ChessPiece.from_unicode_string()
+
+            Return the ChessPiece object described by <string>, e.g. '♙'.
+        """
+        nature, color = ChessPiece.unicode2piece[string]
+        return get_chesspiece(color, nature)
+
     def human_repr(self):
         """ChessPiece.human_repr()"""
         return ChessPiece.piece2unicode[self.nature, self.color]
 
-    def init_from_unicode_string(self,
-                                 string):
-        """ChessPiece.init_from_unicode_string()"""
-        self.nature, self.color = ChessPiece.unicode2piece[string]
-        return self
-
     def is_empty(self):
         """ChessPiece.is_empty()"""
         return self.color == COLOR_NOCOLOR and self.nature == PIECENATURE_NOPIECE
 
 
+# CHESSPIECES[(int)color, (int)nature] = (ChessPiece)piece, see get_chesspiece()
+CHESSPIECES = {(color, nature): ChessPiece(color=color, nature=nature)
+               for nature, color in ChessPiece.piece2unicode}
+
+
+def get_chesspiece(color=COLOR_NOCOLOR,
+                   nature=PIECENATURE_NOPIECE):
+    """
+        get_chesspiece()
+
+        Return the ChessPiece object shared by all boards for this (color, nature),
+        e.g. get_chesspiece() for an empty square.
+    """
+    return CHESSPIECES[color, nature]
+
+
 @dataclass
 class ChessMove(Iaswn):
     """
@@ -410,6 +444,7 @@ class ChessBoard(Iaswn):
         _______________________________________________________________________
 
         o  moves_descr
+        o  startpos
 
         o  (dict)board
         o  (ChessGameStatus)pieces_status
@@ -428,6 +463,7 @@ class ChessBoard(Iaswn):
         o  set_startpos(self)
         o  set_xy(self, xy, value)
         o  set_xy_empty(self, xy)
+        o  to_chessboard(self)
         o  update_by_playing_a_move(self, move)
         o  which_piece_could_go_to(self, piece, coord_after, movetype)
         o  who_attacks(self, xy)
@@ -447,6 +483,16 @@ class ChessBoard(Iaswn):
                                        (0, -1), (0, +1), (-1, 0), (+1, 0)),),
                    }
 
+    # the 64 squares, see .init_from_unicode_string():
+    startpos = "♜♞♝♛♚♝♞♜" \
+               "♟♟♟♟♟♟♟♟" \
+               "________" \
+               "________" \
+               "________" \
+               "________" \
+               "♙♙♙♙♙♙♙♙" \
+               "♖♘♗♕♔♗♘♖"
+
     def __eq__(self,
                other):
         """
@@ -513,7 +559,7 @@ class ChessBoard(Iaswn):
         """ChessBoard.init_from_unicode_string()"""
         index = 0
         for xy in self.iter_through_all_squares():
-            self.set_xy(xy, ChessPiece().init_from_unicode_string(string[index]))
+            self.set_xy(xy, ChessPiece.from_unicode_string(string[index]))
             index += 1
 
     def is_empty_or_is_this_piece(self,
@@ -535,22 +581,55 @@ class ChessBoard(Iaswn):
 
             Return True if board[x0, y0] moving to bord[x1, y1] is impossible since board[x0, y0]
             is a king pinned piece.
+
+            No board copy: a king is moved on <self> then moved back, the king
+            being pinned if more pieces attack him after the move; any other
+            piece is pinned if it is the only piece between its king and an
+            enemy bishop/rook/queen and if it leaves the ray between them.
         """
         # <piece> is the piece that may be pinned:
         piece = self.get_xy(xy0)
-        # <king> is the king of <piece>:
-        king = self.get_king_coord(piece.color)
-        len0 = len(self.who_attacks(king))
 
-        # <board> is an alternative board with <piece> being moved to (x1, y1):
-        _board = self.copy()
-        _board.set_xy_empty(xy0)
-        _board.set_xy(xy1, piece)
-        # the king may have just moved, so we update his position:
-        king = _board.get_king_coord(piece.color)
-        len1 = len(_board.who_attacks(king))
+        if piece.nature == PIECENATURE_KING:
+            len0 = len(self.who_attacks(xy0))
+            captured = self.get_xy(xy1)
+            self.set_xy_empty(xy0)
+            self.set_xy(xy1, piece)
+            len1 = len(self.who_attacks(xy1))
+            self.set_xy(xy1, captured)
+            self.set_xy(xy0, piece)
+            return len0 < len1
 
-        return len0 < len1
+        # <king> is the king of <piece>:
+        king = self.get_king_coord(piece.color)
+        deltax, deltay = xy0[0]-king[0], xy0[1]-king[1]
+        if deltax != 0 and deltay != 0 and abs(deltax) != abs(deltay):
+            # <piece> can't hide its king from a bishop/rook/queen.
+            return False
+
+        # (deltax, deltay): the ray from <king> through <piece>
+        deltax, deltay = (deltax > 0) - (deltax < 0), (deltay > 0) - (deltay < 0)
+        if deltax == 0 or deltay == 0:
+            attackers = (PIECENATURE_ROOK, PIECENATURE_QUEEN)
+        else:
+            attackers = (PIECENATURE_BISHOP, PIECENATURE_QUEEN)
+
+        ray = []  # squares from <king> (excluded) to the first piece beyond <piece> (included)
+        x, y = king[0]+deltax, king[1]+deltay
+        while not ChessBoard.xy_is_off_the_board((x, y)):
+            ray.append((x, y))
+            if (x, y) != xy0:
+                obj = self.get_xy((x, y))
+                if not obj.is_empty():
+                    if xy0 not in ray:
+                        # <obj> is between <king> and <piece>:
+                        return False
+                    return obj.color != piece.color and \
+                        obj.nature in attackers and \
+                        tuple(xy1) not in ray
+            x, y = x+deltax, y+deltay
+
+        return False
 
     @staticmethod
     def iter_through_all_squares():
@@ -565,16 +644,9 @@ class ChessBoard(Iaswn):
         self.pieces_status = ChessGameStatus()
 
         for xy in self.iter_through_all_squares():
-            self.set_xy(xy, ChessPiece())
+            self.set_xy(xy, get_chesspiece())
 
-        self.init_from_unicode_string("♜♞♝♛♚♝♞♜"
-                                      "♟♟♟♟♟♟♟♟"
-                                      "________"
-                                      "________"
-                                      "________"
-                                      "________"
-                                      "♙♙♙♙♙♙♙♙"
-                                      "♖♘♗♕♔♗♘♖")
+        self.init_from_unicode_string(ChessBoard.startpos)
 
     def set_xy(self,
                xy,
@@ -585,7 +657,15 @@ class ChessBoard(Iaswn):
     def set_xy_empty(self,
                      xy):
         """ChessBoard.set_xy_empty()"""
-        self.set_xy(xy, ChessPiece())
+        self.set_xy(xy, get_chesspiece())
+
+    def to_chessboard(self):
+        """
+            ChessBoard.to_chessboard()
+
+            Return a ChessBoard equal to <self>, i.e. <self> itself.
+        """
+        return self
 
     def update_by_playing_a_move(self,
                                  move):
@@ -601,8 +681,8 @@ class ChessBoard(Iaswn):
             if not move.promotion:
                 self.set_xy(after, piece)
             else:
-                self.set_xy(after, ChessPiece(nature=move.promotion,
-                                              color=piece.color))
+                self.set_xy(after, get_chesspiece(color=piece.color,
+                                                  nature=move.promotion))
 
             if move.enpassant:
                 if piece.color == COLOR_WHITE:
@@ -710,8 +790,8 @@ class ChessBoard(Iaswn):
         x, y = xy
 
         # ---- do a pawn attack (x, y) ? --------------------------------------
-        piece = ChessPiece(color=_color,
-                           nature=PIECENATURE_PAWN)
+        piece = get_chesspiece(color=_color,
+                               nature=PIECENATURE_PAWN)
         if target.color == COLOR_WHITE:
             add_to_res_if_rightpiece((x+1, y-1), piece)
             add_to_res_if_rightpiece((x-1, y-1), piece)
@@ -720,8 +800,8 @@ class ChessBoard(Iaswn):
             add_to_res_if_rightpiece((x-1, y+1), piece)
 
         # ---- do a knight attack (x, y) ? ------------------------------------
-        piece = ChessPiece(color=_color,
-                           nature=PIECENATURE_KNIGHT)
+        piece = get_chesspiece(color=_color,
+                               nature=PIECENATURE_KNIGHT)
         add_to_res_if_rightpiece((x-2, y-1), piece)
         add_to_res_if_rightpiece((x-2, y+1), piece)
         add_to_res_if_rightpiece((x+2, y-1), piece)
@@ -736,8 +816,8 @@ class ChessBoard(Iaswn):
                        PIECENATURE_ROOK,
                        PIECENATURE_QUEEN,
                        PIECENATURE_KING):
-            piece = ChessPiece(color=_color,
-                               nature=nature)
+            piece = get_chesspiece(color=_color,
+                                   nature=nature)
             deltamax = ChessBoard.moves_descr[nature][0]
             for deltax, deltay in ChessBoard.moves_descr[nature][1]:
                 for delta in range(1, deltamax):
@@ -762,6 +842,122 @@ class ChessBoard(Iaswn):
         return not ((0 <= xy[0] <= 7) and (0 <= xy[1] <= 7))
 
 
+class ChessBoard64(ChessBoard):
+    """
+        ChessBoard64 class
+
+        Compact alternative to ChessBoard, with the same API: the 64 squares are
+        stored in a bytearray, one byte per square.
+
+            index of (x, y) : x + y*8, i.e. squares are stored in the order of
+                              .iter_through_all_squares()
+            byte            : (piece nature << 2) | piece color, i.e. 0 for an
+                              empty square
+
+        A ChessBoard64 is equal to a ChessBoard storing the same position.
+
+        ChessGames.read_pgn() reads the games with a ChessBoard64 board and
+        stores a ChessBoard (see .to_chessboard()), the only board the
+        serializers have to encode.
+        _______________________________________________________________________
+
+        o  square2piece
+
+        o  (bytearray)board
+        o  (ChessGameStatus)pieces_status
+
+        o  __eq__(self, other)
+        o  copy(self)
+        o  get_king_coord(self, color)
+        o  get_xy(self, xy)
+        o  set_startpos(self)
+        o  set_xy(self, xy, value)
+        o  set_xy_empty(self, xy)
+        o  to_chessboard(self)
+    """
+    # square2piece[(int)byte] = (ChessPiece)piece
+    square2piece = {piece.nature << 2 | piece.color: piece for piece in CHESSPIECES.values()}
+
+    def __eq__(self,
+               other):
+        """
+            ChessBoard64.__eq__()
+
+            Stricly speaking, not required to read/write PGN files but required
+            to check that everything "works as expected" (see cwc validation).
+
+            Since ChessBoard64 is a subclass of ChessBoard, this method is also
+            called by (ChessBoard)board == (ChessBoard64)board.
+            ___________________________________________________________________
+
+            ARGUMENT: (ChessBoard|ChessBoard64)other, the object compared to self
+
+            RETURNED VALUE: (bool)True if other == self
+        """
+        if isinstance(other, ChessBoard64):
+            return self.board == other.board and \
+                self.pieces_status == other.pieces_status
+
+        return all(self.get_xy(xy) == other.get_xy(xy)
+                   for xy in self.iter_through_all_squares()) and \
+            self.pieces_status == other.pieces_status
+
+    def copy(self):
+        """ChessBoard64.copy()"""
+        # no need to call .set_startpos() through .__init__(): the board is overwritten.
+        res = ChessBoard64.__new__(ChessBoard64)
+        res.board = bytearray(self.board)
+        res.pieces_status = self.pieces_status.copy()
+        return res
+
+    def get_king_coord(self,
+                       color):
+        """
+            ChessBoard64.get_king_coord()
+
+            Return the (x, y) of the <color>(white/black) king
+        """
+        index = self.board.find(PIECENATURE_KING << 2 | color)
+        if index == -1:
+            raise ChessError(f"No king (color: {color}): {self.human_repr()}")
+        return index % 8, index // 8
+
+    def get_xy(self,
+               xy):
+        """ChessBoard64.get_xy()"""
+        return ChessBoard64.square2piece[self.board[xy[0] + xy[1]*8]]
+
+    def set_startpos(self):
+        """ChessBoard64.set_startpos()"""
+        self.board = bytearray(64)
+        self.pieces_status = ChessGameStatus()
+
+        self.init_from_unicode_string(ChessBoard.startpos)
+
+    def set_xy(self,
+               xy,
+               value):
+        """ChessBoard64.set_xy()"""
+        self.board[xy[0] + xy[1]*8] = value.nature << 2 | value.color
+
+    def set_xy_empty(self,
+                     xy):
+        """ChessBoard64.set_xy_empty()"""
+        self.board[xy[0] + xy[1]*8] = 0
+
+    def to_chessboard(self):
+        """
+            ChessBoard64.to_chessboard()
+
+            Return a (dict-based) ChessBoard equal to <self>.
+        """
+        res = ChessBoard()
+        for xy in self.iter_through_all_squares():
+            res.set_xy(xy, self.get_xy(xy))
+        res.pieces_status = self.pieces_status.copy()
+        return res
+
+
 class ChessGame(Iaswn):
     """
         ChessGame class
@@ -782,7 +978,7 @@ class ChessGame(Iaswn):
         o  __eq__(self, other)
         o  __init__(self)
         o  __repr__(self)
-        o  read_pgn(self, lines)
+        o  read_pgn(self, lines, boardclass=ChessBoard64)
         o  read_pgn__doublemove(self, str_doublemove)
         o  read_pgn__listofmoves(self, src)
         o  read_pgn__simplemove(self, str_simplemove)
@@ -884,11 +1080,18 @@ class ChessGame(Iaswn):
         return res
 
     def read_pgn(self,
-                 lines):
-        """ChessGame.read_pgn()"""
+                 lines,
+                 boardclass=ChessBoard64):
+        """
+            ChessGame.read_pgn()
+
+            The moves are played on a <boardclass> board; whatever <boardclass>,
+            self.board is a ChessBoard once the game has been read.
+        """
         success = True
 
         self.listofmoves = ChessListOfMoves()
+        self.board = boardclass()
         try:
             str_listofmoves = []
             for _line in lines:
@@ -912,6 +1115,8 @@ class ChessGame(Iaswn):
             self.errors.append(error)
             success = False
 
+        self.board = self.board.to_chessboard()
+
         return success
 
     def read_pgn__doublemove(self,
@@ -1069,8 +1274,8 @@ class ChessGame(Iaswn):
                     # <piece1_coord_before> is only partially initialized: we only have the column,
                     # as in 'Qab2', 'cxb5'
                     for _x, _y in self.board.which_piece_could_go_to(
-                            piece=ChessPiece(nature=piece1_piecenature,
-                                             color=self.listofmoves.next_player),
+                            piece=get_chesspiece(color=self.listofmoves.next_player,
+                                                 nature=piece1_piecenature),
                             coord_after=piece1_coord_after,
                             movetype=movetype):
                         if _x == piece1_coord_before[0]:
@@ -1089,8 +1294,8 @@ class ChessGame(Iaswn):
                     # <piece1_coord_before> is only partially initialized: we only have the row,
                     # as in 'Q2b2'.
                     for _x, _y in self.board.which_piece_could_go_to(
-                            piece=ChessPiece(nature=piece1_piecenature,
-                                             color=self.listofmoves.next_player),
+                            piece=get_chesspiece(color=self.listofmoves.next_player,
+                                                 nature=piece1_piecenature),
                             coord_after=piece1_coord_after,
                             movetype=movetype):
                         if _y == piece1_coord_before[1]:
@@ -1116,8 +1321,8 @@ class ChessGame(Iaswn):
         # any ambiguity.
         if piece1_coord_before is None:
             _possi = self.board.which_piece_could_go_to(
-                piece=ChessPiece(nature=piece1_piecenature,
-                                 color=self.listofmoves.next_player),
+                piece=get_chesspiece(color=self.listofmoves.next_player,
+                                     nature=piece1_piecenature),
                 coord_after=piece1_coord_after,
                 movetype=movetype)
             if not _possi:
@@ -1257,7 +1462,12 @@ class ChessGames(list, Iaswn):
         _______________________________________________________________________
 
         o  __eq__(self, other)
-        o  read_pgn(self, pgnfilename)
+        o  get_pgnfile_offsets(pgnfilename)
+        o  is_the_first_line_of_a_game(line, inside_header)
+        o  iter_pgn(src, boardclass=ChessBoard64)
+        o  iter_pgn__gamelines(src)
+        o  read_pgn(self, src, boardclass=ChessBoard64)
+        o  read_pgnfile(self, pgnfilename, processes=None, boardclass=ChessBoard64)
         o  write_pgn(self, pgnfilename)
     """
     def __eq__(self,
@@ -1275,11 +1485,106 @@ class ChessGames(list, Iaswn):
         """
         return list.__eq__(self, other)
 
-    def read_pgn(self,
-                 src):
-        """ChessGames.read_pgn()"""
-        success = True
+    @staticmethod
+    def get_pgnfile_offsets(pgnfilename):
+        """
+            ChessGames.get_pgnfile_offsets()
+
+            Return the offsets of the first line of each game of <pgnfilename>,
+            the file being memory-mapped and read line by line: the game
+            boundaries are the ones found by .iter_pgn__gamelines().
+            _______________________________________________________________
+
+            ARGUMENT: (str)pgnfilename
 
+            RETURNED VALUE: (list of int)the offsets, in bytes
+        """
+        offsets = []
+        inside_header = False
+
+        with open(pgnfilename, "rb") as src:
+            # an empty file can't be mapped:
+            if not src.seek(0, 2):
+                return offsets
+
+            with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                offset = 0
+                for _line in iter(mapped.readline, b""):
+                    line = _line.decode("utf-8").strip()
+                    if line:
+                        first_line, inside_header = \
+                            ChessGames.is_the_first_line_of_a_game(line, inside_header)
+                        if first_line or not offsets:
+                            offsets.append(offset)
+                    offset += len(_line)
+
+        return offsets
+
+    @staticmethod
+    def is_the_first_line_of_a_game(line,
+                                    inside_header):
+        """
+            ChessGames.is_the_first_line_of_a_game()
+
+            Say if the (stripped, non-empty) <line> begins a new game, i.e. if
+            <line> is a header line following data lines or a first move line
+            outside a header.
+            _______________________________________________________________
+
+            ARGUMENTS:
+            o  (str)line
+            o  (bool)inside_header: True if the previous line is a header line
+
+            RETURNED VALUE: ((bool)<line> begins a new game,
+                             (bool)<line> is a header line)
+        """
+        is_a_header_line = bool(re.search(ChessGame.regex_pgn_tags, line)) and \
+            not line.startswith("1. ")
+
+        if inside_header:
+            return False, is_a_header_line
+        if is_a_header_line:
+            return True, True
+        return line.startswith("1. "), False
+
+    @staticmethod
+    def iter_pgn(src,
+                 boardclass=ChessBoard64):
+        """
+            ChessGames.iter_pgn()
+
+            Yield the games of <src> one at a time, each game being read as soon
+            as its lines have been read: if <src> yields its lines one at a time
+            (e.g. a file or a DMFile object), the memory used doesn't depend on
+            the number of games in <src>.
+
+            A game that can't be read is yielded too, with a non-empty .errors.
+            _______________________________________________________________
+
+            ARGUMENTS:
+            o  (iterable of str)src: the lines of a .pgn file
+            o  (type)boardclass    : class of the board on which the moves are
+                                     played (see ChessGame.read_pgn()).
+
+            YIELDED VALUE: (ChessGame)game
+        """
+        for lines in ChessGames.iter_pgn__gamelines(src):
+            game = ChessGame()
+            game.read_pgn(lines, boardclass)
+            yield game
+
+    @staticmethod
+    def iter_pgn__gamelines(src):
+        """
+            ChessGames.iter_pgn__gamelines()
+
+            Yield the (stripped, non-empty) lines of each game of <src>.
+            _______________________________________________________________
+
+            ARGUMENT: (iterable of str)src: the lines of a .pgn file
+
+            YIELDED VALUE: (list of str)the lines of a game
+        """
         inside_header = False
         buff = []
 
@@ -1287,40 +1592,92 @@ class ChessGames(list, Iaswn):
             line = _line.strip()
 
             if line:
-                if inside_header:
-                    if re.search(ChessGame.regex_pgn_tags, line) and not line.startswith("1. "):
-                        # we're still in the header.
-                        pass
-                    else:
-                        # we're not in the header anymore.
-                        inside_header = False
-                else:
-                    if re.search(ChessGame.regex_pgn_tags, line) and not line.startswith("1. "):
-                        # we weren't in the header but <line> is a header line.
-                        if buff:
-                            game = ChessGame()
-                            success = success and game.read_pgn(buff)
-                            self.append(game)
-                        buff = []
-                        inside_header = True
-                    else:
-                        # we're still reading data lines that are not in a header.
-                        if line.startswith("1. "):
-                            if buff:
-                                game = ChessGame()
-                                success = success and game.read_pgn(buff)
-                                self.append(game)
-                            buff = []
+                first_line, inside_header = \
+                    ChessGames.is_the_first_line_of_a_game(line, inside_header)
+                if first_line and buff:
+                    yield buff
+                    buff = []
 
                 buff.append(line)
 
         if buff:
-            game = ChessGame()
-            success = success and game.read_pgn(buff)
+            yield buff
+
+    def read_pgn(self,
+                 src,
+                 boardclass=ChessBoard64):
+        """
+            ChessGames.read_pgn()
+
+            Append to <self> all the games of <src>, see .iter_pgn().
+
+            RETURNED VALUE: (bool)True if all the games have been read
+        """
+        success = True
+
+        for game in self.iter_pgn(src, boardclass):
+            success = success and not game.errors
             self.append(game)
 
         return success
 
+    def read_pgnfile(self,
+                     pgnfilename,
+                     processes=None,
+                     boardclass=ChessBoard64):
+        """
+            ChessGames.read_pgnfile()
+
+            Append to <self> all the games of <pgnfilename>, read in parallel:
+            the file is cut at the game boundaries (see .get_pgnfile_offsets())
+            into shards of similar sizes, more shards than processes so that
+            a long game doesn't keep the other processes waiting. Each shard is
+            read by a process of the pool; the games are appended in the order
+            of the file.
+            _______________________________________________________________
+
+            ARGUMENTS:
+            o  (str)pgnfilename
+            o  (None|int)processes: number of processes, None for one process
+                                    per CPU; if 1, no process is created.
+            o  (type)boardclass   : see ChessGame.read_pgn()
+
+            RETURNED VALUE: (bool)True if all the games have been read
+        """
+        offsets = self.get_pgnfile_offsets(pgnfilename)
+        if not offsets:
+            return True
+
+        with open(pgnfilename, "rb") as src:
+            filesize = src.seek(0, 2)
+
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+
+        # each shard begins with the last game beginning before <filesize>*index/<shards_number>:
+        shards_number = min(len(offsets), processes*4)
+        starts = set()
+        for index in range(shards_number):
+            gameindex = bisect.bisect_right(offsets, filesize*index//shards_number) - 1
+            starts.add(offsets[max(gameindex, 0)])
+        starts = sorted(starts)
+        shards = [(pgnfilename, start, end, boardclass)
+                  for start, end in zip(starts, starts[1:]+[filesize])]
+
+        if processes == 1 or len(shards) == 1:
+            gamelists = [read_pgnfile__shard(*shard) for shard in shards]
+        else:
+            with multiprocessing.Pool(processes) as pool:
+                gamelists = pool.starmap(read_pgnfile__shard, shards)
+
+        success = True
+        for games in gamelists:
+            for game in games:
+                success = success and not game.errors
+                self.append(game)
+
+        return success
+
     def write_pgn(self,
                   dest):
         """ChessGames.write_pgn()"""
@@ -1328,3 +1685,27 @@ class ChessGames(list, Iaswn):
             for line in game.write_pgn():
                 dest.write(line+"\n")
             dest.write("\n")
+
+
+def read_pgnfile__shard(pgnfilename,
+                        start,
+                        end,
+                        boardclass):
+    """
+        read_pgnfile__shard()
+
+        Read the games of <pgnfilename> between the offsets <start> and <end>;
+        this function is called by the processes of ChessGames.read_pgnfile().
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (str)pgnfilename
+        o  (int)start, (int)end: offsets, in bytes, of the shard
+        o  (type)boardclass    : see ChessGame.read_pgn()
+
+        RETURNED VALUE: (list of ChessGame)the games of the shard
+    """
+    with open(pgnfilename, "rb") as src:
+        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            lines = mapped[start:end].decode("utf-8").split("\n")
+    return list(ChessGames.iter_pgn(lines, boardclass))
@@ -24,22 +24,15 @@
     initialize() and works_as_expected() functions for all cwc/pgnreader/ classes.
     ___________________________________________________________________________
 
+    o  PGNDATA
     o  initialize(obj)
     o  works_as_expected(obj)
 """
 from wisteria.dmfile import DMFile
 
-
-def initialize(obj):
-    """
-        initialize() function
-        _______________________________________________________________________
-
-        ARGUMENT: <obj>, the object to be initialized
-
-        RETURNED OBJECT: <obj>, the now initialized object
-    """
-    data = """
+# the two games read by initialize(), also repeated by the 'chessgames' data
+# generator (see wisteria/datagen.py):
+PGNDATA = """
 [Event "Aimchess US Rapid Prelim"]
 [Site "chess24.com INT"]
 [Date "2021.08.29"]
@@ -87,9 +80,20 @@ Ng4+ 48. Kd5 Kxb3 0-1
 27. Bd2 Ndf6 28. Qh3 Nd5 29. c4 Ndf6 30. Rad1 Qe8 31. Bf4 Rc8
 32. Qa3 Bb7 33. Qxa7 Ba8 34. Qxb6 g5 35. Bg3 Nd7 36. Qb3 f5
 37. f3 Kg7 38. c5 Ndf6 39. Nc4 1-0
+"""
+
+
+def initialize(obj):
+    """
+        initialize() function
+        _______________________________________________________________________
+
+        ARGUMENT: <obj>, the object to be initialized
+
+        RETURNED OBJECT: <obj>, the now initialized object
     """
     with DMFile(":memory:") as src:
-        src.write(data)
+        src.write(PGNDATA)
         if obj.read_pgn(src) is False:
             return None
     return obj
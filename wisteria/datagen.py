@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/datagen.py
+
+    Data generators: families of data objects whose size N is given by the
+    \\[data generators] section of the config file, e.g.
+
+        [data generators]
+        list(int) = 100;10000;1000000
+
+    Each generated data object is added to wisteria.globs.DATA under a name
+    like 'datagen:list(int)[10000]' (see generated_data_name()), so that the
+    report can show how each serializer scales with N (report section B4).
+
+    (pimydoc)data generators
+    ⋅* bytes            : N bytes
+    ⋅* chessgames       : a cwc ChessGames object of N games, read in parallel from a .pgn file
+    ⋅* dict(str->float) : a dict of N (str)key -> (float)value
+    ⋅* list(int)        : a list of N integers
+    ⋅* record(wide)     : a dict with N fields of different types (int, str, float, bool)
+    ⋅* tree(depth)      : a binary tree of depth N, i.e. 2**N-1 nodes; N <= 24
+    ___________________________________________________________________________
+
+    o  compute_scaling(results)
+    o  fit_throughput(points)
+    o  gen_bytes(size)
+    o  gen_chessgames(size)
+    o  gen_dict_str_float(size)
+    o  gen_list_int(size)
+    o  gen_record_wide(size)
+    o  gen_tree_depth(size)
+    o  generated_data_name(family, size)
+    o  get_generated_data_names(config)
+    o  get_generated_families(data_names)
+    o  get_scaling_graph_filename(family)
+    o  init_generated_data(config)
+    o  parse_generated_data_name(data_name)
+    o  read_datagen_sizes(family, sizes)
+"""
+import os
+import re
+
+import wisteria.globs
+from wisteria.cwc.pgnreader.cwc_default import ChessGames
+from wisteria.cwc.pgnreader.works_as_expected import PGNDATA
+from wisteria.globs import VERBOSITY_DEBUG
+from wisteria.msg import msgdebug, msgerror
+from wisteria.utils import get_stage_tmpfilename
+
+
+# prefix of the name of all generated data objects:
+DATAGEN_PREFIX = "datagen:"
+
+# e.g. 'datagen:list(int)[10000]' > 'list(int)', '10000'
+DATAGEN_NAME_REGEX = re.compile(r"^datagen:(?P<family>.+)\[(?P<size>\d+)\]$")
+
+
+def gen_bytes(size):
+    """
+        gen_bytes()
+
+        Return <size> bytes.
+        _______________________________________________________________________
+
+        ARGUMENT: (int)size
+
+        RETURNED VALUE: (bytes)the generated data object
+    """
+    return (bytes(range(256)) * (size // 256 + 1))[:size]
+
+
+def gen_chessgames(size):
+    """
+        gen_chessgames()
+
+        Return a ChessGames object (wisteria/cwc/pgnreader/cwc_default.py) of
+        <size> games: the games of PGNDATA are written again and again in a
+        temp .pgn file, read in parallel by ChessGames.read_pgnfile().
+        _______________________________________________________________________
+
+        ARGUMENT: (int)size
+
+        RETURNED VALUE: (ChessGames)the generated data object
+    """
+    gameslines = list(ChessGames.iter_pgn__gamelines(PGNDATA.split("\n")))
+
+    tmpfilename = get_stage_tmpfilename("datagen")
+    with open(tmpfilename, "w", encoding="utf-8") as dest:
+        for index in range(size):
+            dest.write("\n".join(gameslines[index % len(gameslines)]) + "\n\n")
+
+    res = ChessGames()
+    res.read_pgnfile(tmpfilename)
+    os.remove(tmpfilename)
+    return res
+
+
+def gen_dict_str_float(size):
+    """
+        gen_dict_str_float()
+
+        Return a dict of <size> (str)key -> (float)value.
+        _______________________________________________________________________
+
+        ARGUMENT: (int)size
+
+        RETURNED VALUE: (dict)the generated data object
+    """
+    return {f"key{index}": index/7 for index in range(size)}
+
+
+def gen_list_int(size):
+    """
+        gen_list_int()
+
+        Return a list of <size> integers, small and big ones.
+        _______________________________________________________________________
+
+        ARGUMENT: (int)size
+
+        RETURNED VALUE: (list)the generated data object
+    """
+    return [index*index for index in range(size)]
+
+
+def gen_record_wide(size):
+    """
+        gen_record_wide()
+
+        Return a dict with <size> fields of different types.
+        _______________________________________________________________________
+
+        ARGUMENT: (int)size
+
+        RETURNED VALUE: (dict)the generated data object
+    """
+    return {f"field{index}": (index, str(index), index/7, index % 2 == 0)[index % 4]
+            for index in range(size)}
+
+
+def gen_tree_depth(size):
+    """
+        gen_tree_depth()
+
+        Return a binary tree of depth <size>: each node is a dict
+        {"value": (int), "children": (list)subnodes}.
+        _______________________________________________________________________
+
+        ARGUMENT: (int)size
+
+        RETURNED VALUE: (dict)the generated data object
+    """
+    if size <= 1:
+        return {"value": size, "children": []}
+    return {"value": size, "children": [gen_tree_depth(size-1), gen_tree_depth(size-1)]}
+
+
+# (pimydoc)data generators
+# ⋅* bytes            : N bytes
+# ⋅* chessgames       : a cwc ChessGames object of N games, read in parallel from a .pgn file
+# ⋅* dict(str->float) : a dict of N (str)key -> (float)value
+# ⋅* list(int)        : a list of N integers
+# ⋅* record(wide)     : a dict with N fields of different types (int, str, float, bool)
+# ⋅* tree(depth)      : a binary tree of depth N, i.e. 2**N-1 nodes; N <= 24
+#
+# family name > (generator function, maximal size)
+GENERATORS = {"bytes": (gen_bytes, 10**9),
+              "chessgames": (gen_chessgames, 10**6),
+              "dict(str->float)": (gen_dict_str_float, 10**8),
+              "list(int)": (gen_list_int, 10**8),
+              "record(wide)": (gen_record_wide, 10**8),
+              "tree(depth)": (gen_tree_depth, 24),
+              }
+
+
+def compute_scaling(results):
+    """
+        compute_scaling()
+
+        Gather the results about the generated data objects, family by family.
+        _______________________________________________________________________
+
+        ARGUMENT:
+        o  results: (SerializationResults)a dict of
+                    [(str)serializer][(str)data_name] = SerializationResult
+
+        RETURNED VALUE: a dict [(str)family][(str)serializer] =
+                        list of (size, encoding_time, decoding_time, encoding_strlen),
+                        sorted by size; a time or a length may be None.
+    """
+    res = {}
+    for serializer in results.serializers:
+        for data_name in results[serializer]:
+            family_and_size = parse_generated_data_name(data_name)
+            if family_and_size is None:
+                continue
+            family, size = family_and_size
+            result = results[serializer][data_name]
+            point = (size, None, None, None)
+            if result is not None and result.encoding_success:
+                point = (size,
+                         result.encoding_time,
+                         result.decoding_time if result.decoding_success else None,
+                         result.encoding_strlen)
+            res.setdefault(family, {}).setdefault(serializer, []).append(point)
+
+    for family_data in res.values():
+        for points in family_data.values():
+            points.sort()
+    return res
+
+
+def fit_throughput(points):
+    """
+        fit_throughput()
+
+        Fit by least squares a line time = a + b*length through <points> and
+        return the throughput 1/b in MB/s: the constant cost <a> of a call
+        doesn't distort the throughput.
+        _______________________________________________________________________
+
+        ARGUMENT: (iterable of (None|int)length, (None|float)time)points;
+                  points with a None value are ignored.
+
+        RETURNED VALUE: (None|float)the throughput, in MB/s (10**6 bytes per
+                        second), or None if it can't be computed (less than 2
+                        distinct lengths, non-increasing times).
+    """
+    points = tuple((length, time) for length, time in points
+                   if length is not None and time is not None)
+    if len(set(length for length, _ in points)) < 2:
+        return None
+
+    mean_length = sum(length for length, _ in points) / len(points)
+    mean_time = sum(time for _, time in points) / len(points)
+    covariance = sum((length-mean_length)*(time-mean_time) for length, time in points)
+    variance = sum((length-mean_length)**2 for length, _ in points)
+
+    slope = covariance / variance  # seconds per byte
+    if slope <= 0:
+        return None
+    return 1 / slope / 10**6
+
+
+def generated_data_name(family,
+                        size):
+    """
+        generated_data_name()
+
+        Return the data name of the data object of <family> whose size is <size>.
+            ex: 'list(int)', 100 > 'datagen:list(int)[100]'
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (str)family: a GENERATORS key
+        o  (int)size
+
+        RETURNED VALUE: (str)the data name
+    """
+    return f"{DATAGEN_PREFIX}{family}[{size}]"
+
+
+def get_generated_data_names(config):
+    """
+        get_generated_data_names()
+
+        Return the names of the data objects defined in the \\[data generators]
+        section of <config>.
+        _______________________________________________________________________
+
+        ARGUMENT: (None|dict)config, the value returned by read_cfgfile()
+
+        RETURNED VALUE: (tuple of str)the data names
+    """
+    if config is None:
+        return tuple()
+    return tuple(generated_data_name(family, size)
+                 for family, sizes in config["data generators"].items()
+                 for size in sizes)
+
+
+def get_generated_families(data_names):
+    """
+        get_generated_families()
+
+        Return the families of the generated data objects among <data_names>.
+        _______________________________________________________________________
+
+        ARGUMENT: (iterable of str)data_names, e.g. results.dataobjs or
+                  wisteria.globs.DATA
+
+        RETURNED VALUE: (sorted list of str)the families
+    """
+    return sorted(set(parse_generated_data_name(data_name)[0]
+                      for data_name in data_names
+                      if parse_generated_data_name(data_name) is not None))
+
+
+def get_scaling_graph_filename(family):
+    """
+        get_scaling_graph_filename()
+
+        Return the name of the scaling graph file of <family>.
+            ex: 'dict(str->float)' > 'reports/report_scaling_dict_str_float.png'
+        _______________________________________________________________________
+
+        ARGUMENT: (str)family, a GENERATORS key
+
+        RETURNED VALUE: (str)the file name
+    """
+    suffix = "_scaling_" + "_".join(re.findall(r"[a-z0-9]+", family))
+    return wisteria.globs.GRAPHS_GENERIC_FILENAME.replace("__SUFFIX__", suffix)
+
+
+def init_generated_data(config):
+    """
+        init_generated_data()
+
+        Generate the data objects defined in the \\[data generators] section of
+        <config> and add them to wisteria.globs.DATA .
+        _______________________________________________________________________
+
+        ARGUMENT: (dict)config, the value returned by read_cfgfile()
+    """
+    for family, sizes in config["data generators"].items():
+        for size in sizes:
+            data_name = generated_data_name(family, size)
+            if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+                msgdebug(f"Generating data object '{data_name}'.")
+            wisteria.globs.DATA[data_name] = GENERATORS[family][0](size)
+
+
+def parse_generated_data_name(data_name):
+    """
+        parse_generated_data_name()
+
+        Return the family and the size of a generated data object.
+            ex: 'datagen:list(int)[100]' > ('list(int)', 100)
+        _______________________________________________________________________
+
+        ARGUMENT: (str)data_name
+
+        RETURNED VALUE: None if <data_name> isn't the name of a generated data
+                        object, ((str)family, (int)size) otherwise
+    """
+    match = DATAGEN_NAME_REGEX.match(data_name)
+    if match is None:
+        return None
+    return match.group("family"), int(match.group("size"))
+
+
+def read_datagen_sizes(family,
+                       sizes):
+    """
+        read_datagen_sizes()
+
+        Read the sizes given to <family> in the \\[data generators] section of the
+        config file, e.g. "100;1e4;1e6".
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (str)family: the name of the family
+        o  (str)sizes: the sizes, separated by ';'; scientific notation is accepted.
+
+        RETURNED VALUE: (None if an error occured or a tuple of int)the sizes
+    """
+    if family not in GENERATORS:
+        msgerror(f"(ERRORID063) Wrong definition in \\[data generators]: unknown family "
+                 f"'{family}'; known families are {tuple(GENERATORS.keys())}.")
+        return None
+
+    res = []
+    for size in sizes.split(";"):
+        if size.strip() == "":
+            continue
+        try:
+            floatsize = float(size)
+        except ValueError:
+            floatsize = None
+        if floatsize is None or not floatsize.is_integer() or \
+           not 1 <= floatsize <= GENERATORS[family][1]:
+            msgerror(f"(ERRORID064) Wrong definition in \\[data generators]: "
+                     f"can't read size '{size.strip()}' for family '{family}'; "
+                     f"expected an integer between 1 and {GENERATORS[family][1]}.")
+            return None
+        res.append(int(floatsize))
+
+    return tuple(sorted(set(res)))
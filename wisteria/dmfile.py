@@ -81,9 +81,19 @@ class DMFile:
     def __iter__(self):
         """
             DMFile.__iter__()
+
+            Yield the lines of the file (without their final "\\n") one at a
+            time: unlike .read(), the file is never loaded in memory as a whole.
+            The lines are the ones of .read().split("\\n").
         """
-        for line in self.read().split("\n"):
-            yield line
+        self.obj.seek(0)
+        line = ""
+        for line in self.obj:
+            yield line[:-1] if line.endswith("\n") else line
+
+        if not line or line.endswith("\n"):
+            # .read().split("\n") ends with an empty string
+            yield ""
 
     def close(self):
         """
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/exportresults.py
+
+    Machine-readable export of the results (--exportresults): each
+    SerializationResult is written as soon as it is computed, then the hall
+    of fame and the overall scores are written once all results are known.
+
+    Three formats are available:
+    * 'jsonl'   : one JSON object per line; the "table" key is "results",
+                  "hall" or "overallscores";
+    * 'csv'     : one CSV file per table: <name>.csv, <name>_hall.csv and
+                  <name>_overallscores.csv;
+    * 'columnar': a directory with one binary file per column, written by
+                  array.tofile() and described by 'schema.json'; see
+                  read_columnar_table() to load a table.
+
+    (pimydoc)columnar format
+    ⋅Each column of a table is stored in '<table>.<column>.bin' through
+    ⋅array.array.tofile() (native byte order, see 'byteorder' in schema.json):
+    ⋅- 'str'  : typecode 'I', index in schema.json[tables][table][dictionaries][column]
+    ⋅- 'bool' : typecode 'b', 0/1
+    ⋅- 'int'  : typecode 'q', -1 for None
+    ⋅- 'float': typecode 'd', NaN for None
+    ___________________________________________________________________________
+
+    o  ResultsExporter class
+    o  get_exportresults_default_filename(exportformat)
+    o  parse_exportresults_argument(exportresults_string)
+    o  read_columnar_table(directory, table)
+"""
+import array
+import csv
+import json
+import math
+import os.path
+import sys
+
+import wisteria.globs
+from wisteria.msg import msgerror
+from wisteria.wisteriaerror import WisteriaError
+
+
+# accepted formats for --exportresults:
+EXPORTRESULTS_FORMATS = ("jsonl", "csv", "columnar")
+
+# (pimydoc)columnar format
+# ⋅Each column of a table is stored in '<table>.<column>.bin' through
+# ⋅array.array.tofile() (native byte order, see 'byteorder' in schema.json):
+# ⋅- 'str'  : typecode 'I', index in schema.json[tables][table][dictionaries][column]
+# ⋅- 'bool' : typecode 'b', 0/1
+# ⋅- 'int'  : typecode 'q', -1 for None
+# ⋅- 'float': typecode 'd', NaN for None
+COLUMNAR_TYPECODES = {"str": "I",
+                      "bool": "b",
+                      "int": "q",
+                      "float": "d"}
+
+# columns of each table: (column name, type)
+TABLES = {
+    "results": (("serializer", "str"),
+                ("version", "str"),
+                ("dataobj", "str"),
+                ("encoding_success", "bool"),
+                ("encoding_time", "float"),
+                ("encoding_time_min", "float"),
+                ("encoding_time_stddev", "float"),
+                ("encoding_strlen", "int"),
+                ("encoding_mem_peak", "int"),
+                ("encoding_throughput", "float"),
+                ("decoding_success", "bool"),
+                ("decoding_time", "float"),
+                ("decoding_time_min", "float"),
+                ("decoding_time_stddev", "float"),
+                ("decoding_mem_peak", "int"),
+                ("decoding_throughput", "float"),
+                ("ops_throughput", "float"),
+                ("reversibility", "bool"),
+                ("mem_usage", "int"),
+                ("interruption", "str")),
+    "hall": (("attribute", "str"),
+             ("index", "int"),
+             ("rank", "int"),
+             ("value", "float"),
+             ("serializer", "str")),
+    "overallscores": (("serializer", "str"),
+                      ("overallscore", "int")),
+}
+
+
+class ResultsExporter:
+    """
+        ResultsExporter class
+
+        Write the results in the format given by --exportresults.
+
+        Rows of the 'results' table are written (jsonl, csv) or stored in
+        typed arrays (columnar) by add_result(); close() adds the hall of
+        fame and the overall scores.
+        _______________________________________________________________________
+
+        instance attributes:
+
+        o  (str)exportformat        : one of EXPORTRESULTS_FORMATS
+        o  (str)filename            : file name (jsonl, csv) or directory (columnar)
+        o  (None|file)file          : opened file (jsonl, csv)
+        o  (None|csv.writer)csvwriter
+        o  (dict)columns            : (columnar) columns[(str)column] = array.array
+        o  (dict)dictionaries       : (columnar) dictionaries[(str)column][(str)value] =
+                                                  (int)index
+        o  (dict)schema             : (columnar) content of schema.json
+
+        methods:
+
+        o  __init__(self, exportformat, filename)
+        o  add_result(self, serializer, data_name, result)
+        o  close(self, results)
+        o  get_result_row(serializer, data_name, result)
+        o  write_rows(self, table, rows)
+    """
+    def __init__(self,
+                 exportformat,
+                 filename):
+        """
+            ResultsExporter.__init__()
+            ___________________________________________________________________
+
+            ARGUMENTS:
+            o  (str)exportformat: one of EXPORTRESULTS_FORMATS
+            o  (str)filename    : file name (jsonl, csv) or directory (columnar)
+        """
+        self.exportformat = exportformat
+        self.filename = filename
+        self.file = None
+        self.csvwriter = None
+        self.columns = {}
+        self.dictionaries = {}
+        self.schema = {"byteorder": sys.byteorder,
+                       "tables": {}}
+
+        try:
+            if exportformat == "columnar":
+                os.makedirs(filename, exist_ok=True)
+                for column, columntype in TABLES["results"]:
+                    self.columns[column] = array.array(COLUMNAR_TYPECODES[columntype])
+                    if columntype == "str":
+                        self.dictionaries[column] = {}
+            else:
+                # pylint: disable=consider-using-with
+                self.file = open(filename, "w", encoding="utf-8", newline="")
+                if exportformat == "csv":
+                    self.csvwriter = csv.writer(self.file)
+                    self.csvwriter.writerow(column for column, _ in TABLES["results"])
+        except OSError as exception:
+            raise WisteriaError(f"(ERRORID069) Can't create the --exportresults "
+                                f"file '{filename}': {exception}") from exception
+
+    def add_result(self,
+                   serializer,
+                   data_name,
+                   result):
+        """
+            ResultsExporter.add_result()
+
+            Export the result of (<serializer>, <data_name>).
+            ___________________________________________________________________
+
+            ARGUMENTS:
+            o  (str)serializer
+            o  (str)data_name
+            o  (None|SerializationResult)result
+        """
+        row = self.get_result_row(serializer, data_name, result)
+
+        if self.exportformat == "jsonl":
+            self.file.write(json.dumps(dict(row, table="results")) + "\n")
+        elif self.exportformat == "csv":
+            self.csvwriter.writerow("" if value is None else value for value in row.values())
+        else:
+            for column, columntype in TABLES["results"]:
+                value = row[column]
+                if columntype == "str":
+                    value = self.dictionaries[column].setdefault(value,
+                                                                 len(self.dictionaries[column]))
+                elif value is None:
+                    value = math.nan if columntype == "float" else -1
+                self.columns[column].append(value)
+
+    def close(self,
+              results):
+        """
+            ResultsExporter.close()
+
+            Write the hall of fame and the overall scores of <results> then
+            close the files.
+            ___________________________________________________________________
+
+            ARGUMENT: (None|SerializationResults)results, None if the results
+                      could not be computed.
+        """
+        try:
+            if self.exportformat == "columnar":
+                self.schema["tables"]["results"] = {
+                    "rows": len(self.columns["serializer"]),
+                    "columns": dict(TABLES["results"]),
+                    "dictionaries": {column: list(dictionary)
+                                     for column, dictionary in self.dictionaries.items()}}
+                for column, values in self.columns.items():
+                    with open(os.path.join(self.filename, f"results.{column}.bin"),
+                              "wb") as columnfile:
+                        values.tofile(columnfile)
+
+            if results is not None:
+                self.write_rows("hall",
+                                [{"attribute": attribute,
+                                  "index": index,
+                                  "rank": results.get_hall_rank(attribute, index),
+                                  "value": value,
+                                  "serializer": serializer}
+                                 for attribute in sorted(results.hall)
+                                 for index, (value, serializer)
+                                 in enumerate(results.hall[attribute])])
+                self.write_rows("overallscores",
+                                [{"serializer": serializer,
+                                  "overallscore": results.overallscores[serializer]}
+                                 for serializer in results.serializers])
+
+            if self.exportformat == "columnar":
+                with open(os.path.join(self.filename, "schema.json"),
+                          "w", encoding="utf-8") as schemafile:
+                    json.dump(self.schema, schemafile, indent=1)
+        except OSError as exception:
+            raise WisteriaError(f"(ERRORID069) Can't write the --exportresults "
+                                f"file '{self.filename}': {exception}") from exception
+        finally:
+            if self.file is not None:
+                self.file.close()
+
+    @staticmethod
+    def get_result_row(serializer,
+                       data_name,
+                       result):
+        """
+            ResultsExporter.get_result_row()
+
+            Return the row of the 'results' table describing <result>.
+            ___________________________________________________________________
+
+            ARGUMENTS:
+            o  (str)serializer
+            o  (str)data_name
+            o  (None|SerializationResult)result
+
+            RETURNED VALUE: (dict)row[(str)column] = value, following TABLES["results"]
+        """
+        row = dict.fromkeys((column for column, _ in TABLES["results"]), None)
+        row["serializer"] = serializer
+        row["version"] = str(wisteria.globs.SERIALIZERS[serializer].version)
+        row["dataobj"] = data_name
+        row["encoding_success"] = False
+        row["decoding_success"] = False
+        row["reversibility"] = False
+        if result is None:
+            return row
+
+        for attribute in ("encoding_success", "encoding_time", "encoding_strlen",
+                          "encoding_throughput", "decoding_success", "decoding_time",
+                          "decoding_throughput", "ops_throughput", "reversibility",
+                          "mem_usage", "interruption"):
+            row[attribute] = getattr(result, attribute)
+        for prefix in ("encoding", "decoding"):
+            timestats = getattr(result, f"{prefix}_timestats")
+            if timestats is not None:
+                row[f"{prefix}_time_min"] = timestats.min
+                row[f"{prefix}_time_stddev"] = timestats.stddev
+            memusage = getattr(result, f"{prefix}_memusage")
+            if memusage is not None:
+                row[f"{prefix}_mem_peak"] = memusage.peak
+        return row
+
+    def write_rows(self,
+                   table,
+                   rows):
+        """
+            ResultsExporter.write_rows()
+
+            Write all the <rows> of <table> ('hall' or 'overallscores').
+            ___________________________________________________________________
+
+            ARGUMENTS:
+            o  (str)table: a key of TABLES
+            o  (list of dict)rows
+        """
+        if self.exportformat == "jsonl":
+            for row in rows:
+                self.file.write(json.dumps(dict(row, table=table)) + "\n")
+
+        elif self.exportformat == "csv":
+            root, extension = os.path.splitext(self.filename)
+            with open(f"{root}_{table}{extension}", "w", encoding="utf-8",
+                      newline="") as csvfile:
+                csvwriter = csv.writer(csvfile)
+                csvwriter.writerow(column for column, _ in TABLES[table])
+                for row in rows:
+                    csvwriter.writerow("" if value is None else value for value in row.values())
+
+        else:
+            dictionaries = {}
+            for column, columntype in TABLES[table]:
+                values = [row[column] for row in rows]
+                if columntype == "str":
+                    dictionaries[column] = sorted(set(values))
+                    values = [dictionaries[column].index(value) for value in values]
+                else:
+                    values = [(math.nan if columntype == "float" else -1)
+                              if value is None else value for value in values]
+                with open(os.path.join(self.filename, f"{table}.{column}.bin"),
+                          "wb") as columnfile:
+                    array.array(COLUMNAR_TYPECODES[columntype], values).tofile(columnfile)
+            self.schema["tables"][table] = {"rows": len(rows),
+                                            "columns": dict(TABLES[table]),
+                                            "dictionaries": dictionaries}
+
+
+def get_exportresults_default_filename(exportformat):
+    """
+        get_exportresults_default_filename()
+
+        Return the default name of the file (or of the directory) written by
+        --exportresults.
+        _______________________________________________________________________
+
+        ARGUMENT: (str)exportformat, one of EXPORTRESULTS_FORMATS
+
+        RETURNED VALUE: (str)the file name, e.g. 'reports/results.jsonl'
+    """
+    if exportformat == "columnar":
+        return os.path.join(wisteria.globs.REPORTFILE_PATH, "results_columnar")
+    return os.path.join(wisteria.globs.REPORTFILE_PATH, f"results.{exportformat}")
+
+
+def parse_exportresults_argument(exportresults_string):
+    """
+        parse_exportresults_argument()
+
+        Parse the --exportresults string <exportresults_string>.
+
+        (pimydoc)command line help for --exportresults(full version)
+        ⋅Export all the results in a machine-readable format:
+        ⋅- default value: "no export", i.e. no exported results
+        ⋅- otherwise 'jsonl', 'csv' or 'columnar'; you may add the file name
+        ⋅  (the directory name for 'columnar') after '=', e.g. 'csv=myfile.csv';
+        ⋅  the file is created in the report directory.
+        ⋅* 'jsonl'   : one JSON object per line, the "table" key being "results",
+        ⋅              "hall" or "overallscores";
+        ⋅* 'csv'     : results in <name>.csv, hall of fame in <name>_hall.csv,
+        ⋅              overall scores in <name>_overallscores.csv;
+        ⋅* 'columnar': a directory with one binary file per column (typed arrays)
+        ⋅              described by schema.json, see exportresults.py .
+        ⋅Each result is written as soon as it is computed.
+        _______________________________________________________________________
+
+        ARGUMENT: (str)exportresults_string, the --exportresults string
+
+        RETURNED VALUE: ((bool)parsing_success,
+                         () if no export or ((str)format, (str)filename))
+    """
+    if exportresults_string == "no export":
+        return True, ()
+
+    exportformat, _, filename = (part.strip() for part in exportresults_string.partition("="))
+    if exportformat not in EXPORTRESULTS_FORMATS or (_ and not filename):
+        msgerror(f"(ERRORID068) Ill-formed --exportresults string '{exportresults_string}': "
+                 f"expected 'no export' or one of {EXPORTRESULTS_FORMATS}, "
+                 "optionally followed by '=filename'.")
+        return False, None
+
+    if not filename:
+        return True, (exportformat, get_exportresults_default_filename(exportformat))
+    return True, (exportformat, os.path.join(wisteria.globs.REPORTFILE_PATH, filename))
+
+
+def read_columnar_table(directory,
+                        table):
+    """
+        read_columnar_table()
+
+        Read a table written with --exportresults=columnar.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (str)directory: the directory written by --exportresults=columnar
+        o  (str)table    : 'results', 'hall' or 'overallscores'
+
+        RETURNED VALUE: (dict)res[(str)column] = array.array or, for 'str'
+                        columns, list of str
+    """
+    with open(os.path.join(directory, "schema.json"), encoding="utf-8") as schemafile:
+        schema = json.load(schemafile)
+    tableschema = schema["tables"][table]
+
+    res = {}
+    for column, columntype in tableschema["columns"].items():
+        values = array.array(COLUMNAR_TYPECODES[columntype])
+        with open(os.path.join(directory, f"{table}.{column}.bin"), "rb") as columnfile:
+            values.fromfile(columnfile, tableschema["rows"])
+        if schema["byteorder"] != sys.byteorder:
+            values.byteswap()
+        if columntype == "str":
+            dictionary = tableschema["dictionaries"][column]
+            values = [dictionary[index] for index in values]
+        res[column] = values
+    return res
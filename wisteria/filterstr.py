@@ -25,18 +25,32 @@
 
     ___________________________________________________________________________
 
-    o  parse_filterstr()
+    o  parse_filterstr(filterstr, serializers, dataobjs)
 """
 from wisteria.serializers import func_serialize
+from wisteria.cwc.cwc_utils import is_a_cwc_name, moduleininame_to_modulefullrealname
+from wisteria.cwc.cwc_utils import modulefullrealname_to_modulerealname
+from wisteria.cwc.cwc_utils import is_this_an_appropriate_module_for_serializer
+from wisteria.globs import VERBOSITY_DETAILS
+from wisteria.msg import msginfo
 import wisteria
 
 
-def parse_filterstr(filterstr):
+def parse_filterstr(filterstr,
+                    serializers,
+                    dataobjs):
     """
         parse_filterstr()
 
         Parse the --filter string <filterstr>.
 
+        'data:oktrans_only' requires a pre-pass: each (serializer, data object)
+        couple is encoded/decoded ONCE, without any measure. The results of
+        this pre-pass are stored in wisteria.globs.TRANSCODING_CHECKS so that
+        the timed transcodings (see compute_results()) don't compute them again;
+        encoded objects longer than wisteria.globs.TRANSCODING_CHECKS_MAXLEN
+        are not kept, only their flags.
+
         (pimydoc)filterstr
         ⋅A filter string should be parsed by filterstr.py::parse_filterstr() .
         ⋅
@@ -46,27 +60,54 @@ def parse_filterstr(filterstr):
         ⋅                         transcoded are used
         _______________________________________________________________________
 
-        ARGUMENT: (str)filterstr
+        ARGUMENTS:
+        o  (str)filterstr
+        o  (list of str)serializers : serializers selected by --cmp
+        o  (list of str)dataobjs    : data objects selected by --cmp
 
         RETURNED VALUE: (bool)success,
                         (list of str)data_to_be_discarded,
                         (list of str)serializers_to_be_discarded
     """
     data_to_be_discarded, serializers_to_be_discarded = [], []
+    wisteria.globs.TRANSCODING_CHECKS.clear()
 
     if filterstr == "":
         pass
 
     elif filterstr == "data:oktrans_only":
 
-        for serializer in wisteria.globs.SERIALIZERS:
-            for data_name in wisteria.globs.DATA:
-                res = func_serialize(serializer=serializer,
-                                     data_name=data_name)
-                if not res.reversibility:
+        for serializer in serializers:
+            for data_name in dataobjs:
+                # cwc data objects are only transcoded by the appropriate serializers:
+                if is_a_cwc_name(data_name) and \
+                   not is_this_an_appropriate_module_for_serializer(
+                       modulefullrealname_to_modulerealname(
+                           moduleininame_to_modulefullrealname(data_name)),
+                       serializer):
+                    continue
+
+                transcoding_check = func_serialize(serializer=serializer,
+                                                   data_name=data_name,
+                                                   action="check")
+                if transcoding_check.encoded_object is not None and \
+                   len(transcoding_check.encoded_object) > \
+                   wisteria.globs.TRANSCODING_CHECKS_MAXLEN:
+                    transcoding_check.encoded_object = None
+                wisteria.globs.TRANSCODING_CHECKS[(serializer, data_name)] = transcoding_check
+                if not transcoding_check.reversibility:
                     data_to_be_discarded.append(data_name)
 
+        # the untimed encodings/decodings of the discarded data objects are useless:
+        for serializer, data_name in tuple(wisteria.globs.TRANSCODING_CHECKS):
+            if data_name in data_to_be_discarded:
+                del wisteria.globs.TRANSCODING_CHECKS[(serializer, data_name)]
+
+        if wisteria.globs.ARGS.verbosity >= VERBOSITY_DETAILS:
+            msginfo(f"--filter: {len(set(data_to_be_discarded))} data object(s) discarded "
+                    f"among {len(dataobjs)}.")
+
     else:
         return False, None, None
 
-    return True, sorted(data_to_be_discarded), sorted(serializers_to_be_discarded)
+    return True, sorted(set(data_to_be_discarded)), sorted(serializers_to_be_discarded)
@@ -26,6 +26,15 @@
 
     o  ARGS
 
+    o  BUDGET
+    o  BUDGET_DEFAULTS
+
+    o  CACHE
+    o  CACHE_DEFAULTS
+
+    o  COMPAREWITH
+    o  COMPAREWITH_DEFAULTS
+
     o  CWC_MODULES
 
     o  DATA
@@ -39,9 +48,17 @@
     o  DISCARDED_DATA
     o  DISCARDED_SERIALIZERS
 
+    o  EXPORTRESULTS
+
+    o  HISTORY
+    o  HISTORY_COMPARISON
+
     o  RICHFILECONSOLE
     o  RICHFILECONSOLE_FILEOBJECT
 
+    o  METHOD
+    o  METHOD_DEFAULTS
+
     o  MODULES
 
     o  OUTPUT
@@ -60,14 +77,22 @@
 
     o  RICHCONSOLE
 
+    o  SANDBOX
+    o  SANDBOX_DEFAULTS
+
+    o  SCHEDULE_ROUNDS
+
     o  SERIALIZERS
 
-    o  STR2REPORTSECTION_KEYS
+    o  STAGES
+    o  STAGES_DEFAULTS
 
-    o  TIMEITNUMBER
+    o  STR2REPORTSECTION_KEYS
 
     o  TMPFILENAME
 
+    o  TRANSCODING_CHECKS
+
     o  UNITS
 
     o  VERBOSITY_MINIMAL
@@ -79,8 +104,12 @@
 The following variables depend on previously defined variables,
 hence their location at the end of this list:
 
+    o  CACHEFILE_NAME
+           (initialized by get_cachefile_name())
     o  DEFAULT_EXPORTREPORT_FILENAME
            (initialized by get_default_exportreport_filename())
+    o  HISTORYFILE_NAME
+           (initialized by get_historyfile_name())
     o  DEFAULT_REPORTFILE_NAME
            (initialized by get_default_reportfile_name())
     o  GRAPHS_GENERIC_FILENAME
@@ -100,6 +129,51 @@ import re
 # will be set to argparse.ArgumentParser(...).parse_args()
 ARGS = None
 
+# (pimydoc)BUDGET format
+# ⋅BUDGET[(str)key] = value; keys are those of BUDGET_DEFAULTS.
+# ⋅Initialized by cmdline_budget.py:parse_budget_argument();
+# ⋅{} if there's no time budget.
+# ⋅- 'total': (None|float) wall-clock budget (seconds) of all the
+# ⋅           transcodings; None if there's no limit
+# ⋅- 'order': (str) 'cheapest' (see results.py:sort_transcodings_by_cost())
+# ⋅           or 'planned' (order of PLANNED_TRANSCODINGS)
+BUDGET = {}
+# default values used to initialize BUDGET:
+BUDGET_DEFAULTS = {
+    "total": None,
+    "order": "cheapest",
+}
+
+# (pimydoc)CACHE format
+# ⋅CACHE[(str)key] = value; keys are those of CACHE_DEFAULTS.
+# ⋅Initialized by cmdline_cache.py:parse_cache_argument().
+# ⋅- 'mode'   : (str) 'off' (no cache), 'use' (read and write the cache) or
+# ⋅             'refresh' (don't read the cache but write into it)
+# ⋅- 'maxage' : (float) results older than 'maxage' days are removed
+# ⋅- 'maxsize': (float) if the cache file is bigger than 'maxsize' MB,
+# ⋅             the oldest results are removed
+CACHE = {}
+# default values used to initialize CACHE:
+CACHE_DEFAULTS = {
+    "mode": "off",
+    "maxage": 30,
+    "maxsize": 100,
+}
+
+# (pimydoc)COMPAREWITH format
+# ⋅COMPAREWITH[(str)key] = value; keys are those of COMPAREWITH_DEFAULTS.
+# ⋅Initialized by cmdline_history.py:parse_comparewith_argument();
+# ⋅{} if there's no comparison with a previous run.
+# ⋅- 'run'      : (str|int) 'last', 'baseline' or a run id
+# ⋅- 'threshold': (float) minimal growth (in %) of a time or of an encoded
+# ⋅               string length to be reported as a regression
+COMPAREWITH = {}
+# default values used to initialize COMPAREWITH:
+COMPAREWITH_DEFAULTS = {
+    "run": "last",
+    "threshold": 10,
+}
+
 # (pimydoc)cwc modules names
 # ⋅
 # ⋅cwc modules names start with the "wisteria.cwc" string (cf is_a_cwc_name())
@@ -161,11 +235,53 @@ DEFAULT_CONFIGFILE_URL = "https://raw.githubusercontent.com/suizokukan/wisteria/
 DISCARDED_DATA = []
 DISCARDED_SERIALIZERS = []
 
+# value of the --exportresults argument
+#  initialized by exportresults.py:parse_exportresults_argument(--exportresults string):
+#  () if no export, ((str)format, (str)filename) otherwise.
+EXPORTRESULTS = ()
+
+# value of the --history argument: 'off', 'record' or 'baseline'
+#  initialized by cmdline_history.py:parse_history_argument(--history string)
+HISTORY = "off"
+# (None|HistoryComparison) comparison between the current run and the run
+# given by --comparewith, initialized by history.py:update_history()
+HISTORY_COMPARISON = None
+
 # value: rich.console.Console(file=...)
 RICHFILECONSOLE = None
 # Both variables are initialized by main.py()
 RICHFILECONSOLE_FILEOBJECT = None
 
+# (pimydoc)METHOD format
+# ⋅METHOD[(str)key] = value; keys are those of METHOD_DEFAULTS.
+# ⋅Initialized by cmdline_method.py:parse_method_argument() from --method.
+# ⋅- 'timeitnumber': (None|int) number of calls per timing sample; None for
+# ⋅                  an automatic calibration ('auto' in --method)
+# ⋅- 'mintime'     : (float) minimal duration of a sample, in seconds,
+# ⋅                  if 'timeitnumber' is None
+# ⋅- 'repeat'      : (int) number of timing samples
+# ⋅- 'warmup'      : (int) number of calls made before the first timing sample
+# ⋅- 'memprobe'    : (str) 'tracemalloc', 'rss' or 'fork', see memprobe.py
+# ⋅- 'lenmethod'   : (str) 'bytes' (UTF-8 length) or 'str' (characters),
+# ⋅                  length of an encoded str, see serializers.py:_len()
+# ⋅- 'order'       : (str) 'sorted', 'shuffle', 'roundrobin' or 'latinsquare',
+# ⋅                  see scheduler.py
+# ⋅- 'rounds'      : (int) number of rounds, see scheduler.py
+# ⋅- 'seed'        : (int) seed of the random generator used by 'shuffle'
+METHOD = {}
+# default values used to initialize METHOD:
+METHOD_DEFAULTS = {
+    "timeitnumber": None,
+    "mintime": 0.001,
+    "repeat": 5,
+    "warmup": 1,
+    "memprobe": "tracemalloc",
+    "lenmethod": "bytes",
+    "order": "sorted",
+    "rounds": 1,
+    "seed": 0,
+}
+
 # imported serializers modules
 MODULES = {}
 
@@ -220,6 +336,7 @@ PROGRESSBAR_LENGTH = None
 # ⋅NB: You may use 'vs' as well as 'against', as in:
 # ⋅    --cmp="json vs pickle (cwc)"
 # ⋅NB: globs.py::REGEX_CMP defines exactly the expected format
+# ⋅NB: 'all' doesn't select the pickle variants ('pickle_p0', ...): give their name.
 # regex used to parse the --cmp argument string
 REGEX_CMP = re.compile(r"^\s*(?P<serializer1>[^\s\(\)]+)"
                        r"((\svs\s|\sversus\s|\sagainst\s)(?P<serializer2>[^\s\(\)]+))?"
@@ -245,6 +362,27 @@ REPORT_SHORTCUTS = {
 # value: None or rich.console.Console()
 RICHCONSOLE = None
 
+# (pimydoc)SANDBOX format
+# ⋅SANDBOX[(str)key] = value; keys are those of SANDBOX_DEFAULTS.
+# ⋅Initialized by cmdline_sandbox.py:parse_sandbox_argument().
+# ⋅- 'mode'     : (str) 'off' (no sandbox) or 'on' (each transcoding is
+# ⋅               computed by a new process, see jobs.py)
+# ⋅- 'timeout'  : (float) a sandboxed transcoding lasting more than
+# ⋅               'timeout' seconds is killed
+# ⋅- 'maxmemory': (None|float) maximal memory (MB) a sandboxed transcoding
+# ⋅               may allocate; None if there's no limit
+SANDBOX = {}
+# default values used to initialize SANDBOX:
+SANDBOX_DEFAULTS = {
+    "mode": "off",
+    "timeout": 60,
+    "maxmemory": None,
+}
+
+# (list of dict) drift of each round (see --method 'rounds'), see
+# scheduler.py:summarize_rounds(); initialized by results.py:compute_results()
+SCHEDULE_ROUNDS = []
+
 # dict storing all serializers used by the program.
 #
 # * format: SERIALIZERS[(str)serializer name] = SerializerData object
@@ -256,6 +394,24 @@ SERIALIZERS = {}
 # * initialized by serializers.py::init_serializers()
 UNAVAILABLE_SERIALIZERS = {}
 
+# (pimydoc)STAGES format
+# ⋅STAGES[(str)stage] = (tuple of str)parameters; the stages are the keys
+# ⋅of STAGES_DEFAULTS.
+# ⋅Initialized by cmdline_stages.py:parse_stages_argument() from --stages;
+# ⋅{} if no extra stage has to be measured.
+# ⋅- 'compress': (tuple of str) codecs among 'zlib0'...'zlib9', 'bz2', 'lzma',
+# ⋅              see stage_compress.py
+# ⋅- 'mmap'  : (tuple of str) () or ('fsync',), see stage_mmap.py
+# ⋅- 'stream': (tuple of str) media among 'bytesio', 'file' and 'pipe',
+# ⋅            see stage_stream.py
+STAGES = {}
+# default parameters of each stage:
+STAGES_DEFAULTS = {
+    "compress": ("zlib6", "bz2", "lzma"),
+    "mmap": (),
+    "stream": ("bytesio", "file", "pipe"),
+}
+
 #  globs.py:STR2REPORTSECTION_KEYS should be nothing but STR2REPORTSECTION.keys()
 #
 # Why those two variables ?
@@ -285,6 +441,12 @@ STR2REPORTSECTION_KEYS = (
     'B2a',
     'B2b',
     'B3',
+    'B4',
+    'B5',
+    'B6',
+    'B7',
+    'B8',
+    'B9',
     'C',
     'C1',
     'C1a',
@@ -299,16 +461,26 @@ STR2REPORTSECTION_KEYS = (
     'D1b',
 )
 
-# number of times each serializer is called
-TIMEITNUMBER = 1
-
 # temp file default name
 TMPFILENAME = "wisteria.tmp"
 
+# results of the untimed encodings/decodings made by the --filter pre-pass,
+# reused (and removed) by the timed transcodings:
+#   TRANSCODING_CHECKS[((str)serializer, (str)data_name)] = TranscodingCheck
+# Initialized by filterstr.py:parse_filterstr()
+TRANSCODING_CHECKS = {}
+
+# the pre-pass keeps the encoded objects whose length is at most TRANSCODING_CHECKS_MAXLEN;
+# for the longer ones, only the flags are kept and transcode() encodes the object again
+# (once, untimed): all the kept checks live in memory at the same time.
+TRANSCODING_CHECKS_MAXLEN = 2**16
+
 # units used in this project
 UNITS = {'time': 'seconds',
          'string length': 'characters',
          'memory': 'bytes',
+         'throughput': 'MB/s',
+         'ops throughput': 'encodings+decodings/s',
          }
 
 # values defined for --verbosity:
@@ -324,6 +496,18 @@ VERBOSITY_DEBUG = 3
 # hence their location at the end of this list.
 #
 # =============================================================================
+def get_cachefile_name():
+    """
+        get_cachefile_name()
+
+        Return the value expected for CACHEFILE_NAME
+        _______________________________________________________________________
+
+        RETURNED VALUE: (str)a value for CACHEFILE_NAME
+    """
+    return os.path.join(REPORTFILE_PATH, "wisteria_cache.db")
+
+
 def get_default_exportreport_filename():
     """
         get_default_exportreport_filename()
@@ -348,6 +532,18 @@ def get_default_reportfile_name():
     return os.path.join(REPORTFILE_PATH, "report.txt")
 
 
+def get_historyfile_name():
+    """
+        get_historyfile_name()
+
+        Return the value expected for HISTORYFILE_NAME
+        _______________________________________________________________________
+
+        RETURNED VALUE: (str)a value for HISTORYFILE_NAME
+    """
+    return os.path.join(REPORTFILE_PATH, "wisteria_history.db")
+
+
 def get_exportreport_filename(basename):
     """
         get_exportreport_filename()
@@ -397,18 +593,41 @@ def get_graphs_description():
             ⋅- (str)title       : graph title
             ⋅- (str)filename    : file name to be written
     """
-    return (('encoding_time', "{0:.3f}", 1, UNITS['time'], 'Slowness',
-             GRAPHS_GENERIC_FILENAME.replace("__SUFFIX__", "1")),
-            ('mem_usage', "{0}", 1, UNITS['memory'], 'Memory Usage',
-             GRAPHS_GENERIC_FILENAME.replace("__SUFFIX__", "2")),
-            ('encoding_strlen', "{0}", 1, UNITS['string length'], 'Encoded String Length',
-             GRAPHS_GENERIC_FILENAME.replace("__SUFFIX__", "3")),
-            ('reversibility', "{0:.1f}", 100, "%", 'Coverage data (Reversibility)',
-             GRAPHS_GENERIC_FILENAME.replace("__SUFFIX__", "4")),)
-
-
+    res = (('encoding_time', "{0:.3f}", 1, UNITS['time'], 'Slowness',
+            GRAPHS_GENERIC_FILENAME.replace("__SUFFIX__", "1")),
+           ('mem_usage', "{0}", 1, UNITS['memory'], 'Memory Usage',
+            GRAPHS_GENERIC_FILENAME.replace("__SUFFIX__", "2")),
+           ('encoding_strlen', "{0}", 1, UNITS['string length'], 'Encoded String Length',
+            GRAPHS_GENERIC_FILENAME.replace("__SUFFIX__", "3")),
+           ('reversibility', "{0:.1f}", 100, "%", 'Coverage data (Reversibility)',
+            GRAPHS_GENERIC_FILENAME.replace("__SUFFIX__", "4")),
+           ('encoding_throughput', "{0:.2f}", 1, UNITS['throughput'], 'Encoding Throughput',
+            GRAPHS_GENERIC_FILENAME.replace("__SUFFIX__", "5")),
+           ('decoding_throughput', "{0:.2f}", 1, UNITS['throughput'], 'Decoding Throughput',
+            GRAPHS_GENERIC_FILENAME.replace("__SUFFIX__", "6")),
+           ('ops_throughput', "{0:.0f}", 1, UNITS['ops throughput'], 'Operations per Second',
+            GRAPHS_GENERIC_FILENAME.replace("__SUFFIX__", "7")),)
+
+    # graphs of the 'compress' stage (see --stages), drawn from its first codec:
+    if "compress" in STAGES:
+        codec = STAGES["compress"][0]
+        res += (('compression_ratio', "{0:.1f}", 100, "%",
+                 f'Compression Ratio ({codec})',
+                 GRAPHS_GENERIC_FILENAME.replace("__SUFFIX__", "8")),
+                ('compression_throughput', "{0:.2f}", 1, UNITS['throughput'],
+                 f'Compression Throughput ({codec})',
+                 GRAPHS_GENERIC_FILENAME.replace("__SUFFIX__", "9")),
+                ('decompression_throughput', "{0:.2f}", 1, UNITS['throughput'],
+                 f'Decompression Throughput ({codec})',
+                 GRAPHS_GENERIC_FILENAME.replace("__SUFFIX__", "10")),)
+
+    return res
+
+
+CACHEFILE_NAME = get_cachefile_name()
 DEFAULT_EXPORTREPORT_FILENAME = get_default_exportreport_filename()
 DEFAULT_REPORTFILE_NAME = get_default_reportfile_name()
+HISTORYFILE_NAME = get_historyfile_name()
 
 # generic name for graphs filenames:
 #   'generic' since this string contains a '__SUFFIX__' substring to be replaced.
@@ -24,11 +24,19 @@
     Some help messages
     ___________________________________________________________________________
 
+    o  help_cmdline_budget(details=False)
+    o  help_cmdline_cache(details=False)
     o  help_cmdline_cmp(details=False)
+    o  help_cmdline_comparewith(details=False)
     o  help_cmdline_exportreport(details=False)
+    o  help_cmdline_exportresults(details=False)
     o  help_cmdline_filter(details=False)
+    o  help_cmdline_history(details=False)
+    o  help_cmdline_method(details=False)
     o  help_cmdline_output(details=False)
     o  help_cmdline_report(details=False)
+    o  help_cmdline_sandbox(details=False)
+    o  help_cmdline_stages(details=False)
     o  help_cmdline_helpdescription()
     o  help_graphsfilenames()
 """
@@ -42,6 +50,89 @@ from wisteria.utils import normpath, get_missing_required_internal_modules, get_
 from wisteria.utils import pimydocstr2str
 
 
+def help_cmdline_budget(details=False):
+    """
+        help_cmdline_budget()
+
+        Return help messages for the command line option "--budget".
+        _______________________________________________________________________
+
+        ARGUMENT: (bool)details, True if a full help string has to be returned
+
+        RETURNED VALUE: (str)help message
+    """
+    if not details:
+        return pimydocstr2str("""
+        (pimydoc)command line help for --budget(short version)
+        ⋅Time budget: 'none' or e.g. 'total=600' (wall-clock seconds for all the
+        ⋅transcodings, the cheapest ones first). See also --sandbox.
+        ⋅See --help2 for more informations.
+        """)
+    return pimydocstr2str("""
+           (pimydoc)command line help for --budget(full version)
+           ⋅A string like 'key=value;key=value' limiting the time spent computing
+           ⋅the transcodings:
+           ⋅- default value: "none", i.e. no limit, the transcodings being computed
+           ⋅  in the order of PLANNED_TRANSCODINGS
+           ⋅
+           ⋅Accepted keys are (default values between brackets):
+           ⋅* 'total': wall-clock budget, in seconds, of all the transcodings [no limit].
+           ⋅  Once it is exhausted, the transcodings computed by other processes (see
+           ⋅  --jobs and --sandbox) are killed and the remaining ones aren't computed:
+           ⋅  their results are marked 'budget' in report sections B1a and B2a and the
+           ⋅  reports are written from the partial results.
+           ⋅* 'order': 'cheapest' to compute first the transcodings of the smallest data
+           ⋅  objects, all serializers in turn, or 'planned' [cheapest]
+           ⋅
+           ⋅The timeout of each transcoding is set by --sandbox.
+           ⋅
+           ⋅e.g. --budget="total=600"
+           ⋅     --budget="total=300;order=planned"
+           """)
+
+
+def help_cmdline_cache(details=False):
+    """
+        help_cmdline_cache()
+
+        Return help messages for the command line option "--cache".
+        _______________________________________________________________________
+
+        ARGUMENT: (bool)details, True if a full help string has to be returned
+
+        RETURNED VALUE: (str)help message
+    """
+    if not details:
+        return pimydocstr2str("""
+        (pimydoc)command line help for --cache(short version)
+        ⋅Store the results in a cache file and reuse them, a string like
+        ⋅'off', 'use' or 'refresh', optionally followed by ';maxage=30;maxsize=100'.
+        ⋅See --help2 for more informations.
+        """)
+    return pimydocstr2str("""
+           (pimydoc)command line help for --cache(full version)
+           ⋅A string like 'mode;key=value;key=value' describing how the results
+           ⋅are stored in the cache file, a SQLite database created in the
+           ⋅report directory. Accepted modes are:
+           ⋅* 'off': the cache is neither read nor written;
+           ⋅* 'use': the results found in the cache are not computed again, the
+           ⋅  other ones are computed and written into the cache;
+           ⋅* 'refresh': all results are computed and written into the cache.
+           ⋅
+           ⋅A cached result is only used if the serializer (name and version), the
+           ⋅data object content, the Python version, the machine and --method are
+           ⋅the same.
+           ⋅
+           ⋅Accepted keys are (default values between brackets):
+           ⋅* 'maxage': results older than 'maxage' days are removed [30]
+           ⋅* 'maxsize': if the cache file is bigger than 'maxsize' MB, the oldest
+           ⋅  results are removed [100]
+           ⋅
+           ⋅e.g. --cache="use"
+           ⋅     --cache="refresh;maxage=7;maxsize=20"
+           """)
+
+
 def help_cmdline_cmp(details=False):
     """
         help_cmdline_cmd()
@@ -88,9 +179,55 @@ def help_cmdline_cmp(details=False):
     ⋅NB: You may use 'vs' as well as 'against', as in:
     ⋅    --cmp="json vs pickle (cwc)"
     ⋅NB: globs.py::REGEX_CMP defines exactly the expected format
+    ⋅NB: 'all' doesn't select the pickle variants ('pickle_p0', ...): give their name.
     """)
 
 
+def help_cmdline_comparewith(details=False):
+    """
+        help_cmdline_comparewith()
+
+        Return help messages for the command line option "--comparewith".
+        _______________________________________________________________________
+
+        ARGUMENT: (bool)details, True if a full help string has to be returned
+
+        RETURNED VALUE: (str)help message
+    """
+    if not details:
+        return pimydocstr2str("""
+        (pimydoc)command line help for --comparewith(short version)
+        ⋅Compare the results with a previous run stored in the history file:
+        ⋅'none', 'last', 'baseline' or a run id, optionally followed by ';threshold=10'.
+        ⋅The exit code is 12 if a regression has been found.
+        ⋅See --help2 for more informations.
+        """)
+    return pimydocstr2str("""
+           (pimydoc)command line help for --comparewith(full version)
+           ⋅Compare the current results with the results of a previous run stored
+           ⋅in the history file (see --history), a string like 'run;threshold=10':
+           ⋅- default value: "none", i.e. no comparison
+           ⋅- 'run' is 'last' (the last recorded run), 'baseline' (the last run
+           ⋅  recorded with --history=baseline) or a run id (an integer).
+           ⋅
+           ⋅A regression is reported for a (serializer, data object) if:
+           ⋅* its encoding/decoding time has grown by more than 'threshold' % and
+           ⋅  the 95% confidence intervals of both medians don't overlap;
+           ⋅* its encoded string length has grown by more than 'threshold' %;
+           ⋅* its encoding/decoding/reversibility succeeded and now fails.
+           ⋅
+           ⋅Accepted key is (default value between brackets):
+           ⋅* 'threshold': minimal growth, in % [10]
+           ⋅  (on a noisy machine, increase it or the 'repeat' key of --method)
+           ⋅
+           ⋅The comparison is shown in report section B5; if a regression has been
+           ⋅found, the exit code is 12.
+           ⋅
+           ⋅e.g. --comparewith="baseline"
+           ⋅     --comparewith="12;threshold=20"
+           """)
+
+
 def help_cmdline_exportreport(details=False):
     """
         help_cmdline_exportreport()
@@ -129,6 +266,41 @@ def help_cmdline_exportreport(details=False):
     """.replace("$DEFAULT_EXPORTREPORT_FILENAME", DEFAULT_EXPORTREPORT_FILENAME))
 
 
+def help_cmdline_exportresults(details=False):
+    """
+        help_cmdline_exportresults()
+
+        Return help messages for the command line option "--exportresults".
+        _______________________________________________________________________
+
+        ARGUMENT: (bool)details, True if a full help string has to be returned
+
+        RETURNED VALUE: (str)help message
+    """
+    if not details:
+        return pimydocstr2str("""
+        (pimydoc)command line help for --exportresults(short version)
+        ⋅Export all the results in a machine-readable format: 'no export',
+        ⋅'jsonl', 'csv' or 'columnar', optionally followed by '=filename'.
+        ⋅See --help2 for more informations.
+        """)
+    return pimydocstr2str("""
+           (pimydoc)command line help for --exportresults(full version)
+           ⋅Export all the results in a machine-readable format:
+           ⋅- default value: "no export", i.e. no exported results
+           ⋅- otherwise 'jsonl', 'csv' or 'columnar'; you may add the file name
+           ⋅  (the directory name for 'columnar') after '=', e.g. 'csv=myfile.csv';
+           ⋅  the file is created in the report directory.
+           ⋅* 'jsonl'   : one JSON object per line, the "table" key being "results",
+           ⋅              "hall" or "overallscores";
+           ⋅* 'csv'     : results in <name>.csv, hall of fame in <name>_hall.csv,
+           ⋅              overall scores in <name>_overallscores.csv;
+           ⋅* 'columnar': a directory with one binary file per column (typed arrays)
+           ⋅              described by schema.json, see exportresults.py .
+           ⋅Each result is written as soon as it is computed.
+           """)
+
+
 def help_cmdline_filter(details=False):
     """
         help_cmdline_filter()
@@ -160,6 +332,105 @@ def help_cmdline_filter(details=False):
            """)
 
 
+def help_cmdline_history(details=False):
+    """
+        help_cmdline_history()
+
+        Return help messages for the command line option "--history".
+        _______________________________________________________________________
+
+        ARGUMENT: (bool)details, True if a full help string has to be returned
+
+        RETURNED VALUE: (str)help message
+    """
+    if not details:
+        return pimydocstr2str("""
+        (pimydoc)command line help for --history(short version)
+        ⋅Append the run to the history file: 'off', 'record' or 'baseline'.
+        ⋅See --comparewith and --help2 for more informations.
+        """)
+    return pimydocstr2str("""
+           (pimydoc)command line help for --history(full version)
+           ⋅Append the current run to the history file, a SQLite database created
+           ⋅in the report directory; each run is stored with the machine, the
+           ⋅Python version, the serializers versions and the statistics of each
+           ⋅transcoding. Accepted values are:
+           ⋅* 'off': the history file is not modified;
+           ⋅* 'record': the run is appended to the history file;
+           ⋅* 'baseline': the run is appended to the history file and becomes
+           ⋅  the baseline, i.e. the run used by --comparewith="baseline".
+           ⋅The id of the recorded run is displayed once it has been recorded.
+           ⋅
+           ⋅e.g. --history="baseline"
+           """)
+
+
+def help_cmdline_method(details=False):
+    """
+        help_cmdline_method()
+
+        Return help messages for the command line option "--method".
+        _______________________________________________________________________
+
+        ARGUMENT: (bool)details, True if a full help string has to be returned
+
+        RETURNED VALUE: (str)help message
+    """
+    if not details:
+        return pimydocstr2str("""
+        (pimydoc)command line help for --method(short version)
+        ⋅How the encoding/decoding times and memory are measured, a string like
+        ⋅'timeitnumber=auto;mintime=0.001;repeat=5;warmup=1;memprobe=tracemalloc;
+        ⋅lenmethod=bytes;order=sorted;rounds=1;seed=0'.
+        ⋅See --help2 for more informations.
+        """)
+    return pimydocstr2str("""
+           (pimydoc)command line help for --method(full version)
+           ⋅A string like 'key=value;key=value;...' describing how the measures
+           ⋅are made. Accepted keys are (default values between brackets):
+           ⋅* 'timeitnumber': number of calls of the encoding/decoding function for
+           ⋅  each timing sample; 'auto' to calibrate this number so that each sample
+           ⋅  lasts at least 'mintime' seconds, like timeit.Timer.autorange() does
+           ⋅  ['auto']
+           ⋅* 'mintime': see 'timeitnumber' [0.001]
+           ⋅* 'repeat': number of timing samples [5]
+           ⋅* 'warmup': number of calls before the first timing sample [1]
+           ⋅* 'memprobe': how the memory used by each encoding/decoding is measured
+           ⋅  ['tracemalloc']:
+           ⋅  - 'tracemalloc': peak of the memory allocated through Python's allocator
+           ⋅    (memory allocated directly by C libraries is not seen);
+           ⋅  - 'rss': peak of the resident set size, sampled by a background thread;
+           ⋅  - 'fork': like 'rss' but each measure is made by a new forked process.
+           ⋅* 'lenmethod': how the length of a string encoded into a str is measured
+           ⋅  ['bytes']:
+           ⋅  - 'bytes': length of its UTF-8 encoding, computed without copying the
+           ⋅    whole string;
+           ⋅  - 'str': number of characters.
+           ⋅  The strings encoded into bytes are not concerned.
+           ⋅* 'order': order in which the transcodings are computed ['sorted']:
+           ⋅  - 'sorted': serializer after serializer (see also --budget);
+           ⋅  - 'shuffle': a random order, different for each round;
+           ⋅  - 'roundrobin': data object after data object, the serializers being
+           ⋅    rotated from one data object to the next one;
+           ⋅  - 'latinsquare': like 'roundrobin', the rotation being also shifted
+           ⋅    from one round to the next one.
+           ⋅* 'rounds': number of times each transcoding is computed; its result is
+           ⋅  the one of the round with the median time. The drift of each round is
+           ⋅  shown in report section B9 [1]
+           ⋅* 'seed': seed of the random generator used by 'shuffle' [0]
+           ⋅
+           ⋅The encoding/decoding time is the median of the samples; min, mean,
+           ⋅stddev, 95th percentile and a 95% confidence interval of the median are
+           ⋅computed as well. The serializers are ranked upon the median; two
+           ⋅serializers whose confidence intervals overlap share the same rank.
+           ⋅
+           ⋅e.g. --method="timeitnumber=auto;repeat=7;warmup=2"
+           ⋅     --method="timeitnumber=1;repeat=1;warmup=0" (a single call, no statistics)
+           ⋅     --method="lenmethod=str"
+           ⋅     --method="order=latinsquare;rounds=3"
+           """)
+
+
 def help_cmdline_output(details=False):
     """
         help_cmdline_output()
@@ -253,6 +524,102 @@ def help_cmdline_report(details=False):
                 "$STR2REPORTSECTION_KEYS", str(STR2REPORTSECTION_KEYS)))
 
 
+def help_cmdline_sandbox(details=False):
+    """
+        help_cmdline_sandbox()
+
+        Return help messages for the command line option "--sandbox".
+        _______________________________________________________________________
+
+        ARGUMENT: (bool)details, True if a full help string has to be returned
+
+        RETURNED VALUE: (str)help message
+    """
+    if not details:
+        return pimydocstr2str("""
+        (pimydoc)command line help for --sandbox(short version)
+        ⋅Compute each transcoding in its own process, killed after a timeout: a
+        ⋅string like 'off' or 'on', optionally followed by ';timeout=60;maxmemory=500'.
+        ⋅See --help2 for more informations.
+        """)
+    return pimydocstr2str("""
+           (pimydoc)command line help for --sandbox(full version)
+           ⋅A string like 'mode;key=value;key=value' describing how the
+           ⋅transcodings are isolated from each other. Accepted modes are:
+           ⋅* 'off': the transcodings are computed by the main process (or by the
+           ⋅  processes of --jobs): a serializer crashing the interpreter stops the
+           ⋅  program;
+           ⋅* 'on': each transcoding is computed by a new forked process, killed if it
+           ⋅  lasts too long: crashes, timeouts and memory exhaustions become results
+           ⋅  (see report sections B1a and B2a), the other transcodings going on.
+           ⋅Setting a key implies 'on'.
+           ⋅
+           ⋅Accepted keys are (default values between brackets):
+           ⋅* 'timeout': a transcoding lasting more than 'timeout' seconds is killed [60]
+           ⋅* 'maxmemory': maximal memory (MB) a transcoding may allocate, see
+           ⋅  resource.setrlimit(RLIMIT_AS) (Unix only) [no limit]
+           ⋅
+           ⋅e.g. --sandbox="on"
+           ⋅     --sandbox="timeout=10;maxmemory=500"
+           """)
+
+
+def help_cmdline_stages(details=False):
+    """
+        help_cmdline_stages()
+
+        Return help messages for the command line option "--stages".
+        _______________________________________________________________________
+
+        ARGUMENT: (bool)details, True if a full help string has to be returned
+
+        RETURNED VALUE: (str)help message
+    """
+    if not details:
+        return pimydocstr2str("""
+        (pimydoc)command line help for --stages(short version)
+        ⋅Extra measures made after each transcoding: 'none' or e.g. 'compress;stream'
+        ⋅(zlib/bz2/lzma compression; mmap-backed decoding; dump()/load() through
+        ⋅io.BytesIO, a file, a pipe).
+        ⋅See --help2 for more informations.
+        """)
+    return pimydocstr2str("""
+           (pimydoc)command line help for --stages(full version)
+           ⋅Extra measures made after each transcoding, a string like
+           ⋅'stage;stage=parameter,parameter':
+           ⋅- default value: "none", i.e. no extra measure
+           ⋅
+           ⋅Accepted stages are (default parameters between brackets):
+           ⋅* 'compress': the encoded object is compressed then decompressed by
+           ⋅  each codec [zlib6,bz2,lzma]:
+           ⋅  - 'zlib0' ... 'zlib9': zlib with this compression level;
+           ⋅  - 'bz2', 'lzma': the bz2 and lzma modules with their default settings.
+           ⋅  Compressed length, ratio and (de)compression times are shown in report
+           ⋅  section B8; the first codec is used by the hall of fame and the graphs.
+           ⋅* 'mmap': the encoded object is written into a temp file and decoded
+           ⋅  from a memoryview of this file mapped in memory by mmap [no parameter]:
+           ⋅  - 'fsync': os.fsync() is called by each write.
+           ⋅  Only marshal and pickle directly decode the mmap-backed buffer; the
+           ⋅  other serializers decode a bytes copy of it. Write time, decode time
+           ⋅  and buffer copies are shown in report section B7.
+           ⋅* 'stream': the object is written by dump(obj, fp) and read back by
+           ⋅  load(fp) through each medium [bytesio,file,pipe]:
+           ⋅  - 'bytesio': an io.BytesIO object;
+           ⋅  - 'file': a temporary file on disk;
+           ⋅  - 'pipe': a pipe whose other end is read/written by another thread.
+           ⋅  Lists and tuples are also written as a stream of documents if the
+           ⋅  serializer can do it (JSON Lines, yaml dump_all(), Ion streams).
+           ⋅  Only json, marshal, pickle, pyyaml and simpleion have such functions.
+           ⋅  Time-to-first-byte, throughput and peak memory are shown in report
+           ⋅  section B6.
+           ⋅
+           ⋅e.g. --stages="stream"
+           ⋅     --stages="stream=bytesio,pipe"
+           ⋅     --stages="mmap=fsync;stream"
+           ⋅     --stages="compress=zlib1,zlib9,lzma"
+           """)
+
+
 def help_cmdline_helpdescription():
     """
         help_cmdline_helpdescription()
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/history.py
+
+    History of the runs (--history) and comparison of the current run with a
+    previous one (--comparewith): a SQLite database (HISTORYFILE_NAME) in
+    which each run is appended with the machine, the Python version, the
+    serializers versions and the statistics of each transcoding.
+
+    A run is described by a dict:
+        {"run_id": (None|int),
+         "created": (float)timestamp,
+         "machine": (str)see cache.py:get_machine_fingerprint(),
+         "python": (str),
+         "versions": {(str)serializer: (str)version},
+         "transcodings": {((str)serializer, (str)data_name): {column: value}}}
+    the columns of a transcoding being TRANSCODING_COLUMNS.
+
+    (pimydoc)regression
+    ⋅A regression is reported for a (serializer, data object) if:
+    ⋅* its encoding/decoding time has grown by more than 'threshold' % and
+    ⋅  the 95% confidence intervals of both medians don't overlap;
+    ⋅* its encoded string length has grown by more than 'threshold' %;
+    ⋅* its encoding/decoding/reversibility succeeded and now fails.
+    ___________________________________________________________________________
+
+    o  HistoryComparison class
+    o  HistoryRegression class
+
+    o  compare_runs(reference, current, threshold)
+    o  get_current_run(results)
+    o  open_history()
+    o  read_run(connection, run)
+    o  record_run(connection, run, baseline)
+    o  update_history(results)
+"""
+import platform
+import sqlite3
+import time
+from dataclasses import dataclass, field
+
+import wisteria.globs
+from wisteria.globs import VERBOSITY_NORMAL
+from wisteria.cache import get_machine_fingerprint
+from wisteria.msg import msginfo, msgwarning
+
+
+# columns of the 'transcodings' table, after (run_id, serializer, data_name):
+TRANSCODING_COLUMNS = ("encoding_success",
+                       "encoding_time",
+                       "encoding_time_ci_low",
+                       "encoding_time_ci_high",
+                       "encoding_strlen",
+                       "decoding_success",
+                       "decoding_time",
+                       "decoding_time_ci_low",
+                       "decoding_time_ci_high",
+                       "reversibility")
+
+
+@dataclass
+class HistoryRegression:
+    """
+        HistoryRegression class
+
+        A regression found by compare_runs(), see (pimydoc)regression.
+        _______________________________________________________________________
+
+        instance attributes:
+
+        o  (str)serializer
+        o  (str)dataobj
+        o  (str)attribute           : 'encoding_time', 'decoding_time',
+                                      'encoding_strlen', 'encoding_success',
+                                      'decoding_success' or 'reversibility'
+        o  (bool|float|int)reference: value in the reference run
+        o  (bool|float|int)current  : value in the current run
+    """
+    serializer: str
+    dataobj: str
+    attribute: str
+    reference: object
+    current: object
+
+
+@dataclass
+class HistoryComparison:
+    """
+        HistoryComparison class
+
+        Comparison of the current run with a previous one, see compare_runs().
+        _______________________________________________________________________
+
+        instance attributes:
+
+        o  (int)reference_run       : id of the reference run
+        o  (float)reference_created : timestamp of the reference run
+        o  (bool)same_machine       : False if the reference run has been made
+                                      on another machine or with another Python
+        o  (float)threshold         : see (pimydoc)COMPAREWITH format
+        o  (dict)versions           : versions[serializer] = (reference version,
+                                                              current version)
+                                      only for the serializers whose version changed
+        o  (int)compared            : number of transcodings found in both runs
+        o  (list)regressions        : list of HistoryRegression objects
+        o  (None|int)current_run    : id of the current run if it has been
+                                      recorded (see --history)
+    """
+    # names are the ones of the report:
+    #   pylint: disable=too-many-instance-attributes
+    reference_run: int
+    reference_created: float
+    same_machine: bool
+    threshold: float
+    versions: dict = field(default_factory=dict)
+    compared: int = 0
+    regressions: list = field(default_factory=list)
+    current_run: int = None
+
+
+def compare_runs(reference,
+                 current,
+                 threshold):
+    """
+        compare_runs()
+
+        Compare the <current> run with the <reference> run and search the
+        regressions.
+
+        (pimydoc)regression
+        ⋅A regression is reported for a (serializer, data object) if:
+        ⋅* its encoding/decoding time has grown by more than 'threshold' % and
+        ⋅  the 95% confidence intervals of both medians don't overlap;
+        ⋅* its encoded string length has grown by more than 'threshold' %;
+        ⋅* its encoding/decoding/reversibility succeeded and now fails.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (dict)reference: a run, see the beginning of this file
+        o  (dict)current  : a run, see the beginning of this file
+        o  (float)threshold: minimal growth, in %
+
+        RETURNED VALUE: a HistoryComparison object
+    """
+    comparison = HistoryComparison(
+        reference_run=reference["run_id"],
+        reference_created=reference["created"],
+        same_machine=(reference["machine"], reference["python"]) ==
+        (current["machine"], current["python"]),
+        threshold=threshold,
+        versions={serializer: (reference["versions"][serializer], version)
+                  for serializer, version in current["versions"].items()
+                  if reference["versions"].get(serializer, version) != version})
+
+    factor = 1 + threshold/100
+    for (serializer, data_name), new in sorted(current["transcodings"].items()):
+        old = reference["transcodings"].get((serializer, data_name))
+        if old is None:
+            continue
+        comparison.compared += 1
+
+        attributes = [attribute
+                      for attribute in ("encoding_success", "decoding_success", "reversibility")
+                      if old[attribute] and not new[attribute]]
+
+        if old["encoding_success"] and new["encoding_success"] and \
+           old["encoding_strlen"] and new["encoding_strlen"] is not None and \
+           new["encoding_strlen"] > old["encoding_strlen"]*factor:
+            attributes.append("encoding_strlen")
+
+        for prefix in ("encoding", "decoding"):
+            if not (old[f"{prefix}_success"] and new[f"{prefix}_success"]) or \
+               None in (old[f"{prefix}_time"], new[f"{prefix}_time"],
+                        old[f"{prefix}_time_ci_high"], new[f"{prefix}_time_ci_low"]):
+                continue
+            if new[f"{prefix}_time"] > old[f"{prefix}_time"]*factor and \
+               new[f"{prefix}_time_ci_low"] > old[f"{prefix}_time_ci_high"]:
+                attributes.append(f"{prefix}_time")
+
+        comparison.regressions.extend(HistoryRegression(serializer=serializer,
+                                                        dataobj=data_name,
+                                                        attribute=attribute,
+                                                        reference=old[attribute],
+                                                        current=new[attribute])
+                                      for attribute in attributes)
+
+    return comparison
+
+
+def get_current_run(results):
+    """
+        get_current_run()
+
+        Return the description of the current run.
+
+        The interrupted transcodings (see --sandbox and --budget) are skipped:
+        their results are not measures and can't be compared.
+        _______________________________________________________________________
+
+        ARGUMENT:
+        o  results: (SerializationResults)a dict of
+                    [(str)serializer][(str)data_name] = SerializationResult
+
+        RETURNED VALUE: (dict)a run, see the beginning of this file.
+    """
+    transcodings = {}
+    for serializer in results.serializers:
+        for data_name, result in results[serializer].items():
+            if result is None or result.interruption is not None:
+                continue
+            row = {"encoding_success": result.encoding_success,
+                   "encoding_strlen": result.encoding_strlen,
+                   "decoding_success": result.decoding_success,
+                   "reversibility": result.reversibility}
+            for prefix in ("encoding", "decoding"):
+                timestats = getattr(result, f"{prefix}_timestats")
+                row[f"{prefix}_time"] = getattr(result, f"{prefix}_time")
+                row[f"{prefix}_time_ci_low"], row[f"{prefix}_time_ci_high"] = \
+                    (None, None) if timestats is None else timestats.ci95
+            transcodings[(serializer, data_name)] = row
+
+    return {"run_id": None,
+            "created": time.time(),
+            "machine": get_machine_fingerprint(),
+            "python": f"{platform.python_implementation()} {platform.python_version()}",
+            "versions": {serializer: str(wisteria.globs.SERIALIZERS[serializer].version)
+                         for serializer in results.serializers},
+            "transcodings": transcodings}
+
+
+def open_history():
+    """
+        open_history()
+
+        Open (or create) the history file HISTORYFILE_NAME.
+        _______________________________________________________________________
+
+        RETURNED VALUE: (None|sqlite3.Connection)None if the history file
+                        can't be opened
+    """
+    try:
+        connection = sqlite3.connect(wisteria.globs.HISTORYFILE_NAME)
+        connection.execute("CREATE TABLE IF NOT EXISTS runs "
+                           "(run_id INTEGER PRIMARY KEY AUTOINCREMENT, created REAL, "
+                           "baseline INTEGER, machine TEXT, python TEXT)")
+        connection.execute("CREATE TABLE IF NOT EXISTS versions "
+                           "(run_id INTEGER, serializer TEXT, version TEXT)")
+        connection.execute("CREATE TABLE IF NOT EXISTS transcodings "
+                           "(run_id INTEGER, serializer TEXT, data_name TEXT, " +
+                           ", ".join(TRANSCODING_COLUMNS) + ")")
+    except sqlite3.Error as exception:
+        msgwarning(f"Can't open the history file '{wisteria.globs.HISTORYFILE_NAME}' "
+                   f"({exception}): the history won't be used.")
+        return None
+    return connection
+
+
+def read_run(connection,
+             run):
+    """
+        read_run()
+
+        Read a run in the history file.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (sqlite3.Connection)connection, the value returned by open_history()
+        o  (str|int)run: 'last', 'baseline' or a run id
+
+        RETURNED VALUE: (None|dict)the run (see the beginning of this file)
+                        or None if it can't be found
+    """
+    if run == "last":
+        row = connection.execute("SELECT run_id, created, machine, python FROM runs "
+                                 "ORDER BY run_id DESC LIMIT 1").fetchone()
+    elif run == "baseline":
+        row = connection.execute("SELECT run_id, created, machine, python FROM runs "
+                                 "WHERE baseline = 1 ORDER BY run_id DESC LIMIT 1").fetchone()
+    else:
+        row = connection.execute("SELECT run_id, created, machine, python FROM runs "
+                                 "WHERE run_id = ?", (run,)).fetchone()
+    if row is None:
+        return None
+
+    run_id = row[0]
+    return {"run_id": run_id,
+            "created": row[1],
+            "machine": row[2],
+            "python": row[3],
+            "versions": dict(connection.execute("SELECT serializer, version FROM versions "
+                                                "WHERE run_id = ?", (run_id,))),
+            "transcodings": {(serializer, data_name): dict(zip(TRANSCODING_COLUMNS, values))
+                             for serializer, data_name, *values in connection.execute(
+                                 "SELECT serializer, data_name, " +
+                                 ", ".join(TRANSCODING_COLUMNS) +
+                                 " FROM transcodings WHERE run_id = ?", (run_id,))}}
+
+
+def record_run(connection,
+               run,
+               baseline):
+    """
+        record_run()
+
+        Append <run> to the history file.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (sqlite3.Connection)connection, the value returned by open_history()
+        o  (dict)run: a run, see the beginning of this file
+        o  (bool)baseline: True if <run> is the new baseline
+
+        RETURNED VALUE: (int)the id of the recorded run
+    """
+    run_id = connection.execute("INSERT INTO runs (created, baseline, machine, python) "
+                                "VALUES (?, ?, ?, ?)",
+                                (run["created"], int(baseline),
+                                 run["machine"], run["python"])).lastrowid
+    connection.executemany("INSERT INTO versions VALUES (?, ?, ?)",
+                           ((run_id, serializer, version)
+                            for serializer, version in run["versions"].items()))
+    connection.executemany("INSERT INTO transcodings VALUES (" +
+                           ", ".join("?"*(3+len(TRANSCODING_COLUMNS))) + ")",
+                           ((run_id, serializer, data_name,
+                             *(row[column] for column in TRANSCODING_COLUMNS))
+                            for (serializer, data_name), row in run["transcodings"].items()))
+    connection.commit()
+    return run_id
+
+
+def update_history(results):
+    """
+        update_history()
+
+        Compare the current run with the run given by --comparewith, then
+        append the current run to the history file if --history asks for it.
+
+        Initialize wisteria.globs.HISTORY_COMPARISON .
+        _______________________________________________________________________
+
+        ARGUMENT:
+        o  results: (SerializationResults)a dict of
+                    [(str)serializer][(str)data_name] = SerializationResult
+
+        RETURNED VALUE: (None|HistoryComparison)the comparison, None if there's
+                        no comparison.
+    """
+    if wisteria.globs.HISTORY == "off" and not wisteria.globs.COMPAREWITH:
+        return None
+
+    connection = open_history()
+    if connection is None:
+        return None
+
+    current = get_current_run(results)
+    comparison = None
+    try:
+        # the reference run has to be read before the current run is recorded,
+        # otherwise 'last' would be the current run:
+        if wisteria.globs.COMPAREWITH:
+            reference = read_run(connection, wisteria.globs.COMPAREWITH["run"])
+            if reference is None:
+                msgwarning(f"Can't find run '{wisteria.globs.COMPAREWITH['run']}' in the "
+                           f"history file '{wisteria.globs.HISTORYFILE_NAME}': "
+                           "no comparison with a previous run.")
+            else:
+                comparison = compare_runs(reference,
+                                          current,
+                                          wisteria.globs.COMPAREWITH["threshold"])
+
+        if wisteria.globs.HISTORY != "off":
+            current["run_id"] = record_run(connection,
+                                           current,
+                                           baseline=wisteria.globs.HISTORY == "baseline")
+            if comparison is not None:
+                comparison.current_run = current["run_id"]
+            if wisteria.globs.ARGS.verbosity >= VERBOSITY_NORMAL:
+                msginfo(f"Current run recorded as run #{current['run_id']} in the history "
+                        f"file '{wisteria.globs.HISTORYFILE_NAME}'.")
+    except sqlite3.Error as exception:
+        msgwarning(f"Can't use the history file '{wisteria.globs.HISTORYFILE_NAME}' "
+                   f"({exception}).")
+    finally:
+        connection.close()
+
+    wisteria.globs.HISTORY_COMPARISON = comparison
+    return comparison
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/jobs.py
+
+    Execution of PLANNED_TRANSCODINGS across several processes (--jobs).
+
+    Each planned transcoding is computed by a freshly forked process: at most
+    <jobs> processes are alive at the same time. Since each process is a new
+    one, the memory it uses (see memprobe.py) only depends on the transcoding
+    it computes.
+    Results are sent back to the main process through a pipe.
+
+    If --sandbox is 'on', the processes are also used when --jobs is 1: a process
+    lasting more than SANDBOX['timeout'] seconds is killed and a process may be
+    limited to SANDBOX['maxmemory'] MB. A crash, a timeout or a memory
+    exhaustion doesn't stop the program: the transcoding gets an interrupted
+    result (see SerializationResult.interruption).
+
+    If --budget sets a 'total' budget, the processes still running once it is
+    exhausted are killed and the transcodings not yet started aren't computed:
+    they all get a 'budget' interrupted result.
+    ___________________________________________________________________________
+
+    o  get_interrupted_result(interruption)
+    o  get_jobs_number()
+    o  get_physical_cores_cpus()
+    o  limit_current_process_memory(maxmemory)
+    o  iter_transcodings_in_subprocesses(planned_transcodings, jobs, cpus, budget_deadline=None)
+    o  pin_current_process(cpu)
+    o  transcode_in_subprocess(connection, planned_transcoding, cpu)
+"""
+import multiprocessing
+import multiprocessing.connection
+import os
+import os.path
+import pickle
+import time
+
+try:
+    import resource
+except ImportError:
+    # e.g. on Windows systems: SANDBOX['maxmemory'] can't be enforced.
+    resource = None
+
+import psutil  # pylint: disable=import-error
+
+import wisteria.globs
+from wisteria.globs import VERBOSITY_DEBUG, VERBOSITY_DETAILS
+from wisteria.msg import msgdebug, msginfo, msgwarning
+from wisteria.serializers import func_serialize
+from wisteria.serializers_classes import SerializationResult
+from wisteria.wisteriaerror import WisteriaError
+
+
+def get_interrupted_result(interruption):
+    """
+        get_interrupted_result()
+
+        Return the result of a transcoding whose sandboxed process has been
+        interrupted (see --sandbox).
+        _______________________________________________________________________
+
+        ARGUMENT: (str)interruption, 'crash', 'timeout', 'memory' or 'budget'
+
+        RETURNED VALUE: (SerializationResult)a failed encoding
+    """
+    result = SerializationResult()
+    result.interruption = interruption
+    return result
+
+
+def get_jobs_number():
+    """
+        get_jobs_number()
+
+        Interpret --jobs and --pinworkers and return the number of processes
+        to be used and the cpus on which they have to be pinned.
+
+        SANDBOX['mode'] is set to 'off' if processes can't be forked.
+        _______________________________________________________________________
+
+        RETURNED VALUE: ((int)jobs, (None|list of int)cpus)
+                        If <jobs> is 1, transcodings are computed in the main process.
+                        If <cpus> is None, processes are not pinned.
+    """
+    jobs = wisteria.globs.ARGS.jobs
+    if jobs == 0:
+        jobs = psutil.cpu_count(logical=False) or 1
+
+    if jobs > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        msgwarning("--jobs is ignored on this platform since processes can't be forked: "
+                   "all transcodings will be computed in the main process.")
+        jobs = 1
+
+    if wisteria.globs.SANDBOX.get("mode", "off") == "on" and \
+       "fork" not in multiprocessing.get_all_start_methods():
+        msgwarning("--sandbox is ignored on this platform since processes can't be forked.")
+        wisteria.globs.SANDBOX["mode"] = "off"
+
+    cpus = None
+    if wisteria.globs.ARGS.pinworkers:
+        if not hasattr(psutil.Process(), "cpu_affinity"):
+            msgwarning("--pinworkers is ignored on this platform since "
+                       "the cpu affinity of a process can't be set.")
+        else:
+            cpus = get_physical_cores_cpus()
+            if jobs > len(cpus):
+                msgwarning(f"--jobs: only {len(cpus)} physical core(s) available "
+                           "for --pinworkers: "
+                           f"the number of processes is reduced from {jobs} to {len(cpus)}.")
+                jobs = len(cpus)
+
+    if wisteria.globs.ARGS.verbosity >= VERBOSITY_DETAILS:
+        msginfo(f"Transcodings will be computed by {jobs} process(es)"
+                f"{'' if cpus is None else ', one per physical core'}.")
+
+    return jobs, cpus
+
+
+def get_physical_cores_cpus():
+    """
+        get_physical_cores_cpus()
+
+        Return a list of logical cpus, exactly one per available physical core.
+
+        On Linux systems, the topology described in /sys/devices/system/cpu/ is
+        used to skip the hyperthreaded siblings; on other systems, the first
+        logical cpus are kept.
+        _______________________________________________________________________
+
+        RETURNED VALUE: (list of int)the logical cpus
+    """
+    available_cpus = sorted(psutil.Process().cpu_affinity())
+    physical_cores_number = psutil.cpu_count(logical=False) or len(available_cpus)
+
+    res = []
+    known_cores = set()
+    for cpu in available_cpus:
+        siblings_filename = f"/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list"
+        if not os.path.exists(siblings_filename):
+            # no topology available: we keep the first logical cpus.
+            return available_cpus[:physical_cores_number]
+
+        with open(siblings_filename, encoding="utf-8") as siblings_file:
+            core = siblings_file.read().strip()
+        if core not in known_cores:
+            known_cores.add(core)
+            res.append(cpu)
+
+    return res
+
+
+def iter_transcodings_in_subprocesses(planned_transcodings,
+                                      jobs,
+                                      cpus,
+                                      budget_deadline=None):
+    """
+        iter_transcodings_in_subprocesses()
+
+        Compute <planned_transcodings> using at most <jobs> processes at the
+        same time and yield the results as soon as they are available.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (list)planned_transcodings   : see (pimydoc)PLANNED_TRANSCODINGS
+        o  (int)jobs                    : maximal number of processes alive at the same time
+        o  (None|list of int)cpus       : if not None, each process is pinned on one of
+                                          these cpus, which are never shared.
+        o  (None|float)budget_deadline  : if not None, time.monotonic() value after which
+                                          no transcoding can be computed (see --budget)
+
+        If --sandbox is 'on', a crashed or killed process gives an interrupted
+        result (see get_interrupted_result()); otherwise WisteriaError is raised.
+        Once <budget_deadline> is reached, each remaining transcoding gets a
+        'budget' interrupted result.
+
+        The processes still running when the generator is left (error, or
+        consumer stopping the iteration) are killed.
+
+        RETURNED VALUE: yield ((serializer, data_name, fingerprint), SerializationResult)
+    """
+    context = multiprocessing.get_context("fork")
+
+    sandbox = wisteria.globs.SANDBOX.get("mode", "off") == "on"
+    pending = list(planned_transcodings)
+    free_cpus = list(cpus) if cpus is not None else [None]*jobs
+    running = {}  # running[reader] = (process, planned_transcoding, cpu, (None|float)deadline)
+
+    try:
+        while pending or running:
+            if budget_deadline is not None and time.monotonic() >= budget_deadline:
+                while pending:
+                    yield pending.pop(0), get_interrupted_result("budget")
+
+            while pending and free_cpus:
+                planned_transcoding = pending.pop(0)
+                cpu = free_cpus.pop(0)
+
+                reader, writer = context.Pipe(duplex=False)
+                process = context.Process(target=transcode_in_subprocess,
+                                          args=(writer, planned_transcoding, cpu))
+                process.start()
+                # the writer is only used by the child process:
+                writer.close()
+                running[reader] = (process, planned_transcoding, cpu,
+                                   time.monotonic() + wisteria.globs.SANDBOX["timeout"]
+                                   if sandbox else None)
+
+                if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+                    msgdebug(f"process #{process.pid} started for {planned_transcoding} "
+                             f"(cpu: {cpu}).")
+
+            deadlines = [deadline for *_, deadline in running.values() if deadline is not None]
+            if budget_deadline is not None:
+                deadlines.append(budget_deadline)
+            ready = multiprocessing.connection.wait(
+                list(running),
+                timeout=max(0, min(deadlines)-time.monotonic()) if deadlines else None)
+
+            for reader in list(running):
+                process, planned_transcoding, cpu, deadline = running[reader]
+                if reader in ready:
+                    try:
+                        result, error = reader.recv()
+                    except EOFError:
+                        result, error = None, f"process #{process.pid} died without any result " \
+                            f"(exit code: {process.exitcode})."
+                        if sandbox:
+                            result, error = get_interrupted_result("crash"), None
+                elif deadline is not None and time.monotonic() >= deadline:
+                    process.kill()
+                    result, error = get_interrupted_result("timeout"), None
+                elif budget_deadline is not None and time.monotonic() >= budget_deadline:
+                    process.kill()
+                    result, error = get_interrupted_result("budget"), None
+                else:
+                    continue
+
+                del running[reader]
+                reader.close()
+                process.join()
+                free_cpus.append(cpu)
+
+                if error is not None:
+                    raise WisteriaError(f"(ERRORID056) An error occured while computing "
+                                        f"{planned_transcoding}: {error}")
+
+                if result.interruption is not None and \
+                   wisteria.globs.ARGS.verbosity >= VERBOSITY_DETAILS:
+                    msginfo(f"--sandbox: process #{process.pid} computing {planned_transcoding} "
+                            f"has been interrupted ({result.interruption}).")
+
+                yield planned_transcoding, result
+    finally:
+        # an error or a consumer stopping the generator: no process may survive.
+        for reader, (process, *_) in running.items():
+            process.kill()
+            process.join()
+            process.close()
+            reader.close()
+
+
+def limit_current_process_memory(maxmemory):
+    """
+        limit_current_process_memory()
+
+        Forbid the current process to allocate more than <maxmemory> MB, in
+        addition to the memory it already uses.
+
+        Nothing is done if the resource module isn't available.
+        _______________________________________________________________________
+
+        ARGUMENT: (float)maxmemory, in MB
+    """
+    if resource is None:
+        return
+
+    limit = psutil.Process().memory_info().vms + int(maxmemory*2**20)
+    _, hardlimit = resource.getrlimit(resource.RLIMIT_AS)
+    if hardlimit != resource.RLIM_INFINITY:
+        limit = min(limit, hardlimit)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hardlimit))
+
+    if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+        msgdebug(f"process #{os.getpid()}: address space limited to {limit} bytes.")
+
+
+def pin_current_process(cpu):
+    """
+        pin_current_process()
+
+        Pin the current process on <cpu>.
+        _______________________________________________________________________
+
+        ARGUMENT: (int)cpu, the logical cpu on which the current process has to run.
+    """
+    psutil.Process().cpu_affinity([cpu])
+
+    if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+        msgdebug(f"process #{os.getpid()} pinned on cpu #{cpu}.")
+
+
+def transcode_in_subprocess(connection,
+                            planned_transcoding,
+                            cpu):
+    """
+        transcode_in_subprocess()
+
+        Function executed by the child processes: compute <planned_transcoding>
+        and send the result through <connection>.
+
+        If --sandbox is 'on', the memory of the process may be limited (see
+        SANDBOX['maxmemory']): a MemoryError gives an interrupted result.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (multiprocessing.connection.Connection)connection
+        o  (tuple)planned_transcoding  : (serializer, data_name, fingerprint)
+        o  (None|int)cpu               : if not None, the cpu on which the process has to run.
+    """
+    serializer, data_name, fingerprint = planned_transcoding
+
+    try:
+        if cpu is not None:
+            pin_current_process(cpu)
+        if wisteria.globs.SANDBOX.get("mode", "off") == "on" and \
+           wisteria.globs.SANDBOX["maxmemory"] is not None:
+            limit_current_process_memory(wisteria.globs.SANDBOX["maxmemory"])
+
+        try:
+            result = func_serialize(serializer,
+                                    data_name,
+                                    fingerprint)
+        except MemoryError:
+            if wisteria.globs.SANDBOX.get("mode", "off") == "off":
+                raise
+            result = get_interrupted_result("memory")
+    except WisteriaError as exception:
+        connection.send((None, str(exception)))
+        connection.close()
+        return
+
+    try:
+        connection.send((result, None))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # the encoded object can't be sent back; its representation is enough
+        # for the report:
+        result.encoded_object = repr(result.encoded_object)
+        connection.send((result, None))
+    connection.close()
@@ -30,6 +30,7 @@
     o  gradient_image(axes, extent, direction=0.5, cmap_range=(0, 1), **kwargs)
     o  gradient_bar(axes, pos_x, pos_y, height=0.4, left=0)
     o  hbar2png(_data, filename, unit, title, fmtstring, value_coeff)
+    o  scaling2png(family_scaling, filename, title)
 """
 try:
     from matplotlib import pyplot
@@ -38,6 +39,7 @@ except ModuleNotFoundError:
     pass
 
 import wisteria.globs
+from wisteria.globs import UNITS
 
 
 def gradient_image(axes,
@@ -183,3 +185,47 @@ def hbar2png(results_hall_attribute,
     axes.set_yticks(range(length))
 
     pyplot.savefig(filename)
+
+
+def scaling2png(family_scaling,
+                filename,
+                title):
+    """
+            Create a graph with three log-log plots (encoding time, decoding time
+            and encoded string length vs N) from <family_scaling> and write it in
+            <filename>.
+            ___________________________________________________________________
+
+            ARGUMENTS:
+            o  (dict)family_scaling: [(str)serializer] = list of (size, encoding_time,
+                                     decoding_time, encoding_strlen), see
+                                     datagen.py::compute_scaling()
+            o  (str)      filename: path to the file to be written
+            o  (str)         title: title of the graph
+    """
+    pyplot.rcdefaults()
+    fig, all_axes = pyplot.subplots(1, 3, figsize=(15, 5))
+    fig.suptitle(title)
+
+    for axes, (point_index, ylabel) in zip(all_axes,
+                                           ((1, f"encoding time ({UNITS['time']})"),
+                                            (2, f"decoding time ({UNITS['time']})"),
+                                            (3, f"encoded string length "
+                                                f"({UNITS['string length']})"))):
+        for serializer, points in sorted(family_scaling.items()):
+            points = tuple((point[0], point[point_index]) for point in points
+                           if point[point_index])
+            if points:
+                axes.plot(tuple(point[0] for point in points),
+                          tuple(point[1] for point in points),
+                          marker="o",
+                          label=wisteria.globs.SERIALIZERS[serializer].human_name)
+        axes.set_xscale("log")
+        axes.set_yscale("log")
+        axes.set_xlabel("N")
+        axes.set_ylabel(ylabel)
+
+    all_axes[0].legend(fontsize="x-small")
+    fig.tight_layout()
+    pyplot.savefig(filename)
+    pyplot.close(fig)
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/memprobe.py
+
+    Memory measurement engine: memory used by ONE call, following the
+    'memprobe' key of --method:
+
+    * 'tracemalloc': peak/net of the memory allocated through Python's allocator
+                     during the call; memory allocated directly by C libraries
+                     is not seen;
+    * 'rss'        : peak/net of the resident set size of the process, sampled
+                     by a background thread during the call; before the call,
+                     the free memory kept by the C allocator is given back to
+                     the system (see release_free_memory()) so that it isn't
+                     silently reused by the call;
+    * 'fork'       : like 'rss' but the call is made by a new forked process, so
+                     that the memory freed by the previous calls and still kept
+                     by Python's own allocator doesn't hide the memory used by
+                     this one.
+
+    Where the high-water mark of the resident set size can be reset (Linux, see
+    reset_peak_rss()), it gives the peak, so that a peak shorter than the
+    sampling interval isn't missed; each measure only depends on the measured
+    call.
+    ___________________________________________________________________________
+
+    o  get_peak_rss()
+    o  is_memprobe_available(memprobe)
+    o  measure_memory(func, *args, **kwargs)
+    o  probe_fork(func)
+    o  probe_in_subprocess(connection, func)
+    o  probe_rss(func)
+    o  probe_tracemalloc(func)
+    o  release_free_memory()
+    o  reset_peak_rss()
+"""
+import ctypes
+import functools
+import multiprocessing
+import threading
+import tracemalloc
+
+import psutil  # pylint: disable=import-error
+
+import wisteria.globs
+from wisteria.serializers_classes import MemoryUsage
+
+
+# accepted values for the 'memprobe' key of --method:
+MEMPROBES = ("tracemalloc", "rss", "fork")
+
+# time between two samples of the resident set size, in seconds:
+RSS_SAMPLING_INTERVAL = 0.0005
+
+# Linux only: high-water mark of the resident set size (see get_peak_rss()), which
+# is reset to the current resident set size by writing "5" in CLEAR_REFS_FILENAME.
+PROC_STATUS_FILENAME = "/proc/self/status"
+CLEAR_REFS_FILENAME = "/proc/self/clear_refs"
+
+# glibc only: malloc_trim(), see release_free_memory()
+try:
+    MALLOC_TRIM = getattr(ctypes.CDLL(None), "malloc_trim", None)
+except (OSError, TypeError):
+    # e.g. on Windows systems
+    MALLOC_TRIM = None
+
+
+def get_peak_rss():
+    """
+        get_peak_rss()
+
+        Return the high-water mark of the resident set size of the current
+        process (VmHWM in /proc/self/status), see reset_peak_rss().
+        _______________________________________________________________________
+
+        RETURNED VALUE: (None|int)the peak, in bytes, or None if it can't be read
+    """
+    try:
+        with open(PROC_STATUS_FILENAME, encoding="utf-8") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])*1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def is_memprobe_available(memprobe):
+    """
+        is_memprobe_available()
+
+        Return True if <memprobe> can be used on this platform.
+        _______________________________________________________________________
+
+        ARGUMENT: (str)memprobe, one of MEMPROBES
+
+        RETURNED VALUE: (bool)True if <memprobe> can be used.
+    """
+    if memprobe == "fork":
+        return "fork" in multiprocessing.get_all_start_methods()
+    return True
+
+
+def measure_memory(func,
+                   *args,
+                   **kwargs):
+    """
+        measure_memory()
+
+        Measure the memory used by a call to func(*args, **kwargs), following
+        wisteria.globs.METHOD['memprobe'].
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (callable)func
+        o  *args, **kwargs: arguments given to <func>
+
+        RETURNED VALUE: a MemoryUsage object
+    """
+    method = wisteria.globs.METHOD or wisteria.globs.METHOD_DEFAULTS
+    if args or kwargs:
+        func = functools.partial(func, *args, **kwargs)
+
+    if method["memprobe"] == "fork":
+        return probe_fork(func)
+    if method["memprobe"] == "rss":
+        return probe_rss(func)
+    return probe_tracemalloc(func)
+
+
+def probe_fork(func):
+    """
+        probe_fork()
+
+        Measure with probe_rss() the memory used by func() in a new forked process.
+        _______________________________________________________________________
+
+        ARGUMENT: (callable)func: function without argument
+
+        RETURNED VALUE: a MemoryUsage object
+    """
+    context = multiprocessing.get_context("fork")
+    reader, writer = context.Pipe(duplex=False)
+    process = context.Process(target=probe_in_subprocess,
+                              args=(writer, func))
+    process.start()
+    # the writer is only used by the child process:
+    writer.close()
+
+    try:
+        res = reader.recv()
+    except EOFError:
+        # the child process died without any result: the memory can't be measured.
+        res = MemoryUsage(peak=None, net=None)
+    reader.close()
+    process.join()
+
+    return res
+
+
+def probe_in_subprocess(connection,
+                        func):
+    """
+        probe_in_subprocess()
+
+        Function executed by the child processes created by probe_fork():
+        measure the memory used by func() and send it through <connection>.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (multiprocessing.connection.Connection)connection
+        o  (callable)func: function without argument
+    """
+    connection.send(probe_rss(func))
+    connection.close()
+
+
+def probe_rss(func):
+    """
+        probe_rss()
+
+        Measure the resident set size of the current process while func() is
+        being called: a background thread takes a sample every
+        RSS_SAMPLING_INTERVAL seconds and, if it can be reset, the high-water
+        mark of the resident set size gives the peak. The free memory kept by
+        the C allocator is given back to the system first.
+        _______________________________________________________________________
+
+        ARGUMENT: (callable)func: function without argument
+
+        RETURNED VALUE: a MemoryUsage object
+    """
+    process = psutil.Process()
+    release_free_memory()
+    hiwater = reset_peak_rss()
+    rss0 = process.memory_info().rss
+    peak = rss0
+    stop_sampling = threading.Event()
+
+    def sample():
+        nonlocal peak
+        while not stop_sampling.is_set():
+            peak = max(peak, process.memory_info().rss)
+            stop_sampling.wait(RSS_SAMPLING_INTERVAL)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        result = func()
+        rss1 = process.memory_info().rss
+    finally:
+        stop_sampling.set()
+        sampler.join()
+    del result
+
+    if hiwater:
+        peak = max(peak, get_peak_rss() or 0)
+
+    return MemoryUsage(peak=max(peak, rss1)-rss0,
+                       net=rss1-rss0)
+
+
+def probe_tracemalloc(func):
+    """
+        probe_tracemalloc()
+
+        Measure with tracemalloc the memory allocated by func().
+
+        If tracemalloc was already tracing (e.g. python -X tracemalloc), its
+        traces are left untouched and the deltas are returned; since the peak
+        can't be reset (no tracemalloc.reset_peak() before Python 3.9), the
+        peak is then an upper bound if func() didn't reach the previous peak.
+        _______________________________________________________________________
+
+        ARGUMENT: (callable)func: function without argument
+
+        RETURNED VALUE: a MemoryUsage object
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if was_tracing:
+        # the traces of the caller are kept: only the deltas are measured.
+        current0, _ = tracemalloc.get_traced_memory()
+    else:
+        tracemalloc.start()
+        current0 = 0
+
+    try:
+        result = func()
+        current1, peak1 = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    net = current1-current0
+    peak = peak1-current0
+
+    return MemoryUsage(peak=peak,
+                       net=net)
+
+
+def release_free_memory():
+    """
+        release_free_memory()
+
+        Give back to the system the free memory kept by the C allocator: the
+        next allocations make the resident set size grow instead of reusing
+        memory freed by the previous calls, which is still resident.
+
+        glibc only (malloc_trim()): elsewhere, nothing is done.
+    """
+    if MALLOC_TRIM is not None:
+        MALLOC_TRIM(0)
+
+
+def reset_peak_rss():
+    """
+        reset_peak_rss()
+
+        Reset the high-water mark of the resident set size of the current
+        process to its current resident set size (Linux only).
+        _______________________________________________________________________
+
+        RETURNED VALUE: (bool)True if the high-water mark has been reset and
+                        can be read by get_peak_rss().
+    """
+    try:
+        with open(CLEAR_REFS_FILENAME, "w", encoding="utf-8") as clear_refs:
+            clear_refs.write("5")
+    except OSError:
+        return False
+    return get_peak_rss() is not None
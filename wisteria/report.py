@@ -78,6 +78,11 @@ from wisteria.reprfmt import fmt_exaequowith, fmt_exaequowith_hall, fmt_projectv
 from wisteria.cmdline_mymachine import mymachine
 from wisteria.textandnotes import TextAndNotes
 from wisteria.matplotgraphs import hbar2png
+from wisteria.report_extra import add_throughput_columns, ops_throughput2sentence
+from wisteria.report_extra import throughput_cells
+from wisteria.report_extra import report_section_b4, report_section_b5, report_section_b6
+from wisteria.report_extra import report_section_b7, report_section_b8, report_section_b9
+from wisteria.report_extra import report_section_graphs__scaling
 from wisteria.cwc.cwc_utils import select__works_as_expected__function
 from wisteria.helpmsg import help_cmdline_output
 
@@ -498,6 +503,12 @@ def report_section_a1(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -542,6 +553,15 @@ def report_section_a1(results,
     msgreport(
             "* --filter = "
             f"'[italic]{wisteria.globs.ARGS.filter}[/italic]'")
+    msgreport(
+            "* --jobs = "
+            f"'[italic]{wisteria.globs.ARGS.jobs}[/italic]'"
+            f"{' (--pinworkers)' if wisteria.globs.ARGS.pinworkers else ''}")
+    for option in ("method", "cache", "exportresults", "history", "comparewith",
+                   "stages", "sandbox", "budget"):
+        msgreport(
+            f"* --{option} = "
+            f"'[italic]{getattr(wisteria.globs.ARGS, option)}[/italic]'")
 
     msgreport()
 
@@ -569,6 +589,12 @@ def report_section_a2(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -639,6 +665,12 @@ def report_section_a3(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -710,6 +742,12 @@ def report_section_a4(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -780,6 +818,12 @@ def report_section_a5(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -853,6 +897,12 @@ def report_section_b1a(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -889,6 +939,7 @@ def report_section_b1a(results,
     table.add_column(f"Decod. Time ({UNITS['time']})", width=11)
     table.add_column("Reversibility ?", width=16)
     table.add_column("Memory", width=12)
+    add_throughput_columns(table, widths=(11, 11, 13))
     if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
         table.add_column("Fingerprint ( serial. + dataobj)", width=9)
 
@@ -906,7 +957,8 @@ def report_section_b1a(results,
                         results.repr_attr(serializer, dataobj, "decoding_success"),
                         results.repr_attr(serializer, dataobj, "decoding_time"),
                         results.repr_attr(serializer, dataobj, "reversibility"),
-                        results.repr_attr(serializer, dataobj, "mem_usage"),)
+                        results.repr_attr(serializer, dataobj, "mem_usage"),
+                        *throughput_cells(results, serializer, dataobj),)
                 else:
                     # debug mode:
                     table.add_row(
@@ -918,6 +970,7 @@ def report_section_b1a(results,
                         results.repr_attr(serializer, dataobj, "decoding_time"),
                         results.repr_attr(serializer, dataobj, "reversibility"),
                         results.repr_attr(serializer, dataobj, "mem_usage"),
+                        *throughput_cells(results, serializer, dataobj),
                         "["+strdigest(serializer+dataobj)+"]")
 
     msgreport(table)
@@ -950,6 +1003,12 @@ def report_section_b1b(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -1028,6 +1087,12 @@ def report_section_b1c(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -1064,6 +1129,7 @@ def report_section_b1c(results,
     table.add_column(f"Σ Decoded Time ({UNITS['time']})", width=17)
     table.add_column(f"Reversibility (Coverage Rate) (Max={results.dataobjs_number})", width=17)
     table.add_column("memory", width=12)
+    add_throughput_columns(table, widths=(17, 17, 17), suffix=", geometric mean")
 
     for index in range(results.serializers_total_number):
         table.add_row(
@@ -1075,6 +1141,9 @@ def report_section_b1c(results,
             f"{results.get_hall('decoding_time', index)}",
             f"{results.get_hall('reversibility', index)}",
             f"{results.get_hall('mem_usage', index)}",
+            f"{results.get_hall('encoding_throughput', index)}",
+            f"{results.get_hall('decoding_throughput', index)}",
+            f"{results.get_hall('ops_throughput', index)}",
         )
 
     msgreport(table)
@@ -1107,6 +1176,12 @@ def report_section_b1d(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -1178,6 +1253,12 @@ def report_section_b2a(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -1214,6 +1295,7 @@ def report_section_b2a(results,
     table.add_column(f"Decod. Time ({UNITS['time']})", width=11)
     table.add_column("Reversibility ?", width=16)
     table.add_column("Memory", width=12)
+    add_throughput_columns(table, widths=(11, 11, 13))
     if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
         table.add_column("Fingerprint ( serial. + dataobj)", width=9)
 
@@ -1231,7 +1313,8 @@ def report_section_b2a(results,
                         results.repr_attr(serializer, dataobj, "decoding_success"),
                         results.repr_attr(serializer, dataobj, "decoding_time"),
                         results.repr_attr(serializer, dataobj, "reversibility"),
-                        results.repr_attr(serializer, dataobj, "mem_usage")
+                        results.repr_attr(serializer, dataobj, "mem_usage"),
+                        *throughput_cells(results, serializer, dataobj),
                     )
                 else:
                     # debug mode:
@@ -1244,6 +1327,7 @@ def report_section_b2a(results,
                         results.repr_attr(serializer, dataobj, "decoding_time"),
                         results.repr_attr(serializer, dataobj, "reversibility"),
                         results.repr_attr(serializer, dataobj, "mem_usage"),
+                        *throughput_cells(results, serializer, dataobj),
                         "["+strdigest(serializer+dataobj)+"]")
     msgreport(table)
     msgreport()
@@ -1275,6 +1359,12 @@ def report_section_b2b(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -1361,6 +1451,12 @@ def report_section_b3(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -1428,6 +1524,12 @@ def report_section_c1a(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -1553,6 +1655,12 @@ def report_section_c1b(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -1677,6 +1785,12 @@ def report_section_c2a(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -1767,6 +1881,12 @@ def report_section_c2b(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -1864,7 +1984,8 @@ def report_section_c2c__allvsall(results,
             o  (str)attribute:  'mem_usage',
                                 'reversibility',
                                 'encoding_strlen',
-                                'encoding_plus_decoding_time'
+                                'encoding_plus_decoding_time',
+                                'ops_throughput'
             o  (str)meaning:    '+' or '-'
 
             RETURNED VALUE: (str)a phrase
@@ -1893,6 +2014,15 @@ def report_section_c2c__allvsall(results,
                 string_champion = 'is the slowest to encode/decode'
             elif meaning == '+':
                 string_champion = 'is the quickest to encode/decode'
+        elif attribute == 'ops_throughput':
+            string_equality = 'all serializers are equal when it comes to ' \
+                'encodings+decodings per second (__note:ops_throughput__)'
+            if meaning == '-':
+                string_champion = 'makes the fewest encodings+decodings per second ' \
+                    '(__note:ops_throughput__)'
+            elif meaning == '+':
+                string_champion = 'makes the most encodings+decodings per second ' \
+                    '(__note:ops_throughput__)'
 
         equality = results.are_all_serializers_equal_in_the_hall(attribute)
         # ---- not equality ? ----
@@ -1915,6 +2045,7 @@ def report_section_c2c__allvsall(results,
     text.append(cmpdata2phrase(cmpdata))
 
     text.append(f"{explicit('encoding_plus_decoding_time', '+')}, ")
+    text.append(f"{explicit('ops_throughput', '+')}, ")
     text.append(f"{explicit('encoding_strlen', '+')}, ")
     text.append(f"{explicit('reversibility', '+')} ")
     text.append(f"and {explicit('mem_usage', '+')}. ")
@@ -1931,6 +2062,7 @@ def report_section_c2c__allvsall(results,
 
     text.append("\nOn the contrary, ")
     text.append(f"{explicit('encoding_plus_decoding_time', '-')}, ")
+    text.append(f"{explicit('ops_throughput', '-')}, ")
     text.append(f"{explicit('encoding_strlen', '-')}, ")
     text.append(f"{explicit('reversibility', '-')} ")
     text.append(f"and {explicit('mem_usage', '-')}. ")
@@ -1946,6 +2078,10 @@ def report_section_c2c__allvsall(results,
                     f"{results.serializers_total_number} serializers, "
                     "according to the overall scores (__note:overallscore__).")
 
+    text.notes.append(
+        ("ops_throughput",
+         "geometric mean over the data objects, so that "
+         "a huge data object doesn't outweigh the others"))
     text.notes.append(
         ("overallscore",
          "a rank based on 4 comparisons points: "
@@ -2026,6 +2162,8 @@ def report_section_c2c__serializervsall(results,
                 string = 'All serializers are equal when it comes to data coverage.'
             elif attribute == "encoding_strlen":
                 string = 'All serializers are equal when it comes to encoded string length.'
+            elif attribute == "encoding_plus_decoding_time":
+                string = 'All serializers are equal when it comes to encoding/decoding time.'
 
         elif attribute == "mem_usage":
             if not _less:
@@ -2135,12 +2273,11 @@ def report_section_c2c__serializervsall(results,
 
         return string
 
-    for attribute in ("encoding_strlen",
-                      "encoding_plus_decoding_time",
-                      "reversibility",
-                      "mem_usage",
-                      ):
-        text.append(explicit(attribute)+" ")
+    text.append(explicit("encoding_strlen")+" ")
+    text.append(explicit("encoding_plus_decoding_time")+" ")
+    text.append(ops_throughput2sentence(results, serializer)+" ")
+    text.append(explicit("reversibility")+" ")
+    text.append(explicit("mem_usage")+" ")
 
     msgreport(text.output())
     msgreport()
@@ -2212,6 +2349,49 @@ def report_section_c2c__serializervsserializer(results,
                      numbersformat=".3f"
                  )))
 
+    # ---- ops_throughput -------------------------------------------------
+    if results.mean_throughput('ops_throughput', serializer=seria1, output='value') is None or \
+       results.mean_throughput('ops_throughput', serializer=seria2, output='value') is None:
+        text.append("no information can be given about the number of encodings+decodings "
+                    "per second since at least one serializer "
+                    "returns incoherent informations about this number; ")
+    else:
+        # > 1 if seria1 makes fewer encodings+decodings per second, i.e. if seria1 is slower:
+        ops_throughput_ratio = \
+            results.mean_throughput('ops_throughput', serializer=seria2, output='value') \
+            / results.mean_throughput('ops_throughput', serializer=seria1, output='value')
+
+        if ops_throughput_ratio == 1:
+            text.append(
+                f"{fmt_serializer(seria1)} "
+                f"and {fmt_serializer(seria2)} "
+                "seem to make exactly the same number of encodings+decodings per second; ")
+        else:
+            text.append(
+                "according to the number of encodings+decodings per second, "
+                f"{fmt_serializer(seria1)} "
+                f"is {ratio2phrase(ops_throughput_ratio, 'slow/fast')} "
+                f"- by a factor of {humanratio(ops_throughput_ratio):.3f} "
+                "(__note:ops_throughput_ratio__) - "
+                "than "
+                f"{fmt_serializer(seria2)}; ")
+
+            text.notes.append(
+                ("ops_throughput_ratio",
+                 humanratio(
+                     ops_throughput_ratio,
+                     explanations=(
+                         f"{fmt_serializer(seria2)}'s encod.+decod./s (geometric mean)",
+                         results.mean_throughput('ops_throughput', serializer=seria2,
+                                                 output='value'),
+                         f"{fmt_serializer(seria1)}'s encod.+decod./s (geometric mean)",
+                         results.mean_throughput('ops_throughput', serializer=seria1,
+                                                 output='value'),
+                         'ops throughput',
+                     ),
+                     numbersformat=".3f"
+                 )))
+
     # ---- total_encoding_strlen -----------------------------------------
     if results.total_encoding_strlen(serializer=seria1, output='value') is None or \
        results.total_encoding_strlen(serializer=seria2, output='value') is None:
@@ -2370,6 +2550,12 @@ def report_section_c2c(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -2433,6 +2619,12 @@ def report_section_d1a(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -2491,6 +2683,12 @@ def report_section_d1b(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -2549,6 +2747,12 @@ def report_section_graphs(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
@@ -2614,6 +2818,8 @@ def report_section_graphs(results,
             if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
                 msgdebug(f"results.hall['{attribute}'] = {results.hall[attribute]}")
 
+    report_section_graphs__scaling(results)
+
 
 # STR2REPORTSECTION has two goals:
 # (1) translate a (str)report section name > list of corresponding functions
@@ -2648,7 +2854,13 @@ STR2REPORTSECTION = {
               report_section_b1d,
               report_section_b2a,
               report_section_b2b,
-              report_section_b3,),
+              report_section_b3,
+              report_section_b4,
+              report_section_b5,
+              report_section_b6,
+              report_section_b7,
+              report_section_b8,
+              report_section_b9,),
         "B1": (report_section_b1a,
                report_section_b1b,
                report_section_b1c,
@@ -2662,6 +2874,12 @@ STR2REPORTSECTION = {
         "B2a": (report_section_b2a,),
         "B2b": (report_section_b2b,),
         "B3": (report_section_b3,),
+        "B4": (report_section_b4,),
+        "B5": (report_section_b5,),
+        "B6": (report_section_b6,),
+        "B7": (report_section_b7,),
+        "B8": (report_section_b8,),
+        "B9": (report_section_b9,),
         "C": (report_section_c1a,
               report_section_c1b,
               report_section_c2a,
@@ -2710,6 +2928,12 @@ def report(results,
         ⋅    . B2a   : full details: data object * serializer
         ⋅    . B2b   : full details: data objects
         ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
         ⋅* C         : conclusions
         ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
         ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
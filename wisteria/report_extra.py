@@ -0,0 +1,780 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/report_extra.py
+
+    Report sections B4 to B9 (scaling, comparison with a previous run, stages,
+    drift of the rounds) and the throughput/scaling parts of the other report
+    sections, all of them called by report.py .
+    ___________________________________________________________________________
+
+    o  add_throughput_columns(table, widths, suffix="")
+    o  ops_throughput2sentence(results, serializer)
+    o  throughput_cells(results, serializer, dataobj)
+
+    o  report_section_b4(results, s1s2d)
+    o  report_section_b5(results, s1s2d)
+    o  report_section_b6(results, s1s2d)
+    o  report_section_b7(results, s1s2d)
+    o  report_section_b8(results, s1s2d)
+    o  report_section_b9(results, s1s2d)
+    o  report_section_graphs__scaling(results)
+"""
+import time
+
+import rich.table
+
+import wisteria.globs
+from wisteria.globs import UNITS
+from wisteria.globs import VERBOSITY_DEBUG
+from wisteria.utils import normpath
+from wisteria.msg import msgreport, msgreporttitle, msgdebug
+from wisteria.reprfmt import fmt_serializer, fmt_data, fmt_percentage, fmt_list
+from wisteria.reprfmt import fmt_nounplural, fmt_mem_usage
+from wisteria.reprfmt import fmt_time, fmt_strlen, fmt_throughput, fmt_boolsuccess
+from wisteria.reprfmt import fmt_nodata
+from wisteria.matplotgraphs import scaling2png
+from wisteria.datagen import compute_scaling, fit_throughput, get_generated_families
+from wisteria.datagen import get_scaling_graph_filename
+from wisteria.stage_compress import summarize_compress_stage
+from wisteria.stage_mmap import summarize_mmap_stage
+from wisteria.stage_stream import summarize_stream_stage
+
+
+def add_throughput_columns(table,
+                           widths,
+                           suffix=""):
+    """
+        add_throughput_columns()
+
+        Add to <table> the three throughput columns (encoding, decoding,
+        encodings+decodings per second) of report sections B1a, B1c and B2a.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  table: (rich.table.Table)the table to be modified
+        o  widths: ((int)encod., (int)decod., (int)operations) width of each column
+        o  suffix: (str)added to the unit in each column header, e.g. ", geometric mean"
+    """
+    table.add_column(f"Encod. Throughput ({UNITS['throughput']}{suffix})", width=widths[0])
+    table.add_column(f"Decod. Throughput ({UNITS['throughput']}{suffix})", width=widths[1])
+    table.add_column(f"Operations ({UNITS['ops throughput']}{suffix})", width=widths[2])
+
+
+def ops_throughput2sentence(results,
+                            serializer):
+    """
+        ops_throughput2sentence()
+
+        Using results.hall['ops_throughput'], create a sentence comparing the
+        number of encodings+decodings per second of <serializer> with all the
+        other serializers; sub-function of
+        report.py:report_section_c2c__serializervsall().
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  results: (SerializationResults)a dict of
+                    [(str)serializer][(str)data_name] = SerializationResult
+        o  serializer: (str)the reference serializer
+
+        RETURNED VALUE: (str)a sentence
+    """
+    if results.are_all_serializers_equal_in_the_hall("ops_throughput"):
+        return 'All serializers are equal when it comes to ' \
+            'encodings+decodings per second.'
+
+    _less, _more = results.comparison_inside_hall(serializer, "ops_throughput")
+
+    if not _less:
+        string = "There's no serializer that makes fewer encodings+decodings " \
+                 f"per second than {fmt_serializer(serializer)} "
+    elif len(_less) == 1:
+        string = f"Only {fmt_serializer(_less[0])} makes fewer encodings+decodings " \
+                 f"per second than {fmt_serializer(serializer)} "
+    else:
+        string = f"There are {len(_less)} serializers" \
+                  ", namely " \
+                 f"{fmt_list(_less, fmt_serializer)}, " \
+                 "that make fewer encodings+decodings per second than " \
+                 f"{fmt_serializer(serializer)} "
+
+    if not _more:
+        string += "and there's no serializer that makes more of them."
+    elif len(_more) == 1:
+        string += f"and only {fmt_serializer(_more[0])} makes more of them."
+    else:
+        string += f"and there are {len(_more)} serializers" \
+                   ", namely " \
+                  f"{fmt_list(_more, fmt_serializer)}, " \
+                  "that make more of them."
+
+    return string
+
+
+def throughput_cells(results,
+                     serializer,
+                     dataobj):
+    """
+        throughput_cells()
+
+        Return the cells matching the columns added by add_throughput_columns()
+        for one (<serializer>, <dataobj>) row of report sections B1a and B2a.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  results: (SerializationResults)a dict of
+                    [(str)serializer][(str)data_name] = SerializationResult
+        o  serializer: (str)serializer name
+        o  dataobj: (str)data object name
+
+        RETURNED VALUE: ((str)encod. throughput, (str)decod. throughput, (str)operations)
+    """
+    return (results.repr_attr(serializer, dataobj, "encoding_throughput"),
+            results.repr_attr(serializer, dataobj, "decoding_throughput"),
+            results.repr_attr(serializer, dataobj, "ops_throughput"))
+
+
+# Since all report_() functions have the same signature, it may happen that
+# some arguments passed to the function are not used.
+#   pylint: disable=unused-argument
+def report_section_b4(results,
+                      s1s2d):
+    """
+        report_section_b4()
+
+        Sub-function of report() for report section "B4"
+        (pimydoc)report sections
+        ⋅* A         : main informations
+        ⋅  - A1      : options used to create reports
+        ⋅  - A2      : list of the serializers to be used because they have been selected
+        ⋅  - A3      : list of the data objects to be used because they have been selected
+        ⋅  - A4      : list of the planned transcodings
+        ⋅  - A5      : what do the encoded strings look like? (basic types/demonstration_dataobj)
+        ⋅* B         : full details (raw results)
+        ⋅  - B1      : full details (serializers)
+        ⋅    . B1a   : full details: serializer * data object
+        ⋅    . B1b   : full details: serializers
+        ⋅    . B1c   : full details: serializers, hall of fame
+        ⋅    . B1d   : full details: full details: serializer <S> can't handle <dataobj>
+        ⋅  - B2      : full details (data objects)
+        ⋅    . B2a   : full details: data object * serializer
+        ⋅    . B2b   : full details: data objects
+        ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
+        ⋅* C         : conclusions
+        ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
+        ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
+        ⋅    . C1b   : conclusion: data objects NOT handled by the serializer(s)
+        ⋅  - C2      : conclusion: final text and data
+        ⋅    . C2a   : conclusion: serializers (not sorted)
+        ⋅    . C2b   : conclusion: overall score (based on: Σ strlen./Σ enc+dec time/enc⇆dec)
+        ⋅    . C2c   : conclusion
+        ⋅* D         : various informations
+        ⋅  - D1      : informations about the machine
+        ⋅    . D1a   : informations about the machine (no extensive details)
+        ⋅    . D1b   : informations about the machine (extensive details)
+        ⋅* graphs    : graphic visualizations
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  results: (SerializationResults)a dict of
+                    [(str)serializer][(str)data_name] = SerializationResult
+
+        o  s1s2d: ( (str)seria1,
+                    (str)seria2,
+                    (str)cmpdata         -> 'all', 'ini', 'cwc' or 'allbutcwc', cf read_cmpstring()
+                  )
+    """
+    if "titles;" in wisteria.globs.ARGS.report:
+        msgreporttitle("(B4) Scaling: Time and Encoded String Length vs Size of the Generated Data")
+
+    scaling = compute_scaling(results)
+    if not scaling:
+        msgreport("No generated data object: see the \\[data generators] section "
+                  "of the config file.")
+        msgreport()
+        return
+
+    for family, family_data in sorted(scaling.items()):
+        sizes = sorted(set(point[0] for points in family_data.values() for point in points))
+
+        msgreport(f"* {fmt_data(family)} (N = {', '.join(str(size) for size in sizes)}):")
+        table = rich.table.Table(show_header=True, header_style="bold blue")
+        table.add_column("Serializer", width=28)
+        for size in sizes:
+            table.add_column(f"N={size}", width=12)
+        table.add_column(f"Enc. throughput ({UNITS['throughput']})", width=11)
+        table.add_column(f"Dec. throughput ({UNITS['throughput']})", width=11)
+
+        for serializer, points in sorted(family_data.items()):
+            size2point = {point[0]: point for point in points}
+            cells = []
+            for size in sizes:
+                _, encoding_time, decoding_time, encoding_strlen = \
+                    size2point.get(size, (size, None, None, None))
+                cells.append(f"{fmt_time(encoding_time)}\n"
+                             f"{fmt_time(decoding_time)}\n"
+                             f"{fmt_strlen(encoding_strlen)}")
+            table.add_row(
+                f"{fmt_serializer(serializer)}",
+                *cells,
+                fmt_throughput(fit_throughput((point[3], point[1]) for point in points)),
+                fmt_throughput(fit_throughput((point[3], point[2]) for point in points)),
+            )
+        msgreport(table)
+    msgreport(f"For each N: encoding time ({UNITS['time']}), decoding time ({UNITS['time']}), "
+              f"encoded string length ({UNITS['string length']}).")
+    msgreport("Throughputs are fitted by least squares on (encoded string length, time), "
+              "1 MB being 10**6 characters.")
+    msgreport()
+
+
+def report_section_b5(results,
+                      s1s2d):
+    """
+        report_section_b5()
+
+        Sub-function of report() for report section "B5"
+        (pimydoc)report sections
+        ⋅* A         : main informations
+        ⋅  - A1      : options used to create reports
+        ⋅  - A2      : list of the serializers to be used because they have been selected
+        ⋅  - A3      : list of the data objects to be used because they have been selected
+        ⋅  - A4      : list of the planned transcodings
+        ⋅  - A5      : what do the encoded strings look like? (basic types/demonstration_dataobj)
+        ⋅* B         : full details (raw results)
+        ⋅  - B1      : full details (serializers)
+        ⋅    . B1a   : full details: serializer * data object
+        ⋅    . B1b   : full details: serializers
+        ⋅    . B1c   : full details: serializers, hall of fame
+        ⋅    . B1d   : full details: full details: serializer <S> can't handle <dataobj>
+        ⋅  - B2      : full details (data objects)
+        ⋅    . B2a   : full details: data object * serializer
+        ⋅    . B2b   : full details: data objects
+        ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
+        ⋅* C         : conclusions
+        ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
+        ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
+        ⋅    . C1b   : conclusion: data objects NOT handled by the serializer(s)
+        ⋅  - C2      : conclusion: final text and data
+        ⋅    . C2a   : conclusion: serializers (not sorted)
+        ⋅    . C2b   : conclusion: overall score (based on: Σ strlen./Σ enc+dec time/enc⇆dec)
+        ⋅    . C2c   : conclusion
+        ⋅* D         : various informations
+        ⋅  - D1      : informations about the machine
+        ⋅    . D1a   : informations about the machine (no extensive details)
+        ⋅    . D1b   : informations about the machine (extensive details)
+        ⋅* graphs    : graphic visualizations
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  results: (SerializationResults)a dict of
+                    [(str)serializer][(str)data_name] = SerializationResult
+
+        o  s1s2d: ( (str)seria1,
+                    (str)seria2,
+                    (str)cmpdata         -> 'all', 'ini', 'cwc' or 'allbutcwc', cf read_cmpstring()
+                  )
+    """
+    if "titles;" in wisteria.globs.ARGS.report:
+        msgreporttitle("(B5) Comparison With a Previous Run")
+
+    comparison = wisteria.globs.HISTORY_COMPARISON
+    if comparison is None:
+        msgreport("No comparison with a previous run: see --comparewith and --history.")
+        msgreport()
+        return
+
+    reference_date = time.strftime("%Y-%m-%d %H:%M:%S",
+                                   time.localtime(comparison.reference_created))
+    if comparison.current_run is None:
+        msgreport(f"Reference: run #{comparison.reference_run} ({reference_date}).")
+    else:
+        msgreport(f"Reference: run #{comparison.reference_run} ({reference_date}); "
+                  f"current run: #{comparison.current_run}.")
+    if not comparison.same_machine:
+        msgreport("[bold]Please note that the reference run has been made on another machine "
+                  "or with another Python version: the timings can't really be compared.[/bold]")
+    for serializer, (reference_version, current_version) in sorted(comparison.versions.items()):
+        msgreport(f"* {fmt_serializer(serializer)}: version {reference_version} "
+                  f"> {current_version}")
+    msgreport(f"{comparison.compared} transcoding(s) found in both runs; "
+              f"threshold: {comparison.threshold:g} %.")
+
+    if not comparison.regressions:
+        msgreport("No regression has been found.")
+        msgreport()
+        return
+
+    attribute2name = {"encoding_time": "enc. time",
+                      "decoding_time": "dec. time",
+                      "encoding_strlen": "enc. str. len.",
+                      "encoding_success": "enc. success",
+                      "decoding_success": "dec. success",
+                      "reversibility": "reversibility"}
+    table = rich.table.Table(show_header=True, header_style="bold blue")
+    table.add_column("Serializer", width=12)
+    table.add_column("Data object", width=19)
+    table.add_column("Regression", width=14)
+    table.add_column("Reference", width=10)
+    table.add_column("Current", width=10)
+    table.add_column("Growth", width=9)
+    for regression in comparison.regressions:
+        growth = ""
+        if regression.attribute in ("encoding_time", "decoding_time"):
+            reference, current = fmt_time(regression.reference), fmt_time(regression.current)
+        elif regression.attribute == "encoding_strlen":
+            reference, current = fmt_strlen(regression.reference), fmt_strlen(regression.current)
+        else:
+            reference, current = fmt_boolsuccess(bool(regression.reference)), \
+                fmt_boolsuccess(bool(regression.current))
+        if regression.attribute in ("encoding_time", "decoding_time", "encoding_strlen"):
+            growth = f"+{fmt_percentage(100*(regression.current/regression.reference-1))}"
+        table.add_row(fmt_serializer(regression.serializer),
+                      fmt_data(regression.dataobj),
+                      attribute2name[regression.attribute],
+                      reference,
+                      current,
+                      growth)
+    msgreport(table)
+    msgreport(f"[bold]{len(comparison.regressions)} regression(s) found.[/bold] "
+              f"Times are in {UNITS['time']}, encoded string lengths in "
+              f"{UNITS['string length']}.")
+    msgreport()
+
+
+def report_section_b6(results,
+                      s1s2d):
+    """
+        report_section_b6()
+
+        Sub-function of report() for report section "B6"
+        (pimydoc)report sections
+        ⋅* A         : main informations
+        ⋅  - A1      : options used to create reports
+        ⋅  - A2      : list of the serializers to be used because they have been selected
+        ⋅  - A3      : list of the data objects to be used because they have been selected
+        ⋅  - A4      : list of the planned transcodings
+        ⋅  - A5      : what do the encoded strings look like? (basic types/demonstration_dataobj)
+        ⋅* B         : full details (raw results)
+        ⋅  - B1      : full details (serializers)
+        ⋅    . B1a   : full details: serializer * data object
+        ⋅    . B1b   : full details: serializers
+        ⋅    . B1c   : full details: serializers, hall of fame
+        ⋅    . B1d   : full details: full details: serializer <S> can't handle <dataobj>
+        ⋅  - B2      : full details (data objects)
+        ⋅    . B2a   : full details: data object * serializer
+        ⋅    . B2b   : full details: data objects
+        ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
+        ⋅* C         : conclusions
+        ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
+        ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
+        ⋅    . C1b   : conclusion: data objects NOT handled by the serializer(s)
+        ⋅  - C2      : conclusion: final text and data
+        ⋅    . C2a   : conclusion: serializers (not sorted)
+        ⋅    . C2b   : conclusion: overall score (based on: Σ strlen./Σ enc+dec time/enc⇆dec)
+        ⋅    . C2c   : conclusion
+        ⋅* D         : various informations
+        ⋅  - D1      : informations about the machine
+        ⋅    . D1a   : informations about the machine (no extensive details)
+        ⋅    . D1b   : informations about the machine (extensive details)
+        ⋅* graphs    : graphic visualizations
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  results: (SerializationResults)a dict of
+                    [(str)serializer][(str)data_name] = SerializationResult
+
+        o  s1s2d: ( (str)seria1,
+                    (str)seria2,
+                    (str)cmpdata         -> 'all', 'ini', 'cwc' or 'allbutcwc', cf read_cmpstring()
+                  )
+    """
+    if "titles;" in wisteria.globs.ARGS.report:
+        msgreporttitle("(B6) Streaming: dump()/load() Through io.BytesIO, Files and Pipes")
+
+    if "stream" not in wisteria.globs.STAGES:
+        msgreport("No streaming measure: see --stages.")
+        msgreport()
+        return
+
+    summaries = summarize_stream_stage(results)
+    table = rich.table.Table(show_header=True, header_style="bold blue")
+    table.add_column("Serializer")
+    table.add_column("Medium")
+    table.add_column("Success")
+    table.add_column("Σ time")
+    table.add_column("TTFB")
+    table.add_column("MB/s")
+    table.add_column("Peak mem.")
+    for serializer in sorted(summaries):
+        for (medium, multidoc), summary in sorted(summaries[serializer].items(),
+                                                  key=lambda item: (item[0][1], item[0][0])):
+            table.add_row(fmt_serializer(serializer),
+                          f"{medium}{'*' if multidoc else ''}",
+                          f"{summary['success']}/{summary['total']}",
+                          fmt_time(summary["dump_time"]+summary["load_time"]),
+                          fmt_time(summary["ttfb"]),
+                          fmt_throughput(summary["throughput"]),
+                          fmt_mem_usage(summary["mem_peak"]))
+    msgreport(table)
+
+    without_stream = sorted(set(results.serializers) - set(summaries))
+    if without_stream:
+        msgreport(f"No dump()/load() functions for {fmt_list(without_stream, fmt_serializer)}.")
+    msgreport("'*': the items of a list/tuple written as a stream of documents. "
+              "Σ time: Σ dump+load time; TTFB: median time between the call to dump() "
+              "and the first byte written; MB/s: Σ bytes / Σ time; Peak mem.: max of "
+              f"the peak memory used by dump(). Times are in {UNITS['time']}.")
+    msgreport()
+
+
+def report_section_b7(results,
+                      s1s2d):
+    """
+        report_section_b7()
+
+        Sub-function of report() for report section "B7"
+        (pimydoc)report sections
+        ⋅* A         : main informations
+        ⋅  - A1      : options used to create reports
+        ⋅  - A2      : list of the serializers to be used because they have been selected
+        ⋅  - A3      : list of the data objects to be used because they have been selected
+        ⋅  - A4      : list of the planned transcodings
+        ⋅  - A5      : what do the encoded strings look like? (basic types/demonstration_dataobj)
+        ⋅* B         : full details (raw results)
+        ⋅  - B1      : full details (serializers)
+        ⋅    . B1a   : full details: serializer * data object
+        ⋅    . B1b   : full details: serializers
+        ⋅    . B1c   : full details: serializers, hall of fame
+        ⋅    . B1d   : full details: full details: serializer <S> can't handle <dataobj>
+        ⋅  - B2      : full details (data objects)
+        ⋅    . B2a   : full details: data object * serializer
+        ⋅    . B2b   : full details: data objects
+        ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
+        ⋅* C         : conclusions
+        ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
+        ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
+        ⋅    . C1b   : conclusion: data objects NOT handled by the serializer(s)
+        ⋅  - C2      : conclusion: final text and data
+        ⋅    . C2a   : conclusion: serializers (not sorted)
+        ⋅    . C2b   : conclusion: overall score (based on: Σ strlen./Σ enc+dec time/enc⇆dec)
+        ⋅    . C2c   : conclusion
+        ⋅* D         : various informations
+        ⋅  - D1      : informations about the machine
+        ⋅    . D1a   : informations about the machine (no extensive details)
+        ⋅    . D1b   : informations about the machine (extensive details)
+        ⋅* graphs    : graphic visualizations
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  results: (SerializationResults)a dict of
+                    [(str)serializer][(str)data_name] = SerializationResult
+
+        o  s1s2d: ( (str)seria1,
+                    (str)seria2,
+                    (str)cmpdata         -> 'all', 'ini', 'cwc' or 'allbutcwc', cf read_cmpstring()
+                  )
+    """
+    if "titles;" in wisteria.globs.ARGS.report:
+        msgreporttitle("(B7) Memory-Mapped Files: Disk Write and mmap-Backed Decoding")
+
+    if "mmap" not in wisteria.globs.STAGES:
+        msgreport("No memory-mapped file measure: see --stages.")
+        msgreport()
+        return
+
+    summaries = summarize_mmap_stage(results)
+    table = rich.table.Table(show_header=True, header_style="bold blue")
+    table.add_column("Serializer")
+    table.add_column("Success")
+    table.add_column("Σ write")
+    table.add_column("Σ mmap dec.")
+    table.add_column("Σ dec.")
+    table.add_column("Buffer")
+    table.add_column("Copies")
+    for serializer in sorted(summaries):
+        summary = summaries[serializer]
+        table.add_row(fmt_serializer(serializer),
+                      f"{summary['success']}/{summary['total']}",
+                      fmt_time(summary["write_time"]),
+                      fmt_time(summary["decode_time"]),
+                      fmt_time(summary["memory_decode_time"]),
+                      "yes" if summary["buffer_decoding"] else "no",
+                      f"{summary['copied']}/{summary['success']}")
+    msgreport(table)
+
+    msgreport(f"Σ write: Σ time to write the encoded objects into a file"
+              f"{' (with os.fsync())' if 'fsync' in wisteria.globs.STAGES['mmap'] else ''}; "
+              "Σ mmap dec.: Σ time to decode them from a mmap-backed buffer; "
+              "Σ dec.: Σ time to decode them from memory (see B1); "
+              "Buffer: does the decoder directly read the mmap-backed buffer?; "
+              "Copies: number of data objects whose buffer has been copied by the decoder. "
+              f"Times are in {UNITS['time']}.")
+    msgreport()
+
+
+def report_section_b8(results,
+                      s1s2d):
+    """
+        report_section_b8()
+
+        Sub-function of report() for report section "B8"
+        (pimydoc)report sections
+        ⋅* A         : main informations
+        ⋅  - A1      : options used to create reports
+        ⋅  - A2      : list of the serializers to be used because they have been selected
+        ⋅  - A3      : list of the data objects to be used because they have been selected
+        ⋅  - A4      : list of the planned transcodings
+        ⋅  - A5      : what do the encoded strings look like? (basic types/demonstration_dataobj)
+        ⋅* B         : full details (raw results)
+        ⋅  - B1      : full details (serializers)
+        ⋅    . B1a   : full details: serializer * data object
+        ⋅    . B1b   : full details: serializers
+        ⋅    . B1c   : full details: serializers, hall of fame
+        ⋅    . B1d   : full details: full details: serializer <S> can't handle <dataobj>
+        ⋅  - B2      : full details (data objects)
+        ⋅    . B2a   : full details: data object * serializer
+        ⋅    . B2b   : full details: data objects
+        ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
+        ⋅* C         : conclusions
+        ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
+        ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
+        ⋅    . C1b   : conclusion: data objects NOT handled by the serializer(s)
+        ⋅  - C2      : conclusion: final text and data
+        ⋅    . C2a   : conclusion: serializers (not sorted)
+        ⋅    . C2b   : conclusion: overall score (based on: Σ strlen./Σ enc+dec time/enc⇆dec)
+        ⋅    . C2c   : conclusion
+        ⋅* D         : various informations
+        ⋅  - D1      : informations about the machine
+        ⋅    . D1a   : informations about the machine (no extensive details)
+        ⋅    . D1b   : informations about the machine (extensive details)
+        ⋅* graphs    : graphic visualizations
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  results: (SerializationResults)a dict of
+                    [(str)serializer][(str)data_name] = SerializationResult
+
+        o  s1s2d: ( (str)seria1,
+                    (str)seria2,
+                    (str)cmpdata         -> 'all', 'ini', 'cwc' or 'allbutcwc', cf read_cmpstring()
+                  )
+    """
+    if "titles;" in wisteria.globs.ARGS.report:
+        msgreporttitle("(B8) Compression: zlib/bz2/lzma Applied to the Encoded Strings")
+
+    if "compress" not in wisteria.globs.STAGES:
+        msgreport("No compression measure: see --stages.")
+        msgreport()
+        return
+
+    summaries = summarize_compress_stage(results)
+    table = rich.table.Table(show_header=True, header_style="bold blue")
+    table.add_column("Serializer")
+    table.add_column("Codec")
+    table.add_column("Success")
+    table.add_column(f"Σ enc. length ({UNITS['string length']})")
+    table.add_column(f"Σ comp. length ({UNITS['string length']})")
+    table.add_column("Ratio")
+    table.add_column(f"Comp. {UNITS['throughput']}")
+    table.add_column(f"Decomp. {UNITS['throughput']}")
+    for serializer in sorted(summaries):
+        for codec, summary in summaries[serializer].items():
+            table.add_row(fmt_serializer(serializer),
+                          codec,
+                          f"{summary['success']}/{summary['total']}",
+                          fmt_strlen(summary["strlen"]),
+                          fmt_strlen(summary["compressed_strlen"]),
+                          fmt_nodata() if summary["ratio"] is None
+                          else fmt_percentage(100*summary["ratio"]),
+                          fmt_throughput(summary["strlen"]/summary["compression_time"]/10**6
+                                         if summary["compression_time"] else None),
+                          fmt_throughput(summary["strlen"]/summary["decompression_time"]/10**6
+                                         if summary["decompression_time"] else None))
+    msgreport(table)
+
+    msgreport("Σ enc. length/Σ comp. length: Σ lengths of the encoded strings "
+              "before/after compression; "
+              "Ratio: geometric mean of the compressed/encoded length ratios; "
+              f"{UNITS['throughput']}: Σ encoded lengths / Σ (de)compression times. "
+              "Out-of-band pickles are compressed with their buffers.")
+    msgreport()
+
+    codec = wisteria.globs.STAGES["compress"][0]
+    table = rich.table.Table(show_header=True, header_style="bold blue")
+    table.add_column("#", width=2)
+    table.add_column(f"Σ Comp. Str. Length ({UNITS['string length']}, {codec})", width=17)
+    table.add_column(f"Comp. Ratio (geometric mean, {codec})", width=17)
+    table.add_column(f"Comp. Throughput ({UNITS['throughput']}, geometric mean, {codec})",
+                     width=17)
+    table.add_column(f"Decomp. Throughput ({UNITS['throughput']}, geometric mean, {codec})",
+                     width=17)
+    for index in range(results.serializers_total_number):
+        table.add_row(
+            f"{index+1}",
+            f"{results.get_hall('compressed_strlen', index)}",
+            f"{results.get_hall('compression_ratio', index)}",
+            f"{results.get_hall('compression_throughput', index)}",
+            f"{results.get_hall('decompression_throughput', index)}",
+        )
+    msgreport(table)
+    msgreport()
+
+
+# Since all report_() functions have the same signature, it may happen that
+# some arguments passed to the function are not used.
+#   pylint: disable=unused-argument
+def report_section_b9(results,
+                      s1s2d):
+    """
+        report_section_b9()
+
+        Sub-function of report() for report section "B9"
+        (pimydoc)report sections
+        ⋅* A         : main informations
+        ⋅  - A1      : options used to create reports
+        ⋅  - A2      : list of the serializers to be used because they have been selected
+        ⋅  - A3      : list of the data objects to be used because they have been selected
+        ⋅  - A4      : list of the planned transcodings
+        ⋅  - A5      : what do the encoded strings look like? (basic types/demonstration_dataobj)
+        ⋅* B         : full details (raw results)
+        ⋅  - B1      : full details (serializers)
+        ⋅    . B1a   : full details: serializer * data object
+        ⋅    . B1b   : full details: serializers
+        ⋅    . B1c   : full details: serializers, hall of fame
+        ⋅    . B1d   : full details: full details: serializer <S> can't handle <dataobj>
+        ⋅  - B2      : full details (data objects)
+        ⋅    . B2a   : full details: data object * serializer
+        ⋅    . B2b   : full details: data objects
+        ⋅  - B3      : encoded string of all data objects and of all serializers
+        ⋅  - B4      : scaling: time and encoded string length vs size of the generated data objects
+        ⋅  - B5      : comparison with a previous run (see --comparewith)
+        ⋅  - B6      : streaming: dump()/load() through io.BytesIO, files and pipes (see --stages)
+        ⋅  - B7      : memory-mapped files: disk write and mmap-backed decoding (see --stages)
+        ⋅  - B8      : compression: zlib/bz2/lzma applied to the encoded strings (see --stages)
+        ⋅  - B9      : scheduling: drift of each round (see --method)
+        ⋅* C         : conclusions
+        ⋅  - C1      : conclusion: data objects handled/not handled by the serializer(s)
+        ⋅    . C1a   : conclusion: data objects handled by the serializer(s)
+        ⋅    . C1b   : conclusion: data objects NOT handled by the serializer(s)
+        ⋅  - C2      : conclusion: final text and data
+        ⋅    . C2a   : conclusion: serializers (not sorted)
+        ⋅    . C2b   : conclusion: overall score (based on: Σ strlen./Σ enc+dec time/enc⇆dec)
+        ⋅    . C2c   : conclusion
+        ⋅* D         : various informations
+        ⋅  - D1      : informations about the machine
+        ⋅    . D1a   : informations about the machine (no extensive details)
+        ⋅    . D1b   : informations about the machine (extensive details)
+        ⋅* graphs    : graphic visualizations
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  results: (SerializationResults)a dict of
+                    [(str)serializer][(str)data_name] = SerializationResult
+
+        o  s1s2d: ( (str)seria1,
+                    (str)seria2,
+                    (str)cmpdata         -> 'all', 'ini', 'cwc' or 'allbutcwc', cf read_cmpstring()
+                  )
+    """
+    if "titles;" in wisteria.globs.ARGS.report:
+        msgreporttitle("(B9) Scheduling: Drift of Each Round")
+
+    msgreport(f"Transcodings computed in '{wisteria.globs.METHOD['order']}' order "
+              f"by {wisteria.globs.METHOD['rounds']} "
+              f"{fmt_nounplural('round', wisteria.globs.METHOD['rounds'])} "
+              f"(seed: {wisteria.globs.METHOD['seed']}); see --method.")
+    if len(wisteria.globs.SCHEDULE_ROUNDS) < 2:
+        msgreport("No drift can be measured with a single round: see --method 'rounds'.")
+        msgreport()
+        return
+
+    table = rich.table.Table(show_header=True, header_style="bold blue")
+    table.add_column("Round")
+    table.add_column("Transcodings")
+    table.add_column(f"Σ enc.+dec. time ({UNITS['time']})")
+    table.add_column("Drift")
+    table.add_column("Drift (1st half)")
+    table.add_column("Drift (2nd half)")
+    for round_index, summary in enumerate(wisteria.globs.SCHEDULE_ROUNDS):
+        table.add_row(f"{round_index+1}",
+                      f"{summary['transcodings']}",
+                      fmt_time(summary["time"]),
+                      *(fmt_nodata() if summary[key] is None
+                        else fmt_percentage(100*(summary[key]-1))
+                        for key in ("drift", "first_half", "second_half")))
+    msgreport(table)
+
+    msgreport("Drift: geometric mean of the ratios between the time of each transcoding "
+              "in this round and its median time over all rounds, minus 1 "
+              "(a positive drift means a slower round); "
+              "each transcoding keeps the result of its median round.")
+    msgreport()
+
+
+def report_section_graphs__scaling(results):
+    """
+        report_section_graphs__scaling()
+
+        Sub-function of report.py:report_section_graphs(): draw the scaling
+        graphs, one by family of generated data objects (see report section B4).
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  results: (SerializationResults)a dict of
+                    [(str)serializer][(str)data_name] = SerializationResult
+    """
+    scaling = compute_scaling(results)
+    for family in get_generated_families(results.dataobjs):
+        filename = get_scaling_graph_filename(family)
+        if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+            msgdebug(f"About to create a new graph named '{filename}' ({normpath(filename)}).")
+        scaling2png(scaling[family], filename, f"Scaling: {family}[N]")
@@ -44,7 +44,9 @@
     o  fmt_serializer0(serializer_name)
     o  fmt_serializer(serializer_name)
     o  fmt_strlen(int_stringlength)
+    o  fmt_throughput(floatthroughput)
     o  fmt_time(floattime)
+    o  fmt_time_ci95(floattime, ci95)
     o  fmt_title(title)
     o  fmt_warning(title)
 
@@ -402,6 +404,25 @@ def fmt_strlen(int_stringlength):
     return f"{int_stringlength}"
 
 
+def fmt_throughput(floatthroughput):
+    """
+        fmt_throughput()
+
+        Format the input argument into a string. The input argument is a (float)throughput.
+            ex: 123.456789 > "123.46"
+
+        Please note that the unit has deliberately not been added to the end of the string.
+        _______________________________________________________________
+
+        ARGUMENT: (None|float)floatthroughput
+
+        RETURNED VALUE: a formatted string representing the input argument.
+    """
+    if floatthroughput is None:
+        return fmt_nodata()
+    return f"{floatthroughput:.2f}"
+
+
 def fmt_time(floattime):
     """
         fmt_time()
@@ -421,6 +442,30 @@ def fmt_time(floattime):
     return f"{floattime:.6f}"
 
 
+def fmt_time_ci95(floattime,
+                  ci95):
+    """
+        fmt_time_ci95()
+
+        Format the 95% confidence interval <ci95> of <floattime> into a string
+        to be added after fmt_time(floattime).
+            ex: 0.333345677, (0.333300000, 0.333400000) > " ±0.000055"
+
+        The interval may be asymmetric: the largest distance between <floattime>
+        and a bound is displayed.
+        _______________________________________________________________
+
+        ARGUMENTS:
+        o  (None|float)floattime
+        o  (None|(float, float))ci95
+
+        RETURNED VALUE: a formatted string, empty if the confidence interval is unknown.
+    """
+    if floattime is None or ci95 is None:
+        return ""
+    return f" ±{max(floattime-ci95[0], ci95[1]-floattime):.6f}"
+
+
 def fmt_title(title):
     """
         fmt_title()
@@ -481,7 +526,8 @@ def fmt_exaequowith(item,
     """
     if len(listitems) == 1:
         return ""
-    listitems.remove(item)
+    # <listitems> may be shared (see serializers_classes.py:memoized()): it is not modified.
+    listitems = [_item for _item in listitems if _item != item]
 
     if fmt_list(listitems, func):
         return prefix + fmt_list(listitems, func) + suffix
@@ -26,10 +26,16 @@
     ___________________________________________________________________________
 
     o  compute_results(config, serializer1, serializer2, cmpdata)
+    o  get_data_cost(data_name)
     o  get_serializers_selection(serializer1, serializer2)
     o  get_data_selection(cmpdata, config)
     o  init_planned_transcodings(serializer1, serializer2, cmpdata, config, filterstr)
+    o  sort_transcodings_by_cost(planned_transcodings)
 """
+import math
+import pickle
+import time
+
 from rich.console import Console
 from rich.progress_bar import ProgressBar
 
@@ -38,17 +44,25 @@ import wisteria.globs
 from wisteria.globs import VERBOSITY_NORMAL, VERBOSITY_DEBUG, VERBOSITY_DETAILS
 from wisteria.globs import PROGRESSBAR_LENGTH
 from wisteria.wisteriaerror import WisteriaError
-from wisteria.msg import msgdebug, msginfo, msgerror
-from wisteria.serializers import func_serialize
+from wisteria.msg import msgdebug, msginfo, msgerror, msgwarning
+from wisteria.serializers import func_serialize, PICKLE_VARIANTS
 from wisteria.serializers_classes import SerializationResults
 from wisteria.utils import strdigest
 from wisteria.cwc.cwc_utils import is_a_cwc_name, moduleininame_to_modulefullrealname
+from wisteria.datagen import get_generated_data_names
 from wisteria.cwc.cwc_utils import modulefullrealname_to_modulerealname
 from wisteria.cwc.cwc_utils import is_this_an_appropriate_module_for_serializer
 from wisteria.filterstr import parse_filterstr
 from wisteria.helpmsg import help_cmdline_filter
+from wisteria.jobs import get_jobs_number, iter_transcodings_in_subprocesses
+from wisteria.jobs import pin_current_process, get_interrupted_result
+from wisteria.cache import read_cached_results, write_results_to_cache
+from wisteria.exportresults import ResultsExporter
+from wisteria.scheduler import get_median_result, get_schedule, summarize_rounds
 
 
+# The locals are the steps of the computation (cache, --jobs, --exportresults, --budget, rounds):
+#   pylint: disable=too-many-locals
 def compute_results():
     """
         compute_results()
@@ -90,9 +104,107 @@ def compute_results():
 
             console.show_cursor(True)
 
+    def advance_progress_bar():
+        """
+            advance_progress_bar()
+
+            Update the progress bar: one more transcoding has been computed.
+        """
+        nonlocal progressbar_index
+
+        # (pimydoc)progress bar
+        # ⋅A progress bar is displayed only if verbosity is set to 1 (normal).
+        # ⋅If verbosity is set to 0 (minimal), the progress bar is hidden since no
+        # ⋅console output is authorized: it's important for scripts calling the
+        # ⋅project from the outside.
+        # ⋅If verbosity is set to 2 (details) or 3 (debug), the progress bar is hidden
+        # ⋅in order to avoid mixing the progress bar with the text displayed while
+        # ⋅computing the result, which is unpleasant to see.
+        if wisteria.globs.ARGS.verbosity == VERBOSITY_NORMAL:
+            progressbar_index += 1
+            progressbar.update(progressbar_index)
+            console.print(progressbar)
+            console.file.write("\r")
+
+    def iter_transcodings_in_main_process(planned_transcodings):
+        """
+            iter_transcodings_in_main_process()
+
+            Compute <planned_transcodings> in the main process, unless --budget
+            is exhausted.
+            ___________________________________________________________________
+
+            ARGUMENT: (list)planned_transcodings, see (pimydoc)PLANNED_TRANSCODINGS
+
+            RETURNED VALUE: yield ((serializer, data_name, fingerprint), SerializationResult)
+        """
+        for (transcoding_index,
+             (serializer,
+              data_name,
+              fingerprint)) in enumerate(planned_transcodings):
+
+            if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+                if not is_a_cwc_name(data_name):
+                    msgdebug(f"({transcoding_index+1}/{len(planned_transcodings)}) "
+                             "About to call transcoding functions "
+                             f"for serializer='{serializer}' "
+                             f"and data name='{data_name}' "
+                             f"[{fingerprint}]")
+                else:
+                    msgdebug("About to call serialize/unserialize function "
+                             f"for serializer='{serializer}' "
+                             f"and (cwc) data name='{data_name}' "
+                             f"[{fingerprint}]")
+            if budget_deadline is not None and time.monotonic() >= budget_deadline:
+                # --budget: the budget is exhausted, the transcoding isn't computed.
+                result = get_interrupted_result("budget")
+            else:
+                result = func_serialize(serializer,
+                                        data_name,
+                                        fingerprint)
+            yield (serializer, data_name, fingerprint), result
+
+    def store_result(serializer,
+                     data_name,
+                     fingerprint,
+                     result,
+                     progress=True):
+        """
+            store_result()
+
+            Store <result> in <results> and update the progress bar.
+            ___________________________________________________________________
+
+            ARGUMENTS:
+            o  (str)serializer
+            o  (str)data_name
+            o  (str)fingerprint
+            o  (SerializationResult)result
+            o  (bool)progress: False if the progress bar has already been updated
+        """
+        results.add(serializer, data_name, result)
+
+        if exporter is not None:
+            exporter.add_result(serializer, data_name, result)
+
+        if progress:
+            advance_progress_bar()
+
+        if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+            msgdebug(f"result: {results[serializer][data_name]} "
+                     f"[{fingerprint}]")
+
+    progressbar_index = 0
+    exporter = None
+    budget_deadline = None
     try:
         results = SerializationResults()
 
+        # --exportresults: each result is exported as soon as it is stored
+        if wisteria.globs.EXPORTRESULTS:
+            exporter = ResultsExporter(exportformat=wisteria.globs.EXPORTRESULTS[0],
+                                       filename=wisteria.globs.EXPORTRESULTS[1])
+
         planned_transcodings_number = len(wisteria.globs.PLANNED_TRANSCODINGS)
 
         # (pimydoc)progress bar
@@ -108,12 +220,37 @@ def compute_results():
             progressbar = ProgressBar(width=PROGRESSBAR_LENGTH,
                                       total=planned_transcodings_number)
             console.show_cursor(False)
-            progressbar_index = 0
 
         # ---- real work ------------------------------------------------------
         if wisteria.globs.ARGS.verbosity >= VERBOSITY_DETAILS:
             msginfo("Please wait until all required encodings/decodings have been computed.")
 
+        jobs, cpus = get_jobs_number()
+
+        # --budget: time.monotonic() value after which no transcoding can be computed
+        if wisteria.globs.BUDGET.get("total") is not None:
+            budget_deadline = time.monotonic() + wisteria.globs.BUDGET["total"]
+
+        # results already computed by a previous run, if --cache allows it:
+        cached_results, remaining_transcodings = \
+            read_cached_results(wisteria.globs.PLANNED_TRANSCODINGS)
+        for (serializer, data_name, fingerprint), result in cached_results:
+            store_result(serializer, data_name, fingerprint, result)
+            # no timed transcoding will use the --filter pre-pass result:
+            wisteria.globs.TRANSCODING_CHECKS.pop((serializer, data_name), None)
+        computed_results = []
+
+        if wisteria.globs.BUDGET.get("order") == "cheapest":
+            remaining_transcodings = sort_transcodings_by_cost(remaining_transcodings)
+
+        # --method: order of the transcodings and number of rounds
+        schedule = get_schedule(remaining_transcodings,
+                                wisteria.globs.METHOD["order"],
+                                wisteria.globs.METHOD["rounds"],
+                                wisteria.globs.METHOD["seed"])
+        if wisteria.globs.ARGS.verbosity == VERBOSITY_NORMAL:
+            progressbar.total = len(cached_results) + sum(map(len, schedule))
+
         # (pimydoc)PLANNED_TRANSCODINGS
         # ⋅a list:
         # ⋅    - (str)serializer,
@@ -121,50 +258,52 @@ def compute_results():
         # ⋅    - (int)len(dataobjs)
         # ⋅
         # ⋅Initialized by results.py:init_planned_transcodings()
-        for (transcoding_index,
-             (serializer,
-              data_name,
-              fingerprint)) in enumerate(wisteria.globs.PLANNED_TRANSCODINGS):
-
-            if serializer not in results:
-                results[serializer] = {}
-
-            if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                if not is_a_cwc_name(data_name):
-                    msgdebug(f"({transcoding_index+1}/{planned_transcodings_number}) "
-                             "About to call transcoding functions "
-                             f"for serializer='{serializer}' "
-                             f"and data name='{data_name}' "
-                             f"[{fingerprint}]")
+        # --sandbox: each transcoding is computed by its own process, even if jobs is 1.
+        in_main_process = jobs == 1 and wisteria.globs.SANDBOX.get("mode", "off") == "off"
+        if in_main_process and cpus is not None:
+            pin_current_process(cpus[0])
+
+        # rounds_results[(int)round index][(tuple)planned transcoding] = SerializationResult
+        rounds_results = []
+        for round_transcodings in schedule:
+            rounds_results.append({})
+            if in_main_process:
+                round_iterator = iter_transcodings_in_main_process(round_transcodings)
+            else:
+                round_iterator = iter_transcodings_in_subprocesses(round_transcodings,
+                                                                   jobs,
+                                                                   cpus,
+                                                                   budget_deadline)
+            for planned_transcoding, result in round_iterator:
+                rounds_results[-1][planned_transcoding] = result
+                if len(schedule) == 1:
+                    computed_results.append((planned_transcoding, result))
+                    store_result(*planned_transcoding, result)
                 else:
-                    msgdebug("About to call serialize/unserialize function "
-                             f"for serializer='{serializer}' "
-                             f"and (cwc) data name='{data_name}' "
-                             f"[{fingerprint}]")
-            results[serializer][data_name] = func_serialize(serializer,
-                                                            data_name,
-                                                            fingerprint)
-
-            # (pimydoc)progress bar
-            # ⋅A progress bar is displayed only if verbosity is set to 1 (normal).
-            # ⋅If verbosity is set to 0 (minimal), the progress bar is hidden since no
-            # ⋅console output is authorized: it's important for scripts calling the
-            # ⋅project from the outside.
-            # ⋅If verbosity is set to 2 (details) or 3 (debug), the progress bar is hidden
-            # ⋅in order to avoid mixing the progress bar with the text displayed while
-            # ⋅computing the result, which is unpleasant to see.
-            if wisteria.globs.ARGS.verbosity == VERBOSITY_NORMAL:
-                progressbar_index += 1
-                progressbar.update(progressbar_index)
-                console.print(progressbar)
-                console.file.write("\r")
-
-            if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                # is serializer/data_name has been skipped, no results[serializer][data_name],
-                # hence the following "if" statement:
-                if data_name in results[serializer]:
-                    msgdebug(f"result: {results[serializer][data_name]} "
-                             f"[{fingerprint}]")
+                    advance_progress_bar()
+
+        # several rounds: each transcoding keeps its median result.
+        if len(schedule) > 1:
+            for planned_transcoding in remaining_transcodings:
+                result = get_median_result([round_results[planned_transcoding]
+                                            for round_results in rounds_results
+                                            if planned_transcoding in round_results])
+                computed_results.append((planned_transcoding, result))
+                store_result(*planned_transcoding, result, progress=False)
+        wisteria.globs.SCHEDULE_ROUNDS = summarize_rounds(schedule, rounds_results)
+
+        write_results_to_cache(computed_results)
+
+        budget_interruptions = sum(result.interruption == "budget"
+                                   for _, result in computed_results)
+        if budget_interruptions:
+            erase_progress_bar()
+            msgwarning(f"--budget: the time budget ({wisteria.globs.BUDGET['total']}s) "
+                       f"has been exhausted: {budget_interruptions} transcoding(s) out of "
+                       f"{planned_transcodings_number} haven't been (fully) computed; "
+                       "their results are marked 'budget'.")
+        # the untimed encodings/decodings made by the --filter pre-pass are useless from now:
+        wisteria.globs.TRANSCODING_CHECKS.clear()
 
         # (pimydoc)progress bar
         # ⋅A progress bar is displayed only if verbosity is set to 1 (normal).
@@ -176,7 +315,13 @@ def compute_results():
         # ⋅computing the result, which is unpleasant to see.
         erase_progress_bar()
 
-        if not results.finish_initialization():
+        finish_initialization_success = results.finish_initialization()
+
+        # --exportresults: the hall of fame and the overall scores are only known now:
+        if exporter is not None:
+            exporter.close(results if finish_initialization_success else None)
+
+        if not finish_initialization_success:
             msgerror("(ERRORID015) Incorrect data, the program has to stop.")
 
             # (pimydoc)exit codes
@@ -201,6 +346,15 @@ def compute_results():
             # ⋅*    4: error, missing required module
             # ⋅*    5: error: an inconsistency between the data has been detected
             # ⋅*    6: error: can't open/create report file
+            # ⋅*    7: error, ill-formed --method string
+            # ⋅*    8: error, ill-formed --cache string
+            # ⋅*    9: error, ill-formed --exportresults string
+            # ⋅*   10: error, ill-formed --history string
+            # ⋅*   11: error, ill-formed --comparewith string
+            # ⋅*   12: a regression has been found by --comparewith
+            # ⋅*   13: error, ill-formed --stages string
+            # ⋅*   14: error, ill-formed --sandbox string
+            # ⋅*   15: error, ill-formed --budget string
             # ⋅*  100: internal error, data can't be loaded
             # ⋅*  101: internal error, an error occured while computing the results
             # ⋅*  102: internal error, an error occured in main()
@@ -234,6 +388,15 @@ def compute_results():
         # ⋅*    4: error, missing required module
         # ⋅*    5: error: an inconsistency between the data has been detected
         # ⋅*    6: error: can't open/create report file
+        # ⋅*    7: error, ill-formed --method string
+        # ⋅*    8: error, ill-formed --cache string
+        # ⋅*    9: error, ill-formed --exportresults string
+        # ⋅*   10: error, ill-formed --history string
+        # ⋅*   11: error, ill-formed --comparewith string
+        # ⋅*   12: a regression has been found by --comparewith
+        # ⋅*   13: error, ill-formed --stages string
+        # ⋅*   14: error, ill-formed --sandbox string
+        # ⋅*   15: error, ill-formed --budget string
         # ⋅*  100: internal error, data can't be loaded
         # ⋅*  101: internal error, an error occured while computing the results
         # ⋅*  102: internal error, an error occured in main()
@@ -247,6 +410,9 @@ def get_serializers_selection(serializer1,
         get_serializers_selection()
 
         Return a tuple of all serializers defined by (str)<serializer1>, (str)<serializer2>.
+
+        'all' doesn't select the pickle variants (see serializers.py:PICKLE_VARIANTS),
+        which are only selected when their name is given.
         _______________________________________________________________________
 
         ARGUMENTS:
@@ -260,13 +426,15 @@ def get_serializers_selection(serializer1,
 
     if serializer1 == 'all':
         for serializer in wisteria.globs.SERIALIZERS:
-            res.add(serializer)
+            if serializer not in PICKLE_VARIANTS:
+                res.add(serializer)
     else:
         res.add(serializer1)
 
     if serializer2 == 'all':
         for serializer in wisteria.globs.SERIALIZERS:
-            res.add(serializer)
+            if serializer not in PICKLE_VARIANTS:
+                res.add(serializer)
     else:
         res.add(serializer2)
 
@@ -306,6 +474,8 @@ def get_data_selection(cmpdata,
                 f"what is '{config['data selection']['data selection']}' ? "
                 "Known values are 'all', 'ini' and 'data set/xxx' "
                 "where xxx is a string.")
+        # generated data objects are always selected:
+        res += get_generated_data_names(config)
     elif cmpdata == 'cwc':
         res = tuple(data_name for data_name in wisteria.globs.DATA
                     if is_a_cwc_name(data_name))
@@ -321,6 +491,30 @@ def get_data_selection(cmpdata,
     return res
 
 
+def get_data_cost(data_name):
+    """
+        get_data_cost()
+
+        Return an estimate of the cost of the transcodings of <data_name>: the
+        length of the pickled data object or, if it can't be pickled, the
+        length of its repr(). The cwc data objects are said to be the most
+        expensive ones.
+        _______________________________________________________________________
+
+        ARGUMENT: (str)data_name
+
+        RETURNED VALUE: (int|float)the estimated cost, math.inf for a cwc data object
+    """
+    if is_a_cwc_name(data_name):
+        return math.inf
+
+    obj = wisteria.globs.DATA[data_name]
+    try:
+        return len(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:  # pylint: disable=broad-except
+        return len(repr(obj))
+
+
 def init_planned_transcodings(serializer1,
                               serializer2,
                               cmpdata,
@@ -359,17 +553,6 @@ def init_planned_transcodings(serializer1,
                         NB: about (bool)success: True may be returned even if len(serializers)==0 or
                             if len(dataobjs)==0.
     """
-    (parse_filterstr_ok,
-     wisteria.globs.DISCARDED_DATA,
-     wisteria.globs.DISCARDED_SERIALIZERS) = parse_filterstr(filterstr)
-
-    if not parse_filterstr_ok:
-        msgerror("(ERRORID052) Can't set PLANNED_TRANSCODINGS "
-                 "since an error occured while parsing the filter string.")
-        msginfo("About --filter:")
-        msginfo(help_cmdline_filter(details=True))
-        return False, None, None
-
     try:
         wisteria.globs.PLANNED_TRANSCODINGS = []
 
@@ -382,6 +565,20 @@ def init_planned_transcodings(serializer1,
         if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
             msgdebug(f"data objs to be used are: {dataobjs}")
 
+        # the filter only has to check the serializers and the data selected by --cmp:
+        (parse_filterstr_ok,
+         wisteria.globs.DISCARDED_DATA,
+         wisteria.globs.DISCARDED_SERIALIZERS) = parse_filterstr(filterstr,
+                                                                 serializers,
+                                                                 dataobjs)
+
+        if not parse_filterstr_ok:
+            msgerror("(ERRORID052) Can't set PLANNED_TRANSCODINGS "
+                     "since an error occured while parsing the filter string.")
+            msginfo("About --filter:")
+            msginfo(help_cmdline_filter(details=True))
+            return False, None, None
+
         for serializer in sorted(set(serializers)-set(wisteria.globs.DISCARDED_SERIALIZERS)):
             for dataobj in sorted(set(dataobjs)-set(wisteria.globs.DISCARDED_DATA)):
                 fingerprint = strdigest(serializer+dataobj)
@@ -436,3 +633,27 @@ def init_planned_transcodings(serializer1,
         return False, len(serializers), len(dataobjs)
 
     return True, len(serializers), len(dataobjs)
+
+
+def sort_transcodings_by_cost(planned_transcodings):
+    """
+        sort_transcodings_by_cost()
+
+        Sort <planned_transcodings> so that the cheapest transcodings (see
+        get_data_cost()) are computed first: all the serializers are tried on
+        the cheapest data object, then on the next one, and so on. Hence, if
+        --budget is exhausted, each serializer has results about the same
+        data objects.
+        _______________________________________________________________________
+
+        ARGUMENT: (list)planned_transcodings, see (pimydoc)PLANNED_TRANSCODINGS
+
+        RETURNED VALUE: (list)the sorted transcodings
+    """
+    # each data object is pickled once, whatever the number of serializers:
+    costs = {data_name: get_data_cost(data_name)
+             for data_name in dict.fromkeys(data_name for _, data_name, _ in planned_transcodings)}
+    return sorted(planned_transcodings,
+                  key=lambda planned_transcoding: (costs[planned_transcoding[1]],
+                                                   planned_transcoding[1],
+                                                   planned_transcoding[0]))
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/resultsmatrix.py
+
+    Columnar view of a SerializationResults object: one typed array per
+    metric, each array storing the (serializers x data objects) grid row by
+    row. All the totals, ratios and means used by the report are computed
+    once, row by row (serializers) and column by column (data objects), so
+    that SerializationResults.total_encoding_time() & co. only read them.
+
+    (pimydoc)results matrix
+    ⋅cell (row, col) = index row*len(dataobjs)+col, row being the index of the
+    ⋅serializer in .serializers and col the index of the data object in .dataobjs.
+    ⋅- flags (bytearray, 0/1)      : 'exists' (the cell has been computed),
+    ⋅                                'compatible' (see serializer_is_compatible_with_dataobj()),
+    ⋅                                'present' (the result isn't None),
+    ⋅                                'interrupted' (see SerializationResult.interruption),
+    ⋅                                'encoding_success', 'decoding_success', 'reversibility'
+    ⋅- values (array.array)        : one array by metric of MATRIX_METRICS;
+    ⋅                                values[metric] is meaningful only if valid[metric] is 1.
+    ⋅- reductions                  : rows[serializer][key] and columns[dataobj][key],
+    ⋅                                see ResultsMatrix.reduce_cells()
+    ___________________________________________________________________________
+
+    o  and_flags(*flags)
+    o  get_compression_measure(result, measure)
+    o  ResultsMatrix class
+"""
+import array
+import itertools
+import math
+import statistics
+
+from wisteria.cwc.cwc_utils import serializer_is_compatible_with_dataobj
+
+
+def and_flags(*flags):
+    """
+        and_flags()
+
+        Cell by cell AND of 0/1 flags: the flags are read as (big) Python
+        integers so that the AND isn't computed by a loop over the cells.
+        _______________________________________________________________________
+
+        ARGUMENT: (bytes|bytearray)*flags, all of them having the same length
+
+        RETURNED VALUE: (bytes) the 0/1 flags
+    """
+    res = int.from_bytes(flags[0], "little")
+    for flag in flags[1:]:
+        res &= int.from_bytes(flag, "little")
+    return res.to_bytes(len(flags[0]), "little")
+
+
+def get_compression_measure(result,
+                            measure):
+    """
+        get_compression_measure()
+
+        Return a measure made by the first codec of the 'compress' stage
+        (see --stages and stage_compress.py).
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (SerializationResult)result
+        o  (str)measure: 'compressed_strlen',
+                         'compression_ratio' (compressed/encoded string length),
+                         'compression_throughput' or 'decompression_throughput'
+                         (encoded string length/time, in MB/s)
+
+        RETURNED VALUE: (None|int|float) None if the stage hasn't been measured
+                        or if the compression failed.
+    """
+    if not result.stages.get("compress"):
+        return None
+    compressionresult = next(iter(result.stages["compress"].values()))
+    if not compressionresult.success:
+        return None
+
+    if measure == "compressed_strlen":
+        return compressionresult.compressed_strlen
+    if measure == "compression_ratio":
+        return compressionresult.compressed_strlen / compressionresult.strlen \
+            if compressionresult.strlen else None
+
+    timestats = compressionresult.compression_timestats if measure == "compression_throughput" \
+        else compressionresult.decompression_timestats
+    return compressionresult.strlen / timestats.median / 10**6 if timestats.median else None
+
+
+# metric > (array typecode, function returning the value stored in a SerializationResult)
+MATRIX_METRICS = {
+    "encoding_time": ("d", lambda result: result.encoding_time),
+    "decoding_time": ("d", lambda result: result.decoding_time),
+    "encoding_strlen": ("q", lambda result: result.encoding_strlen),
+    "mem_usage": ("q", lambda result: result.mem_usage),
+    "encoding_throughput": ("d", lambda result: result.encoding_throughput),
+    "decoding_throughput": ("d", lambda result: result.decoding_throughput),
+    "ops_throughput": ("d", lambda result: result.ops_throughput),
+    "compressed_strlen": ("q", lambda result: get_compression_measure(result,
+                                                                      "compressed_strlen")),
+    "compression_ratio": ("d", lambda result: get_compression_measure(result,
+                                                                      "compression_ratio")),
+    "compression_throughput": ("d", lambda result: get_compression_measure(
+        result, "compression_throughput")),
+    "decompression_throughput": ("d", lambda result: get_compression_measure(
+        result, "decompression_throughput")),
+    "encoding_time_ci95_low": ("d", lambda result: None if result.encoding_timestats is None
+                               else result.encoding_timestats.ci95[0]),
+    "encoding_time_ci95_high": ("d", lambda result: None if result.encoding_timestats is None
+                                else result.encoding_timestats.ci95[1]),
+    "decoding_time_ci95_low": ("d", lambda result: None if result.decoding_timestats is None
+                               else result.decoding_timestats.ci95[0]),
+    "decoding_time_ci95_high": ("d", lambda result: None if result.decoding_timestats is None
+                                else result.decoding_timestats.ci95[1]),
+}
+
+# <flags>.translate(NOT_FLAGS) reverses 0/1 flags:
+NOT_FLAGS = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+
+# flags stored for each cell, see (pimydoc)results matrix:
+MATRIX_FLAGS = ("exists", "compatible", "present", "interrupted",
+                "encoding_success", "decoding_success", "reversibility")
+
+
+# No useless public methods to add, indeed!
+#   pylint: disable=too-few-public-methods
+class ResultsMatrix:
+    """
+        ResultsMatrix class
+
+        Columnar view of a SerializationResults object, see (pimydoc)results matrix.
+        _______________________________________________________________________
+
+        instance attributes:
+
+        o  (list of str)serializers
+        o  (list of str)dataobjs
+        o  (dict)flags      : flags[flag] = bytearray, flag being one of MATRIX_FLAGS
+        o  (dict)values     : values[metric] = array.array, metric being one of MATRIX_METRICS
+        o  (dict)valid      : valid[metric] = bytearray, 1 if values[metric] is not None
+        o  (dict)rows       : rows[serializer] = reductions of the row, see reduce_cells()
+        o  (dict)columns    : columns[dataobj] = reductions of the column, see reduce_cells()
+
+        methods:
+
+        o  __init__(self, results)
+        o  reduce_cells(self, cells, serializer_row)
+    """
+    def __init__(self,
+                 results):
+        """
+            ResultsMatrix.__init__()
+
+            Fill the arrays with <results>, then compute the reductions of each
+            row and of each column.
+            ___________________________________________________________________
+
+            ARGUMENT:
+            o  results: (SerializationResults)a dict of
+                        [(str)serializer][(str)data_name] = SerializationResult
+        """
+        # same order as SerializationResults.serializers:
+        self.serializers = sorted(results)
+        self.dataobjs = sorted(set(dataobj
+                                   for serializer in self.serializers
+                                   for dataobj in results[serializer]))
+        size = len(self.serializers)*len(self.dataobjs)
+
+        self.flags = {flag: bytearray(size) for flag in MATRIX_FLAGS}
+        self.values = {metric: array.array(typecode, bytes(size*array.array(typecode).itemsize))
+                       for metric, (typecode, _) in MATRIX_METRICS.items()}
+        self.valid = {metric: bytearray(size) for metric in MATRIX_METRICS}
+
+        cell = 0
+        for serializer in self.serializers:
+            serializer_results = results[serializer]
+            for dataobj in self.dataobjs:
+                self.flags["compatible"][cell] = \
+                    serializer_is_compatible_with_dataobj(serializer, dataobj)
+                if dataobj in serializer_results:
+                    self.flags["exists"][cell] = 1
+                    result = serializer_results[dataobj]
+                    if result is not None:
+                        self.flags["present"][cell] = 1
+                        self.flags["interrupted"][cell] = result.interruption is not None
+                        self.flags["encoding_success"][cell] = bool(result.encoding_success)
+                        self.flags["decoding_success"][cell] = bool(result.decoding_success)
+                        self.flags["reversibility"][cell] = bool(result.reversibility)
+                        for metric, (_, getvalue) in MATRIX_METRICS.items():
+                            value = getvalue(result)
+                            if value is not None:
+                                self.values[metric][cell] = value
+                                self.valid[metric][cell] = 1
+                cell += 1
+
+        columns_number = len(self.dataobjs)
+        self.rows = {serializer: self.reduce_cells(slice(row*columns_number,
+                                                         (row+1)*columns_number),
+                                                   serializer_row=True)
+                     for row, serializer in enumerate(self.serializers)}
+        self.columns = {dataobj: self.reduce_cells(slice(col, size, columns_number),
+                                                   serializer_row=False)
+                        for col, dataobj in enumerate(self.dataobjs)}
+
+    def reduce_cells(self,
+                     cells,
+                     serializer_row):
+        """
+            ResultsMatrix.reduce_cells()
+
+            Compute the reductions of a row (a serializer) or of a column
+            (a data object), only the cells that exist and whose serializer is
+            compatible with the data object being taken into account. The
+            interrupted cells (e.g. by --budget, see SerializationResult.interruption)
+            have no measure: they are only counted, as 'interrupted'.
+
+            If one of these cells is None, the totals and the success counts
+            are None. For a row, the totals are also None if an encoding failed.
+            'compressed_strlen' is None if an encoded string hasn't been
+            compressed (see the 'compress' stage).
+            ___________________________________________________________________
+
+            ARGUMENTS:
+            o  (slice)cells: the indexes of the cells, e.g. slice(row*n, (row+1)*n)
+            o  (bool)serializer_row: True for a row, False for a column
+
+            RETURNED VALUE: (dict) with the following keys:
+                o  'compatible'             : (int) number of compatible cells
+                o  'interrupted'            : (int) number of interrupted cells, which
+                                              are left out of the other reductions
+                o  'encoding_success',
+                   'decoding_success',
+                   'reversibility'          : (None|int) number of successes
+                o  'encoding_time',
+                   'decoding_time',
+                   'encoding_strlen',
+                   'compressed_strlen',
+                   'mem_usage'              : (None|float|int) totals
+                o  'encoding_throughput',
+                   'decoding_throughput',
+                   'ops_throughput',
+                   'compression_ratio',
+                   'compression_throughput',
+                   'decompression_throughput': (None|float) geometric means
+                o  'encoding_time_ci95',
+                   'decoding_time_ci95'     : (None|(float, float)) sums of the bounds
+                                              of the confidence intervals
+        """
+        # each reduction reads a slice (a copy of the row/column) of the arrays it needs,
+        # the values being selected by itertools.compress():
+        flags = {flag: self.flags[flag][cells] for flag in MATRIX_FLAGS}
+        values, valid = self.values, self.valid
+        compress = itertools.compress
+
+        selected = and_flags(flags["compatible"], flags["exists"])
+        interrupted_number = and_flags(selected, flags["interrupted"]).count(1)
+        if interrupted_number:
+            selected = and_flags(selected, flags["interrupted"].translate(NOT_FLAGS))
+        selected_number = selected.count(1)
+
+        res = {"compatible": flags["compatible"].count(1),
+               "interrupted": interrupted_number}
+
+        if and_flags(selected, flags["present"]).count(1) != selected_number:
+            res.update(dict.fromkeys(("encoding_success", "decoding_success", "reversibility",
+                                      "encoding_time", "decoding_time",
+                                      "encoding_strlen", "compressed_strlen", "mem_usage",
+                                      "encoding_time_ci95", "decoding_time_ci95")))
+        else:
+            for flag in ("encoding_success", "decoding_success", "reversibility"):
+                res[flag] = and_flags(selected, flags[flag]).count(1)
+
+            if serializer_row and res["encoding_success"] != selected_number:
+                res.update(dict.fromkeys(("encoding_time", "decoding_time",
+                                          "encoding_strlen", "compressed_strlen",
+                                          "mem_usage",
+                                          "encoding_time_ci95", "decoding_time_ci95")))
+            else:
+                for prefix in ("encoding", "decoding"):
+                    successes = and_flags(selected, flags[f"{prefix}_success"])
+                    res[f"{prefix}_time"] = sum(compress(values[f"{prefix}_time"][cells],
+                                                         successes))
+                    if and_flags(successes,
+                                 valid[f"{prefix}_time_ci95_low"][cells]) == successes:
+                        res[f"{prefix}_time_ci95"] = (
+                            sum(compress(values[f"{prefix}_time_ci95_low"][cells], successes)),
+                            sum(compress(values[f"{prefix}_time_ci95_high"][cells], successes)))
+                    else:
+                        res[f"{prefix}_time_ci95"] = None
+                for metric in ("encoding_strlen", "mem_usage"):
+                    res[metric] = sum(compress(values[metric][cells],
+                                               and_flags(selected, valid[metric][cells])))
+                # each encoded string has to be compressed (see the 'compress' stage):
+                successes = and_flags(selected, flags["encoding_success"])
+                res["compressed_strlen"] = \
+                    sum(compress(values["compressed_strlen"][cells], successes)) \
+                    if and_flags(successes, valid["compressed_strlen"][cells]) == successes \
+                    else None
+
+        for metric in ("encoding_throughput", "decoding_throughput", "ops_throughput",
+                       "compression_ratio", "compression_throughput", "decompression_throughput"):
+            logs = list(map(math.log, compress(values[metric][cells],
+                                               and_flags(selected, valid[metric][cells]))))
+            res[metric] = math.exp(statistics.fmean(logs)) if logs else None
+
+        return res
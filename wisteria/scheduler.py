@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/scheduler.py
+
+    Order in which the transcodings are computed, see --method 'order',
+    'rounds' and 'seed'.
+
+    If all the transcodings of a serializer are computed one after the other,
+    any drift of the machine during the run (cpu frequency scaling, thermal
+    throttling, background load) is charged to the serializers computed at
+    that time. The transcodings may instead be interleaved and computed
+    during several rounds: each transcoding keeps the result of its median
+    round (see get_median_result()) and the drift of each round is measured
+    (see summarize_rounds(), report section B9).
+
+    Accepted orders are:
+    * 'sorted'     : the order of PLANNED_TRANSCODINGS (serializer after
+                     serializer, or cheapest data objects first, see --budget)
+    * 'shuffle'    : a random order, different for each round but
+                     reproducible (see METHOD['seed'])
+    * 'roundrobin' : data object after data object, the serializers being
+                     rotated from one data object to the next one
+    * 'latinsquare': like 'roundrobin', the rotation being also shifted from
+                     one round to the next one: after as many rounds as there
+                     are serializers, each serializer has been computed at
+                     each position for each data object.
+    ___________________________________________________________________________
+
+    o  get_median_result(round_results)
+    o  get_result_time(result)
+    o  get_schedule(planned_transcodings, order, rounds, seed)
+    o  summarize_rounds(schedule, rounds_results)
+"""
+import math
+import random
+import statistics
+
+
+# accepted values for METHOD['order']:
+SCHEDULE_ORDERS = ("sorted", "shuffle", "roundrobin", "latinsquare")
+
+
+def get_median_result(round_results):
+    """
+        get_median_result()
+
+        Return the result of the round whose encoding+decoding time is the
+        median one. The interrupted results (see --sandbox and --budget) are
+        only returned if all results are interrupted.
+        _______________________________________________________________________
+
+        ARGUMENT: (list of SerializationResult)round_results, one per round
+
+        RETURNED VALUE: (SerializationResult)the median result
+    """
+    candidates = [result for result in round_results if result.interruption is None] \
+        or round_results
+    candidates = sorted(candidates, key=lambda result: get_result_time(result) or 0)
+    return candidates[(len(candidates)-1)//2]
+
+
+def get_result_time(result):
+    """
+        get_result_time()
+
+        Return the encoding+decoding time of <result> or None if <result> has
+        no such time.
+        _______________________________________________________________________
+
+        ARGUMENT: (SerializationResult)result
+
+        RETURNED VALUE: (None|float)the time, in seconds
+    """
+    if result.interruption is not None or \
+       not result.encoding_success or not result.decoding_success or \
+       result.encoding_time is None or result.decoding_time is None:
+        return None
+    return result.encoding_time + result.decoding_time
+
+
+def get_schedule(planned_transcodings,
+                 order,
+                 rounds,
+                 seed):
+    """
+        get_schedule()
+
+        Return the transcodings to be computed by each round, see the
+        documentation of this module.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (list)planned_transcodings   : see (pimydoc)PLANNED_TRANSCODINGS
+        o  (str)order                   : see SCHEDULE_ORDERS
+        o  (int)rounds                  : number of rounds, >= 1
+        o  (int)seed                    : seed of the random generator ('shuffle')
+
+        RETURNED VALUE: (list of lists)the transcodings of each round
+    """
+    rng = random.Random(seed)
+    # serializers and data objects, in the order they appear in <planned_transcodings>:
+    serializers = list(dict.fromkeys(serializer for serializer, _, _ in planned_transcodings))
+    dataobjs = list(dict.fromkeys(data_name for _, data_name, _ in planned_transcodings))
+    # transcodings[(serializer, data_name)] = planned transcoding
+    transcodings = {planned_transcoding[:2]: planned_transcoding
+                    for planned_transcoding in planned_transcodings}
+
+    res = []
+    for round_index in range(rounds):
+        if order == "sorted":
+            round_transcodings = list(planned_transcodings)
+        elif order == "shuffle":
+            round_transcodings = list(planned_transcodings)
+            rng.shuffle(round_transcodings)
+        else:
+            shift = round_index if order == "latinsquare" else 0
+            round_transcodings = []
+            for dataobj_index, data_name in enumerate(dataobjs):
+                for serializer_index in range(len(serializers)):
+                    serializer = serializers[
+                        (serializer_index+dataobj_index+shift) % len(serializers)]
+                    if (serializer, data_name) in transcodings:
+                        round_transcodings.append(transcodings[(serializer, data_name)])
+        res.append(round_transcodings)
+
+    return res
+
+
+def summarize_rounds(schedule,
+                     rounds_results):
+    """
+        summarize_rounds()
+
+        Measure the drift of each round: for each transcoding computed by
+        several rounds, the ratio of its time in this round to its median
+        time over all rounds. A round whose ratios are greater than 1 has
+        been slower than the other ones.
+
+        The ratios are also given for the first and for the second half of the
+        round: a drift during the round makes them differ.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (list of lists)schedule      : see get_schedule()
+        o  (list of dicts)rounds_results: rounds_results[(int)round index]
+                                          [(tuple)planned transcoding] = SerializationResult
+
+        RETURNED VALUE: (list of dicts)one dict by round:
+                        {"transcodings": (int)number of computed transcodings,
+                         "time": (float)Σ encoding+decoding times, in seconds,
+                         "drift": (None|float)geometric mean of the ratios,
+                         "first_half": (None|float)idem, first half of the round,
+                         "second_half": (None|float)idem, second half of the round}
+    """
+    # times[planned transcoding] = list of (None|float)time, one per round
+    times = {}
+    for round_index, round_results in enumerate(rounds_results):
+        for planned_transcoding, result in round_results.items():
+            times.setdefault(planned_transcoding, [None]*len(rounds_results))
+            times[planned_transcoding][round_index] = get_result_time(result)
+
+    medians = {}
+    for planned_transcoding, transcoding_times in times.items():
+        transcoding_times = [time for time in transcoding_times if time]
+        if len(transcoding_times) > 1:
+            medians[planned_transcoding] = statistics.median(transcoding_times)
+
+    def geometric_mean(logratios):
+        """
+            geometric_mean()
+
+            Return the geometric mean of the ratios whose logarithms are <logratios>.
+        """
+        return math.exp(statistics.fmean(logratios)) if logratios else None
+
+    res = []
+    for round_index, round_transcodings in enumerate(schedule):
+        logratios = []
+        for position, planned_transcoding in enumerate(round_transcodings):
+            time = times.get(planned_transcoding, [None]*len(schedule))[round_index]
+            if time and planned_transcoding in medians:
+                logratios.append((position < len(round_transcodings)/2,
+                                  math.log(time/medians[planned_transcoding])))
+        res.append(
+            {"transcodings": len(rounds_results[round_index]),
+             "time": sum(transcoding_times[round_index] or 0
+                         for transcoding_times in times.values()),
+             "drift": geometric_mean([logratio for _, logratio in logratios]),
+             "first_half": geometric_mean([logratio for first, logratio in logratios
+                                           if first]),
+             "second_half": geometric_mean([logratio for first, logratio in logratios
+                                            if not first])})
+
+    return res
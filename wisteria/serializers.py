@@ -22,92 +22,119 @@
     Wisteria project : wisteria/serializers.py
 
     All known serializers are defined here, in the SERIALIZERS dict. Each serializer
-    has its own serializer_xxx function.
+    has its own serializer_xxx function, which only describes through a
+    TranscodingAdapter the functions to be called: the transcoding itself is
+    made by transcode().
     A reference to each module imported is added in the MODULES dict.
     ___________________________________________________________________________
 
     o  _len(obj)
-    o  func_serialize(serializer, data_name, fingerprint=None)
-    o  win_memory()
+    o  check_transcoding(adapter,
+                         obj, obj_data_name=None,
+                         fingerprint="",
+                         strictmute=False,
+                         works_as_expected=None)
+    o  func_serialize(serializer, data_name, fingerprint=None, action="serialize")
+    o  jsonlines_dump(module, objs, fp)
+    o  jsonlines_load(module, fp)
+    o  pickle_optimized_dumps(module, protocol, obj)
+    o  pickle_outofband_dumps(optimize, obj)
+    o  pickle_outofband_loads(module, encoded_object)
 
     o  serializer_iaswn(action="serialize",
                         obj=None, obj_data_name=None,
                         fingerprint="",
                         strictmute=False,
-                        works_as_expected=None)
+                        works_as_expected=None,
+                        transcoding_check=None)
     o  serializer_json(action="serialize",
                         obj=None,
                         obj_data_name=None,
                         fingerprint="",
                         strictmute=False,
-                        works_as_expected=None)
+                        works_as_expected=None,
+                        transcoding_check=None)
     o  serializer_jsonpickle(action="serialize",
                              obj=None, obj_data_name=None,
                              fingerprint="",
                              strictmute=False,
-                             works_as_expected=None)
+                             works_as_expected=None,
+                             transcoding_check=None)
     o  serializer_jsonpickle_keystrue(action="serialize",
                                       obj=None, obj_data_name=None,
                                       fingerprint="",
                                       strictmute=False,
-                                      works_as_expected=None)
+                                      works_as_expected=None,
+                                      transcoding_check=None)
     o  serializer_marshal(action="serialize",
                           obj=None, obj_data_name=None,
                           fingerprint="",
                           strictmute=False,
-                          works_as_expected=None)
+                          works_as_expected=None,
+                          transcoding_check=None)
     o  serializer_pickle(action="serialize",
                          obj=None, obj_data_name=None,
                          fingerprint="",
                          strictmute=False,
-                         works_as_expected=None)
+                         works_as_expected=None,
+                         transcoding_check=None)
+    o  serializer_pickle_variant(action="serialize",
+                                 obj=None, obj_data_name=None,
+                                 fingerprint="",
+                                 strictmute=False,
+                                 works_as_expected=None,
+                                 transcoding_check=None,
+                                 variant=None)
     o  serializer_pyyaml(action="serialize",
                          obj=None, obj_data_name=None,
                          fingerprint="",
                          strictmute=False,
-                         works_as_expected=None)
+                         works_as_expected=None,
+                         transcoding_check=None)
     o  serializer_simpleion(action="serialize",
                             obj=None, obj_data_name=None,
                             fingerprint="",
                             strictmute=False,
-                            works_as_expected=None)
+                            works_as_expected=None,
+                            transcoding_check=None)
     o  serializer_yajl(action="serialize",
                        obj=None, obj_data_name=None,
                        fingerprint="",
                        strictmute=False,
-                       works_as_expected=None)
+                       works_as_expected=None,
+                       transcoding_check=None)
+
+    o  transcode(adapter,
+                 action="serialize",
+                 obj=None, obj_data_name=None,
+                 fingerprint="",
+                 strictmute=False,
+                 works_as_expected=None,
+                 transcoding_check=None)
 
     o  init_serializers()
 """
 #   pylint: disable = wrong-import-position
-import timeit
+import functools
+import io
+import pickletools
 
 import wisteria.globs
 
-if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-    # We have to import 'os' only for Windows systems, hence the useless
-    # remark from Pylint when Pylint is used on non-Windows systems.
-    #   pylint: disable=unused-import
-    import os
-    # We have to import 'WMI' only for Windows systems, hence the useless
-    # remark from Pylint when Pylint is used on non-Windows systems.
-    #   pylint: disable=import-error
-    from wmi import WMI
-else:
-    # We have to import 'resource' only for non-Windows systems, hence the useless
-    # remark from Pylint when Pylint is used on Windows systems.
-    #   pylint: disable=import-error
-    import resource
-
 # MEMOVERUSE# --memoveruse C++ module:
 # MEMOVERUSEimport cppyy
 
-from wisteria.globs import TIMEITNUMBER, MODULES
+from wisteria.globs import MODULES
 from wisteria.globs import VERBOSITY_DEBUG, VERBOSITY_DETAILS
 from wisteria.wisteriaerror import WisteriaError
 from wisteria.utils import trytoimport, get_python_version
 from wisteria.serializers_classes import SerializersDataNMVH, SerializerData, SerializationResult
+from wisteria.serializers_classes import TranscodingAdapter, TranscodingCheck
+from wisteria.serializers_classes import OutOfBandPickle, OutOfBandPickler
 from wisteria.msg import msgdebug, msginfo
+from wisteria.timing import measure_time
+from wisteria.memprobe import measure_memory
+from wisteria.stages import run_stages
 from wisteria.cwc.cwc_utils import is_a_cwc_name, moduleininame_to_modulefullrealname
 from wisteria.cwc.cwc_utils import modulefullrealname_to_modulerealname
 from wisteria.cwc.cwc_utils import modulefullrealname_to_classname
@@ -122,48 +149,90 @@ from wisteria.cwc.cwc_utils import modulefullrealname_to_waemodulename
 # MEMOVERUSEfrom cppyy.gbl import MemOverUse  # noqa
 
 
+# pickle variants, registered by init_serializers() as distinct serializers
+# that 'all' doesn't select (see results.py:get_serializers_selection()):
+#   PICKLE_VARIANTS[(str)serializer] = ((int)protocol, (bool)outofband, (bool)optimize)
+# * protocol  : pickle protocol, from 0 to 5
+# * outofband : (protocol 5 only) True if the content of the array.array and memoryview
+#               objects is given as out-of-band buffers instead of being copied,
+#               see OutOfBandPickler
+# * optimize  : True if the pickle stream is optimized by pickletools.optimize()
+PICKLE_VARIANTS = {
+    f"pickle_p{protocol}{'_oob' if outofband else ''}{'_opt' if optimize else ''}":
+    (protocol, outofband, optimize)
+    for protocol in range(6)
+    for outofband in ((False, True) if protocol == 5 else (False,))
+    for optimize in (False, True)}
+
+# number of characters encoded at once by _len() to compute the UTF-8 length of a
+# non-ASCII str: the temporary bytes object is at most 4*UTF8LEN_CHUNKSIZE long.
+UTF8LEN_CHUNKSIZE = 2**16
+
+
 def _len(obj):
     """
         _len()
 
-        Return the length of <obj>
+        Return the length of <obj>: see METHOD['lenmethod'] for a str object.
+
+        The UTF-8 length of a str is computed without any copy of the whole
+        string: an ASCII string has as many bytes as characters and a non-ASCII
+        string is encoded by chunks of UTF8LEN_CHUNKSIZE characters.
         _______________________________________________________________________
 
-        ARGUMENT: (bytes|str)<obj>
+        ARGUMENT: (bytes|str|OutOfBandPickle)<obj>
 
         RETURNED VALUE: the length of <obj>
     """
-    if isinstance(obj, str):
-        return len(bytes(obj, "utf-8"))
-    return len(obj)
+    if not isinstance(obj, str):
+        return len(obj)
+
+    method = wisteria.globs.METHOD or wisteria.globs.METHOD_DEFAULTS
+    if method["lenmethod"] == "str" or obj.isascii():
+        return len(obj)
+    return sum(len(obj[index:index+UTF8LEN_CHUNKSIZE].encode("utf-8"))
+               for index in range(0, len(obj), UTF8LEN_CHUNKSIZE))
 
 
 def func_serialize(serializer,
                    data_name,
-                   fingerprint=None):
+                   fingerprint=None,
+                   action="serialize"):
     """
         func_serialize()
 
         Just a wrapper around .transcodefunc(action="serialize")
+
+        If the untimed encoding/decoding of (<serializer>, <data_name>) has
+        already been made by the --filter pre-pass, its result is read (and
+        removed) from wisteria.globs.TRANSCODING_CHECKS instead of being computed again.
         _______________________________________________________________________
 
         ARGUMENTS:
         o  (str)     serializer
         o  (str)     data_name
         o  (None|str)fingerprint
+        o  (str)     action: "serialize" or "check", see transcode()
 
-        RETURNED VALUE: serialized object corresponding to <data_name>.
+        RETURNED VALUE: serialized object corresponding to <data_name>
+                        (a SerializationResult object) or, if <action> is "check",
+                        a TranscodingCheck object.
     """
+    transcoding_check = None
+    if action == "serialize":
+        transcoding_check = wisteria.globs.TRANSCODING_CHECKS.pop((serializer, data_name), None)
+
     # ==== <data_name> is NOT A CWC CLASS =====================================
     if not is_a_cwc_name(data_name):
         return wisteria.globs.SERIALIZERS[serializer].transcodefunc(
-            action="serialize",
+            action=action,
             obj=wisteria.globs.DATA[data_name],
             obj_data_name=data_name,
             fingerprint=fingerprint,
             works_as_expected=wisteria.data.works_as_expected
             if wisteria.data.works_as_expected(data_name=data_name,
-                                               obj=None) is True else None)
+                                               obj=None) is True else None,
+            transcoding_check=transcoding_check)
 
     # ==== <data_name> is a CWC CLASS =========================================
     # data_name: e.g. "cwc.pgnreader.cwc_default.chessgames"
@@ -183,30 +252,112 @@ def func_serialize(serializer,
                     data_name__strclassname)())
 
     return wisteria.globs.SERIALIZERS[serializer].transcodefunc(
-        action="serialize",
+        action=action,
         obj=cwc_object,
         obj_data_name=data_name,
         fingerprint=fingerprint,
         works_as_expected=getattr(
             wisteria.globs.MODULES[data_name__strwaemodulename],
-            "works_as_expected"))
+            "works_as_expected"),
+        transcoding_check=transcoding_check)
 
 
-def win_memory():
+def jsonlines_dump(module,
+                   objs,
+                   fp):
     """
-        win_memory()
+        jsonlines_dump()
 
-        Compute using WMI the quantity of memory used by the current process.
+        Write the items of <objs> into <fp> as JSON Lines, i.e. one JSON document
+        per line.
         _______________________________________________________________________
 
-        RETURNED VALUE: (int)the number of bytes used by the current process.
+        ARGUMENTS:
+        o  (module)module: the json module
+        o  (iterable)objs
+        o  (text file object)fp
     """
-    wmi = WMI('.')
-    result = wmi.query(
-        "SELECT WorkingSet "
-        f"FROM Win32_PerfRawData_PerfProc_Process WHERE IDProcess={os.getpid()}")
-    res = int(result[0].WorkingSet)
-    return res
+    for obj in objs:
+        module.dump(obj, fp)
+        fp.write("\n")
+
+
+def jsonlines_load(module,
+                   fp):
+    """
+        jsonlines_load()
+
+        Read the JSON Lines written into <fp> by jsonlines_dump().
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (module)module: the json module
+        o  (text file object)fp
+
+        RETURNED VALUE: (list)the documents read from <fp>
+    """
+    return [module.loads(line) for line in fp if line.strip()]
+
+
+def pickle_optimized_dumps(module,
+                           protocol,
+                           obj):
+    """
+        pickle_optimized_dumps()
+
+        Pickle <obj> with <protocol>, then optimize the pickle stream.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (module)module: the pickle module
+        o  (int)protocol
+        o  obj: the object to be pickled
+
+        RETURNED VALUE: (bytes)the optimized pickle stream
+    """
+    return pickletools.optimize(module.dumps(obj, protocol=protocol))
+
+
+def pickle_outofband_dumps(optimize,
+                           obj):
+    """
+        pickle_outofband_dumps()
+
+        Pickle <obj> with protocol 5, the content of the array.array and
+        memoryview objects being given as out-of-band buffers, see OutOfBandPickler.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (bool)optimize: True if the pickle stream has to be optimized by
+                           pickletools.optimize()
+        o  obj: the object to be pickled
+
+        RETURNED VALUE: an OutOfBandPickle object
+    """
+    buffers = []
+    stream = io.BytesIO()
+    OutOfBandPickler(stream, protocol=5, buffer_callback=buffers.append).dump(obj)
+    data = stream.getvalue()
+    if optimize:
+        data = pickletools.optimize(data)
+    return OutOfBandPickle(data, buffers)
+
+
+def pickle_outofband_loads(module,
+                           encoded_object):
+    """
+        pickle_outofband_loads()
+
+        Unpickle an object pickled by pickle_outofband_dumps().
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (module)module: the pickle module
+        o  (OutOfBandPickle)encoded_object
+
+        RETURNED VALUE: the unpickled object
+    """
+    return module.loads(encoded_object.data, buffers=encoded_object.buffers)
 
 
 def serializer_iaswn(action="serialize",
@@ -214,154 +365,493 @@ def serializer_iaswn(action="serialize",
                      obj_data_name=None,
                      fingerprint="",
                      strictmute=False,
-                     works_as_expected=None):
+                     works_as_expected=None,
+                     transcoding_check=None):
     """
         serializer_iaswn()
 
-        Serializer for the Iaswn module.
+        Serializer for the Iaswn module: see transcode().
+        _______________________________________________________________________
 
-        Like every serializer_xxx() function:
-        * this function may return (action='version') the version of the concerned module.
-        * this function may try (action='serialize') to encode/decode an <obj>ect.
-        * if the serializer raises an error, this error is silently converted and no exception
-          is raised. If an internal error happpens, a WisteriaError exception is raised.
+        ARGUMENTS: see transcode()
 
-        This function assumes that the concerned module has already be imported.
+        RETURNED VALUE: see transcode()
+    """
+    module = MODULES[wisteria.globs.SERIALIZERS['iaswn'].module_name]
+
+    return transcode(
+        adapter=TranscodingAdapter(
+            module=module,
+            version=module.__version__,
+            encode=module.encode,
+            decode=module.decode,
+            encoding_errors=(module.IaswnError,),
+            decoding_errors=(module.IaswnError,)),
+        action=action,
+        obj=obj,
+        obj_data_name=obj_data_name,
+        fingerprint=fingerprint,
+        strictmute=strictmute,
+        works_as_expected=works_as_expected,
+        transcoding_check=transcoding_check)
+
+
+def serializer_json(action="serialize",
+                    obj=None,
+                    obj_data_name=None,
+                    fingerprint="",
+                    strictmute=False,
+                    works_as_expected=None,
+                    transcoding_check=None):
+    """
+        serializer_json()
+
+        Serializer for the json module: see transcode().
         _______________________________________________________________________
 
-        ARGUMENTS:
-        o  action           : (str) "version", "serialize" or "encode"
-        o  obj              : the object to be serialized
-        o  obj_data_name    : (str) obj type as defined in DATA[]
-        o  fingerprint      : a string describing the operation (usefull to debug)
-        o  strictmute       : (bool)True if no message can be displayed
-        o  works_as_expected: (None or callable)if not None, will be called to check
-                              the reversibility of the de-serialized object.
+        ARGUMENTS: see transcode()
 
-        RETURNED VALUE:
-           - None if an error occcured
-           - if <action> is (str)"version", return a string.
-           - if <action> is (str)"encode", return the encoded string
-           - if <action> is (str)"serialize", return a SerializationResult object.
+        RETURNED VALUE: see transcode()
     """
-    serializer_name = 'iaswn'
+    module = MODULES[wisteria.globs.SERIALIZERS['json'].module_name]
+
+    return transcode(
+        adapter=TranscodingAdapter(
+            module=module,
+            version=module.__version__,
+            encode=module.dumps,
+            decode=module.loads,
+            encoding_errors=(TypeError,),
+            decoding_errors=(TypeError, AttributeError),
+            dump=module.dump,
+            load=module.load,
+            dump_all=functools.partial(jsonlines_dump, module),
+            load_all=functools.partial(jsonlines_load, module),
+            textstream=True),
+        action=action,
+        obj=obj,
+        obj_data_name=obj_data_name,
+        fingerprint=fingerprint,
+        strictmute=strictmute,
+        works_as_expected=works_as_expected,
+        transcoding_check=transcoding_check)
 
-    module = MODULES[wisteria.globs.SERIALIZERS[serializer_name].module_name]
 
-    # -------------------
-    # action == "version"
-    # -------------------
-    if action == "version":
-        return module.__version__
+def serializer_jsonpickle(action="serialize",
+                          obj=None,
+                          obj_data_name=None,
+                          fingerprint="",
+                          strictmute=False,
+                          works_as_expected=None,
+                          transcoding_check=None):
+    """
+        serializer_jsonpickle()
 
-    # -------------------
-    # action == "encode"
-    # -------------------
-    if action == "encode":
-        try:
-            return module.encode(obj)
-        except module.IaswnError:
-            return None
+        Serializer for the jsonpickle module: see transcode().
+        _______________________________________________________________________
 
-    # ---------------------
-    # action == "serialize"
-    # ---------------------
-    if action != "serialize":
-        raise WisteriaError(f"(ERRORID030) Unknown 'action' keyword '{action}'.")
+        ARGUMENTS: see transcode()
 
-    # MEMOVERUSE# ---- --memoveruse ? -----------------------------------------------------
-    # MEMOVERUSEif 'Python' in wisteria.globs.ARGS.memoveruse:
-    # MEMOVERUSE    #   pylint: disable=possibly-unused-variable
-    # MEMOVERUSE    dumbstr = "0123456789"*100000
-    # MEMOVERUSEif 'C++' in wisteria.globs.ARGS.memoveruse:
-    # MEMOVERUSE    MemOverUse().memoveruse()
+        RETURNED VALUE: see transcode()
+    """
+    module = MODULES[wisteria.globs.SERIALIZERS['jsonpickle'].module_name]
+
+    return transcode(
+        adapter=TranscodingAdapter(
+            module=module,
+            version=module.__version__,
+            encode=module.dumps,
+            decode=module.loads,
+            encoding_errors=(TypeError,),
+            decoding_errors=(TypeError, AttributeError)),
+        action=action,
+        obj=obj,
+        obj_data_name=obj_data_name,
+        fingerprint=fingerprint,
+        strictmute=strictmute,
+        works_as_expected=works_as_expected,
+        transcoding_check=transcoding_check)
 
-    # ---- main computation ---------------------------------------------------
-    res = SerializationResult()
 
-    if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-        mem0 = win_memory()
+def serializer_jsonpickle_keystrue(action="serialize",
+                                   obj=None,
+                                   obj_data_name=None,
+                                   fingerprint="",
+                                   strictmute=False,
+                                   works_as_expected=None,
+                                   transcoding_check=None):
+    """
+        serializer_jsonpickle_keystrue()
+
+        Serializer for the jsonpickle module (keys=True): see transcode().
+        _______________________________________________________________________
+
+        ARGUMENTS: see transcode()
+
+        RETURNED VALUE: see transcode()
+    """
+    module = MODULES[wisteria.globs.SERIALIZERS['jsonpickle'].module_name]
+
+    return transcode(
+        adapter=TranscodingAdapter(
+            module=module,
+            version=module.__version__,
+            encode=functools.partial(module.dumps, keys=True),
+            decode=functools.partial(module.loads, keys=True),
+            encoding_errors=(TypeError,),
+            decoding_errors=(TypeError, AttributeError)),
+        action=action,
+        obj=obj,
+        obj_data_name=obj_data_name,
+        fingerprint=fingerprint,
+        strictmute=strictmute,
+        works_as_expected=works_as_expected,
+        transcoding_check=transcoding_check)
+
+
+def serializer_marshal(action="serialize",
+                       obj=None,
+                       obj_data_name=None,
+                       fingerprint="",
+                       strictmute=False,
+                       works_as_expected=None,
+                       transcoding_check=None):
+    """
+        serializer_marshal()
+
+        Serializer for the marshal module: see transcode().
+        _______________________________________________________________________
+
+        ARGUMENTS: see transcode()
+
+        RETURNED VALUE: see transcode()
+    """
+    module = MODULES[wisteria.globs.SERIALIZERS['marshal'].module_name]
+
+    return transcode(
+        adapter=TranscodingAdapter(
+            module=module,
+            version=f"version {module.version}; (Python version) {get_python_version()}",
+            encode=module.dumps,
+            decode=module.loads,
+            encoding_errors=(TypeError, ValueError),
+            decoding_errors=(TypeError, AttributeError),
+            dump=module.dump,
+            load=module.load,
+            decode_buffer=module.loads),
+        action=action,
+        obj=obj,
+        obj_data_name=obj_data_name,
+        fingerprint=fingerprint,
+        strictmute=strictmute,
+        works_as_expected=works_as_expected,
+        transcoding_check=transcoding_check)
+
+
+def serializer_pickle(action="serialize",
+                      obj=None,
+                      obj_data_name=None,
+                      fingerprint="",
+                      strictmute=False,
+                      works_as_expected=None,
+                      transcoding_check=None):
+    """
+        serializer_pickle()
+
+        Serializer for the pickle module: see transcode().
+        _______________________________________________________________________
+
+        ARGUMENTS: see transcode()
+
+        RETURNED VALUE: see transcode()
+    """
+    module = MODULES[wisteria.globs.SERIALIZERS['pickle'].module_name]
+
+    return transcode(
+        adapter=TranscodingAdapter(
+            module=module,
+            version=f"(Python version) {get_python_version()}",
+            encode=module.dumps,
+            decode=module.loads,
+            encoding_errors=(AttributeError, TypeError),
+            decoding_errors=(TypeError, AttributeError),
+            dump=module.dump,
+            load=module.load,
+            decode_buffer=module.loads),
+        action=action,
+        obj=obj,
+        obj_data_name=obj_data_name,
+        fingerprint=fingerprint,
+        strictmute=strictmute,
+        works_as_expected=works_as_expected,
+        transcoding_check=transcoding_check)
+
+
+def serializer_pickle_variant(action="serialize",
+                              obj=None,
+                              obj_data_name=None,
+                              fingerprint="",
+                              strictmute=False,
+                              works_as_expected=None,
+                              transcoding_check=None,
+                              variant=None):
+    """
+        serializer_pickle_variant()
+
+        Serializer for the pickle module with the protocol and options of
+        <variant>: see transcode() and PICKLE_VARIANTS.
+        _______________________________________________________________________
+
+        ARGUMENTS: see transcode()
+        o  (str)variant: a key of PICKLE_VARIANTS
+
+        RETURNED VALUE: see transcode()
+    """
+    # the arguments of the serializers + the variant:
+    #   pylint: disable=too-many-arguments
+    module = MODULES[wisteria.globs.SERIALIZERS[variant].module_name]
+    protocol, outofband, optimize = PICKLE_VARIANTS[variant]
+
+    options = ""
+    if outofband:
+        options += "; out-of-band buffers"
+    if optimize:
+        options += "; pickletools.optimize()"
+
+    if outofband:
+        adapter = TranscodingAdapter(
+            module=module,
+            version=f"protocol {protocol}{options}; (Python version) {get_python_version()}",
+            encode=functools.partial(pickle_outofband_dumps, optimize),
+            decode=functools.partial(pickle_outofband_loads, module),
+            encoding_errors=(AttributeError, TypeError),
+            decoding_errors=(TypeError, AttributeError))
+    elif optimize:
+        adapter = TranscodingAdapter(
+            module=module,
+            version=f"protocol {protocol}{options}; (Python version) {get_python_version()}",
+            encode=functools.partial(pickle_optimized_dumps, module, protocol),
+            decode=module.loads,
+            encoding_errors=(AttributeError, TypeError),
+            decoding_errors=(TypeError, AttributeError),
+            decode_buffer=module.loads)
     else:
-        mem0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        adapter = TranscodingAdapter(
+            module=module,
+            version=f"protocol {protocol}; (Python version) {get_python_version()}",
+            encode=functools.partial(module.dumps, protocol=protocol),
+            decode=module.loads,
+            encoding_errors=(AttributeError, TypeError),
+            decoding_errors=(TypeError, AttributeError),
+            dump=functools.partial(module.dump, protocol=protocol),
+            load=module.load,
+            decode_buffer=module.loads)
+
+    return transcode(
+        adapter=adapter,
+        action=action,
+        obj=obj,
+        obj_data_name=obj_data_name,
+        fingerprint=fingerprint,
+        strictmute=strictmute,
+        works_as_expected=works_as_expected,
+        transcoding_check=transcoding_check)
 
-    _error = False
-    try:
-        res.encoded_object = module.encode(obj)
-        _timeit = timeit.Timer('module.encode(obj)',
-                               globals=locals())
-        res.encoding_success = True
-        res.encoding_strlen = _len(res.encoded_object)
-        res.encoding_time = _timeit.timeit(TIMEITNUMBER)
 
-        if not strictmute and wisteria.globs.ARGS.verbosity >= VERBOSITY_DETAILS:
-            msginfo(
-                f"([{fingerprint}] '{module.__name__}' / '{obj_data_name}' (type: '{type(obj)}')) "
-                f"encoded string=({type(res.encoded_object)}) '{res.encoded_object}'")
+def serializer_pyyaml(action="serialize",
+                      obj=None,
+                      obj_data_name=None,
+                      fingerprint="",
+                      strictmute=False,
+                      works_as_expected=None,
+                      transcoding_check=None):
+    """
+        serializer_pyyaml()
 
-    except module.IaswnError as error:
-        if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-            msgdebug(f"[{fingerprint}] '{module}': encoding failed ({error})")
-        _error = True
+        Serializer for the pyyaml module: see transcode().
+        _______________________________________________________________________
 
-    # incoherent result: if res.encoding_strlen is 0, everything is wrong:
-    if res.encoding_strlen == 0:
-        res.encoding_success = False
-        res.encoding_strlen = None
-        res.encoding_time = None
-        res.decoding_time = None
-        res.decoding_success = False
-        res.reversibility = False
-        res.mem_usage = None
-        return res
+        ARGUMENTS: see transcode()
 
-    if not _error:
-        try:
-            _decodedobj = module.decode(res.encoded_object)
-            res.decoding_success = True  # True because not exception was raised.
-            _timeit = timeit.Timer("module.decode(res.encoded_object)",
-                                   globals=locals())
-            res.decoding_time = _timeit.timeit(TIMEITNUMBER)
-
-            if obj == _decodedobj:
-                res.reversibility = True
-            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                msgdebug(f"[{fingerprint}] res.reversibility (first part:obj == _decodedobj) "
-                         f"is {res.reversibility} ({obj=}; {_decodedobj=};)")
-            if res.reversibility and works_as_expected:
-                res.reversibility = res.reversibility and works_as_expected(data_name=obj_data_name,
-                                                                            obj=_decodedobj)
-                if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                    msgdebug(f"[{fingerprint}] res.reversibility "
-                             f"(second part:works_as_expected(_decodedobj)) "
-                             f"is {res.reversibility}.")
-
-        except module.IaswnError as error:
-            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                msgdebug(f"[{fingerprint}] '{module}': decoding failed ({error})")
-            return res
-
-    if res.reversibility is True:
-        if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-            res.mem_usage = win_memory() - mem0
-        else:
-            res.mem_usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - mem0
+        RETURNED VALUE: see transcode()
+    """
+    module = MODULES[wisteria.globs.SERIALIZERS['pyyaml'].module_name]
+
+    return transcode(
+        adapter=TranscodingAdapter(
+            module=module,
+            version=module.__version__,
+            encode=functools.partial(module.dump, Dumper=module.Dumper),
+            decode=functools.partial(module.load, Loader=module.Loader),
+            encoding_errors=(ValueError, TypeError),
+            decoding_errors=(module.constructor.ConstructorError, ValueError),
+            dump=functools.partial(module.dump, Dumper=module.Dumper),
+            load=functools.partial(module.load, Loader=module.Loader),
+            dump_all=functools.partial(module.dump_all, Dumper=module.Dumper),
+            load_all=lambda fp: list(module.load_all(fp, Loader=module.Loader)),
+            textstream=True),
+        action=action,
+        obj=obj,
+        obj_data_name=obj_data_name,
+        fingerprint=fingerprint,
+        strictmute=strictmute,
+        works_as_expected=works_as_expected,
+        transcoding_check=transcoding_check)
 
-    return res
 
+def serializer_simpleion(action="serialize",
+                         obj=None,
+                         obj_data_name=None,
+                         fingerprint="",
+                         strictmute=False,
+                         works_as_expected=None,
+                         transcoding_check=None):
+    """
+        serializer_simpleion()
+
+        Serializer for the simpleion module: see transcode().
+        _______________________________________________________________________
+
+        ARGUMENTS: see transcode()
 
-def serializer_json(action="serialize",
+        RETURNED VALUE: see transcode()
+    """
+    module = MODULES[wisteria.globs.SERIALIZERS['simpleion'].module_name]
+    module__version = MODULES[wisteria.globs.SERIALIZERS['simpleion'].module_name__version]
+
+    return transcode(
+        adapter=TranscodingAdapter(
+            module=module,
+            version=module__version.__version__,
+            encode=module.dumps,
+            decode=module.loads,
+            encoding_errors=(AssertionError, AttributeError, ValueError, TypeError),
+            decoding_errors=(ValueError,),
+            dump=module.dump,
+            load=module.load,
+            dump_all=functools.partial(module.dump, sequence_as_stream=True),
+            load_all=functools.partial(module.load, single_value=False)),
+        action=action,
+        obj=obj,
+        obj_data_name=obj_data_name,
+        fingerprint=fingerprint,
+        strictmute=strictmute,
+        works_as_expected=works_as_expected,
+        transcoding_check=transcoding_check)
+
+
+def serializer_yajl(action="serialize",
                     obj=None,
                     obj_data_name=None,
                     fingerprint="",
                     strictmute=False,
-                    works_as_expected=None):
+                    works_as_expected=None,
+                    transcoding_check=None):
     """
-        serializer_json()
+        serializer_yajl()
+
+        Serializer for the yajl module: see transcode().
+        _______________________________________________________________________
+
+        ARGUMENTS: see transcode()
+
+        RETURNED VALUE: see transcode()
+    """
+    module = MODULES[wisteria.globs.SERIALIZERS['yajl'].module_name]
+
+    return transcode(
+        adapter=TranscodingAdapter(
+            module=module,
+            version="unknown version",
+            encode=module.dumps,
+            decode=module.loads,
+            encoding_errors=(ValueError, TypeError, SystemError),
+            decoding_errors=(ValueError, SystemError)),
+        action=action,
+        obj=obj,
+        obj_data_name=obj_data_name,
+        fingerprint=fingerprint,
+        strictmute=strictmute,
+        works_as_expected=works_as_expected,
+        transcoding_check=transcoding_check)
+
+
+def check_transcoding(adapter,
+                      obj,
+                      obj_data_name=None,
+                      fingerprint="",
+                      strictmute=False,
+                      works_as_expected=None):
+    """
+        check_transcoding()
+
+        Encode <obj> then decode it ONCE, without any measure: this is both the
+        first step of transcode() and a cheap way to know if <obj> can be
+        transcoded (see filterstr.py:parse_filterstr()).
+        _______________________________________________________________________
 
-        Serializer for the json module.
+        ARGUMENTS: see transcode()
+
+        RETURNED VALUE: a TranscodingCheck object
+    """
+    module = adapter.module
+
+    try:
+        encoded_object = adapter.encode(obj)
+    except adapter.encoding_errors as error:
+        if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+            msgdebug(f"[{fingerprint}] '{module}': encoding failed ({error})")
+        return TranscodingCheck(encoded_object=None,
+                                encoding_success=False,
+                                decoding_success=False,
+                                reversibility=False)
+
+    try:
+        decodedobj = adapter.decode(encoded_object)
+    except adapter.decoding_errors as error:
+        if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+            msgdebug(f"[{fingerprint}] '{module}': decoding failed ({error})")
+        return TranscodingCheck(encoded_object=encoded_object,
+                                encoding_success=True,
+                                decoding_success=False,
+                                reversibility=False)
+
+    reversibility = obj == decodedobj
+    if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+        msgdebug(f"[{fingerprint}] res.reversibility (first part:obj == _decodedobj) "
+                 f"is {reversibility} ({obj=}; {decodedobj=};)")
+    if reversibility and works_as_expected:
+        reversibility = works_as_expected(data_name=obj_data_name,
+                                          obj=decodedobj)
+        if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+            msgdebug(f"[{fingerprint}] res.reversibility "
+                     f"(second part:works_as_expected(_decodedobj)) "
+                     f"is {reversibility}.")
+
+    return TranscodingCheck(encoded_object=encoded_object,
+                            encoding_success=True,
+                            decoding_success=True,
+                            reversibility=reversibility and _len(encoded_object) != 0)
+
+
+def transcode(adapter,
+              action="serialize",
+              obj=None,
+              obj_data_name=None,
+              fingerprint="",
+              strictmute=False,
+              works_as_expected=None,
+              transcoding_check=None):
+    """
+        transcode()
+
+        Measurement core shared by all serializer_xxx() functions: <adapter>
+        gives what differs from one serializer to another.
 
         Like every serializer_xxx() function:
         * this function may return (action='version') the version of the concerned module.
+        * this function may check (action='check') that an <obj>ect can be encoded/decoded,
+          without any measure.
         * this function may try (action='serialize') to encode/decode an <obj>ect.
         * if the serializer raises an error, this error is silently converted and no exception
           is raised. If an internal error happpens, a WisteriaError exception is raised.
@@ -370,43 +860,56 @@ def serializer_json(action="serialize",
         _______________________________________________________________________
 
         ARGUMENTS:
-        o  action           : (str) "version", "serialize" or "encode"
+        o  adapter          : (TranscodingAdapter) encode/decode functions and their errors
+        o  action           : (str) "version", "check", "serialize" or "encode"
         o  obj              : the object to be serialized
         o  obj_data_name    : (str) obj type as defined in DATA[]
         o  fingerprint      : a string describing the operation (usefull to debug)
         o  strictmute       : (bool)True if no message can be displayed
         o  works_as_expected: (None or callable)if not None, will be called to check
                               the reversibility of the de-serialized object.
+        o  transcoding_check: (None|TranscodingCheck) if not None, the result of a
+                              previous call with action='check' for the same <obj>:
+                              the encoding/decoding is not checked again.
 
         RETURNED VALUE:
            - None if an error occcured
            - if <action> is (str)"version", return a string.
+           - if <action> is (str)"check", return a TranscodingCheck object.
            - if <action> is (str)"encode", return the encoded string
            - if <action> is (str)"serialize", return a SerializationResult object.
     """
-    serializer_name = 'json'
-    module = MODULES[wisteria.globs.SERIALIZERS[serializer_name].module_name]
-
     # -------------------
     # action == "version"
     # -------------------
     if action == "version":
-        return module.__version__
+        return adapter.version
 
     # -------------------
     # action == "encode"
     # -------------------
     if action == "encode":
         try:
-            return module.dumps(obj)
-        except TypeError:
+            return adapter.encode(obj)
+        except adapter.encoding_errors:
             return None
 
+    # -------------------
+    # action == "check"
+    # -------------------
+    if action == "check":
+        return check_transcoding(adapter=adapter,
+                                 obj=obj,
+                                 obj_data_name=obj_data_name,
+                                 fingerprint=fingerprint,
+                                 strictmute=strictmute,
+                                 works_as_expected=works_as_expected)
+
     # ---------------------
     # action == "serialize"
     # ---------------------
     if action != "serialize":
-        raise WisteriaError(f"(ERRORID031) Unknown 'action' keyword '{action}'.")
+        raise WisteriaError(f"(ERRORID030) Unknown 'action' keyword '{action}'.")
 
     # MEMOVERUSE# ---- --memoveruse ? -----------------------------------------------------
     # MEMOVERUSEif 'Python' in wisteria.globs.ARGS.memoveruse:
@@ -415,1053 +918,86 @@ def serializer_json(action="serialize",
     # MEMOVERUSEif 'C++' in wisteria.globs.ARGS.memoveruse:
     # MEMOVERUSE    MemOverUse().memoveruse()
 
+    # ---- untimed encoding/decoding ------------------------------------------
+    if transcoding_check is None:
+        transcoding_check = check_transcoding(adapter=adapter,
+                                              obj=obj,
+                                              obj_data_name=obj_data_name,
+                                              fingerprint=fingerprint,
+                                              strictmute=strictmute,
+                                              works_as_expected=works_as_expected)
+
     # ---- main computation ---------------------------------------------------
+    module = adapter.module
     res = SerializationResult()
 
-    if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-        mem0 = win_memory()
-    else:
-        mem0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if not transcoding_check.encoding_success:
+        return res
+
+    res.encoded_object = transcoding_check.encoded_object
+    if res.encoded_object is None:
+        # the --filter pre-pass only kept the flags (see TRANSCODING_CHECKS_MAXLEN):
+        res.encoded_object = transcode(adapter=adapter, action="encode", obj=obj)
+    res.encoding_success = True
+    res.encoding_strlen = 0 if res.encoded_object is None else _len(res.encoded_object)
+
+    # incoherent result: if res.encoding_strlen is 0 (or if the encoding failed this
+    # time), everything is wrong:
+    if res.encoding_strlen == 0:
+        res.encoding_success = False
+        res.encoding_strlen = None
+        return res
 
-    _error = False
     try:
-        res.encoded_object = module.dumps(obj)
-        _timeit = timeit.Timer('module.dumps(obj)',
-                               globals=locals())
-        res.encoding_success = True
-        res.encoding_strlen = _len(res.encoded_object)
-        res.encoding_time = _timeit.timeit(TIMEITNUMBER)
+        res.encoding_timestats = measure_time(adapter.encode, obj)
+        res.encoding_time = res.encoding_timestats.median
+        res.encoding_memusage = measure_memory(adapter.encode, obj)
+        if res.encoding_time:
+            res.encoding_throughput = res.encoding_strlen / res.encoding_time / 10**6
 
         if not strictmute and wisteria.globs.ARGS.verbosity >= VERBOSITY_DETAILS:
             msginfo(
                 f"([{fingerprint}] '{module.__name__}' / '{obj_data_name}' (type: '{type(obj)}')) "
                 f"encoded string=({type(res.encoded_object)}) '{res.encoded_object}'")
 
-    except TypeError as error:
+    except adapter.encoding_errors as error:
         if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
             msgdebug(f"[{fingerprint}] '{module}': encoding failed ({error})")
-        _error = True
+        return res
 
-    # incoherent result: if res.encoding_strlen is 0, everything is wrong:
-    if res.encoding_strlen == 0:
-        res.encoding_success = False
-        res.encoding_strlen = None
-        res.encoding_time = None
-        res.decoding_time = None
-        res.decoding_success = False
-        res.reversibility = False
-        res.mem_usage = None
+    if not transcoding_check.decoding_success:
         return res
 
-    if not _error:
-        try:
-            _decodedobj = module.loads(res.encoded_object)
-            res.decoding_success = True  # True because not exception was raised.
-            _timeit = timeit.Timer("module.loads(res.encoded_object)",
-                                   globals=locals())
-            res.decoding_time = _timeit.timeit(TIMEITNUMBER)
-
-            if obj == _decodedobj:
-                res.reversibility = True
-            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                msgdebug(f"[{fingerprint}] res.reversibility (first part:obj == _decodedobj) "
-                         f"is {res.reversibility} ({obj=}; {_decodedobj=};)")
-            if res.reversibility and works_as_expected:
-                res.reversibility = res.reversibility and works_as_expected(data_name=obj_data_name,
-                                                                            obj=_decodedobj)
-                if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                    msgdebug(f"[{fingerprint}] res.reversibility "
-                             f"(second part:works_as_expected(_decodedobj)) "
-                             f"is {res.reversibility}.")
-
-        except (TypeError, AttributeError) as error:
-            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                msgdebug(f"[{fingerprint}] '{module}': decoding failed ({error})")
-            return res
-
-    if res.reversibility is True:
-        if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-            res.mem_usage = win_memory() - mem0
-        else:
-            res.mem_usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - mem0
-    return res
-
-
-def serializer_jsonpickle(action="serialize",
-                          obj=None,
-                          obj_data_name=None,
-                          fingerprint="",
-                          strictmute=False,
-                          works_as_expected=None):
-    """
-        serializer_jsonpickle()
-
-        Serializer for the jsonpickle module.
-
-        Like every serializer_xxx() function:
-        * this function may return (action='version') the version of the concerned module.
-        * this function may try (action='serialize') to encode/decode an <obj>ect.
-        * if the serializer raises an error, this error is silently converted and no exception
-          is raised. If an internal error happpens, a WisteriaError exception is raised.
-
-        This function assumes that the concerned module has already be imported.
-        _______________________________________________________________________
-
-        ARGUMENTS:
-        o  action           : (str) "version", "serialize" or "encode"
-        o  obj              : the object to be serialized
-        o  obj_data_name    : (str) obj type as defined in DATA[]
-        o  fingerprint      : a string describing the operation (usefull to debug)
-        o  strictmute       : (bool)True if no message can be displayed
-        o  works_as_expected: (None or callable)if not None, will be called to check
-                              the reversibility of the de-serialized object.
-
-        RETURNED VALUE:
-           - None if an error occcured
-           - if <action> is (str)"version", return a string.
-           - if <action> is (str)"encode", return the encoded string
-           - if <action> is (str)"serialize", return a SerializationResult object.
-    """
-    serializer_name = 'jsonpickle'
-
-    module = MODULES[wisteria.globs.SERIALIZERS[serializer_name].module_name]
-
-    # -------------------
-    # action == "version"
-    # -------------------
-    if action == "version":
-        return module.__version__
-
-    # -------------------
-    # action == "encode"
-    # -------------------
-    if action == "encode":
-        try:
-            return module.dumps(obj)
-        except TypeError:
-            return None
-
-    # ---------------------
-    # action == "serialize"
-    # ---------------------
-    if action != "serialize":
-        raise WisteriaError(f"(ERRORID032) Unknown 'action' keyword '{action}'.")
-
-    # MEMOVERUSE# ---- --memoveruse ? -----------------------------------------------------
-    # MEMOVERUSEif 'Python' in wisteria.globs.ARGS.memoveruse:
-    # MEMOVERUSE    #   pylint: disable=possibly-unused-variable
-    # MEMOVERUSE    dumbstr = "0123456789"*100000
-    # MEMOVERUSEif 'C++' in wisteria.globs.ARGS.memoveruse:
-    # MEMOVERUSE    MemOverUse().memoveruse()
-
-    # ---- main computation ---------------------------------------------------
-    res = SerializationResult()
-
-    if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-        mem0 = win_memory()
-    else:
-        mem0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-
-    _error = False
-    try:
-        res.encoded_object = module.dumps(obj)
-        _timeit = timeit.Timer('module.dumps(obj)',
-                               globals=locals())
-        res.encoding_success = True
-        res.encoding_strlen = _len(res.encoded_object)
-        res.encoding_time = _timeit.timeit(TIMEITNUMBER)
-
-        if not strictmute and wisteria.globs.ARGS.verbosity >= VERBOSITY_DETAILS:
-            msginfo(
-                f"([{fingerprint}] '{module.__name__}' / '{obj_data_name}' (type: '{type(obj)}')) "
-                f"encoded string=({type(res.encoded_object)}) '{res.encoded_object}'")
-
-    except TypeError as error:
-        if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-            msgdebug(f"[{fingerprint}] '{module}': encoding failed ({error})")
-        _error = True
-
-    # incoherent result: if res.encoding_strlen is 0, everything is wrong:
-    if res.encoding_strlen == 0:
-        res.encoding_success = False
-        res.encoding_strlen = None
-        res.encoding_time = None
-        res.decoding_time = None
-        res.decoding_success = False
-        res.reversibility = False
-        res.mem_usage = None
-        return res
-
-    if not _error:
-        try:
-            _decodedobj = module.loads(res.encoded_object)
-            res.decoding_success = True  # True because not exception was raised.
-            _timeit = timeit.Timer("module.loads(res.encoded_object)",
-                                   globals=locals())
-            res.decoding_time = _timeit.timeit(TIMEITNUMBER)
-
-            if obj == _decodedobj:
-                res.reversibility = True
-            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                msgdebug(f"[{fingerprint}] res.reversibility (first part:obj == _decodedobj)")
-            if res.reversibility and works_as_expected:
-                res.reversibility = res.reversibility and works_as_expected(data_name=obj_data_name,
-                                                                            obj=_decodedobj)
-                if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                    msgdebug(f"[{fingerprint}] res.reversibility "
-                             f"(second part:works_as_expected(_decodedobj)) "
-                             f"is {res.reversibility}.")
-
-        except (TypeError, AttributeError) as error:
-            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                msgdebug(f"[{fingerprint}] '{module}': decoding failed ({error})")
-            return res
-
-    if res.reversibility is True:
-        if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-            res.mem_usage = win_memory() - mem0
-        else:
-            res.mem_usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - mem0
-
-    return res
-
-
-def serializer_jsonpickle_keystrue(action="serialize",
-                                   obj=None,
-                                   obj_data_name=None,
-                                   fingerprint="",
-                                   strictmute=False,
-                                   works_as_expected=None):
-    """
-        serializer_jsonpickle_keystrue()
-
-        Serializer for the jsonpickle module (keys=True).
-
-        Like every serializer_xxx() function:
-        * this function may return (action='version') the version of the concerned module.
-        * this function may try (action='serialize') to encode/decode an <obj>ect.
-        * if the serializer raises an error, this error is silently converted and no exception
-          is raised. If an internal error happpens, a WisteriaError exception is raised.
-
-        This function assumes that the concerned module has already be imported.
-        _______________________________________________________________________
-
-        ARGUMENTS:
-        o  action           : (str) "version", "serialize" or "encode"
-        o  obj              : the object to be serialized
-        o  obj_data_name    : (str) obj type as defined in DATA[]
-        o  fingerprint      : a string describing the operation (usefull to debug)
-        o  strictmute       : (bool)True if no message can be displayed
-        o  works_as_expected: (None or callable)if not None, will be called to check
-                              the reversibility of the de-serialized object.
-
-        RETURNED VALUE:
-           - None if an error occcured
-           - if <action> is (str)"version", return a string.
-           - if <action> is (str)"encode", return the encoded string
-           - if <action> is (str)"serialize", return a SerializationResult object.
-    """
-    serializer_name = 'jsonpickle'
-
-    module = MODULES[wisteria.globs.SERIALIZERS[serializer_name].module_name]
-
-    # -------------------
-    # action == "version"
-    # -------------------
-    if action == "version":
-        return module.__version__
-
-    # -------------------
-    # action == "encode"
-    # -------------------
-    if action == "encode":
-        try:
-            return module.dumps(obj)
-        except TypeError:
-            return None
-
-    # ---------------------
-    # action == "serialize"
-    # ---------------------
-    if action != "serialize":
-        raise WisteriaError(f"(ERRORID042) Unknown 'action' keyword '{action}'.")
-
-    # MEMOVERUSE# ---- --memoveruse ? -----------------------------------------------------
-    # MEMOVERUSEif 'Python' in wisteria.globs.ARGS.memoveruse:
-    # MEMOVERUSE    #   pylint: disable=possibly-unused-variable
-    # MEMOVERUSE    dumbstr = "0123456789"*100000
-    # MEMOVERUSEif 'C++' in wisteria.globs.ARGS.memoveruse:
-    # MEMOVERUSE    MemOverUse().memoveruse()
-
-    # ---- main computation ---------------------------------------------------
-    res = SerializationResult()
-
-    if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-        mem0 = win_memory()
-    else:
-        mem0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-
-    _error = False
-    try:
-        res.encoded_object = module.dumps(obj, keys=True)
-        _timeit = timeit.Timer('module.dumps(obj, keys=True)',
-                               globals=locals())
-        res.encoding_success = True
-        res.encoding_strlen = _len(res.encoded_object)
-        res.encoding_time = _timeit.timeit(TIMEITNUMBER)
-
-        if not strictmute and wisteria.globs.ARGS.verbosity >= VERBOSITY_DETAILS:
-            msginfo(
-                f"([{fingerprint}] '{module.__name__}' / '{obj_data_name}' (type: '{type(obj)}')) "
-                f"encoded string=({type(res.encoded_object)}) '{res.encoded_object}'")
-
-    except TypeError as error:
-        if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-            msgdebug(f"[{fingerprint}] '{module}': encoding failed ({error})")
-        _error = True
-
-    # incoherent result: if res.encoding_strlen is 0, everything is wrong:
-    if res.encoding_strlen == 0:
-        res.encoding_success = False
-        res.encoding_strlen = None
-        res.encoding_time = None
-        res.decoding_time = None
-        res.decoding_success = False
-        res.reversibility = False
-        res.mem_usage = None
-        return res
-
-    if not _error:
-        try:
-            _decodedobj = module.loads(res.encoded_object, keys=True)
-            res.decoding_success = True  # True because not exception was raised.
-            _timeit = timeit.Timer("module.loads(res.encoded_object, keys=True)",
-                                   globals=locals())
-            res.decoding_time = _timeit.timeit(TIMEITNUMBER)
-
-            if obj == _decodedobj:
-                res.reversibility = True
-            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                msgdebug(f"[{fingerprint}] res.reversibility (first part:obj == _decodedobj) "
-                         f"is {res.reversibility} ({obj=}; {_decodedobj=};)")
-            if res.reversibility and works_as_expected:
-                res.reversibility = res.reversibility and works_as_expected(data_name=obj_data_name,
-                                                                            obj=_decodedobj)
-                if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                    msgdebug(f"[{fingerprint}] res.reversibility "
-                             f"(second part:works_as_expected(_decodedobj)) "
-                             f"is {res.reversibility}.")
-
-        except (TypeError, AttributeError) as error:
-            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                msgdebug(f"[{fingerprint}] '{module}': decoding failed ({error})")
-            return res
-
-    if res.reversibility is True:
-        if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-            res.mem_usage = win_memory() - mem0
-        else:
-            res.mem_usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - mem0
-
-    return res
-
-
-def serializer_marshal(action="serialize",
-                       obj=None,
-                       obj_data_name=None,
-                       fingerprint="",
-                       strictmute=False,
-                       works_as_expected=None):
-    """
-        serializer_marshal()
-
-        Serializer for the marshal module.
-
-        Like every serializer_xxx() function:
-        * this function may return (action='version') the version of the concerned module.
-        * this function may try (action='serialize') to encode/decode an <obj>ect.
-        * if the serializer raises an error, this error is silently converted and no exception
-          is raised. If an internal error happpens, a WisteriaError exception is raised.
-
-        This function assumes that the concerned module has already be imported.
-        _______________________________________________________________________
-
-        ARGUMENTS:
-        o  action           : (str) "version", "serialize" or "encode"
-        o  obj              : the object to be serialized
-        o  obj_data_name    : (str) obj type as defined in DATA[]
-        o  fingerprint      : a string describing the operation (usefull to debug)
-        o  strictmute       : (bool)True if no message can be displayed
-        o  works_as_expected: (None or callable)if not None, will be called to check
-                              the reversibility of the de-serialized object.
-
-        RETURNED VALUE:
-           - None if an error occcured
-           - if <action> is (str)"version", return a string.
-           - if <action> is (str)"encode", return the encoded string
-           - if <action> is (str)"serialize", return a SerializationResult object.
-    """
-    serializer_name = 'marshal'
-
-    module = MODULES[wisteria.globs.SERIALIZERS[serializer_name].module_name]
-
-    # -------------------
-    # action == "version"
-    # -------------------
-    if action == "version":
-        return f"version {module.version}; (Python version) {get_python_version()}"
-
-    # -------------------
-    # action == "encode"
-    # -------------------
-    if action == "encode":
-        try:
-            return module.dumps(obj)
-        except (TypeError, ValueError):
-            return None
-
-    # ---------------------
-    # action == "serialize"
-    # ---------------------
-    if action != "serialize":
-        raise WisteriaError(f"(ERRORID033) Unknown 'action' keyword '{action}'.")
-
-    # MEMOVERUSE# ---- --memoveruse ? -----------------------------------------------------
-    # MEMOVERUSEif 'Python' in wisteria.globs.ARGS.memoveruse:
-    # MEMOVERUSE    #   pylint: disable=possibly-unused-variable
-    # MEMOVERUSE    dumbstr = "0123456789"*100000
-    # MEMOVERUSEif 'C++' in wisteria.globs.ARGS.memoveruse:
-    # MEMOVERUSE    MemOverUse().memoveruse()
-
-    # ---- main computation ---------------------------------------------------
-    res = SerializationResult()
-
-    if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-        mem0 = win_memory()
-    else:
-        mem0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-
-    _error = False
-    try:
-        res.encoded_object = module.dumps(obj)
-        _timeit = timeit.Timer('module.dumps(obj)',
-                               globals=locals())
-        res.encoding_success = True
-        res.encoding_strlen = _len(res.encoded_object)
-        res.encoding_time = _timeit.timeit(TIMEITNUMBER)
-
-        if not strictmute and wisteria.globs.ARGS.verbosity >= VERBOSITY_DETAILS:
-            msginfo(
-                f"([{fingerprint}] '{module.__name__}' / '{obj_data_name}' (type: '{type(obj)}')) "
-                f"encoded string=({type(res.encoded_object)}) '{res.encoded_object}'")
-
-    except (TypeError, ValueError) as error:
-        if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-            msgdebug(f"[{fingerprint}] '{module}': encoding failed ({error})")
-        _error = True
-
-    # incoherent result: if res.encoding_strlen is 0, everything is wrong:
-    if res.encoding_strlen == 0:
-        res.encoding_success = False
-        res.encoding_strlen = None
-        res.encoding_time = None
-        res.decoding_time = None
-        res.decoding_success = False
-        res.reversibility = False
-        res.mem_usage = None
-        return res
-
-    if not _error:
-        try:
-            _decodedobj = module.loads(res.encoded_object)
-            res.decoding_success = True  # True because not exception was raised.
-            _timeit = timeit.Timer("module.loads(res.encoded_object)",
-                                   globals=locals())
-            res.decoding_time = _timeit.timeit(TIMEITNUMBER)
-
-            if obj == _decodedobj:
-                res.reversibility = True
-            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                msgdebug(f"[{fingerprint}] res.reversibility (first part:obj == _decodedobj) "
-                         f"is {res.reversibility} ({obj=}; {_decodedobj=};)")
-            if res.reversibility and works_as_expected:
-                res.reversibility = res.reversibility and works_as_expected(data_name=obj_data_name,
-                                                                            obj=_decodedobj)
-                if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                    msgdebug(f"[{fingerprint}] res.reversibility "
-                             f"(second part:works_as_expected(_decodedobj)) "
-                             f"is {res.reversibility}.")
-
-        except (TypeError, AttributeError) as error:
-            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                msgdebug(f"[{fingerprint}] '{module}': decoding failed ({error})")
-            return res
-
-    if res.reversibility is True:
-        if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-            res.mem_usage = win_memory() - mem0
-        else:
-            res.mem_usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - mem0
-
-    return res
-
-
-def serializer_pickle(action="serialize",
-                      obj=None,
-                      obj_data_name=None,
-                      fingerprint="",
-                      strictmute=False,
-                      works_as_expected=None):
-    """
-        serializer_pickle()
-
-        Serializer for the pickle module.
-
-        Like every serializer_xxx() function:
-        * this function may return (action='version') the version of the concerned module.
-        * this function may try (action='serialize') to encode/decode an <obj>ect.
-        * if the serializer raises an error, this error is silently converted and no exception
-          is raised. If an internal error happpens, a WisteriaError exception is raised.
-
-        This function assumes that the concerned module has already be imported.
-        _______________________________________________________________________
-
-        ARGUMENTS:
-        o  action           : (str) "version", "serialize" or "encode"
-        o  obj              : the object to be serialized
-        o  obj_data_name    : (str) obj type as defined in DATA[]
-        o  fingerprint      : a string describing the operation (usefull to debug)
-        o  strictmute       : (bool)True if no message can be displayed
-        o  works_as_expected: (None or callable)if not None, will be called to check
-                              the reversibility of the de-serialized object.
-
-        RETURNED VALUE:
-           - None if an error occcured
-           - if <action> is (str)"version", return a string.
-           - if <action> is (str)"encode", return the encoded string
-           - if <action> is (str)"serialize", return a SerializationResult object.
-    """
-    serializer_name = 'pickle'
-
-    module = MODULES[wisteria.globs.SERIALIZERS[serializer_name].module_name]
-
-    # -------------------
-    # action == "version"
-    # -------------------
-    if action == "version":
-        return f"(Python version) {get_python_version()}"
-
-    # -------------------
-    # action == "encode"
-    # -------------------
-    if action == "encode":
-        try:
-            return module.dumps(obj)
-        except TypeError:
-            return None
-
-    # ---------------------
-    # action == "serialize"
-    # ---------------------
-    if action != "serialize":
-        raise WisteriaError(f"(ERRORID034) Unknown 'action' keyword '{action}'.")
-
-    # MEMOVERUSE# ---- --memoveruse ? -----------------------------------------------------
-    # MEMOVERUSEif 'Python' in wisteria.globs.ARGS.memoveruse:
-    # MEMOVERUSE    #   pylint: disable=possibly-unused-variable
-    # MEMOVERUSE    dumbstr = "0123456789"*100000
-    # MEMOVERUSEif 'C++' in wisteria.globs.ARGS.memoveruse:
-    # MEMOVERUSE    MemOverUse().memoveruse()
-
-    # ---- main computation ---------------------------------------------------
-    res = SerializationResult()
-
-    if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-        mem0 = win_memory()
-    else:
-        mem0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-
-    _error = False
-    try:
-        res.encoded_object = module.dumps(obj)
-        _timeit = timeit.Timer('module.dumps(obj)',
-                               globals=locals())
-        res.encoding_success = True
-        res.encoding_strlen = _len(res.encoded_object)
-        res.encoding_time = _timeit.timeit(TIMEITNUMBER)
-
-        if not strictmute and wisteria.globs.ARGS.verbosity >= VERBOSITY_DETAILS:
-            msginfo(
-                f"([{fingerprint}] '{module.__name__}' / '{obj_data_name}' (type: '{type(obj)}')) "
-                f"encoded string=({type(res.encoded_object)}) '{res.encoded_object}'")
-
-    except (AttributeError, TypeError) as error:
-        if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-            msgdebug(f"[{fingerprint}] '{module}': encoding failed ({error})")
-        _error = True
-
-    # incoherent result: if res.encoding_strlen is 0, everything is wrong:
-    if res.encoding_strlen == 0:
-        res.encoding_success = False
-        res.encoding_strlen = None
-        res.encoding_time = None
-        res.decoding_time = None
-        res.decoding_success = False
-        res.reversibility = False
-        res.mem_usage = None
-        return res
-
-    if not _error:
-        try:
-            _decodedobj = module.loads(res.encoded_object)
-            res.decoding_success = True  # True because not exception was raised.
-            _timeit = timeit.Timer("module.loads(res.encoded_object)",
-                                   globals=locals())
-            res.decoding_time = _timeit.timeit(TIMEITNUMBER)
-
-            if obj == _decodedobj:
-                res.reversibility = True
-            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                msgdebug(f"[{fingerprint}] res.reversibility (first part:obj == _decodedobj) "
-                         f"is {res.reversibility} ({obj=}; {_decodedobj=};)")
-            if res.reversibility and works_as_expected:
-                res.reversibility = res.reversibility and works_as_expected(data_name=obj_data_name,
-                                                                            obj=_decodedobj)
-                if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                    msgdebug(f"[{fingerprint}] res.reversibility "
-                             f"(second part:works_as_expected(_decodedobj)) "
-                             f"is {res.reversibility}.")
-
-        except (TypeError, AttributeError) as error:
-            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                msgdebug(f"[{fingerprint}] '{module}': decoding failed ({error})")
-            return res
-
-    if res.reversibility is True:
-        if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-            res.mem_usage = win_memory() - mem0
-        else:
-            res.mem_usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - mem0
-
-    return res
-
-
-def serializer_pyyaml(action="serialize",
-                      obj=None,
-                      obj_data_name=None,
-                      fingerprint="",
-                      strictmute=False,
-                      works_as_expected=None):
-    """
-        serializer_pyyaml()
-
-        Serializer for the pyyaml module.
-
-        Like every serializer_xxx() function:
-        * this function may return (action='version') the version of the concerned module.
-        * this function may try (action='serialize') to encode/decode an <obj>ect.
-        * if the serializer raises an error, this error is silently converted and no exception
-          is raised. If an internal error happpens, a WisteriaError exception is raised.
-
-        This function assumes that the concerned module has already be imported.
-        _______________________________________________________________________
-
-        ARGUMENTS:
-        o  action           : (str) "version", "serialize" or "encode"
-        o  obj              : the object to be serialized
-        o  obj_data_name    : (str) obj type as defined in DATA[]
-        o  fingerprint      : a string describing the operation (usefull to debug)
-        o  strictmute       : (bool)True if no message can be displayed
-        o  works_as_expected: (None or callable)if not None, will be called to check
-                              the reversibility of the de-serialized object.
-
-        RETURNED VALUE:
-           - None if an error occcured
-           - if <action> is (str)"version", return a string.
-           - if <action> is (str)"encode", return the encoded string
-           - if <action> is (str)"serialize", return a SerializationResult object.
-    """
-    serializer_name = 'pyyaml'
-
-    module = MODULES[wisteria.globs.SERIALIZERS[serializer_name].module_name]
-
-    # -------------------
-    # action == "version"
-    # -------------------
-    if action == "version":
-        return module.__version__
-
-    # -------------------
-    # action == "encode"
-    # -------------------
-    if action == "encode":
-        try:
-            return module.dump(obj, Dumper=module.Dumper)
-        except (ValueError, TypeError):
-            return None
-
-    # ---------------------
-    # action == "serialize"
-    # ---------------------
-    if action != "serialize":
-        raise WisteriaError(f"(ERRORID044) Unknown 'action' keyword '{action}'.")
-
-    # MEMOVERUSE# ---- --memoveruse ? -----------------------------------------------------
-    # MEMOVERUSEif 'Python' in wisteria.globs.ARGS.memoveruse:
-    # MEMOVERUSE    #   pylint: disable=possibly-unused-variable
-    # MEMOVERUSE    dumbstr = "0123456789"*100000
-    # MEMOVERUSEif 'C++' in wisteria.globs.ARGS.memoveruse:
-    # MEMOVERUSE    MemOverUse().memoveruse()
-
-    # ---- main computation ---------------------------------------------------
-    res = SerializationResult()
-
-    if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-        mem0 = win_memory()
-    else:
-        mem0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-
-    _error = False
-    try:
-        res.encoded_object = module.dump(obj, Dumper=module.Dumper)
-        _timeit = timeit.Timer('module.dump(obj, Dumper=module.Dumper)',
-                               globals=locals())
-        res.encoding_success = True
-        res.encoding_strlen = _len(res.encoded_object)
-        res.encoding_time = _timeit.timeit(TIMEITNUMBER)
-
-        if not strictmute and wisteria.globs.ARGS.verbosity >= VERBOSITY_DETAILS:
-            msginfo(
-                f"([{fingerprint}] '{module.__name__}' / '{obj_data_name}' (type: '{type(obj)}')) "
-                f"encoded string=({type(res.encoded_object)}) '{res.encoded_object}'")
-
-    except (ValueError, TypeError) as error:
-        if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-            msgdebug(f"[{fingerprint}] '{module}': encoding failed ({error})")
-        _error = True
-
-    # incoherent result: if res.encoding_strlen is 0, everything is wrong:
-    if res.encoding_strlen == 0:
-        res.encoding_success = False
-        res.encoding_strlen = None
-        res.encoding_time = None
-        res.decoding_time = None
-        res.decoding_success = False
-        res.reversibility = False
-        res.mem_usage = None
-        return res
-
-    if not _error:
-        try:
-            _decodedobj = module.load(res.encoded_object, Loader=module.Loader)
-            res.decoding_success = True  # True because not exception was raised.
-            _timeit = timeit.Timer("module.load(res.encoded_object, Loader=module.Loader)",
-                                   globals=locals())
-            res.decoding_time = _timeit.timeit(TIMEITNUMBER)
-
-            if obj == _decodedobj:
-                res.reversibility = True
-            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                msgdebug(f"[{fingerprint}] res.reversibility (first part:obj == _decodedobj) "
-                         f"is {res.reversibility} ({obj=}; {_decodedobj=};)")
-            if res.reversibility and works_as_expected:
-                res.reversibility = res.reversibility and works_as_expected(data_name=obj_data_name,
-                                                                            obj=_decodedobj)
-                if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                    msgdebug(f"[{fingerprint}] res.reversibility "
-                             f"(second part:works_as_expected(_decodedobj)) "
-                             f"is {res.reversibility}.")
-
-        except (module.constructor.ConstructorError, ValueError) as error:
-            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                msgdebug(f"[{fingerprint}] '{module}': decoding failed ({error})")
-            return res
-
-    if res.reversibility is True:
-        if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-            res.mem_usage = win_memory() - mem0
-        else:
-            res.mem_usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - mem0
-
-    return res
-
-
-def serializer_simpleion(action="serialize",
-                         obj=None,
-                         obj_data_name=None,
-                         fingerprint="",
-                         strictmute=False,
-                         works_as_expected=None):
-    """
-        serializer_simpleion()
-
-        Serializer for the simpleion module.
-
-        Like every serializer_xxx() function:
-        * this function may return (action='version') the version of the concerned module.
-        * this function may try (action='serialize') to encode/decode an <obj>ect.
-        * if the serializer raises an error, this error is silently converted and no exception
-          is raised. If an internal error happpens, a WisteriaError exception is raised.
-
-        This function assumes that the concerned module has already be imported.
-        _______________________________________________________________________
-
-        ARGUMENTS:
-        o  action           : (str) "version", "serialize" or "encode"
-        o  obj              : the object to be serialized
-        o  obj_data_name    : (str) obj type as defined in DATA[]
-        o  fingerprint      : a string describing the operation (usefull to debug)
-        o  strictmute       : (bool)True if no message can be displayed
-        o  works_as_expected: (None or callable)if not None, will be called to check
-                              the reversibility of the de-serialized object.
-
-        RETURNED VALUE:
-           - None if an error occcured
-           - if <action> is (str)"version", return a string.
-           - if <action> is (str)"encode", return the encoded string
-           - if <action> is (str)"serialize", return a SerializationResult object.
-    """
-    serializer_name = 'simpleion'
-
-    module = MODULES[wisteria.globs.SERIALIZERS[serializer_name].module_name]
-
-    # -------------------
-    # action == "version"
-    # -------------------
-    if action == "version":
-        return MODULES[wisteria.globs.SERIALIZERS[serializer_name].module_name__version].__version__
-
-    # -------------------
-    # action == "encode"
-    # -------------------
-    if action == "encode":
-        try:
-            return module.dumps(obj)
-        except (AssertionError, AttributeError, ValueError, TypeError):
-            return None
-
-    # ---------------------
-    # action == "serialize"
-    # ---------------------
-    if action != "serialize":
-        raise WisteriaError(f"(ERRORID050) Unknown 'action' keyword '{action}'.")
-
-    # MEMOVERUSE# ---- --memoveruse ? -----------------------------------------------------
-    # MEMOVERUSEif 'Python' in wisteria.globs.ARGS.memoveruse:
-    # MEMOVERUSE    #   pylint: disable=possibly-unused-variable
-    # MEMOVERUSE    dumbstr = "0123456789"*100000
-    # MEMOVERUSEif 'C++' in wisteria.globs.ARGS.memoveruse:
-    # MEMOVERUSE    MemOverUse().memoveruse()
-
-    # ---- main computation ---------------------------------------------------
-    res = SerializationResult()
-
-    if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-        mem0 = win_memory()
-    else:
-        mem0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-
-    _error = False
     try:
-        res.encoded_object = module.dumps(obj)
-        _timeit = timeit.Timer('module.dumps(obj)',
-                               globals=locals())
-        res.encoding_success = True
-        res.encoding_strlen = _len(res.encoded_object)
-        res.encoding_time = _timeit.timeit(TIMEITNUMBER)
-
-        if not strictmute and wisteria.globs.ARGS.verbosity >= VERBOSITY_DETAILS:
-            msginfo(
-                f"([{fingerprint}] '{module.__name__}' / '{obj_data_name}' (type: '{type(obj)}')) "
-                f"encoded string=({type(res.encoded_object)}) '{res.encoded_object}'")
-
-    except (AssertionError, AttributeError, ValueError, TypeError) as error:
+        res.decoding_timestats = measure_time(adapter.decode, res.encoded_object)
+        res.decoding_success = True  # True because not exception was raised.
+        res.decoding_time = res.decoding_timestats.median
+        res.decoding_memusage = measure_memory(adapter.decode, res.encoded_object)
+        if res.decoding_time:
+            res.decoding_throughput = res.encoding_strlen / res.decoding_time / 10**6
+            res.ops_throughput = 1 / (res.encoding_time + res.decoding_time)
+    except adapter.decoding_errors as error:
         if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-            msgdebug(f"[{fingerprint}] '{module}': encoding failed ({error})")
-        _error = True
-
-    # incoherent result: if res.encoding_strlen is 0, everything is wrong:
-    if res.encoding_strlen == 0:
-        res.encoding_success = False
-        res.encoding_strlen = None
-        res.encoding_time = None
-        res.decoding_time = None
-        res.decoding_success = False
-        res.reversibility = False
-        res.mem_usage = None
+            msgdebug(f"[{fingerprint}] '{module}': decoding failed ({error})")
         return res
 
-    if not _error:
-        try:
-            _decodedobj = module.loads(res.encoded_object)
-            res.decoding_success = True  # True because not exception was raised.
-            _timeit = timeit.Timer("module.loads(res.encoded_object)",
-                                   globals=locals())
-            res.decoding_time = _timeit.timeit(TIMEITNUMBER)
-
-            if obj == _decodedobj:
-                res.reversibility = True
-            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                msgdebug(f"[{fingerprint}] res.reversibility (first part:obj == _decodedobj) "
-                         f"is {res.reversibility} ({obj=}; {_decodedobj=};)")
-            if res.reversibility and works_as_expected:
-                res.reversibility = res.reversibility and works_as_expected(data_name=obj_data_name,
-                                                                            obj=_decodedobj)
-                if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                    msgdebug(f"[{fingerprint}] res.reversibility "
-                             f"(second part:works_as_expected(_decodedobj)) "
-                             f"is {res.reversibility}.")
-
-        except (ValueError,) as error:
-            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                msgdebug(f"[{fingerprint}] '{module}': decoding failed ({error})")
-            return res
-
-    if res.reversibility is True:
-        if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-            res.mem_usage = win_memory() - mem0
-        else:
-            res.mem_usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - mem0
-
-    return res
-
-
-def serializer_yajl(action="serialize",
-                    obj=None,
-                    obj_data_name=None,
-                    fingerprint="",
-                    strictmute=False,
-                    works_as_expected=None):
-    """
-        serializer_yajl()
-
-        Serializer for the yajl module.
-
-        Like every serializer_xxx() function:
-        * this function may return (action='version') the version of the concerned module.
-        * this function may try (action='serialize') to encode/decode an <obj>ect.
-        * if the serializer raises an error, this error is silently converted and no exception
-          is raised. If an internal error happpens, a WisteriaError exception is raised.
-
-        This function assumes that the concerned module has already be imported.
-        _______________________________________________________________________
-
-        ARGUMENTS:
-        o  action           : (str) "version", "serialize" or "encode"
-        o  obj              : the object to be serialized
-        o  obj_data_name    : (str) obj type as defined in DATA[]
-        o  fingerprint      : a string describing the operation (usefull to debug)
-        o  strictmute       : (bool)True if no message can be displayed
-        o  works_as_expected: (None or callable)if not None, will be called to check
-                              the reversibility of the de-serialized object.
-
-        RETURNED VALUE:
-           - None if an error occcured
-           - if <action> is (str)"version", return a string.
-           - if <action> is (str)"encode", return the encoded string
-           - if <action> is (str)"serialize", return a SerializationResult object.
-    """
-    serializer_name = 'yajl'
-
-    module = MODULES[wisteria.globs.SERIALIZERS[serializer_name].module_name]
-
-    # -------------------
-    # action == "version"
-    # -------------------
-    if action == "version":
-        return "unknown version"
-
-    # -------------------
-    # action == "encode"
-    # -------------------
-    if action == "encode":
-        try:
-            return module.dumps(obj)
-        except (ValueError, TypeError):
-            return None
-
-    # ---------------------
-    # action == "serialize"
-    # ---------------------
-    if action != "serialize":
-        raise WisteriaError(f"(ERRORID047) Unknown 'action' keyword '{action}'.")
-
-    # MEMOVERUSE# ---- --memoveruse ? -----------------------------------------------------
-    # MEMOVERUSEif 'Python' in wisteria.globs.ARGS.memoveruse:
-    # MEMOVERUSE    #   pylint: disable=possibly-unused-variable
-    # MEMOVERUSE    dumbstr = "0123456789"*100000
-    # MEMOVERUSEif 'C++' in wisteria.globs.ARGS.memoveruse:
-    # MEMOVERUSE    MemOverUse().memoveruse()
-
-    # ---- main computation ---------------------------------------------------
-    res = SerializationResult()
-
-    if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-        mem0 = win_memory()
-    else:
-        mem0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-
-    _error = False
-    try:
-        res.encoded_object = module.dumps(obj)
-        _timeit = timeit.Timer('module.dumps(obj)',
-                               globals=locals())
-        res.encoding_success = True
-        res.encoding_strlen = _len(res.encoded_object)
-        res.encoding_time = _timeit.timeit(TIMEITNUMBER)
-
-        if not strictmute and wisteria.globs.ARGS.verbosity >= VERBOSITY_DETAILS:
-            msginfo(
-                f"([{fingerprint}] '{module.__name__}' / '{obj_data_name}' (type: '{type(obj)}')) "
-                f"encoded string=({type(res.encoded_object)}) '{res.encoded_object}'")
+    res.reversibility = transcoding_check.reversibility
 
-    except (ValueError, TypeError, SystemError) as error:
-        if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-            msgdebug(f"[{fingerprint}] '{module}': encoding failed ({error})")
-        _error = True
+    # ---- extra stages (--stages) --------------------------------------------
+    if wisteria.globs.STAGES:
+        res.stages = run_stages(adapter=adapter,
+                                obj=obj,
+                                encoded_object=res.encoded_object,
+                                fingerprint=fingerprint,
+                                strictmute=strictmute)
 
-    # incoherent result: if res.encoding_strlen is 0, everything is wrong:
-    if res.encoding_strlen == 0:
-        res.encoding_success = False
-        res.encoding_strlen = None
-        res.encoding_time = None
-        res.decoding_time = None
-        res.decoding_success = False
-        res.reversibility = False
-        res.mem_usage = None
-        return res
+    if res.reversibility is True and \
+       res.encoding_memusage.peak is not None and res.decoding_memusage.peak is not None:
+        res.mem_usage = res.encoding_memusage.peak + res.decoding_memusage.peak
 
-    if not _error:
-        try:
-            _decodedobj = module.loads(res.encoded_object)
-            res.decoding_success = True  # True because not exception was raised.
-            _timeit = timeit.Timer("module.loads(res.encoded_object)",
-                                   globals=locals())
-            res.decoding_time = _timeit.timeit(TIMEITNUMBER)
-
-            if obj == _decodedobj:
-                res.reversibility = True
-            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                msgdebug(f"[{fingerprint}] res.reversibility (first part:obj == _decodedobj) "
-                         f"is {res.reversibility} ({obj=}; {_decodedobj=};)")
-            if res.reversibility and works_as_expected:
-                res.reversibility = res.reversibility and works_as_expected(data_name=obj_data_name,
-                                                                            obj=_decodedobj)
-                if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                    msgdebug(f"[{fingerprint}] res.reversibility "
-                             f"(second part:works_as_expected(_decodedobj)) "
-                             f"is {res.reversibility}.")
-
-        except (ValueError, SystemError) as error:
-            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
-                msgdebug(f"[{fingerprint}] '{module}': decoding failed ({error})")
-            return res
-
-    if res.reversibility is True:
-        if wisteria.globs.PLATFORM_SYSTEM == "Windows":
-            res.mem_usage = win_memory() - mem0
-        else:
-            res.mem_usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - mem0
+    if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+        msgdebug(f"[{fingerprint}] memory: encoding={res.encoding_memusage}; "
+                 f"decoding={res.decoding_memusage}; {res.mem_usage=}")
 
     return res
 
@@ -1516,6 +1052,19 @@ def init_serializers():
                 internet="https://docs.python.org/3/library/pickle.html",
                 transcodefunc=serializer_pickle,
                 cwc="cwc_default"),
+            *(SerializerData(
+                SerializersDataNMVH(name=variant,
+                                    module_name="pickle",
+                                    human_name=f"pickle(protocol={protocol}"
+                                               f"{', out-of-band' if outofband else ''}"
+                                               f"{', optimize' if optimize else ''})"),
+                internet="https://docs.python.org/3/library/pickle.html",
+                transcodefunc=functools.partial(serializer_pickle_variant, variant=variant),
+                cwc="cwc_default",
+                comment=f"pickle with protocol {protocol}"
+                        f"{' and out-of-band buffers' if outofband else ''}"
+                        f"{' and pickletools.optimize()' if optimize else ''}")
+              for variant, (protocol, outofband, optimize) in PICKLE_VARIANTS.items()),
             SerializerData(
                 SerializersDataNMVH(name="pyyaml",
                                     module_name="yaml",
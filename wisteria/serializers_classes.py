@@ -24,17 +24,32 @@
     All classes required to handle serializers.
     ___________________________________________________________________________
 
+    o  MemoryUsage class
     o  SerializersDataNMVH class
     o  SerializerData class
     o  SerializerDataObj class
+    o  TimingStats class
+    o  StreamResult class
+    o  MmapResult class
+    o  CompressionResult class
+    o  OutOfBandPickle class
+    o  OutOfBandPickler class
+    o  TranscodingAdapter class
+    o  TranscodingCheck class
     o  SerializationResult class
+    o  memoized(method)
     o  SerializationResults class
 """
+import array
 from dataclasses import dataclass
+import functools
+import pickle
 
 from wisteria.wisteriaerror import WisteriaError
 from wisteria.reprfmt import fmt_serializer, fmt_ratio, fmt_time, fmt_nodata
-from wisteria.reprfmt import fmt_strlen, fmt_boolsuccess, fmt_mem_usage
+from wisteria.reprfmt import fmt_strlen, fmt_boolsuccess, fmt_mem_usage, fmt_time_ci95
+from wisteria.reprfmt import fmt_throughput, fmt_percentage
+from wisteria.resultsmatrix import ResultsMatrix
 from wisteria.msg import msgerror, msgdebug
 from wisteria.cwc.cwc_utils import count_dataobjs_number_without_cwc_variant
 from wisteria.cwc.cwc_utils import serializer_is_compatible_with_dataobj
@@ -42,6 +57,24 @@ import wisteria.globs
 from wisteria.globs import VERBOSITY_DEBUG
 
 
+@dataclass
+class MemoryUsage:
+    """
+        MemoryUsage class
+
+        Memory used by an encoding or by a decoding, see memprobe.py:measure_memory().
+        _______________________________________________________________________
+
+        instance attributes:
+
+        o  (int)peak                : peak of the memory used during the call, in bytes
+        o  (int)net                 : memory still used after the call (e.g. by the
+                                      returned object), in bytes
+    """
+    peak: int
+    net: int
+
+
 @dataclass
 class SerializersDataNMVH:
     """
@@ -170,8 +203,339 @@ class SerializerDataObj:
     dataobj: str = None
 
 
+@dataclass
+class TimingStats:
+    """
+        TimingStats class
+
+        Statistics about the time samples of an encoding or of a decoding,
+        see timing.py:measure_time(). All times are the time of ONE call, in seconds.
+        _______________________________________________________________________
+
+        instance attributes:
+
+        o  (tuple of float)samples
+        o  (int)loops               : number of calls per sample
+        o  (float)min
+        o  (float)median
+        o  (float)mean
+        o  (float)stddev
+        o  (float)p95               : 95th percentile
+        o  (float, float)ci95       : 95% confidence interval of the median
+    """
+    # names are the ones of the statistics:
+    #   pylint: disable=too-many-instance-attributes
+    samples: tuple
+    loops: int
+    min: float
+    median: float
+    mean: float
+    stddev: float
+    p95: float
+    ci95: tuple
+
+
+@dataclass
+class StreamResult:
+    """
+        StreamResult class
+
+        Result of the 'stream' stage (see --stages) for ONE medium: the object
+        is written by dump(obj, fp) and read back by load(fp), see
+        stage_stream.py:measure_stream().
+        _______________________________________________________________________
+
+        instance attributes:
+
+        o  (str)medium              : 'bytesio', 'file' or 'pipe'
+        o  (bool)multidoc           : True if the object has been written as a
+                                      stream of documents (JSON Lines, dump_all()...)
+        o  (bool)success            : True if the object has been written and read
+                                      back without error and is equal to the initial object
+        o  (None|int)strlen         : number of bytes written
+        o  (None|float)ttfb         : time-to-first-byte, i.e. time between the call
+                                      to dump() and the first byte written, in seconds
+        o  (None|TimingStats)dump_timestats
+        o  (None|TimingStats)load_timestats
+        o  (None|int)mem_peak       : peak of the memory used by dump(), in bytes
+    """
+    # each attribute is a measure:
+    #   pylint: disable=too-many-instance-attributes
+    medium: str
+    multidoc: bool
+    success: bool = False
+    strlen: int = None
+    ttfb: float = None
+    dump_timestats: TimingStats = None
+    load_timestats: TimingStats = None
+    mem_peak: int = None
+
+
+@dataclass
+class MmapResult:
+    """
+        MmapResult class
+
+        Result of the 'mmap' stage (see --stages): the encoded object is written
+        into a file and decoded from a mmap-backed buffer, see
+        stage_mmap.py:measure_mmap().
+        _______________________________________________________________________
+
+        instance attributes:
+
+        o  (bool)success            : True if the encoded object has been written
+                                      and decoded from the mmap-backed buffer
+                                      without error
+        o  (None|int)strlen         : number of bytes written
+        o  (bool)buffer_decoding    : True if the decoder directly read the
+                                      mmap-backed buffer (adapter.decode_buffer),
+                                      False if a bytes copy of the buffer has
+                                      been given to adapter.decode()
+        o  (None|bool)copied        : True if the decoder copied the buffer
+        o  (None|TimingStats)write_timestats
+        o  (None|TimingStats)decode_timestats
+    """
+    success: bool = False
+    strlen: int = None
+    buffer_decoding: bool = False
+    copied: bool = None
+    write_timestats: TimingStats = None
+    decode_timestats: TimingStats = None
+
+
+@dataclass
+class CompressionResult:
+    """
+        CompressionResult class
+
+        Result of the 'compress' stage (see --stages) for one codec: the encoded
+        object is compressed then decompressed, see
+        stage_compress.py:measure_compress().
+        _______________________________________________________________________
+
+        instance attributes:
+
+        o  (str)codec               : 'zlib0' ... 'zlib9', 'bz2' or 'lzma'
+        o  (bool)success            : True if the encoded object has been
+                                      compressed and decompressed without error
+        o  (None|int)strlen         : length of the encoded object, in bytes
+        o  (None|int)compressed_strlen: length of the compressed object, in bytes
+        o  (None|TimingStats)compression_timestats
+        o  (None|TimingStats)decompression_timestats
+    """
+    codec: str
+    success: bool = False
+    strlen: int = None
+    compressed_strlen: int = None
+    compression_timestats: TimingStats = None
+    decompression_timestats: TimingStats = None
+
+
+class OutOfBandPickle:
+    """
+        OutOfBandPickle class
+
+        An object encoded by serializers.py:pickle_outofband_dumps(), i.e. by
+        an OutOfBandPickler with protocol 5 and a buffer_callback: the pickle
+        stream and the out-of-band buffers, i.e. the pickle.PickleBuffer objects
+        referencing the memory of the encoded object instead of copies of it.
+
+        len(OutOfBandPickle) is the number of bytes to be transmitted (stream +
+        buffers); only .copied_strlen bytes have been copied by the encoding.
+        _______________________________________________________________________
+
+        instance attributes:
+
+        o  (bytes)data                  : the pickle stream
+        o  (list of pickle.PickleBuffer)buffers
+
+        methods:
+
+        o  __init__(self, data, buffers)
+        o  __len__(self)
+        o  __repr__(self)
+        o  copied_strlen(self)
+    """
+    def __init__(self,
+                 data,
+                 buffers):
+        """
+            OutOfBandPickle.__init__()
+            ___________________________________________________________________
+
+            ARGUMENTS:
+            o  (bytes)data
+            o  (list of pickle.PickleBuffer)buffers
+        """
+        self.data = data
+        self.buffers = buffers
+
+    def __len__(self):
+        """
+            OutOfBandPickle.__len__()
+
+            RETURNED VALUE: (int)the length of the stream + the size of the buffers
+        """
+        return len(self.data) + sum(memoryview(buffer).nbytes for buffer in self.buffers)
+
+    def __repr__(self):
+        """
+            OutOfBandPickle.__repr__()
+        """
+        return f"OutOfBandPickle(data={self.data!r}; " \
+            f"{len(self.buffers)} out-of-band buffer(s), " \
+            f"{len(self)-self.copied_strlen} bytes not copied)"
+
+    @property
+    def copied_strlen(self):
+        """
+            OutOfBandPickle.copied_strlen()
+
+            RETURNED VALUE: (int)the number of bytes copied by the encoding, i.e.
+                            the length of the pickle stream.
+        """
+        return len(self.data)
+
+
+class OutOfBandPickler(pickle.Pickler):
+    """
+        OutOfBandPickler class
+
+        pickle.Pickler giving the content of the array.array and memoryview
+        objects as out-of-band buffers (protocol 5): those buffers are passed to
+        <buffer_callback> instead of being copied into the pickle stream.
+
+        The C pickler serializes bytes and bytearray objects before calling
+        reducer_override(): they are always copied into the pickle stream.
+        _______________________________________________________________________
+
+        methods:
+
+        o  array_frombuffer(typecode, buffer)
+        o  reducer_override(self, obj)
+    """
+    @staticmethod
+    def array_frombuffer(typecode,
+                         buffer):
+        """
+            OutOfBandPickler.array_frombuffer()
+
+            Rebuild an array.array from the out-of-band <buffer>.
+            ___________________________________________________________________
+
+            ARGUMENTS:
+            o  (str)typecode
+            o  (bytes-like object)buffer
+
+            RETURNED VALUE: (array.array)the rebuilt array
+        """
+        res = array.array(typecode)
+        with memoryview(buffer) as view:
+            res.frombytes(view.cast("B"))
+        return res
+
+    def reducer_override(self,
+                         obj):
+        """
+            OutOfBandPickler.reducer_override()
+
+            See pickle.Pickler.reducer_override().
+            ___________________________________________________________________
+
+            ARGUMENT: obj, the object to be pickled
+
+            RETURNED VALUE: the reduction of <obj> or NotImplemented if <obj> has
+                            to be pickled as usual.
+        """
+        # exact types: a subclass of array.array would be rebuilt as an array.array:
+        #   pylint: disable=unidiomatic-typecheck
+        if type(obj) is array.array:
+            return OutOfBandPickler.array_frombuffer, (obj.typecode, pickle.PickleBuffer(obj))
+        if type(obj) is memoryview:
+            return memoryview, (pickle.PickleBuffer(obj),)
+        return NotImplemented
+
+
+@dataclass
+class TranscodingAdapter:
+    """
+        TranscodingAdapter class
+
+        What differs from one serializer to another: the encoding/decoding
+        functions and the exceptions they raise when they fail.
+        The transcoding itself is made by serializers.py:transcode().
+        _______________________________________________________________________
+
+        instance attributes:
+
+        o  (module)module           : the serializer's module, only used by the messages
+        o  (str)version             : what is returned by transcodefunc(action='version')
+        o  (callable)encode         : encode(obj) returns the encoded object
+        o  (callable)decode         : decode(encoded_object) returns the decoded object
+        o  (tuple)encoding_errors   : exceptions raised by encode() when it fails
+        o  (tuple)decoding_errors   : exceptions raised by decode() when it fails
+
+        Functions used by the 'stream' stage (see --stages), None if the
+        serializer can't write into/read from a file object:
+        o  (None|callable)dump      : dump(obj, fp) writes <obj> into <fp>
+        o  (None|callable)load      : load(fp) returns the object read from <fp>
+        o  (None|callable)dump_all  : dump_all(objs, fp) writes the items of <objs>
+                                      as a stream of documents
+        o  (None|callable)load_all  : load_all(fp) returns the list of the documents
+                                      read from <fp>
+        o  (bool)textstream         : True if <fp> is a text file object, False if
+                                      it is a binary one
+
+        Function used by the 'mmap' stage (see --stages), None if the serializer
+        can't decode a bytes-like object without copying it into a bytes object:
+        o  (None|callable)decode_buffer : decode_buffer(buffer) returns the object
+                                          decoded from <buffer>, e.g. a memoryview
+    """
+    # the stream functions are optional:
+    #   pylint: disable=too-many-instance-attributes
+    module: object
+    version: str
+    encode: object
+    decode: object
+    encoding_errors: tuple
+    decoding_errors: tuple
+    dump: object = None
+    load: object = None
+    dump_all: object = None
+    load_all: object = None
+    textstream: bool = False
+    decode_buffer: object = None
+
+
+@dataclass
+class TranscodingCheck:
+    """
+        TranscodingCheck class
+
+        Result of ONE encoding followed by ONE decoding, without any measure,
+        see serializers.py:check_transcoding(). The encoded object is kept so
+        that the timed transcoding doesn't have to compute it again; it may be
+        None even if .encoding_success is True (see TRANSCODING_CHECKS_MAXLEN):
+        transcode() encodes the object again, once and untimed.
+        _______________________________________________________________________
+
+        instance attributes:
+
+        o  (None|object)encoded_object
+        o  (bool)encoding_success
+        o  (bool)decoding_success
+        o  (bool)reversibility
+    """
+    encoded_object: object
+    encoding_success: bool
+    decoding_success: bool
+    reversibility: bool
+
+
 # No useless public methods to add, indeed!
 #   pylint: disable=too-few-public-methods
+# Each attribute is a result of the transcoding:
+#   pylint: disable=too-many-instance-attributes
 class SerializationResult:
     """
         SerializationResult class
@@ -182,12 +546,27 @@ class SerializationResult:
         instance attributes:
         o  (str|bytes)   encoded_object
         o  (bool)        encoding_success
-        o  (float)       encoding_time
+        o  (float)       encoding_time          : median of .encoding_timestats
+        o  (None|TimingStats) encoding_timestats
+        o  (None|MemoryUsage) encoding_memusage
         o  (int)         encoding_strlen
+        o  (None|float)  encoding_throughput    : encoding_strlen/encoding_time, in MB/s
         o  (bool)        decoding_success
-        o  (float)       decoding_time
+        o  (float)       decoding_time          : median of .decoding_timestats
+        o  (None|TimingStats) decoding_timestats
+        o  (None|MemoryUsage) decoding_memusage
         o  (bool)        reversibility
-        o  (int)         mem_usage
+        o  (int)         mem_usage              : encoding peak + decoding peak
+        o  (None|float)  decoding_throughput    : encoding_strlen/decoding_time, in MB/s
+        o  (None|float)  ops_throughput         : 1/(encoding_time+decoding_time), i.e.
+                                                  encodings+decodings per second
+        o  (dict)        stages                 : results of the extra stages (see --stages),
+                                                  see serializers.py:transcode()
+        o  (None|str)    interruption           : None or, if the sandboxed process computing
+                                                  the transcoding has been interrupted (see
+                                                  --sandbox and jobs.py), 'crash', 'timeout'
+                                                  or 'memory'; 'budget' if the transcoding
+                                                  hasn't been (fully) computed (see --budget)
 
         methods:
 
@@ -204,29 +583,76 @@ class SerializationResult:
             o  (str|bytes) encoded_object
             o  (bool)      encoding_success
             o  (float)     encoding_time
+            o  (None|TimingStats) encoding_timestats
+            o  (None|MemoryUsage) encoding_memusage
             o  (int)       encoding_strlen
+            o  (None|float) encoding_throughput
             o  (bool)      decoding_success
             o  (float)     decoding_time
+            o  (None|TimingStats) decoding_timestats
+            o  (None|MemoryUsage) decoding_memusage
             o  (bool)      reversibility
             o  (int)       mem_usage
+            o  (None|float) decoding_throughput
+            o  (None|float) ops_throughput
+            o  (dict)      stages
+            o  (None|str)  interruption
         """
         self.encoded_object = None
         self.encoding_success = False
         self.encoding_time = None
+        self.encoding_timestats = None
+        self.encoding_memusage = None
         self.encoding_strlen = None
         self.decoding_success = False
         self.decoding_time = None
+        self.decoding_timestats = None
+        self.decoding_memusage = None
         self.reversibility = False
         self.mem_usage = None
+        self.encoding_throughput = None
+        self.decoding_throughput = None
+        self.ops_throughput = None
+        self.stages = {}
+        self.interruption = None
 
     def __repr__(self):
         """
             SerializationResult.__repr__()
         """
         return f"{self.encoded_object=}; {self.encoding_success=}; {self.encoding_time=}; " \
-            "{self.encoding_strlen=}; " \
-            f"{self.decoding_success=}; {self.decoding_time=}; {self.reversibility=}; " \
-            f"{self.mem_usage=}"
+            f"{self.encoding_timestats=}; {self.encoding_memusage=}; " \
+            f"{self.encoding_strlen=}; " \
+            f"{self.decoding_success=}; {self.decoding_time=}; " \
+            f"{self.decoding_timestats=}; {self.decoding_memusage=}; " \
+            f"{self.reversibility=}; " \
+            f"{self.mem_usage=}; " \
+            f"{self.encoding_throughput=}; {self.decoding_throughput=}; " \
+            f"{self.ops_throughput=}; {self.stages=}; {self.interruption=}"
+
+
+def memoized(method):
+    """
+        memoized()
+
+        Decorator: the value returned by a SerializationResults <method> is
+        stored in .memo, the key being the name of the method and its arguments.
+        .memo is emptied by .reset_memo() each time the results change.
+
+        The returned values are shared between the callers: don't modify them.
+        _______________________________________________________________________
+
+        ARGUMENT: (SerializationResults method)method
+
+        RETURNED VALUE: (function)the memoized method
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in self.memo:
+            self.memo[key] = method(self, *args, **kwargs)
+        return self.memo[key]
+    return wrapper
 
 
 class SerializationResults(dict):
@@ -239,6 +665,9 @@ class SerializationResults(dict):
                 SerializationResults[(str)serializer][(str)dataobj] = SerializationResult object
 
         Do not forget to call .finish_initialization() once you have finished initializing <self>.
+
+        The hall, the ranks and the formatted strings are memoized (see memoized()):
+        use .add() to add a result, .memo being emptied each time a result is added.
         _______________________________________________________________________
 
         instance attributes:
@@ -256,33 +685,58 @@ class SerializationResults(dict):
                                                 'decoding_success', 'decoding_time',
                                                 'reversibility',
                                                 'encoding_plus_decoding_time',
-                                                'mem_usage'
-
+                                                'mem_usage',
+                                                'encoding_throughput', 'decoding_throughput',
+                                                'ops_throughput',
+                                                'compressed_strlen', 'compression_ratio',
+                                                'compression_throughput',
+                                                'decompression_throughput'
+                                      throughputs are sorted from the highest to the lowest;
+                                      the compression values come from the first
+                                      codec of the 'compress' stage (see --stages).
+
+        o  (dict)hall_ci95          : hall_ci95[attribute][serializer] = (None|(low, high))
+                                      95% confidence interval of the total time;
+                                      keys are: 'encoding_time', 'decoding_time',
+                                                'encoding_plus_decoding_time'
         o  (dict)overallscores      : overallscores[serializer] = (int)overallscore
+        o  (None|ResultsMatrix)matrix : columnar view of <self>, see get_matrix()
+        o  (dict)memo               : values returned by the memoized methods, see memoized()
 
 
         methods:
 
         o  __init__(self)
+        o  __delitem__(self, serializer)
+        o  __setitem__(self, serializer, serializer_results)
+        o  add(self, serializer, dataobj, result)
         o  are_all_serializers_equal_in_the_hall(self, attribute)
         o  comparison_inside_hall(self, serializer, attribute)
         o  count_serializers_compatible_with_dataobj(self, dataobj)
         o  finish_initialization(self)
         o  get_hall(self, attribute, index)
+        o  get_hall_rank(self, attribute, index)
+        o  get_matrix(self)
         o  get_overallscore_rank(self, serializer)
         o  get_overallscore_bestrank(self)
         o  get_overallscore_worstrank(self)
+        o  get_reduction(self, key, serializer=None, dataobj=None)
         o  get_serializers_whose_overallscore_rank_is(self, rank)
         o  hall_without_none_for_attribute(self, attribute)
+        o  mean_compression_ratio(self, serializer=None, dataobj=None, output="fmtstr")
+        o  mean_throughput(self, attribute, serializer=None, dataobj=None, output="fmtstr")
         o  ratio_decoding_success(self, serializer=None, dataobj=None, output="fmtstr")
         o  ratio_encoding_success(self, serializer=None, dataobj=None, output="fmtstr")
         o  ratio_reversibility(self, serializer=None, dataobj=None, output="fmtstr")
         o  repr_attr(self, serializer, dataobj, attribute_name, output="fmtstr")
+        o  reset_memo(self)
+        o  total_compressed_strlen(self, serializer=None, dataobj=None, output="fmtstr")
         o  total_decoding_time(self, serializer=None, dataobj=None, output="fmtstr")
         o  total_encoding_plus_decoding_time(self, serializer=None, dataobj=None, output="fmtstr")
         o  total_encoding_strlen(self, serializer=None, dataobj=None, output="fmtstr")
         o  total_encoding_time(self, serializer=None, dataobj=None, output="fmtstr")
         o  total_mem_usage(self, serializer=None, dataobj=None, output="fmtstr")
+        o  total_time_ci95(self, serializer, attribute)
     """
     def __init__(self):
         """
@@ -308,8 +762,19 @@ class SerializationResults(dict):
                                                     'encoding_strlen',
                                                     'decoding_success', 'decoding_time',
                                                     'reversibility',
-                                                    'encoding_plus_decoding_time'
+                                                    'encoding_plus_decoding_time',
+                                                    'mem_usage',
+                                                    'encoding_throughput',
+                                                    'decoding_throughput',
+                                                    'ops_throughput',
+                                                    'compressed_strlen',
+                                                    'compression_ratio',
+                                                    'compression_throughput',
+                                                    'decompression_throughput'
+            o  (dict)hall_ci95          : hall_ci95[attribute][serializer] = (None|(low, high))
             o  (dict)overallscores      : overallscores[serializer] = (int)overallscore
+            o  (None|ResultsMatrix)matrix : columnar view of <self>, see get_matrix()
+            o  (dict)memo               : values returned by the memoized methods
         """
         dict.__init__(self)
 
@@ -332,8 +797,63 @@ class SerializationResults(dict):
         self.dataobjs_number = None
 
         self.hall = None
+        self.hall_ci95 = None
         self.overallscores = None
+        self.matrix = None
+        self.memo = {}
 
+    def __delitem__(self,
+                    serializer):
+        """
+            SerializationResults.__delitem__()
+
+            Remove the results of <serializer>: the memoized values are forgotten.
+            ___________________________________________________________________
+
+            ARGUMENT: (str)serializer
+        """
+        dict.__delitem__(self, serializer)
+        self.reset_memo()
+
+    def __setitem__(self,
+                    serializer,
+                    serializer_results):
+        """
+            SerializationResults.__setitem__()
+
+            Set the results of <serializer>: the memoized values are forgotten.
+            ___________________________________________________________________
+
+            ARGUMENTS:
+            o  (str)serializer
+            o  (dict)serializer_results: [(str)dataobj] = SerializationResult
+        """
+        dict.__setitem__(self, serializer, serializer_results)
+        self.reset_memo()
+
+    def add(self,
+            serializer,
+            dataobj,
+            result):
+        """
+            SerializationResults.add()
+
+            Add the <result> of (<serializer>, <dataobj>): the memoized values
+            are forgotten. Call .finish_initialization() once all the results
+            have been added.
+            ___________________________________________________________________
+
+            ARGUMENTS:
+            o  (str)serializer
+            o  (str)dataobj
+            o  (None|SerializationResult)result
+        """
+        if serializer not in self:
+            dict.__setitem__(self, serializer, {})
+        self[serializer][dataobj] = result
+        self.reset_memo()
+
+    @memoized
     def are_all_serializers_equal_in_the_hall(self,
                                               attribute):
         """
@@ -359,6 +879,7 @@ class SerializationResults(dict):
                     break
         return res
 
+    @memoized
     def comparison_inside_hall(self,
                                serializer,
                                attribute):
@@ -404,6 +925,11 @@ class SerializationResults(dict):
 
             RETURNED VALUE: (int)the number of serializer(s) compatible with <dataobj>.
         """
+        matrix = self.get_matrix()
+        if dataobj in matrix.columns:
+            return matrix.columns[dataobj]["compatible"]
+
+        # <dataobj> has not been used by any serializer:
         res = 0
         for serializer in self:
             if serializer_is_compatible_with_dataobj(serializer,
@@ -417,11 +943,14 @@ class SerializationResults(dict):
 
             Once the initialization of <self> is over, this method must be called to
             set self.self.serializers, self.dataobjs, self.serializers_total_number
-            self.dataobjs_number, self.hall and self.overallscores
+            self.dataobjs_number, self.matrix, self.hall, self.hall_ci95 and self.overallscores
             ___________________________________________________________________
 
             RETURNED VALUE: (bool)success
         """
+        # the hall and the ranks are computed again:
+        self.reset_memo()
+
         self.serializers = sorted(self.keys())
         self.serializers_total_number = len(self.serializers)
 
@@ -446,6 +975,10 @@ class SerializationResults(dict):
         # ⋅(class variable initialized in initialization in finish_initialization())
         self.dataobjs_number = count_dataobjs_number_without_cwc_variant(self.dataobjs)
 
+        # ---- <self.matrix> --------------------------------------------------
+        # all the totals and ratios read below are computed here, once:
+        self.matrix = ResultsMatrix(self)
+
         # ---- <self.hall> ----------------------------------------------------
         self.hall = {}
 
@@ -553,8 +1086,61 @@ class SerializationResults(dict):
             self.hall["mem_usage"] = \
                 tuple((None, serializer) for serializer in self.serializers)
 
+        # we add "compressed_strlen" only if it makes sense:
+        if not tuple(0 for serializer in self.serializers
+                     if self.total_compressed_strlen(serializer=serializer,
+                                                     output="value") is None):
+            self.hall["compressed_strlen"] = \
+                sorted(((self.total_compressed_strlen(serializer=serializer,
+                                                      output="value"),
+                         serializer) for serializer in self.serializers),
+                       reverse=False)
+        else:
+            self.hall["compressed_strlen"] = \
+                tuple((None, serializer) for serializer in self.serializers)
+
+        # we add "compression_ratio" only if it makes sense:
+        if not tuple(0 for serializer in self.serializers
+                     if self.mean_compression_ratio(serializer=serializer,
+                                                    output="value") is None):
+            self.hall["compression_ratio"] = \
+                sorted(((self.mean_compression_ratio(serializer=serializer,
+                                                     output="value"),
+                         serializer) for serializer in self.serializers),
+                       reverse=False)
+        else:
+            self.hall["compression_ratio"] = \
+                tuple((None, serializer) for serializer in self.serializers)
+
+        # we add the throughputs only if it makes sense; the highest throughput comes first:
+        for attribute in ('encoding_throughput', 'decoding_throughput', 'ops_throughput',
+                          'compression_throughput', 'decompression_throughput'):
+            if not tuple(0 for serializer in self.serializers
+                         if self.mean_throughput(attribute,
+                                                 serializer=serializer,
+                                                 output="value") is None):
+                self.hall[attribute] = \
+                    sorted(((self.mean_throughput(attribute,
+                                                  serializer=serializer,
+                                                  output="value"),
+                             serializer) for serializer in self.serializers),
+                           reverse=True)
+            else:
+                self.hall[attribute] = \
+                    tuple((None, serializer) for serializer in self.serializers)
+
+        # ---- <self.hall_ci95> -----------------------------------------------
+        self.hall_ci95 = {}
+        for attribute in ('encoding_time', 'decoding_time', 'encoding_plus_decoding_time'):
+            self.hall_ci95[attribute] = {}
+            for serializer in self.serializers:
+                self.hall_ci95[attribute][serializer] = \
+                    self.total_time_ci95(serializer=serializer,
+                                         attribute=attribute)
+
         if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
             msgdebug(f"hall={self.hall}")
+            msgdebug(f"hall_ci95={self.hall_ci95}")
 
         # ---- self.overallscores ---------------------------------------------
         # overall score computing:
@@ -563,21 +1149,21 @@ class SerializationResults(dict):
         # * if a serializer is #1 (first rank) for a certain attribute,
         #   its score increases by results.serializers_total_number-1.
         # * ...
-        self.overallscores = {}
-        for serializer in self.serializers:
-            self.overallscores[serializer] = 0
-
-            for attribute in ('encoding_plus_decoding_time',
-                              'encoding_strlen',
-                              'reversibility',
-                              'mem_usage',
-                              ):
-                for index in range(self.serializers_total_number):
-                    if self.hall[attribute][index][1] == serializer:
-                        self.overallscores[serializer] += self.serializers_total_number-index
+        # Two serializers whose time confidence intervals overlap share the same rank:
+        # see .get_hall_rank().
+        self.overallscores = {serializer: 0 for serializer in self.serializers}
+        for attribute in ('encoding_plus_decoding_time',
+                          'encoding_strlen',
+                          'reversibility',
+                          'mem_usage',
+                          ):
+            for index, (_, serializer) in enumerate(self.hall[attribute]):
+                self.overallscores[serializer] += \
+                    self.serializers_total_number-self.get_hall_rank(attribute, index)
 
         return True
 
+    @memoized
     def get_hall(self,
                  attribute,
                  index):
@@ -597,7 +1183,14 @@ class SerializationResults(dict):
                                'decoding_time' or
                                'encoding_strlen' or
                                'reversibility' or
-                               'mem_usage' ?
+                               'mem_usage' or
+                               'encoding_throughput' or
+                               'decoding_throughput' or
+                               'ops_throughput' or
+                               'compressed_strlen' or
+                               'compression_ratio' or
+                               'compression_throughput' or
+                               'decompression_throughput' ?
             o  (int)index: 0 <= index < len(self.serializers_total_numbers-1)
 
             RETURNED VALUE: (str)a formatted string describing the result.
@@ -608,7 +1201,14 @@ class SerializationResults(dict):
                              'decoding_time',
                              'encoding_strlen',
                              'reversibility',
-                             'mem_usage')
+                             'mem_usage',
+                             'encoding_throughput',
+                             'decoding_throughput',
+                             'ops_throughput',
+                             'compressed_strlen',
+                             'compression_ratio',
+                             'compression_throughput',
+                             'decompression_throughput')
 
         value, serializer = self.hall[attribute][index]
 
@@ -618,7 +1218,8 @@ class SerializationResults(dict):
 
         if attribute == 'encoding_time':
             return f"{fmt_serializer(serializer)} " \
-                f"[{fmt_time(value)}]"
+                f"[{fmt_time(value)}" \
+                f"{fmt_time_ci95(value, self.hall_ci95[attribute][serializer])}]"
 
         if attribute == 'decoding_success':
             return f"{fmt_serializer(serializer)} " \
@@ -627,14 +1228,15 @@ class SerializationResults(dict):
         if attribute == 'decoding_time':
             serializer = self.hall[attribute][index][1]
             return f"{fmt_serializer(serializer)} " \
-                f"[{fmt_time(value)}]"
+                f"[{fmt_time(value)}" \
+                f"{fmt_time_ci95(value, self.hall_ci95[attribute][serializer])}]"
 
         if attribute == 'reversibility':
             serializer = self.hall[attribute][index][1]
             return f"{fmt_serializer(serializer)} " \
                 f"[{self.ratio_reversibility(serializer=serializer)}]"
 
-        if attribute == 'encoding_strlen':
+        if attribute in ('encoding_strlen', 'compressed_strlen'):
             serializer = self.hall[attribute][index][1]
             return f"{fmt_serializer(serializer)} " \
                 f"[{fmt_strlen(value)}]"
@@ -644,8 +1246,66 @@ class SerializationResults(dict):
             return f"{fmt_serializer(serializer)} " \
                 f"[{fmt_mem_usage(value)}]"
 
+        if attribute in ('encoding_throughput', 'decoding_throughput', 'ops_throughput',
+                         'compression_throughput', 'decompression_throughput'):
+            return f"{fmt_serializer(serializer)} " \
+                f"[{fmt_throughput(value)}]"
+
+        if attribute == 'compression_ratio':
+            return f"{fmt_serializer(serializer)} " \
+                f"[{self.mean_compression_ratio(serializer=serializer)}]"
+
         return None  # this line should never be executed.
 
+    @memoized
+    def get_hall_rank(self,
+                      attribute,
+                      index):
+        """
+            SerializationResults.get_hall_rank()
+
+            Return the rank of self.hall[attribute][index], taking into account
+            the confidence intervals of the times: if the confidence interval of
+            self.hall[attribute][index] overlaps the one of
+            self.hall[attribute][index-1], both serializers share the same rank.
+
+            For attributes without confidence interval, the rank is <index>.
+            ___________________________________________________________________
+
+            ARGUMENTS:
+            o  (str)attribute: a key of self.hall
+            o  (int)index: 0 <= index < len(self.serializers_total_numbers-1)
+
+            RETURNED VALUE: (int)rank, 0 <= rank <= index
+        """
+        if attribute not in self.hall_ci95:
+            return index
+
+        while index > 0:
+            previous_ci95 = self.hall_ci95[attribute][self.hall[attribute][index-1][1]]
+            current_ci95 = self.hall_ci95[attribute][self.hall[attribute][index][1]]
+            if previous_ci95 is None or current_ci95 is None or \
+               previous_ci95[1] < current_ci95[0]:
+                break
+            index -= 1
+
+        return index
+
+    def get_matrix(self):
+        """
+            SerializationResults.get_matrix()
+
+            Return the columnar view of <self>, see (pimydoc)results matrix;
+            it is built by .finish_initialization() or, if needed, here.
+            ___________________________________________________________________
+
+            RETURNED VALUE: (ResultsMatrix)self.matrix
+        """
+        if self.matrix is None:
+            self.matrix = ResultsMatrix(self)
+        return self.matrix
+
+    @memoized
     def get_overallscore_rank(self,
                               serializer):
         """
@@ -670,6 +1330,7 @@ class SerializationResults(dict):
 
         return _rank
 
+    @memoized
     def get_overallscore_bestrank(self):
         """
             SerializationResults.get_overallscore_bestrank()
@@ -690,6 +1351,7 @@ class SerializationResults(dict):
                 res.append(serializer)
         return res
 
+    @memoized
     def get_overallscore_worstrank(self):
         """
             SerializationResults.get_overallscore_worstrank()
@@ -710,6 +1372,33 @@ class SerializationResults(dict):
                 res.append(serializer)
         return res
 
+    def get_reduction(self,
+                      key,
+                      serializer=None,
+                      dataobj=None):
+        """
+            SerializationResults.get_reduction()
+
+            Return the reduction <key> of the row <serializer> OR of the column
+            <dataobj> of self.matrix, see ResultsMatrix.reduce_cells().
+            ___________________________________________________________________
+
+            ARGUMENTS:
+            o  (str)key: e.g. 'encoding_time' or 'reversibility'
+            o  <None|str>serializer: if not None, name of the serializer to be used.
+            o  <None|str>dataobj: if not None, name of the data object to be used.
+                BEWARE ! One and only one argument among <serializer> and <dataobj> can be set to
+                         None.
+
+            RETURNED VALUE: (None|int|float|(float, float))the reduction
+        """
+        assert serializer is None or dataobj is None
+
+        if serializer is not None:
+            return self.get_matrix().rows[serializer][key]
+        return self.get_matrix().columns[dataobj][key]
+
+    @memoized
     def get_serializers_whose_overallscore_is(self,
                                               score):
         """
@@ -725,6 +1414,7 @@ class SerializationResults(dict):
         return list(serializer for serializer in self.serializers
                     if self.overallscores[serializer] == score)
 
+    @memoized
     def hall_without_none_for_attribute(self,
                                         attribute):
         """
@@ -745,6 +1435,85 @@ class SerializationResults(dict):
 
         return res
 
+    @memoized
+    def mean_compression_ratio(self,
+                               serializer=None,
+                               dataobj=None,
+                               output="fmtstr"):
+        """
+            SerializationResults.mean_compression_ratio()
+
+            Compute and format the mean compression ratio (compressed/encoded
+            string length, see the 'compress' stage) of a <serializer> OR of a
+            <dataobj>ect: like the throughputs, it's a geometric mean.
+            _______________________________________________________________
+
+            ARGUMENTS:
+            o  <None|str>serializer: if not None, name of the serializer to be used.
+            o  <None|str>dataobj: if not None, name of the data object to be used.
+                BEWARE ! One and only one argument among <serializer> and <dataobj> can be set to
+                         None.
+            o  (str)output: output type and format
+                    - "value": raw value (float)
+                    - "fmtstr": formatted string (str)
+
+            RETURNED VALUE:
+                (output=='fmtstr')a formatted string representing the input argument.
+                (output=='value')a float or None if the result can't be computed
+        """
+        assert serializer is None or dataobj is None
+        assert output in ('fmtstr', 'value',)
+
+        res = self.get_reduction("compression_ratio", serializer=serializer, dataobj=dataobj)
+
+        if output == "value":
+            return res
+        return fmt_nodata() if res is None else fmt_percentage(100*res)
+
+    @memoized
+    def mean_throughput(self,
+                        attribute,
+                        serializer=None,
+                        dataobj=None,
+                        output="fmtstr"):
+        """
+            SerializationResults.mean_throughput()
+
+            Compute and format the mean throughput of a <serializer> OR of a
+            <dataobj>ect.
+
+            Unlike a sum of times, the geometric mean of the throughputs gives
+            the same weight to each transcoding: a serializer that is slow on
+            one huge object doesn't dominate the result. Failed transcodings
+            are ignored: see the encoding/decoding success ratios.
+            _______________________________________________________________
+
+            ARGUMENTS:
+            o  (str)attribute: 'encoding_throughput', 'decoding_throughput',
+                               'ops_throughput', 'compression_throughput' or
+                               'decompression_throughput'
+            o  <None|str>serializer: if not None, name of the serializer to be used.
+            o  <None|str>dataobj: if not None, name of the data object to be used.
+                BEWARE ! One and only one argument among <serializer> and <dataobj> can be set to
+                         None.
+            o  (str)output: output type and format
+                    - "value": raw value (float)
+                    - "fmtstr": formatted string (str)
+
+            RETURNED VALUE:
+                (output=='fmtstr')a formatted string representing the input argument.
+                (output=='value')a float or None if the result can't be computed
+        """
+        assert attribute in ('encoding_throughput', 'decoding_throughput', 'ops_throughput',
+                             'compression_throughput', 'decompression_throughput')
+        assert serializer is None or dataobj is None
+        assert output in ('fmtstr', 'value',)
+
+        res = self.get_reduction(attribute, serializer=serializer, dataobj=dataobj)
+
+        return fmt_throughput(res) if output == 'fmtstr' else res
+
+    @memoized
     def ratio_decoding_success(self,
                                serializer=None,
                                dataobj=None,
@@ -771,48 +1540,24 @@ class SerializationResults(dict):
         assert serializer is None or dataobj is None
         assert output in ('fmtstr', 'value')
 
-        count = 0  # number of serializers or dataobjs that are taken in account.
-
-        # serializer is not None:
         if serializer is not None:
             if self.serializers_total_number == 0:
                 return fmt_ratio(None) if output == "fmtstr" else None
+            count = self.get_reduction("decoding_success", serializer=serializer)
+            total = self.dataobjs_number
+        else:
+            if self.dataobjs_number == 0:
+                return fmt_ratio(None) if output == "fmtstr" else None
+            count = self.get_reduction("decoding_success", dataobj=dataobj)
+            total = self.count_serializers_compatible_with_dataobj(dataobj)
 
-            for _dataobj in self[serializer]:
-                if not serializer_is_compatible_with_dataobj(serializer, _dataobj):
-                    continue
-                if self[serializer][_dataobj] is None:
-                    return fmt_ratio(None) if output == 'fmtstr' else None
-                if self[serializer][_dataobj] is not None and \
-                   self[serializer][_dataobj].decoding_success:
-                    count += 1
-            if output == "fmtstr":
-                return fmt_ratio((count, count/self.dataobjs_number))
-            if output == "value":
-                return count/self.dataobjs_number
-
-        # dataobj is not None:
-        if self.dataobjs_number == 0:
-            return fmt_ratio(None) if output == "fmtstr" else None
-
-        for _serializer in self:
-            if not serializer_is_compatible_with_dataobj(_serializer, dataobj):
-                continue
-            if self[_serializer][dataobj] is None:
-                return fmt_ratio(None) if output == 'fmtstr' else None
-            if dataobj in self[_serializer] and \
-               self[_serializer][dataobj] is not None and \
-               self[_serializer][dataobj].decoding_success:
-                count += 1
-
-        serializers_total_number = self.count_serializers_compatible_with_dataobj(dataobj)
+        if count is None:
+            return fmt_ratio(None) if output == 'fmtstr' else None
         if output == "fmtstr":
-            return fmt_ratio((count, count/serializers_total_number))
-        if output == "value":
-            return count/serializers_total_number
-
-        return None  # this line should never be executed.
+            return fmt_ratio((count, count/total))
+        return count/total
 
+    @memoized
     def ratio_encoding_success(self,
                                serializer=None,
                                dataobj=None,
@@ -837,50 +1582,26 @@ class SerializationResults(dict):
                 (output=='value')a float or None if the ratio can't be computed
         """
         assert serializer is None or dataobj is None
-        assert output in ("fmtstr", "value")
-
-        count = 0  # number of serializers or dataobjs that are taken in account.
+        assert output in ('fmtstr', 'value')
 
-        # serializer is not None:
         if serializer is not None:
             if self.serializers_total_number == 0:
                 return fmt_ratio(None) if output == "fmtstr" else None
+            count = self.get_reduction("encoding_success", serializer=serializer)
+            total = self.dataobjs_number
+        else:
+            if self.dataobjs_number == 0:
+                return fmt_ratio(None) if output == "fmtstr" else None
+            count = self.get_reduction("encoding_success", dataobj=dataobj)
+            total = self.count_serializers_compatible_with_dataobj(dataobj)
 
-            for _dataobj in self[serializer]:
-                if not serializer_is_compatible_with_dataobj(serializer, _dataobj):
-                    continue
-                if self[serializer][_dataobj] is None:
-                    return fmt_ratio(None) if output == 'fmtstr' else None
-                if self[serializer][_dataobj] is not None and \
-                   self[serializer][_dataobj].encoding_success:
-                    count += 1
-            if output == "fmtstr":
-                return fmt_ratio((count, count/self.dataobjs_number))
-            if output == "value":
-                return count/self.dataobjs_number
-
-        # dataobj is not None:
-        if self.dataobjs_number == 0:
-            return fmt_ratio(None) if output == "fmtstr" else None
-
-        for _serializer in self:
-            if not serializer_is_compatible_with_dataobj(_serializer, dataobj):
-                continue
-            if self[_serializer][dataobj] is None:
-                return fmt_ratio(None) if output == 'fmtstr' else None
-            if dataobj in self[_serializer] and \
-               self[_serializer][dataobj] is not None and \
-               self[_serializer][dataobj].encoding_success:
-                count += 1
-
-        serializers_total_number = self.count_serializers_compatible_with_dataobj(dataobj)
+        if count is None:
+            return fmt_ratio(None) if output == 'fmtstr' else None
         if output == "fmtstr":
-            return fmt_ratio((count, count/serializers_total_number))
-        if output == "value":
-            return count/serializers_total_number
-
-        return None  # this line should never be executed.
+            return fmt_ratio((count, count/total))
+        return count/total
 
+    @memoized
     def ratio_reversibility(self,
                             serializer=None,
                             dataobj=None,
@@ -907,47 +1628,22 @@ class SerializationResults(dict):
         assert serializer is None or dataobj is None
         assert output in ('fmtstr', 'value')
 
-        count = 0  # number of serializers or dataobjs that are taken in account.
-
-        # serializer is not None:
         if serializer is not None:
             if self.serializers_total_number == 0:
                 return fmt_ratio(None) if output == "fmtstr" else None
+            count = self.get_reduction("reversibility", serializer=serializer)
+            total = self.dataobjs_number
+        else:
+            if self.dataobjs_number == 0:
+                return fmt_ratio(None) if output == "fmtstr" else None
+            count = self.get_reduction("reversibility", dataobj=dataobj)
+            total = self.count_serializers_compatible_with_dataobj(dataobj)
 
-            for _dataobj in self[serializer]:
-                if not serializer_is_compatible_with_dataobj(serializer, _dataobj):
-                    continue
-                if self[serializer][_dataobj] is None:
-                    return fmt_ratio(None) if output == 'fmtstr' else None
-                if self[serializer][_dataobj] is not None and \
-                   self[serializer][_dataobj].reversibility:
-                    count += 1
-            if output == "fmtstr":
-                return fmt_ratio((count, count/self.dataobjs_number))
-            if output == "value":
-                return count/self.dataobjs_number
-
-        # dataobj is not None:
-        if self.dataobjs_number == 0:
-            return fmt_ratio(None) if output == "fmtstr" else None
-
-        for _serializer in self:
-            if not serializer_is_compatible_with_dataobj(_serializer, dataobj):
-                continue
-            if self[_serializer][dataobj] is None:
-                return fmt_ratio(None) if output == 'fmtstr' else None
-            if dataobj in self[_serializer] and \
-               self[_serializer][dataobj] is not None and \
-               self[_serializer][dataobj].reversibility:
-                count += 1
-
-        serializers_total_number = self.count_serializers_compatible_with_dataobj(dataobj)
+        if count is None:
+            return fmt_ratio(None) if output == 'fmtstr' else None
         if output == "fmtstr":
-            return fmt_ratio((count, count/serializers_total_number))
-        if output == "value":
-            return count/serializers_total_number
-
-        return None  # this line should never be executed.
+            return fmt_ratio((count, count/total))
+        return count/total
 
     def repr_attr(self,
                   serializer,
@@ -965,7 +1661,9 @@ class SerializationResults(dict):
             o  <str>dataobj: name of the data object to be used.
             o  <str>attribute_name: 'decoding_success', 'decoding_time', 'encoding_strlen',
                                     'encoding_success', 'encoding_time',
-                                    'reversibility', 'mem_usage'
+                                    'reversibility', 'mem_usage',
+                                    'encoding_throughput', 'decoding_throughput',
+                                    'ops_throughput'
 
             RETURNED VALUE: a formatted string representing
                             self[serializer][dataobj].<attribute_name>
@@ -974,7 +1672,9 @@ class SerializationResults(dict):
         assert dataobj is not None
         assert attribute_name in ('decoding_success', 'decoding_time', 'encoding_strlen',
                                   'encoding_success', 'encoding_time',
-                                  'reversibility', 'mem_usage')
+                                  'reversibility', 'mem_usage',
+                                  'encoding_throughput', 'decoding_throughput',
+                                  'ops_throughput')
 
         res = None  # unexpected result !
 
@@ -1012,6 +1712,9 @@ class SerializationResults(dict):
             if self[serializer][dataobj] is None or \
                self[serializer][dataobj].encoding_success is None:
                 res = fmt_nodata()
+            elif self[serializer][dataobj].interruption is not None:
+                # the transcoding has been interrupted, see --sandbox and --budget:
+                res = f"[red]{self[serializer][dataobj].interruption}[/red]"
             else:
                 res = fmt_boolsuccess(
                     self[serializer][dataobj].encoding_success)
@@ -1032,8 +1735,26 @@ class SerializationResults(dict):
                 res = fmt_mem_usage(
                     self[serializer][dataobj].mem_usage)
 
+        if attribute_name in ('encoding_throughput', 'decoding_throughput', 'ops_throughput'):
+            if self[serializer][dataobj] is None:
+                res = fmt_nodata()
+            else:
+                res = fmt_throughput(
+                    getattr(self[serializer][dataobj], attribute_name))
+
         return res
 
+    def reset_memo(self):
+        """
+            SerializationResults.reset_memo()
+
+            Forget the memoized values and self.matrix: they will be computed
+            again from the current results.
+        """
+        self.memo = {}
+        self.matrix = None
+
+    @memoized
     def total_decoding_time(self,
                             serializer=None,
                             dataobj=None,
@@ -1061,52 +1782,24 @@ class SerializationResults(dict):
         assert serializer is None or dataobj is None
         assert output in ('fmtstr', 'value',)
 
-        res = None  # unexpected result !
-        total = 0  # total time
-
         if serializer is not None:
             if self.serializers_total_number == 0:
-                return None if output == "value" else fmt_time(None)
-
-            for _dataobj in self[serializer]:
-                if not serializer_is_compatible_with_dataobj(serializer, _dataobj):
-                    continue
-                if self[serializer][_dataobj] is None:
-                    return fmt_time(None) if output == 'fmtstr' else None
-                if self[serializer][_dataobj].encoding_success is False:
-                    return None if output == "value" else fmt_time(None)
-
-                if self[serializer][_dataobj] is not None and \
-                   self[serializer][_dataobj].decoding_success:
-                    total += self[serializer][_dataobj].decoding_time
-            if output == "value":
-                res = total
-            elif output == "fmtstr":
-                res = fmt_time(total)
-
+                return fmt_time(None) if output == 'fmtstr' else None
+            res = self.get_reduction("decoding_time", serializer=serializer)
         else:
             if self.dataobjs_number == 0:
                 return fmt_time(None) if output == 'fmtstr' else None
+            res = self.get_reduction("decoding_time", dataobj=dataobj)
 
-            for _serializer in self:
-                if not serializer_is_compatible_with_dataobj(_serializer, dataobj):
-                    continue
-                if self[_serializer][dataobj] is None:
-                    return fmt_time(None) if output == 'fmtstr' else None
-                if dataobj in self[_serializer] and \
-                   self[_serializer][dataobj] is not None and \
-                   self[_serializer][dataobj].decoding_success:
-                    total += self[_serializer][dataobj].decoding_time
-            if output == "value":
-                res = total
-            elif output == "fmtstr":
-                res = fmt_time(total)
-
-        if res is None:
-            raise WisteriaError("(ERRORID026) Internal error: the result could not be computed. "
-                                f"{serializer=}; {dataobj=}; {output=};")
-        return res
+        if output == "value":
+            return res
+        if output == "fmtstr":
+            return fmt_time(res)
+
+        raise WisteriaError("(ERRORID026) Internal error: the result could not be computed. "
+                            f"{serializer=}; {dataobj=}; {output=};")
 
+    @memoized
     def total_encoding_plus_decoding_time(self,
                                           serializer=None,
                                           output="fmtstr"):
@@ -1145,6 +1838,39 @@ class SerializationResults(dict):
         raise WisteriaError("(ERRORID027) Internal error: the result could not be computed. "
                             f"{serializer=}; {output=};")
 
+    @memoized
+    def total_compressed_strlen(self,
+                                serializer=None,
+                                dataobj=None,
+                                output="fmtstr"):
+        """
+            SerializationResults.total_compressed_strlen()
+
+            Compute and format the total compressed string length (see the
+            'compress' stage) of a <serializer> OR of a <dataobj>ect.
+            _______________________________________________________________
+
+            ARGUMENTS:
+            o  <None|str>serializer: if not None, name of the serializer to be used.
+            o  <None|str>dataobj: if not None, name of the data object to be used.
+                BEWARE ! One and only one argument among <serializer> and <dataobj> can be set to
+                         None.
+            o  (str)output: output type and format
+                    - "value": raw value (int)
+                    - "fmtstr": formatted string (str)
+
+            RETURNED VALUE:
+                (output=='fmtstr')a formatted string representing the input argument.
+                (output=='value')an int or None if the result can't be computed
+        """
+        assert serializer is None or dataobj is None
+        assert output in ('fmtstr', 'value',)
+
+        res = self.get_reduction("compressed_strlen", serializer=serializer, dataobj=dataobj)
+
+        return fmt_strlen(res) if output == 'fmtstr' else res
+
+    @memoized
     def total_encoding_strlen(self,
                               serializer=None,
                               dataobj=None,
@@ -1172,52 +1898,24 @@ class SerializationResults(dict):
         assert serializer is None or dataobj is None
         assert output in ('fmtstr', 'value',)
 
-        res = None  # unexpected result !
-        total = 0  # total time
-
         if serializer is not None:
             if self.serializers_total_number == 0:
                 return fmt_strlen(None) if output == 'fmtstr' else None
-
-            for _dataobj in self[serializer]:
-                if not serializer_is_compatible_with_dataobj(serializer, _dataobj):
-                    continue
-                if self[serializer][_dataobj] is None:
-                    return fmt_strlen(None) if output == 'fmtstr' else None
-                if self[serializer][_dataobj].encoding_success is False:
-                    return fmt_strlen(None) if output == 'fmtstr' else None
-
-                if self[serializer][_dataobj] is not None and \
-                   self[serializer][_dataobj].encoding_strlen:
-                    total += self[serializer][_dataobj].encoding_strlen
-            if output == "value":
-                res = total
-            elif output == "fmtstr":
-                res = fmt_strlen(total)
-
+            res = self.get_reduction("encoding_strlen", serializer=serializer)
         else:
             if self.dataobjs_number == 0:
                 return fmt_strlen(None) if output == 'fmtstr' else None
+            res = self.get_reduction("encoding_strlen", dataobj=dataobj)
 
-            for _serializer in self:
-                if not serializer_is_compatible_with_dataobj(_serializer, dataobj):
-                    continue
-                if self[_serializer][dataobj] is None:
-                    return fmt_strlen(None) if output == 'fmtstr' else None
-                if dataobj in self[_serializer] and \
-                   self[_serializer][dataobj] is not None and \
-                   self[_serializer][dataobj].encoding_strlen:
-                    total += self[_serializer][dataobj].encoding_strlen
-            if output == "value":
-                res = total
-            elif output == "fmtstr":
-                res = fmt_strlen(total)
-
-        if res is None:
-            raise WisteriaError("(ERRORID028) Internal error: the result could not be computed. "
-                                f"{serializer=}; {dataobj=}; {output=};")
-        return res
+        if output == "value":
+            return res
+        if output == "fmtstr":
+            return fmt_strlen(res)
 
+        raise WisteriaError("(ERRORID028) Internal error: the result could not be computed. "
+                            f"{serializer=}; {dataobj=}; {output=};")
+
+    @memoized
     def total_encoding_time(self,
                             serializer=None,
                             dataobj=None,
@@ -1245,51 +1943,24 @@ class SerializationResults(dict):
         assert serializer is None or dataobj is None
         assert output in ('fmtstr', 'value',)
 
-        res = None  # unexpected result !
-        total = 0  # total time
-
         if serializer is not None:
             if self.serializers_total_number == 0:
                 return fmt_time(None) if output == 'fmtstr' else None
-
-            for _dataobj in self[serializer]:
-                if not serializer_is_compatible_with_dataobj(serializer, _dataobj):
-                    continue
-                if self[serializer][_dataobj] is None:
-                    return fmt_time(None) if output == 'fmtstr' else None
-                if self[serializer][_dataobj].encoding_success is False:
-                    return fmt_time(None) if output == 'fmtstr' else None
-                if self[serializer][_dataobj] is not None and \
-                   self[serializer][_dataobj].encoding_success:
-                    total += self[serializer][_dataobj].encoding_time
-            if output == "value":
-                res = total
-            elif output == "fmtstr":
-                res = fmt_time(total)
-
+            res = self.get_reduction("encoding_time", serializer=serializer)
         else:
             if self.dataobjs_number == 0:
                 return fmt_time(None) if output == 'fmtstr' else None
+            res = self.get_reduction("encoding_time", dataobj=dataobj)
 
-            for _serializer in self:
-                if not serializer_is_compatible_with_dataobj(_serializer, dataobj):
-                    continue
-                if self[_serializer][dataobj] is None:
-                    return fmt_time(None) if output == 'fmtstr' else None
-                if dataobj in self[_serializer] and \
-                   self[_serializer][dataobj] is not None and \
-                   self[_serializer][dataobj].encoding_success:
-                    total += self[_serializer][dataobj].encoding_time
-            if output == "value":
-                res = total
-            elif output == "fmtstr":
-                res = fmt_time(total)
-
-        if res is None:
-            raise WisteriaError("(ERRORID029) Internal error: the result could not be computed. "
-                                f"{serializer=}; {dataobj=}; {output=};")
-        return res
+        if output == "value":
+            return res
+        if output == "fmtstr":
+            return fmt_time(res)
 
+        raise WisteriaError("(ERRORID029) Internal error: the result could not be computed. "
+                            f"{serializer=}; {dataobj=}; {output=};")
+
+    @memoized
     def total_mem_usage(self,
                         serializer=None,
                         dataobj=None,
@@ -1317,48 +1988,60 @@ class SerializationResults(dict):
         assert serializer is None or dataobj is None
         assert output in ('fmtstr', 'value',)
 
-        res = None  # unexpected result !
-        total = 0  # total time
-
         if serializer is not None:
             if self.serializers_total_number == 0:
                 return fmt_mem_usage(None) if output == 'fmtstr' else None
-
-            for _dataobj in self[serializer]:
-                if not serializer_is_compatible_with_dataobj(serializer, _dataobj):
-                    continue
-                if self[serializer][_dataobj] is None:
-                    return fmt_mem_usage(None) if output == 'fmtstr' else None
-                if self[serializer][_dataobj].encoding_success is False:
-                    return fmt_mem_usage(None) if output == 'fmtstr' else None
-
-                if self[serializer][_dataobj] is not None and \
-                   self[serializer][_dataobj].mem_usage:
-                    total += self[serializer][_dataobj].mem_usage
-            if output == "value":
-                res = total
-            elif output == "fmtstr":
-                res = fmt_mem_usage(total)
-
+            res = self.get_reduction("mem_usage", serializer=serializer)
         else:
             if self.dataobjs_number == 0:
                 return fmt_mem_usage(None) if output == 'fmtstr' else None
+            res = self.get_reduction("mem_usage", dataobj=dataobj)
 
-            for _serializer in self:
-                if not serializer_is_compatible_with_dataobj(_serializer, dataobj):
-                    continue
-                if self[_serializer][dataobj] is None:
-                    return fmt_mem_usage(None) if output == 'fmtstr' else None
-                if dataobj in self[_serializer] and \
-                   self[_serializer][dataobj] is not None and \
-                   self[_serializer][dataobj].mem_usage:
-                    total += self[_serializer][dataobj].mem_usage
-            if output == "value":
-                res = total
-            elif output == "fmtstr":
-                res = fmt_mem_usage(total)
-
-        if res is None:
-            raise WisteriaError("(ERRORID025) Internal error: the result could not be computed. "
-                                f"{serializer=}; {dataobj=}; {output=};")
-        return res
+        if output == "value":
+            return res
+        if output == "fmtstr":
+            return fmt_mem_usage(res)
+
+        raise WisteriaError("(ERRORID025) Internal error: the result could not be computed. "
+                            f"{serializer=}; {dataobj=}; {output=};")
+
+    @memoized
+    def total_time_ci95(self,
+                        serializer,
+                        attribute):
+        """
+            SerializationResults.total_time_ci95()
+
+            Compute the 95% confidence interval of the total time <attribute>
+            used by a <serializer>: the bounds are the sums of the bounds of the
+            confidence intervals of each transcoding, the same transcodings being
+            taken into account than in .total_encoding_time() and
+            .total_decoding_time() .
+            _______________________________________________________________
+
+            ARGUMENTS:
+            o  (str)serializer: name of the serializer to be used.
+            o  (str)attribute: 'encoding_time' or
+                               'decoding_time' or
+                               'encoding_plus_decoding_time'
+
+            RETURNED VALUE: (None|((float)low, (float)high))
+                            None if the total time can't be computed.
+        """
+        assert attribute in ('encoding_time',
+                             'decoding_time',
+                             'encoding_plus_decoding_time')
+
+        if self.total_encoding_plus_decoding_time(serializer=serializer,
+                                                  output="value") is None:
+            return None
+
+        intervals = []
+        if attribute != 'decoding_time':
+            intervals.append(self.get_reduction("encoding_time_ci95", serializer=serializer))
+        if attribute != 'encoding_time':
+            intervals.append(self.get_reduction("decoding_time_ci95", serializer=serializer))
+        if None in intervals:
+            return None
+
+        return sum(low for low, _ in intervals), sum(high for _, high in intervals)
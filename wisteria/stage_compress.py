@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/stage_compress.py
+
+    The 'compress' stage (see --stages): the encoded object is compressed then
+    decompressed by each codec, i.e. by zlib (with a compression level from 0
+    to 9: 'zlib0' ... 'zlib9'), bz2 or lzma.
+
+    A str is compressed once encoded in UTF-8; an OutOfBandPickle is compressed
+    as its pickle stream followed by its out-of-band buffers.
+
+    The first codec of STAGES['compress'] is the one used by the hall of fame
+    and by the graphs (see resultsmatrix.py:get_compression_measure()); all the
+    codecs are detailed in report section B8.
+    ___________________________________________________________________________
+
+    o  get_codec_functions(codec)
+    o  measure_compress(adapter, obj, codecs, encoded_object=None, fingerprint="", strictmute=False)
+    o  summarize_compress_stage(results)
+"""
+import functools
+import importlib
+import math
+import statistics
+import zlib
+
+import wisteria.globs
+from wisteria.globs import VERBOSITY_DEBUG
+from wisteria.msg import msgdebug
+from wisteria.serializers_classes import CompressionResult, OutOfBandPickle
+from wisteria.timing import measure_time
+
+
+def get_codec_functions(codec):
+    """
+        get_codec_functions()
+
+        Return the compression and decompression functions of <codec>.
+        _______________________________________________________________________
+
+        ARGUMENT: (str)codec, 'zlib0' ... 'zlib9', 'bz2' or 'lzma'
+
+        RETURNED VALUE: ((callable)compress, (callable)decompress)
+    """
+    if codec.startswith("zlib"):
+        return functools.partial(zlib.compress, level=int(codec[len("zlib"):])), zlib.decompress
+
+    # bz2 and lzma are optional when Python is compiled: ImportError may be raised.
+    module = importlib.import_module(codec)
+    return module.compress, module.decompress
+
+
+def measure_compress(adapter,
+                     obj,
+                     codecs,
+                     encoded_object=None,
+                     fingerprint="",
+                     strictmute=False):
+    """
+        measure_compress()
+
+        The 'compress' stage: measure how <encoded_object> is compressed and
+        decompressed by each codec of <codecs>.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (TranscodingAdapter)adapter
+        o  obj                      : not used since <encoded_object> is given
+        o  (tuple of str)codecs     : see STAGES['compress']
+        o  (bytes|str|OutOfBandPickle)encoded_object: <obj> encoded by adapter.encode()
+        o  (str)fingerprint         : a string describing the operation (usefull to debug)
+        o  (bool)strictmute         : True if no message can be displayed
+
+        RETURNED VALUE: None if the encoded object is neither a bytes, a str nor
+                        an OutOfBandPickle object, a dict [(str)codec] =
+                        CompressionResult otherwise, in the order of <codecs>.
+    """
+    # all stage functions have the same signature:
+    #   pylint: disable=unused-argument
+    if isinstance(encoded_object, OutOfBandPickle):
+        # the out-of-band buffers are compressed with the pickle stream, as if they
+        # were sent after it:
+        data = b"".join((encoded_object.data,
+                         *(memoryview(buffer).cast("B") for buffer in encoded_object.buffers)))
+    elif isinstance(encoded_object, str):
+        data = encoded_object.encode("utf-8")
+    elif isinstance(encoded_object, bytes):
+        data = encoded_object
+    else:
+        return None
+
+    res = {}
+    for codec in codecs:
+        res[codec] = CompressionResult(codec=codec, strlen=len(data))
+
+        # a failure of a stage can't stop the computation of the results,
+        # whatever the exception raised by the codec:
+        #   pylint: disable=broad-except
+        try:
+            compress, decompress = get_codec_functions(codec)
+            compressed = compress(data)
+            if decompress(compressed) != data:
+                continue
+
+            res[codec].compressed_strlen = len(compressed)
+            res[codec].compression_timestats = measure_time(compress, data)
+            res[codec].decompression_timestats = measure_time(decompress, compressed)
+            res[codec].success = True
+        except Exception as error:
+            if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+                msgdebug(f"[{fingerprint}] '{adapter.module}': compress stage failed "
+                         f"({codec=}; {error})")
+            res[codec] = CompressionResult(codec=codec, strlen=len(data))
+
+    return res
+
+
+def summarize_compress_stage(results):
+    """
+        summarize_compress_stage()
+
+        Gather the results of the 'compress' stage, serializer by serializer and
+        codec by codec.
+        _______________________________________________________________________
+
+        ARGUMENT:
+        o  results: (SerializationResults)a dict of
+                    [(str)serializer][(str)data_name] = SerializationResult
+
+        RETURNED VALUE: a dict [(str)serializer][(str)codec] =
+                        {"success": (int)number of successful dataobjs,
+                         "total": (int)number of dataobjs,
+                         "strlen": (int)Σ encoded string lengths,
+                         "compressed_strlen": (int)Σ compressed string lengths,
+                         "ratio": (None|float)geometric mean of the compression
+                                  ratios (compressed/encoded string length),
+                         "compression_time": (float)Σ compression times, in seconds,
+                         "decompression_time": (float)Σ decompression times, in seconds}
+                        Only the successful dataobjs are taken into account by the
+                        sums and by the mean.
+    """
+    res = {}
+    for serializer in results.serializers:
+        for data_name in results[serializer]:
+            result = results[serializer][data_name]
+            if result is None or "compress" not in result.stages:
+                continue
+            for codec, compressionresult in result.stages["compress"].items():
+                summary = res.setdefault(serializer, {}).setdefault(
+                    codec,
+                    {"success": 0, "total": 0, "strlen": 0, "compressed_strlen": 0,
+                     "ratio": [], "compression_time": 0, "decompression_time": 0})
+                summary["total"] += 1
+                if not compressionresult.success:
+                    continue
+                summary["success"] += 1
+                summary["strlen"] += compressionresult.strlen
+                summary["compressed_strlen"] += compressionresult.compressed_strlen
+                summary["ratio"].append(
+                    math.log(compressionresult.compressed_strlen / compressionresult.strlen))
+                summary["compression_time"] += compressionresult.compression_timestats.median
+                summary["decompression_time"] += compressionresult.decompression_timestats.median
+
+    for serializer_summaries in res.values():
+        for summary in serializer_summaries.values():
+            summary["ratio"] = math.exp(statistics.fmean(summary["ratio"])) \
+                if summary["ratio"] else None
+
+    return res
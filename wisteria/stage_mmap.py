@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/stage_mmap.py
+
+    The 'mmap' stage (see --stages): the encoded object is written into a
+    temp file (see utils.py:get_stage_tmpfilename()) and decoded from a
+    memoryview of this file mapped in memory by mmap.mmap().
+
+    Serializers able to decode any bytes-like object (adapter.decode_buffer,
+    e.g. pickle and marshal) directly read the mmap-backed buffer; the other
+    ones are given a bytes copy of the buffer (a str one for the serializers
+    encoding into str).
+
+    Each write opens, writes and closes the file (with os.fsync() if the
+    'fsync' parameter has been given); each decoding opens the file, maps it,
+    decodes it and closes it.
+
+    The decoder is said to have copied the buffer if it hasn't read it directly
+    or if decoding from the mmap-backed buffer temporarily allocated (see
+    memprobe.py:probe_tracemalloc()) at least as many bytes as the buffer's
+    length more than decoding from the encoded object itself.
+    ___________________________________________________________________________
+
+    o  decode_from_mmap(adapter, filename, textencoded)
+    o  decode_view(adapter, view, textencoded)
+    o  measure_mmap(adapter, obj, parameters, encoded_object=None, fingerprint="", strictmute=False)
+    o  summarize_mmap_stage(results)
+    o  transient_memory(func)
+    o  write_file(filename, data, fsync)
+"""
+import functools
+import mmap
+import os
+
+import wisteria.globs
+from wisteria.globs import VERBOSITY_DEBUG
+from wisteria.msg import msgdebug
+from wisteria.serializers_classes import MmapResult
+from wisteria.timing import measure_time
+from wisteria.memprobe import probe_tracemalloc
+from wisteria.utils import get_stage_tmpfilename
+
+
+def decode_from_mmap(adapter,
+                     filename,
+                     textencoded):
+    """
+        decode_from_mmap()
+
+        Decode the object written into <filename> from a memoryview of this file
+        mapped in memory.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (TranscodingAdapter)adapter
+        o  (str)filename            : file written by write_file()
+        o  (bool)textencoded        : True if the serializer encodes into str
+
+        RETURNED VALUE: the decoded object
+    """
+    with open(filename, "rb") as datafile, \
+         mmap.mmap(datafile.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+         memoryview(mapped) as view:
+        return decode_view(adapter, view, textencoded)
+
+
+def decode_view(adapter,
+                view,
+                textencoded):
+    """
+        decode_view()
+
+        Decode the object stored in <view>, directly if the serializer can read
+        a buffer, from a copy of <view> otherwise.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (TranscodingAdapter)adapter
+        o  (memoryview)view
+        o  (bool)textencoded        : True if the serializer encodes into str
+
+        RETURNED VALUE: the decoded object
+    """
+    if adapter.decode_buffer is not None:
+        return adapter.decode_buffer(view)
+
+    data = bytes(view)
+    if textencoded:
+        data = str(data, "utf-8")
+    return adapter.decode(data)
+
+
+def measure_mmap(adapter,
+                 obj,
+                 parameters,
+                 encoded_object=None,
+                 fingerprint="",
+                 strictmute=False):
+    """
+        measure_mmap()
+
+        The 'mmap' stage: measure how <encoded_object> is written into a file
+        and decoded from a mmap-backed buffer.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (TranscodingAdapter)adapter
+        o  obj                      : not used since <encoded_object> is given
+        o  (tuple of str)parameters : see STAGES['mmap']
+        o  (bytes|str)encoded_object: <obj> encoded by adapter.encode()
+        o  (str)fingerprint         : a string describing the operation (usefull to debug)
+        o  (bool)strictmute         : True if no message can be displayed
+
+        RETURNED VALUE: None if the encoded object is neither a bytes nor a str
+                        object, a MmapResult object otherwise.
+    """
+    # all stage functions have the same signature:
+    #   pylint: disable=unused-argument
+    if not isinstance(encoded_object, (bytes, str)):
+        # e.g. OutOfBandPickle: there's no single buffer to be written
+        return None
+
+    textencoded = isinstance(encoded_object, str)
+    data = encoded_object.encode("utf-8") if textencoded else encoded_object
+    res = MmapResult(strlen=len(data),
+                     buffer_decoding=adapter.decode_buffer is not None)
+    filename = get_stage_tmpfilename("mmap")
+
+    # a failure of a stage can't stop the computation of the results,
+    # whatever the exception raised by the serializer or by mmap:
+    #   pylint: disable=broad-except
+    try:
+        write_file(filename, data, "fsync" in parameters)
+        decode_from_mmap(adapter, filename, textencoded)
+
+        res.write_timestats = measure_time(write_file, filename, data, "fsync" in parameters)
+        res.decode_timestats = measure_time(decode_from_mmap, adapter, filename, textencoded)
+
+        res.copied = True
+        if res.buffer_decoding:
+            with open(filename, "rb") as datafile, \
+                 mmap.mmap(datafile.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                 memoryview(mapped) as view:
+                mmap_transient = transient_memory(
+                    functools.partial(decode_view, adapter, view, textencoded))
+            res.copied = mmap_transient - transient_memory(
+                functools.partial(adapter.decode, encoded_object)) >= res.strlen
+
+        res.success = True
+    except Exception as error:
+        if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+            msgdebug(f"[{fingerprint}] '{adapter.module}': mmap stage failed ({error})")
+        res = MmapResult(strlen=res.strlen, buffer_decoding=res.buffer_decoding)
+    finally:
+        if os.path.exists(filename):
+            os.remove(filename)
+
+    return res
+
+
+def summarize_mmap_stage(results):
+    """
+        summarize_mmap_stage()
+
+        Gather the results of the 'mmap' stage, serializer by serializer.
+        _______________________________________________________________________
+
+        ARGUMENT:
+        o  results: (SerializationResults)a dict of
+                    [(str)serializer][(str)data_name] = SerializationResult
+
+        RETURNED VALUE: a dict [(str)serializer] =
+                        {"success": (int)number of successful dataobjs,
+                         "total": (int)number of dataobjs,
+                         "buffer_decoding": (bool)True if the decoder reads the buffer,
+                         "copied": (int)number of successful dataobjs whose buffer
+                                   has been copied by the decoder,
+                         "write_time": (float)Σ write times, in seconds,
+                         "decode_time": (float)Σ mmap-decode times, in seconds,
+                         "memory_decode_time": (float)Σ decode times of the encoded
+                                               objects themselves (see transcode()),
+                                               in seconds}
+                        Only the successful dataobjs are taken into account by the
+                        sums.
+    """
+    res = {}
+    for serializer in results.serializers:
+        for data_name in results[serializer]:
+            result = results[serializer][data_name]
+            if result is None or "mmap" not in result.stages:
+                continue
+            mmapresult = result.stages["mmap"]
+            summary = res.setdefault(
+                serializer,
+                {"success": 0, "total": 0, "buffer_decoding": mmapresult.buffer_decoding,
+                 "copied": 0, "write_time": 0, "decode_time": 0, "memory_decode_time": 0})
+            summary["total"] += 1
+            if not mmapresult.success:
+                continue
+            summary["success"] += 1
+            summary["copied"] += mmapresult.copied
+            summary["write_time"] += mmapresult.write_timestats.median
+            summary["decode_time"] += mmapresult.decode_timestats.median
+            summary["memory_decode_time"] += result.decoding_time
+
+    return res
+
+
+def transient_memory(func):
+    """
+        transient_memory()
+
+        Return the memory temporarily allocated by func(), i.e. allocated during
+        the call but not used anymore after it.
+        _______________________________________________________________________
+
+        ARGUMENT: (callable)func: function without argument
+
+        RETURNED VALUE: (int)peak-net memory, in bytes
+    """
+    usage = probe_tracemalloc(func)
+    return usage.peak - usage.net
+
+
+def write_file(filename,
+               data,
+               fsync):
+    """
+        write_file()
+
+        Write <data> into <filename>.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (str)filename
+        o  (bytes)data
+        o  (bool)fsync              : True if os.fsync() has to be called before
+                                      the file is closed
+    """
+    with open(filename, "wb") as datafile:
+        datafile.write(data)
+        if fsync:
+            datafile.flush()
+            os.fsync(datafile.fileno())
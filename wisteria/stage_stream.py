@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/stage_stream.py
+
+    The 'stream' stage (see --stages): the object is written by dump(obj, fp)
+    and read back by load(fp) through each medium:
+
+    * 'bytesio': an io.BytesIO object, without any buffer in between;
+    * 'file'   : a temporary file, through an io.BufferedWriter;
+    * 'pipe'   : an os.pipe() through an io.BufferedWriter, the other end being
+                 drained (dump) or fed (load) by another thread.
+
+    Text serializers (json, pyyaml) write through an io.TextIOWrapper(encoding="utf-8",
+    write_through=True).
+
+    Each call opens a new medium and closes it: the measured times include the
+    opening and the closing of the medium, which cost the same thing whatever
+    the serializer.
+
+    The time-to-first-byte is the time between the call to dump() and the first
+    bytes given by the serializer to the file object, before any buffer: a
+    serializer writing the whole object at once (e.g. marshal) has the same
+    time-to-first-byte and dump time.
+
+    If the object is a list or a tuple and if the serializer can do it (JSON
+    Lines, yaml dump_all(), Ion streams), its items are also written as a
+    stream of documents ('multidoc').
+    ___________________________________________________________________________
+
+    o  ByteCounter class
+    o  drain_pipe(readfd)
+    o  dump_into(medium, dump, obj, textstream, filename)
+    o  feed_pipe(writefd, data)
+    o  load_from(medium, load, data, textstream, filename)
+    o  measure_stream(adapter, obj, media, encoded_object=None, fingerprint="", strictmute=False)
+    o  measure_stream_medium(medium, multidoc, dump, load, obj, textstream, filename)
+    o  summarize_stream_stage(results)
+"""
+import io
+import os
+import statistics
+import threading
+import time
+
+import wisteria.globs
+from wisteria.globs import VERBOSITY_DEBUG
+from wisteria.msg import msgdebug
+from wisteria.serializers_classes import StreamResult
+from wisteria.timing import measure_time
+from wisteria.memprobe import measure_memory
+from wisteria.utils import get_stage_tmpfilename
+
+
+# size of the chunks read from/written into a pipe by drain_pipe()/feed_pipe():
+PIPE_CHUNKSIZE = 65536
+
+
+class ByteCounter(io.RawIOBase):
+    """
+        ByteCounter class
+
+        Raw binary stream given to the serializer (through an io.TextIOWrapper
+        for the text serializers): count the bytes written and note when the
+        first one has been written. Closing a ByteCounter doesn't close <sink>.
+        _______________________________________________________________________
+
+        instance attributes:
+
+        o  (file object)sink        : the medium or its buffer
+        o  (int)strlen              : number of bytes written
+        o  (None|float)dump_start   : time.perf_counter() when dump() has been
+                                      called, set by dump_into()
+        o  (None|float)first_write  : time.perf_counter() when the first byte
+                                      has been written
+        o  (None|float)dump_end     : time.perf_counter() when dump() has
+                                      returned, set by dump_into()
+
+        methods:
+
+        o  __init__(self, sink)
+        o  writable(self)
+        o  write(self, data)
+    """
+    def __init__(self,
+                 sink):
+        """
+            ByteCounter.__init__()
+            ___________________________________________________________________
+
+            ARGUMENT: (file object)sink, the medium or its buffer
+        """
+        super().__init__()
+        self.sink = sink
+        self.strlen = 0
+        self.dump_start = None
+        self.first_write = None
+        self.dump_end = None
+
+    def writable(self):
+        """
+            ByteCounter.writable()
+        """
+        return True
+
+    def write(self,
+              data):
+        """
+            ByteCounter.write()
+
+            Write <data> into <sink>.
+            ___________________________________________________________________
+
+            ARGUMENT: (bytes-like object)data
+
+            RETURNED VALUE: (int)the number of bytes written
+        """
+        if self.first_write is None and len(data):
+            self.first_write = time.perf_counter()
+        self.sink.write(data)
+        self.strlen += len(data)
+        return len(data)
+
+
+def drain_pipe(readfd):
+    """
+        drain_pipe()
+
+        Read (and forget) everything written into the pipe whose read end is
+        <readfd>, until the write end is closed.
+        _______________________________________________________________________
+
+        ARGUMENT: (int)readfd
+    """
+    with open(readfd, "rb", buffering=0) as pipe:
+        while pipe.read(PIPE_CHUNKSIZE):
+            pass
+
+
+def dump_into(medium,
+              dump,
+              obj,
+              textstream,
+              filename):
+    """
+        dump_into()
+
+        Write <obj> by dump(obj, fp) into a new <medium>.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (str)medium              : 'bytesio', 'file' or 'pipe'
+        o  (callable)dump           : dump(obj, fp)
+        o  obj                      : the object to be written
+        o  (bool)textstream         : True if <fp> has to be a text file object
+        o  (str)filename            : file used if <medium> is 'file'
+
+        RETURNED VALUE: ((ByteCounter)counter, (None|bytes)data), <data> being
+                        what has been written if <medium> is 'bytesio'.
+    """
+    drain = None
+    if medium == "bytesio":
+        sink = io.BytesIO()
+        buffered = sink
+    elif medium == "file":
+        # pylint: disable=consider-using-with
+        sink = open(filename, "wb", buffering=0)
+        buffered = io.BufferedWriter(sink)
+    else:
+        readfd, writefd = os.pipe()
+        drain = threading.Thread(target=drain_pipe, args=(readfd,), daemon=True)
+        drain.start()
+        # pylint: disable=consider-using-with
+        sink = open(writefd, "wb", buffering=0)
+        buffered = io.BufferedWriter(sink)
+
+    counter = ByteCounter(buffered)
+    fp = counter
+    if textstream:
+        fp = io.TextIOWrapper(counter, encoding="utf-8", write_through=True)
+
+    data = None
+    try:
+        counter.dump_start = time.perf_counter()
+        dump(obj, fp)
+        counter.dump_end = time.perf_counter()
+        fp.flush()
+        buffered.flush()
+        if medium == "bytesio":
+            data = sink.getvalue()
+    finally:
+        try:
+            fp.close()
+            buffered.close()
+        finally:
+            sink.close()
+            if drain is not None:
+                drain.join()
+
+    return counter, data
+
+
+def feed_pipe(writefd,
+              data):
+    """
+        feed_pipe()
+
+        Write <data> into the pipe whose write end is <writefd>, then close it.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (int)writefd
+        o  (bytes)data
+    """
+    try:
+        with open(writefd, "wb", buffering=0) as pipe:
+            view = memoryview(data)
+            for index in range(0, len(view), PIPE_CHUNKSIZE):
+                pipe.write(view[index:index+PIPE_CHUNKSIZE])
+    except BrokenPipeError:
+        # load() didn't read everything:
+        pass
+
+
+def load_from(medium,
+              load,
+              data,
+              textstream,
+              filename):
+    """
+        load_from()
+
+        Read by load(fp) an object from a new <medium> containing <data>.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (str)medium              : 'bytesio', 'file' or 'pipe'
+        o  (callable)load           : load(fp)
+        o  (bytes)data              : what has been written by dump_into()
+        o  (bool)textstream         : True if <fp> has to be a text file object
+        o  (str)filename            : file used if <medium> is 'file'; it must
+                                      already contain <data>.
+
+        RETURNED VALUE: the object returned by load()
+    """
+    feeder = None
+    if medium == "bytesio":
+        fp = io.BytesIO(data)
+    elif medium == "file":
+        # pylint: disable=consider-using-with
+        fp = open(filename, "rb")
+    else:
+        readfd, writefd = os.pipe()
+        feeder = threading.Thread(target=feed_pipe, args=(writefd, data), daemon=True)
+        feeder.start()
+        # pylint: disable=consider-using-with
+        fp = open(readfd, "rb")
+
+    if textstream:
+        fp = io.TextIOWrapper(fp, encoding="utf-8")
+
+    try:
+        return load(fp)
+    finally:
+        try:
+            fp.close()
+        finally:
+            if feeder is not None:
+                feeder.join()
+
+
+def measure_stream(adapter,
+                   obj,
+                   media,
+                   encoded_object=None,
+                   fingerprint="",
+                   strictmute=False):
+    """
+        measure_stream()
+
+        The 'stream' stage: measure how <obj> is written into/read back from
+        each medium of <media> by the stream functions of <adapter>.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (TranscodingAdapter)adapter
+        o  obj                      : the object to be written
+        o  (tuple of str)media      : see STAGES['stream']
+        o  encoded_object           : not used since dump() encodes <obj> itself
+        o  (str)fingerprint         : a string describing the operation (usefull to debug)
+        o  (bool)strictmute         : True if no message can be displayed
+
+        RETURNED VALUE: None if the serializer has no stream functions,
+                        a dict [((str)medium, (bool)multidoc)] = StreamResult otherwise.
+    """
+    # all stage functions have the same signature:
+    #   pylint: disable=unused-argument
+    if adapter.dump is None or adapter.load is None:
+        return None
+
+    # (multidoc, dump, load, expected object)
+    modes = [(False, adapter.dump, adapter.load, obj)]
+    if isinstance(obj, (list, tuple)) and adapter.dump_all is not None:
+        modes.append((True, adapter.dump_all, adapter.load_all, list(obj)))
+
+    res = {}
+    filename = get_stage_tmpfilename("stream")
+    try:
+        for multidoc, dump, load, expected in modes:
+            for medium in media:
+                # a failure of a stage can't stop the computation of the results,
+                # whatever the exception raised by the serializer or by the medium:
+                #   pylint: disable=broad-except
+                try:
+                    res[(medium, multidoc)] = measure_stream_medium(
+                        medium=medium,
+                        multidoc=multidoc,
+                        dump=dump,
+                        load=load,
+                        obj=expected,
+                        textstream=adapter.textstream,
+                        filename=filename)
+                except Exception as error:
+                    if not strictmute and wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+                        msgdebug(f"[{fingerprint}] '{adapter.module}': stream stage failed "
+                                 f"({medium=}; {multidoc=}; {error})")
+                    res[(medium, multidoc)] = StreamResult(medium=medium, multidoc=multidoc)
+    finally:
+        if os.path.exists(filename):
+            os.remove(filename)
+
+    return res
+
+
+def measure_stream_medium(medium,
+                          multidoc,
+                          dump,
+                          load,
+                          obj,
+                          textstream,
+                          filename):
+    """
+        measure_stream_medium()
+
+        Measure how <obj> is written by dump(obj, fp) into <medium> and read
+        back by load(fp).
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (str)medium              : 'bytesio', 'file' or 'pipe'
+        o  (bool)multidoc           : True if <dump> writes a stream of documents
+        o  (callable)dump           : dump(obj, fp)
+        o  (callable)load           : load(fp)
+        o  obj                      : the object to be written
+        o  (bool)textstream         : True if <fp> has to be a text file object
+        o  (str)filename            : file used if <medium> is 'file'
+
+        RETURNED VALUE: a StreamResult object
+    """
+    res = StreamResult(medium=medium, multidoc=multidoc)
+
+    # ---- untimed dump/load --------------------------------------------------
+    counter, data = dump_into("bytesio", dump, obj, textstream, filename)
+    if counter.strlen == 0 or load_from("bytesio", load, data, textstream, filename) != obj:
+        return res
+    res.strlen = counter.strlen
+    with open(filename, "wb") as datafile:
+        datafile.write(data)
+
+    # ---- time-to-first-byte -------------------------------------------------
+    method = wisteria.globs.METHOD or wisteria.globs.METHOD_DEFAULTS
+    ttfb = []
+    for _ in range(method["repeat"]):
+        counter, _ = dump_into(medium, dump, obj, textstream, filename)
+        ttfb.append(counter.first_write - counter.dump_start)
+    res.ttfb = statistics.median(ttfb)
+
+    # ---- times and memory ---------------------------------------------------
+    res.dump_timestats = measure_time(dump_into, medium, dump, obj, textstream, filename)
+    res.mem_peak = measure_memory(dump_into, medium, dump, obj, textstream, filename).peak
+
+    # dump_into() has written <data> into <filename>:
+    res.load_timestats = measure_time(load_from, medium, load, data, textstream, filename)
+
+    res.success = True
+    return res
+
+
+def summarize_stream_stage(results):
+    """
+        summarize_stream_stage()
+
+        Gather the results of the 'stream' stage, serializer by serializer and
+        medium by medium.
+        _______________________________________________________________________
+
+        ARGUMENT:
+        o  results: (SerializationResults)a dict of
+                    [(str)serializer][(str)data_name] = SerializationResult
+
+        RETURNED VALUE: a dict [(str)serializer][((str)medium, (bool)multidoc)] =
+                        {"success": (int)number of successful dataobjs,
+                         "total": (int)number of dataobjs,
+                         "dump_time": (float)Σ dump times, in seconds,
+                         "load_time": (float)Σ load times, in seconds,
+                         "ttfb": (None|float)median of the time-to-first-byte,
+                         "throughput": (None|float)Σ bytes / Σ (dump+load) times,
+                                       in MB/s,
+                         "mem_peak": (None|int)max of the dump peak memory, in bytes}
+                        Only the successful dataobjs are taken into account by the
+                        sums, the median and the max.
+    """
+    res = {}
+    for serializer in results.serializers:
+        for data_name in results[serializer]:
+            result = results[serializer][data_name]
+            if result is None or "stream" not in result.stages:
+                continue
+            for key, streamresult in result.stages["stream"].items():
+                summary = res.setdefault(serializer, {}).setdefault(
+                    key,
+                    {"success": 0, "total": 0, "dump_time": 0, "load_time": 0,
+                     "ttfb": [], "strlen": 0, "mem_peak": None})
+                summary["total"] += 1
+                if not streamresult.success:
+                    continue
+                summary["success"] += 1
+                summary["dump_time"] += streamresult.dump_timestats.median
+                summary["load_time"] += streamresult.load_timestats.median
+                summary["ttfb"].append(streamresult.ttfb)
+                summary["strlen"] += streamresult.strlen
+                if streamresult.mem_peak is not None:
+                    summary["mem_peak"] = max(summary["mem_peak"] or 0, streamresult.mem_peak)
+
+    for serializer_summaries in res.values():
+        for summary in serializer_summaries.values():
+            summary["ttfb"] = statistics.median(summary["ttfb"]) if summary["ttfb"] else None
+            time_ = summary["dump_time"] + summary["load_time"]
+            summary["throughput"] = summary.pop("strlen") / time_ / 10**6 if time_ else None
+
+    return res
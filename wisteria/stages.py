@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/stages.py
+
+    Extra stages (see --stages) measured by serializers.py:transcode() after
+    the transcoding itself. Each stage has its own module (stage_xxx.py) whose
+    main function is registered in STAGE_FUNCTIONS.
+    ___________________________________________________________________________
+
+    o  run_stages(adapter, obj, encoded_object, fingerprint="", strictmute=False)
+"""
+import wisteria.globs
+from wisteria.stage_compress import measure_compress
+from wisteria.stage_mmap import measure_mmap
+from wisteria.stage_stream import measure_stream
+
+
+# stage name > function(adapter, obj, parameters, encoded_object, fingerprint, strictmute)
+#              returning None if the stage can't be measured for this serializer.
+STAGE_FUNCTIONS = {
+    "compress": measure_compress,
+    "mmap": measure_mmap,
+    "stream": measure_stream,
+}
+
+
+def run_stages(adapter,
+               obj,
+               encoded_object,
+               fingerprint="",
+               strictmute=False):
+    """
+        run_stages()
+
+        Measure each stage of wisteria.globs.STAGES for <obj>.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (TranscodingAdapter)adapter
+        o  obj                      : the object to be serialized
+        o  (bytes|str)encoded_object: <obj> encoded by adapter.encode()
+        o  (str)fingerprint         : a string describing the operation (usefull to debug)
+        o  (bool)strictmute         : True if no message can be displayed
+
+        RETURNED VALUE: (dict)[(str)stage] = what is returned by the stage function;
+                        a stage that can't be measured for this serializer is missing.
+    """
+    res = {}
+    for stage, parameters in wisteria.globs.STAGES.items():
+        stage_result = STAGE_FUNCTIONS[stage](adapter,
+                                              obj,
+                                              parameters,
+                                              encoded_object=encoded_object,
+                                              fingerprint=fingerprint,
+                                              strictmute=strictmute)
+        if stage_result is not None:
+            res[stage] = stage_result
+    return res
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+################################################################################
+#    Wisteria Copyright (C) 2021 suizokukan
+#    Contact: suizokukan _A.T._ orange dot fr
+#
+#    This file is part of Wisteria.
+#    Wisteria is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Wisteria is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Wisteria.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+"""
+    Wisteria project : wisteria/timing.py
+
+    Time measurement engine: warm-up calls, calibration of the number of calls
+    per sample, repeated samples and statistics about these samples.
+
+    Like timeit, the garbage collector is disabled while the samples are taken.
+    ___________________________________________________________________________
+
+    o  compute_timingstats(samples, loops)
+    o  measure_time(func, *args, **kwargs)
+    o  timeloop(func, loops)
+"""
+import functools
+import gc
+import itertools
+import math
+import statistics
+import time
+
+import wisteria.globs
+from wisteria.serializers_classes import TimingStats
+
+
+# z-value of the 95% confidence interval:
+Z95 = 1.96
+
+
+def compute_timingstats(samples,
+                        loops):
+    """
+        compute_timingstats()
+
+        Compute the statistics about <samples>.
+
+        The confidence interval of the median is distribution-free: its bounds
+        are the order statistics of rank n/2 -/+ 1.96*sqrt(n)/2 .
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (list of float)samples: time (in seconds) of ONE call, for each sample
+        o  (int)loops            : number of calls per sample
+
+        RETURNED VALUE: a TimingStats object
+    """
+    sortedsamples = sorted(samples)
+    number = len(sortedsamples)
+
+    delta = Z95*math.sqrt(number)/2
+    ci_low = sortedsamples[max(0, math.floor(number/2-delta))]
+    ci_high = sortedsamples[min(number-1, math.ceil(number/2+delta)-1)]
+
+    return TimingStats(samples=tuple(samples),
+                       loops=loops,
+                       min=sortedsamples[0],
+                       median=statistics.median(sortedsamples),
+                       mean=statistics.fmean(sortedsamples),
+                       stddev=statistics.stdev(sortedsamples) if number > 1 else 0.0,
+                       p95=sortedsamples[min(number-1, math.ceil(0.95*number)-1)],
+                       ci95=(ci_low, ci_high))
+
+
+def measure_time(func,
+                 *args,
+                 **kwargs):
+    """
+        measure_time()
+
+        Measure the time of a call to func(*args, **kwargs), following
+        wisteria.globs.METHOD:
+            (1) METHOD['warmup'] calls are made and not measured;
+            (2) if METHOD['timeitnumber'] is None, the number of calls per sample is
+                calibrated (1, 2, 5, 10, 20, 50, ...) until a sample lasts at least
+                METHOD['mintime'] seconds;
+            (3) METHOD['repeat'] samples are measured.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (callable)func
+        o  *args, **kwargs: arguments given to <func>
+
+        RETURNED VALUE: a TimingStats object, each value being the time of ONE call.
+    """
+    method = wisteria.globs.METHOD or wisteria.globs.METHOD_DEFAULTS
+    if kwargs:
+        func = functools.partial(func, *args, **kwargs)
+    elif args:
+        func = functools.partial(func, *args)
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        # (1) warm-up
+        if method["warmup"]:
+            timeloop(func, method["warmup"])
+
+        # (2) calibration
+        loops = method["timeitnumber"]
+        if loops is None:
+            loops = 1
+            for multiplier in itertools.cycle((2, 2.5, 2)):
+                if timeloop(func, loops) >= method["mintime"]:
+                    break
+                loops = int(loops*multiplier)
+
+        # (3) samples
+        samples = [timeloop(func, loops)/loops for _ in range(method["repeat"])]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return compute_timingstats(samples, loops)
+
+
+def timeloop(func,
+             loops):
+    """
+        timeloop()
+
+        Call <loops> times func() and return the time spent in these calls.
+
+        The loop avoids any overhead but the iteration itself.
+        _______________________________________________________________________
+
+        ARGUMENTS:
+        o  (callable)func: function without argument
+        o  (int)loops
+
+        RETURNED VALUE: (float)the time spent, in seconds.
+    """
+    _timer = time.perf_counter
+    iterator = itertools.repeat(None, loops)
+    time0 = _timer()
+    for _ in iterator:
+        func()
+    return _timer() - time0
@@ -28,6 +28,8 @@
 
     o  get_missing_required_internal_modules()
     o  get_python_version()
+    o  get_stage_tmpfilename(stage)
+    o  nonnegative_int(string)
     o  normpath(path)
     o  pimydocstr2str(source, replacements=None)
     o  shortenedstr(string, maximallength)
@@ -37,6 +39,7 @@
 # BEWARE! Please use only verby basic imports since this file is used in
 # "step A" section of the program, where no third-party libraries may
 # be used.
+import argparse
 import hashlib
 import importlib
 import os
@@ -73,6 +76,46 @@ def get_python_version():
     return sys.version.replace(chr(0x0A), '- ')
 
 
+def get_stage_tmpfilename(stage):
+    """
+        get_stage_tmpfilename()
+
+        Return the name of the temp file used by <stage> (see --stages) in the
+        current process: the jobs being run in parallel, each process has its
+        own file, derived from wisteria.globs.TMPFILENAME. Such files are
+        removed by the stage itself and, at the latest, at the end of the
+        program (see exit_handler()).
+        ________________________________________________________________________
+
+        PARAMETER : (str)stage
+
+        RETURNED VALUE : (str)the temp file name
+    """
+    return f"{wisteria.globs.TMPFILENAME}.{stage}.{os.getpid()}"
+
+
+def nonnegative_int(string):
+    """
+        nonnegative_int()
+
+        argparse type of the command line arguments expecting an integer >= 0
+        (e.g. --jobs).
+        _______________________________________________________________________
+
+        PARAMETER : (str)string, the command line argument
+
+        RETURNED VALUE : (int)the converted <string>
+    """
+    try:
+        res = int(string)
+    except ValueError:
+        res = None
+    if res is None or res < 0:
+        raise argparse.ArgumentTypeError(
+            f"(ERRORID084) '{string}' isn't an integer greater than or equal to 0.")
+    return res
+
+
 def normpath(path):
     """
         normpath()
@@ -37,7 +37,7 @@
     ⋅- (B/07) msgxxx() functions can be used
     ⋅- (B/08) check STR2REPORTSECTION_KEYS and STR2REPORTSECTION
     ⋅- (B/09) project name & version
-    ⋅- (B/10) ARGS.report interpretation
+    ⋅- (B/10) ARGS.report/method/cache/exportresults/history/comparewith/stages/sandbox/budget
     ⋅- (B/11) exit handler installation
     ⋅- (B/12) serializers import
     ⋅- (B/13) temp file opening
@@ -53,7 +53,8 @@
     ⋅       - (C/18.3) main(): config file reading
     ⋅       - (C/18.4) main(): PLANNED_TRANSCODINGS initialization
     ⋅       - (C/18.5) main(): results computing
-    ⋅       - (C/18.6) main(): report
+    ⋅       - (C/18.6) main(): history
+    ⋅       - (C/18.7) main(): report
     ⋅
     ⋅step D: exit_handler()
     ⋅- (D/01) exported report
@@ -84,6 +85,15 @@
     ⋅*    4: error, missing required module
     ⋅*    5: error: an inconsistency between the data has been detected
     ⋅*    6: error: can't open/create report file
+    ⋅*    7: error, ill-formed --method string
+    ⋅*    8: error, ill-formed --cache string
+    ⋅*    9: error, ill-formed --exportresults string
+    ⋅*   10: error, ill-formed --history string
+    ⋅*   11: error, ill-formed --comparewith string
+    ⋅*   12: a regression has been found by --comparewith
+    ⋅*   13: error, ill-formed --stages string
+    ⋅*   14: error, ill-formed --sandbox string
+    ⋅*   15: error, ill-formed --budget string
     ⋅*  100: internal error, data can't be loaded
     ⋅*  101: internal error, an error occured while computing the results
     ⋅*  102: internal error, an error occured in main()
@@ -100,6 +110,7 @@
 # not installed.
 import argparse
 import atexit
+import glob
 import os
 import os.path
 import sys
@@ -112,11 +123,14 @@ import sys
 # not installed.
 #   pylint: disable=wrong-import-position
 #   pylint: disable=wrong-import-order
-from wisteria.utils import normpath, get_python_version
+from wisteria.utils import normpath, get_python_version, nonnegative_int
 from wisteria.aboutproject import __projectname__, __version__
 from wisteria.helpmsg import help_graphsfilenames, help_cmdline_helpdescription
 from wisteria.helpmsg import help_cmdline_filter, help_cmdline_exportreport, help_cmdline_output
-from wisteria.helpmsg import help_cmdline_cmp, help_cmdline_report
+from wisteria.helpmsg import help_cmdline_cmp, help_cmdline_report, help_cmdline_method
+from wisteria.helpmsg import help_cmdline_budget, help_cmdline_cache, help_cmdline_exportresults
+from wisteria.helpmsg import help_cmdline_comparewith, help_cmdline_history
+from wisteria.helpmsg import help_cmdline_sandbox, help_cmdline_stages
 from wisteria.globs import DEFAULT_REPORTFILE_NAME
 from wisteria.globs import VERBOSITY_MINIMAL, VERBOSITY_NORMAL, VERBOSITY_DETAILS, VERBOSITY_DEBUG
 from wisteria.globs import REPORT_SHORTCUTS
@@ -135,6 +149,57 @@ PARSER = \
         add_help=False,
         formatter_class=argparse.ArgumentDefaultsHelpFormatter)
 
+# (pimydoc)command line help for --budget(full version)
+# ⋅A string like 'key=value;key=value' limiting the time spent computing
+# ⋅the transcodings:
+# ⋅- default value: "none", i.e. no limit, the transcodings being computed
+# ⋅  in the order of PLANNED_TRANSCODINGS
+# ⋅
+# ⋅Accepted keys are (default values between brackets):
+# ⋅* 'total': wall-clock budget, in seconds, of all the transcodings [no limit].
+# ⋅  Once it is exhausted, the transcodings computed by other processes (see
+# ⋅  --jobs and --sandbox) are killed and the remaining ones aren't computed:
+# ⋅  their results are marked 'budget' in report sections B1a and B2a and the
+# ⋅  reports are written from the partial results.
+# ⋅* 'order': 'cheapest' to compute first the transcodings of the smallest data
+# ⋅  objects, all serializers in turn, or 'planned' [cheapest]
+# ⋅
+# ⋅The timeout of each transcoding is set by --sandbox.
+# ⋅
+# ⋅e.g. --budget="total=600"
+# ⋅     --budget="total=300;order=planned"
+PARSER.add_argument(
+    '--budget',
+    action='store',
+    default="none",
+    help=help_cmdline_budget(details=False))
+
+# (pimydoc)command line help for --cache(full version)
+# ⋅A string like 'mode;key=value;key=value' describing how the results
+# ⋅are stored in the cache file, a SQLite database created in the
+# ⋅report directory. Accepted modes are:
+# ⋅* 'off': the cache is neither read nor written;
+# ⋅* 'use': the results found in the cache are not computed again, the
+# ⋅  other ones are computed and written into the cache;
+# ⋅* 'refresh': all results are computed and written into the cache.
+# ⋅
+# ⋅A cached result is only used if the serializer (name and version), the
+# ⋅data object content, the Python version, the machine and --method are
+# ⋅the same.
+# ⋅
+# ⋅Accepted keys are (default values between brackets):
+# ⋅* 'maxage': results older than 'maxage' days are removed [30]
+# ⋅* 'maxsize': if the cache file is bigger than 'maxsize' MB, the oldest
+# ⋅  results are removed [100]
+# ⋅
+# ⋅e.g. --cache="use"
+# ⋅     --cache="refresh;maxage=7;maxsize=20"
+PARSER.add_argument(
+    '--cache',
+    action='store',
+    default="off",
+    help=help_cmdline_cache(details=False))
+
 PARSER.add_argument(
     '--cfgfile',
     action='store',
@@ -173,12 +238,41 @@ PARSER.add_argument(
 # ⋅NB: You may use 'vs' as well as 'against', as in:
 # ⋅    --cmp="json vs pickle (cwc)"
 # ⋅NB: globs.py::REGEX_CMP defines exactly the expected format
+# ⋅NB: 'all' doesn't select the pickle variants ('pickle_p0', ...): give their name.
 PARSER.add_argument(
     '--cmp',
     action='store',
     default="all vs all",
     help=help_cmdline_cmp(details=False))
 
+# (pimydoc)command line help for --comparewith(full version)
+# ⋅Compare the current results with the results of a previous run stored
+# ⋅in the history file (see --history), a string like 'run;threshold=10':
+# ⋅- default value: "none", i.e. no comparison
+# ⋅- 'run' is 'last' (the last recorded run), 'baseline' (the last run
+# ⋅  recorded with --history=baseline) or a run id (an integer).
+# ⋅
+# ⋅A regression is reported for a (serializer, data object) if:
+# ⋅* its encoding/decoding time has grown by more than 'threshold' % and
+# ⋅  the 95% confidence intervals of both medians don't overlap;
+# ⋅* its encoded string length has grown by more than 'threshold' %;
+# ⋅* its encoding/decoding/reversibility succeeded and now fails.
+# ⋅
+# ⋅Accepted key is (default value between brackets):
+# ⋅* 'threshold': minimal growth, in % [10]
+# ⋅  (on a noisy machine, increase it or the 'repeat' key of --method)
+# ⋅
+# ⋅The comparison is shown in report section B5; if a regression has been
+# ⋅found, the exit code is 12.
+# ⋅
+# ⋅e.g. --comparewith="baseline"
+# ⋅     --comparewith="12;threshold=20"
+PARSER.add_argument(
+    '--comparewith',
+    action='store',
+    default="none",
+    help=help_cmdline_comparewith(details=False))
+
 PARSER.add_argument(
     '--downloadconfigfile',
     action='store_true',
@@ -202,6 +296,25 @@ PARSER.add_argument(
     default='no export',
     help=help_cmdline_exportreport(details=False))
 
+# (pimydoc)command line help for --exportresults(full version)
+# ⋅Export all the results in a machine-readable format:
+# ⋅- default value: "no export", i.e. no exported results
+# ⋅- otherwise 'jsonl', 'csv' or 'columnar'; you may add the file name
+# ⋅  (the directory name for 'columnar') after '=', e.g. 'csv=myfile.csv';
+# ⋅  the file is created in the report directory.
+# ⋅* 'jsonl'   : one JSON object per line, the "table" key being "results",
+# ⋅              "hall" or "overallscores";
+# ⋅* 'csv'     : results in <name>.csv, hall of fame in <name>_hall.csv,
+# ⋅              overall scores in <name>_overallscores.csv;
+# ⋅* 'columnar': a directory with one binary file per column (typed arrays)
+# ⋅              described by schema.json, see exportresults.py .
+# ⋅Each result is written as soon as it is computed.
+PARSER.add_argument(
+    '--exportresults',
+    action='store',
+    default='no export',
+    help=help_cmdline_exportresults(details=False))
+
 # (pimydoc)command line help for --filter(full version)
 # ⋅The --filter argument allows to select only some serializers or
 # ⋅data objects. Currently only two values are accepted:
@@ -225,6 +338,83 @@ PARSER.add_argument(
     action='store_true',
     help="Show detailed help messages about some command line arguments and exit.")
 
+# (pimydoc)command line help for --history(full version)
+# ⋅Append the current run to the history file, a SQLite database created
+# ⋅in the report directory; each run is stored with the machine, the
+# ⋅Python version, the serializers versions and the statistics of each
+# ⋅transcoding. Accepted values are:
+# ⋅* 'off': the history file is not modified;
+# ⋅* 'record': the run is appended to the history file;
+# ⋅* 'baseline': the run is appended to the history file and becomes
+# ⋅  the baseline, i.e. the run used by --comparewith="baseline".
+# ⋅The id of the recorded run is displayed once it has been recorded.
+# ⋅
+# ⋅e.g. --history="baseline"
+PARSER.add_argument(
+    '--history',
+    action='store',
+    default="off",
+    help=help_cmdline_history(details=False))
+
+PARSER.add_argument(
+    '--jobs',
+    type=nonnegative_int,
+    default=1,
+    help="Number of processes computing the transcodings at the same time; "
+    "0 means one process per physical core. "
+    "If --jobs is greater than 1, each transcoding is computed in its own process "
+    "so that memory measurements are not disturbed by the other transcodings. "
+    "See also --pinworkers.")
+
+# (pimydoc)command line help for --method(full version)
+# ⋅A string like 'key=value;key=value;...' describing how the measures
+# ⋅are made. Accepted keys are (default values between brackets):
+# ⋅* 'timeitnumber': number of calls of the encoding/decoding function for
+# ⋅  each timing sample; 'auto' to calibrate this number so that each sample
+# ⋅  lasts at least 'mintime' seconds, like timeit.Timer.autorange() does
+# ⋅  ['auto']
+# ⋅* 'mintime': see 'timeitnumber' [0.001]
+# ⋅* 'repeat': number of timing samples [5]
+# ⋅* 'warmup': number of calls before the first timing sample [1]
+# ⋅* 'memprobe': how the memory used by each encoding/decoding is measured
+# ⋅  ['tracemalloc']:
+# ⋅  - 'tracemalloc': peak of the memory allocated through Python's allocator
+# ⋅    (memory allocated directly by C libraries is not seen);
+# ⋅  - 'rss': peak of the resident set size, sampled by a background thread;
+# ⋅  - 'fork': like 'rss' but each measure is made by a new forked process.
+# ⋅* 'lenmethod': how the length of a string encoded into a str is measured
+# ⋅  ['bytes']:
+# ⋅  - 'bytes': length of its UTF-8 encoding, computed without copying the
+# ⋅    whole string;
+# ⋅  - 'str': number of characters.
+# ⋅  The strings encoded into bytes are not concerned.
+# ⋅* 'order': order in which the transcodings are computed ['sorted']:
+# ⋅  - 'sorted': serializer after serializer (see also --budget);
+# ⋅  - 'shuffle': a random order, different for each round;
+# ⋅  - 'roundrobin': data object after data object, the serializers being
+# ⋅    rotated from one data object to the next one;
+# ⋅  - 'latinsquare': like 'roundrobin', the rotation being also shifted
+# ⋅    from one round to the next one.
+# ⋅* 'rounds': number of times each transcoding is computed; its result is
+# ⋅  the one of the round with the median time. The drift of each round is
+# ⋅  shown in report section B9 [1]
+# ⋅* 'seed': seed of the random generator used by 'shuffle' [0]
+# ⋅
+# ⋅The encoding/decoding time is the median of the samples; min, mean,
+# ⋅stddev, 95th percentile and a 95% confidence interval of the median are
+# ⋅computed as well. The serializers are ranked upon the median; two
+# ⋅serializers whose confidence intervals overlap share the same rank.
+# ⋅
+# ⋅e.g. --method="timeitnumber=auto;repeat=7;warmup=2"
+# ⋅     --method="timeitnumber=1;repeat=1;warmup=0" (a single call, no statistics)
+# ⋅     --method="lenmethod=str"
+# ⋅     --method="order=latinsquare;rounds=3"
+PARSER.add_argument(
+    '--method',
+    action='store',
+    default="timeitnumber=auto;mintime=0.001;repeat=5;warmup=1;memprobe=tracemalloc",
+    help=help_cmdline_method(details=False))
+
 PARSER.add_argument(
     '--mute',
     action='store_true',
@@ -278,6 +468,14 @@ PARSER.add_argument(
     default=f'console;reportfile/w={DEFAULT_REPORTFILE_NAME}',
     help=help_cmdline_output(details=False))
 
+PARSER.add_argument(
+    '--pinworkers',
+    action='store_true',
+    default=False,
+    help="Pin each process computing the transcodings on its own physical core; "
+    "the number of processes can't then exceed the number of physical cores. "
+    "See also --jobs.")
+
 # (pimydoc)command line help for --report(full version)
 # ⋅Report format:
 # ⋅you may use one of the special keywords ($REPORT_SHORTCUTS_KEYS)
@@ -295,6 +493,69 @@ PARSER.add_argument(
     default="glance",
     help=help_cmdline_report(details=False))
 
+# (pimydoc)command line help for --sandbox(full version)
+# ⋅A string like 'mode;key=value;key=value' describing how the
+# ⋅transcodings are isolated from each other. Accepted modes are:
+# ⋅* 'off': the transcodings are computed by the main process (or by the
+# ⋅  processes of --jobs): a serializer crashing the interpreter stops the
+# ⋅  program;
+# ⋅* 'on': each transcoding is computed by a new forked process, killed if it
+# ⋅  lasts too long: crashes, timeouts and memory exhaustions become results
+# ⋅  (see report sections B1a and B2a), the other transcodings going on.
+# ⋅Setting a key implies 'on'.
+# ⋅
+# ⋅Accepted keys are (default values between brackets):
+# ⋅* 'timeout': a transcoding lasting more than 'timeout' seconds is killed [60]
+# ⋅* 'maxmemory': maximal memory (MB) a transcoding may allocate, see
+# ⋅  resource.setrlimit(RLIMIT_AS) (Unix only) [no limit]
+# ⋅
+# ⋅e.g. --sandbox="on"
+# ⋅     --sandbox="timeout=10;maxmemory=500"
+PARSER.add_argument(
+    '--sandbox',
+    action='store',
+    default="off",
+    help=help_cmdline_sandbox(details=False))
+
+# (pimydoc)command line help for --stages(full version)
+# ⋅Extra measures made after each transcoding, a string like
+# ⋅'stage;stage=parameter,parameter':
+# ⋅- default value: "none", i.e. no extra measure
+# ⋅
+# ⋅Accepted stages are (default parameters between brackets):
+# ⋅* 'compress': the encoded object is compressed then decompressed by
+# ⋅  each codec [zlib6,bz2,lzma]:
+# ⋅  - 'zlib0' ... 'zlib9': zlib with this compression level;
+# ⋅  - 'bz2', 'lzma': the bz2 and lzma modules with their default settings.
+# ⋅  Compressed length, ratio and (de)compression times are shown in report
+# ⋅  section B8; the first codec is used by the hall of fame and the graphs.
+# ⋅* 'mmap': the encoded object is written into a temp file and decoded
+# ⋅  from a memoryview of this file mapped in memory by mmap [no parameter]:
+# ⋅  - 'fsync': os.fsync() is called by each write.
+# ⋅  Only marshal and pickle directly decode the mmap-backed buffer; the
+# ⋅  other serializers decode a bytes copy of it. Write time, decode time
+# ⋅  and buffer copies are shown in report section B7.
+# ⋅* 'stream': the object is written by dump(obj, fp) and read back by
+# ⋅  load(fp) through each medium [bytesio,file,pipe]:
+# ⋅  - 'bytesio': an io.BytesIO object;
+# ⋅  - 'file': a temporary file on disk;
+# ⋅  - 'pipe': a pipe whose other end is read/written by another thread.
+# ⋅  Lists and tuples are also written as a stream of documents if the
+# ⋅  serializer can do it (JSON Lines, yaml dump_all(), Ion streams).
+# ⋅  Only json, marshal, pickle, pyyaml and simpleion have such functions.
+# ⋅  Time-to-first-byte, throughput and peak memory are shown in report
+# ⋅  section B6.
+# ⋅
+# ⋅e.g. --stages="stream"
+# ⋅     --stages="stream=bytesio,pipe"
+# ⋅     --stages="mmap=fsync;stream"
+# ⋅     --stages="compress=zlib1,zlib9,lzma"
+PARSER.add_argument(
+    '--stages',
+    action='store',
+    default="none",
+    help=help_cmdline_stages(details=False))
+
 PARSER.add_argument(
     '--verbosity',
     type=int,
@@ -316,25 +577,65 @@ ARGS = PARSER.parse_args()
 
 
 if ARGS.help2:
+    print("===============")
+    print("About --budget:")
+    print("===============")
+    print(help_cmdline_budget(details=True))
+    print()
+    print("==============")
+    print("About --cache:")
+    print("==============")
+    print(help_cmdline_cache(details=True))
+    print()
     print("============")
     print("About --cmp:")
     print("============")
     print(help_cmdline_cmp(details=True))
     print()
+    print("====================")
+    print("About --comparewith:")
+    print("====================")
+    print(help_cmdline_comparewith(details=True))
+    print()
     print("=====================")
     print("About --exportreport:")
     print("=====================")
     print(help_cmdline_exportreport(details=True))
     print()
+    print("======================")
+    print("About --exportresults:")
+    print("======================")
+    print(help_cmdline_exportresults(details=True))
+    print()
     print("===============")
     print("About --filter:")
     print("===============")
     print(help_cmdline_filter(details=True))
     print()
+    print("================")
+    print("About --history:")
+    print("================")
+    print(help_cmdline_history(details=True))
+    print()
+    print("===============")
+    print("About --method:")
+    print("===============")
+    print(help_cmdline_method(details=True))
+    print()
     print("===============")
     print("About --output:")
     print("===============")
     print(help_cmdline_output(details=True))
+    print()
+    print("================")
+    print("About --sandbox:")
+    print("================")
+    print(help_cmdline_sandbox(details=True))
+    print()
+    print("===============")
+    print("About --stages:")
+    print("===============")
+    print(help_cmdline_stages(details=True))
     # (pimydoc)exit codes
     # ⋅These exit codes try to take into account the standards, in particular this
     # ⋅one: https://docs.python.org/3/library/sys.html#sys.exit
@@ -357,6 +658,15 @@ if ARGS.help2:
     # ⋅*    4: error, missing required module
     # ⋅*    5: error: an inconsistency between the data has been detected
     # ⋅*    6: error: can't open/create report file
+    # ⋅*    7: error, ill-formed --method string
+    # ⋅*    8: error, ill-formed --cache string
+    # ⋅*    9: error, ill-formed --exportresults string
+    # ⋅*   10: error, ill-formed --history string
+    # ⋅*   11: error, ill-formed --comparewith string
+    # ⋅*   12: a regression has been found by --comparewith
+    # ⋅*   13: error, ill-formed --stages string
+    # ⋅*   14: error, ill-formed --sandbox string
+    # ⋅*   15: error, ill-formed --budget string
     # ⋅*  100: internal error, data can't be loaded
     # ⋅*  101: internal error, an error occured while computing the results
     # ⋅*  102: internal error, an error occured in main()
@@ -399,6 +709,15 @@ if MISSING_REQUIRED_MODULES:
     # ⋅*    4: error, missing required module
     # ⋅*    5: error: an inconsistency between the data has been detected
     # ⋅*    6: error: can't open/create report file
+    # ⋅*    7: error, ill-formed --method string
+    # ⋅*    8: error, ill-formed --cache string
+    # ⋅*    9: error, ill-formed --exportresults string
+    # ⋅*   10: error, ill-formed --history string
+    # ⋅*   11: error, ill-formed --comparewith string
+    # ⋅*   12: a regression has been found by --comparewith
+    # ⋅*   13: error, ill-formed --stages string
+    # ⋅*   14: error, ill-formed --sandbox string
+    # ⋅*   15: error, ill-formed --budget string
     # ⋅*  100: internal error, data can't be loaded
     # ⋅*  101: internal error, an error occured while computing the results
     # ⋅*  102: internal error, an error occured in main()
@@ -426,12 +745,23 @@ from wisteria.wisteriaerror import WisteriaError  # noqa
 from wisteria.msg import msginfo, msgwarning, msgerror, msgdebug, msgreport, msgreporttitle  # noqa
 from wisteria.cmdline_output import parse_output_argument  # noqa
 from wisteria.cmdline_cmp import read_cmpstring  # noqa
+from wisteria.cmdline_method import parse_method_argument  # noqa
+from wisteria.cmdline_budget import parse_budget_argument  # noqa
+from wisteria.cmdline_cache import parse_cache_argument  # noqa
+from wisteria.exportresults import parse_exportresults_argument  # noqa
+from wisteria.cmdline_history import parse_history_argument, parse_comparewith_argument  # noqa
+from wisteria.cmdline_sandbox import parse_sandbox_argument  # noqa
+from wisteria.cmdline_stages import parse_stages_argument  # noqa
+from wisteria.history import update_history  # noqa
 from wisteria.cmdline_mymachine import mymachine  # noqa
 from wisteria.cfgfile import read_cfgfile, downloadconfigfile  # noqa
+from wisteria.datagen import init_generated_data, get_generated_families  # noqa
+from wisteria.datagen import get_scaling_graph_filename  # noqa
 from wisteria.serializers import func_serialize  # noqa
 from wisteria.globs import get_graphs_filename, get_graphs_description  # noqa
 from wisteria.globs import get_exportreport_filename, get_default_exportreport_filename  # noqa
-from wisteria.globs import get_default_reportfile_name  # noqa
+from wisteria.globs import get_default_reportfile_name, get_cachefile_name  # noqa
+from wisteria.globs import get_historyfile_name  # noqa
 
 
 # =============================================================================
@@ -499,6 +829,15 @@ else:
         # ⋅*    4: error, missing required module
         # ⋅*    5: error: an inconsistency between the data has been detected
         # ⋅*    6: error: can't open/create report file
+        # ⋅*    7: error, ill-formed --method string
+        # ⋅*    8: error, ill-formed --cache string
+        # ⋅*    9: error, ill-formed --exportresults string
+        # ⋅*   10: error, ill-formed --history string
+        # ⋅*   11: error, ill-formed --comparewith string
+        # ⋅*   12: a regression has been found by --comparewith
+        # ⋅*   13: error, ill-formed --stages string
+        # ⋅*   14: error, ill-formed --sandbox string
+        # ⋅*   15: error, ill-formed --budget string
         # ⋅*  100: internal error, data can't be loaded
         # ⋅*  101: internal error, an error occured while computing the results
         # ⋅*  102: internal error, an error occured in main()
@@ -523,6 +862,8 @@ wisteria.globs.DEFAULT_REPORTFILE_NAME = get_default_reportfile_name()
 wisteria.globs.GRAPHS_GENERIC_FILENAME = get_graphs_filename()
 wisteria.globs.GRAPHS_DESCRIPTION = get_graphs_description()
 wisteria.globs.DEFAULT_EXPORTREPORT_FILENAME = get_default_exportreport_filename()
+wisteria.globs.CACHEFILE_NAME = get_cachefile_name()
+wisteria.globs.HISTORYFILE_NAME = get_historyfile_name()
 
 
 if wisteria.globs.RICHFILECONSOLE_FILEOBJECT is None:
@@ -548,6 +889,15 @@ if wisteria.globs.RICHFILECONSOLE_FILEOBJECT is None:
     # ⋅*    4: error, missing required module
     # ⋅*    5: error: an inconsistency between the data has been detected
     # ⋅*    6: error: can't open/create report file
+    # ⋅*    7: error, ill-formed --method string
+    # ⋅*    8: error, ill-formed --cache string
+    # ⋅*    9: error, ill-formed --exportresults string
+    # ⋅*   10: error, ill-formed --history string
+    # ⋅*   11: error, ill-formed --comparewith string
+    # ⋅*   12: a regression has been found by --comparewith
+    # ⋅*   13: error, ill-formed --stages string
+    # ⋅*   14: error, ill-formed --sandbox string
+    # ⋅*   15: error, ill-formed --budget string
     # ⋅*  100: internal error, data can't be loaded
     # ⋅*  101: internal error, an error occured while computing the results
     # ⋅*  102: internal error, an error occured in main()
@@ -614,6 +964,15 @@ if not check_str2reportsection_keys():
     # ⋅*    4: error, missing required module
     # ⋅*    5: error: an inconsistency between the data has been detected
     # ⋅*    6: error: can't open/create report file
+    # ⋅*    7: error, ill-formed --method string
+    # ⋅*    8: error, ill-formed --cache string
+    # ⋅*    9: error, ill-formed --exportresults string
+    # ⋅*   10: error, ill-formed --history string
+    # ⋅*   11: error, ill-formed --comparewith string
+    # ⋅*   12: a regression has been found by --comparewith
+    # ⋅*   13: error, ill-formed --stages string
+    # ⋅*   14: error, ill-formed --sandbox string
+    # ⋅*   15: error, ill-formed --budget string
     # ⋅*  100: internal error, data can't be loaded
     # ⋅*  101: internal error, an error occured while computing the results
     # ⋅*  102: internal error, an error occured in main()
@@ -629,7 +988,7 @@ if wisteria.globs.ARGS.verbosity >= VERBOSITY_DETAILS:
     msgreport(f"Running on Python {get_python_version()}")
 
 # =============================================================================
-# (B/10) ARGS.report interpretation
+# (B/10) ARGS.report/method/cache/exportresults/history/comparewith/stages/sandbox/budget
 # =============================================================================
 if wisteria.globs.ARGS.mute:
     wisteria.globs.ARGS.report = ""
@@ -650,6 +1009,362 @@ if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
     msgdebug("From now --report (wisteria.globs.ARGS.report) is set "
              f"to '{wisteria.globs.ARGS.report}'.")
 
+PARSING_SUCCESS, METHOD = parse_method_argument(wisteria.globs.ARGS.method)
+if not PARSING_SUCCESS:
+    msgerror("Ill-formed --method string. The program has to stop.")
+    msginfo(help_cmdline_method(details=True))
+    # (pimydoc)exit codes
+    # ⋅These exit codes try to take into account the standards, in particular this
+    # ⋅one: https://docs.python.org/3/library/sys.html#sys.exit
+    # ⋅
+    # ⋅Please note that `os` constants like `os.EX_OK` as defined in Python doc
+    # ⋅(see https://docs.python.org/3/library/os.html#process-management) are not
+    # ⋅used for this project; these constants are only defined for Linux systems
+    # ⋅and this project aims Windows/OSX systems.
+    # ⋅
+    # ⋅*    0: normal exit code
+    # ⋅*       normal exit code after --help/--help2
+    # ⋅*       normal exit code after --checkup
+    # ⋅*       normal exit code after --downloadconfigfile
+    # ⋅*       normal exit code after --mymachine
+    # ⋅*       normal exit code (no data to handle)
+    # ⋅*       normal exit code (no serializer to handle)
+    # ⋅*    1: error, given config file can't be read (missing or ill-formed file)
+    # ⋅*    2: error, ill-formed --cmp string
+    # ⋅*    3: error, ill-formed --output string
+    # ⋅*    4: error, missing required module
+    # ⋅*    5: error: an inconsistency between the data has been detected
+    # ⋅*    6: error: can't open/create report file
+    # ⋅*    7: error, ill-formed --method string
+    # ⋅*    8: error, ill-formed --cache string
+    # ⋅*    9: error, ill-formed --exportresults string
+    # ⋅*   10: error, ill-formed --history string
+    # ⋅*   11: error, ill-formed --comparewith string
+    # ⋅*   12: a regression has been found by --comparewith
+    # ⋅*   13: error, ill-formed --stages string
+    # ⋅*   14: error, ill-formed --sandbox string
+    # ⋅*   15: error, ill-formed --budget string
+    # ⋅*  100: internal error, data can't be loaded
+    # ⋅*  101: internal error, an error occured while computing the results
+    # ⋅*  102: internal error, an error occured in main()
+    # ⋅*  103: internal error, can't initialize PLANNED_TRANSCODINGS
+    sys.exit(7)
+wisteria.globs.METHOD = METHOD
+if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+    msgdebug(f"From now wisteria.globs.METHOD is set to {wisteria.globs.METHOD}.")
+
+PARSING_SUCCESS, CACHE = parse_cache_argument(wisteria.globs.ARGS.cache)
+if not PARSING_SUCCESS:
+    msgerror("Ill-formed --cache string. The program has to stop.")
+    msginfo(help_cmdline_cache(details=True))
+    # (pimydoc)exit codes
+    # ⋅These exit codes try to take into account the standards, in particular this
+    # ⋅one: https://docs.python.org/3/library/sys.html#sys.exit
+    # ⋅
+    # ⋅Please note that `os` constants like `os.EX_OK` as defined in Python doc
+    # ⋅(see https://docs.python.org/3/library/os.html#process-management) are not
+    # ⋅used for this project; these constants are only defined for Linux systems
+    # ⋅and this project aims Windows/OSX systems.
+    # ⋅
+    # ⋅*    0: normal exit code
+    # ⋅*       normal exit code after --help/--help2
+    # ⋅*       normal exit code after --checkup
+    # ⋅*       normal exit code after --downloadconfigfile
+    # ⋅*       normal exit code after --mymachine
+    # ⋅*       normal exit code (no data to handle)
+    # ⋅*       normal exit code (no serializer to handle)
+    # ⋅*    1: error, given config file can't be read (missing or ill-formed file)
+    # ⋅*    2: error, ill-formed --cmp string
+    # ⋅*    3: error, ill-formed --output string
+    # ⋅*    4: error, missing required module
+    # ⋅*    5: error: an inconsistency between the data has been detected
+    # ⋅*    6: error: can't open/create report file
+    # ⋅*    7: error, ill-formed --method string
+    # ⋅*    8: error, ill-formed --cache string
+    # ⋅*    9: error, ill-formed --exportresults string
+    # ⋅*   10: error, ill-formed --history string
+    # ⋅*   11: error, ill-formed --comparewith string
+    # ⋅*   12: a regression has been found by --comparewith
+    # ⋅*   13: error, ill-formed --stages string
+    # ⋅*   14: error, ill-formed --sandbox string
+    # ⋅*   15: error, ill-formed --budget string
+    # ⋅*  100: internal error, data can't be loaded
+    # ⋅*  101: internal error, an error occured while computing the results
+    # ⋅*  102: internal error, an error occured in main()
+    # ⋅*  103: internal error, can't initialize PLANNED_TRANSCODINGS
+    sys.exit(8)
+wisteria.globs.CACHE = CACHE
+if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+    msgdebug(f"From now wisteria.globs.CACHE is set to {wisteria.globs.CACHE}.")
+
+PARSING_SUCCESS, EXPORTRESULTS = \
+    parse_exportresults_argument(wisteria.globs.ARGS.exportresults)
+if not PARSING_SUCCESS:
+    msgerror("Ill-formed --exportresults string. The program has to stop.")
+    msginfo(help_cmdline_exportresults(details=True))
+    # (pimydoc)exit codes
+    # ⋅These exit codes try to take into account the standards, in particular this
+    # ⋅one: https://docs.python.org/3/library/sys.html#sys.exit
+    # ⋅
+    # ⋅Please note that `os` constants like `os.EX_OK` as defined in Python doc
+    # ⋅(see https://docs.python.org/3/library/os.html#process-management) are not
+    # ⋅used for this project; these constants are only defined for Linux systems
+    # ⋅and this project aims Windows/OSX systems.
+    # ⋅
+    # ⋅*    0: normal exit code
+    # ⋅*       normal exit code after --help/--help2
+    # ⋅*       normal exit code after --checkup
+    # ⋅*       normal exit code after --downloadconfigfile
+    # ⋅*       normal exit code after --mymachine
+    # ⋅*       normal exit code (no data to handle)
+    # ⋅*       normal exit code (no serializer to handle)
+    # ⋅*    1: error, given config file can't be read (missing or ill-formed file)
+    # ⋅*    2: error, ill-formed --cmp string
+    # ⋅*    3: error, ill-formed --output string
+    # ⋅*    4: error, missing required module
+    # ⋅*    5: error: an inconsistency between the data has been detected
+    # ⋅*    6: error: can't open/create report file
+    # ⋅*    7: error, ill-formed --method string
+    # ⋅*    8: error, ill-formed --cache string
+    # ⋅*    9: error, ill-formed --exportresults string
+    # ⋅*   10: error, ill-formed --history string
+    # ⋅*   11: error, ill-formed --comparewith string
+    # ⋅*   12: a regression has been found by --comparewith
+    # ⋅*   13: error, ill-formed --stages string
+    # ⋅*   14: error, ill-formed --sandbox string
+    # ⋅*   15: error, ill-formed --budget string
+    # ⋅*  100: internal error, data can't be loaded
+    # ⋅*  101: internal error, an error occured while computing the results
+    # ⋅*  102: internal error, an error occured in main()
+    # ⋅*  103: internal error, can't initialize PLANNED_TRANSCODINGS
+    sys.exit(9)
+wisteria.globs.EXPORTRESULTS = EXPORTRESULTS
+if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+    msgdebug(f"From now wisteria.globs.EXPORTRESULTS is set to "
+             f"{wisteria.globs.EXPORTRESULTS}.")
+
+PARSING_SUCCESS, HISTORY = parse_history_argument(wisteria.globs.ARGS.history)
+if not PARSING_SUCCESS:
+    msgerror("Ill-formed --history string. The program has to stop.")
+    msginfo(help_cmdline_history(details=True))
+    # (pimydoc)exit codes
+    # ⋅These exit codes try to take into account the standards, in particular this
+    # ⋅one: https://docs.python.org/3/library/sys.html#sys.exit
+    # ⋅
+    # ⋅Please note that `os` constants like `os.EX_OK` as defined in Python doc
+    # ⋅(see https://docs.python.org/3/library/os.html#process-management) are not
+    # ⋅used for this project; these constants are only defined for Linux systems
+    # ⋅and this project aims Windows/OSX systems.
+    # ⋅
+    # ⋅*    0: normal exit code
+    # ⋅*       normal exit code after --help/--help2
+    # ⋅*       normal exit code after --checkup
+    # ⋅*       normal exit code after --downloadconfigfile
+    # ⋅*       normal exit code after --mymachine
+    # ⋅*       normal exit code (no data to handle)
+    # ⋅*       normal exit code (no serializer to handle)
+    # ⋅*    1: error, given config file can't be read (missing or ill-formed file)
+    # ⋅*    2: error, ill-formed --cmp string
+    # ⋅*    3: error, ill-formed --output string
+    # ⋅*    4: error, missing required module
+    # ⋅*    5: error: an inconsistency between the data has been detected
+    # ⋅*    6: error: can't open/create report file
+    # ⋅*    7: error, ill-formed --method string
+    # ⋅*    8: error, ill-formed --cache string
+    # ⋅*    9: error, ill-formed --exportresults string
+    # ⋅*   10: error, ill-formed --history string
+    # ⋅*   11: error, ill-formed --comparewith string
+    # ⋅*   12: a regression has been found by --comparewith
+    # ⋅*   13: error, ill-formed --stages string
+    # ⋅*   14: error, ill-formed --sandbox string
+    # ⋅*   15: error, ill-formed --budget string
+    # ⋅*  100: internal error, data can't be loaded
+    # ⋅*  101: internal error, an error occured while computing the results
+    # ⋅*  102: internal error, an error occured in main()
+    # ⋅*  103: internal error, can't initialize PLANNED_TRANSCODINGS
+    sys.exit(10)
+wisteria.globs.HISTORY = HISTORY
+if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+    msgdebug(f"From now wisteria.globs.HISTORY is set to '{wisteria.globs.HISTORY}'.")
+
+PARSING_SUCCESS, COMPAREWITH = parse_comparewith_argument(wisteria.globs.ARGS.comparewith)
+if not PARSING_SUCCESS:
+    msgerror("Ill-formed --comparewith string. The program has to stop.")
+    msginfo(help_cmdline_comparewith(details=True))
+    # (pimydoc)exit codes
+    # ⋅These exit codes try to take into account the standards, in particular this
+    # ⋅one: https://docs.python.org/3/library/sys.html#sys.exit
+    # ⋅
+    # ⋅Please note that `os` constants like `os.EX_OK` as defined in Python doc
+    # ⋅(see https://docs.python.org/3/library/os.html#process-management) are not
+    # ⋅used for this project; these constants are only defined for Linux systems
+    # ⋅and this project aims Windows/OSX systems.
+    # ⋅
+    # ⋅*    0: normal exit code
+    # ⋅*       normal exit code after --help/--help2
+    # ⋅*       normal exit code after --checkup
+    # ⋅*       normal exit code after --downloadconfigfile
+    # ⋅*       normal exit code after --mymachine
+    # ⋅*       normal exit code (no data to handle)
+    # ⋅*       normal exit code (no serializer to handle)
+    # ⋅*    1: error, given config file can't be read (missing or ill-formed file)
+    # ⋅*    2: error, ill-formed --cmp string
+    # ⋅*    3: error, ill-formed --output string
+    # ⋅*    4: error, missing required module
+    # ⋅*    5: error: an inconsistency between the data has been detected
+    # ⋅*    6: error: can't open/create report file
+    # ⋅*    7: error, ill-formed --method string
+    # ⋅*    8: error, ill-formed --cache string
+    # ⋅*    9: error, ill-formed --exportresults string
+    # ⋅*   10: error, ill-formed --history string
+    # ⋅*   11: error, ill-formed --comparewith string
+    # ⋅*   12: a regression has been found by --comparewith
+    # ⋅*   13: error, ill-formed --stages string
+    # ⋅*   14: error, ill-formed --sandbox string
+    # ⋅*   15: error, ill-formed --budget string
+    # ⋅*  100: internal error, data can't be loaded
+    # ⋅*  101: internal error, an error occured while computing the results
+    # ⋅*  102: internal error, an error occured in main()
+    # ⋅*  103: internal error, can't initialize PLANNED_TRANSCODINGS
+    sys.exit(11)
+wisteria.globs.COMPAREWITH = COMPAREWITH
+if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+    msgdebug(f"From now wisteria.globs.COMPAREWITH is set to {wisteria.globs.COMPAREWITH}.")
+
+PARSING_SUCCESS, STAGES = parse_stages_argument(wisteria.globs.ARGS.stages)
+if not PARSING_SUCCESS:
+    msgerror("Ill-formed --stages string. The program has to stop.")
+    msginfo(help_cmdline_stages(details=True))
+    # (pimydoc)exit codes
+    # ⋅These exit codes try to take into account the standards, in particular this
+    # ⋅one: https://docs.python.org/3/library/sys.html#sys.exit
+    # ⋅
+    # ⋅Please note that `os` constants like `os.EX_OK` as defined in Python doc
+    # ⋅(see https://docs.python.org/3/library/os.html#process-management) are not
+    # ⋅used for this project; these constants are only defined for Linux systems
+    # ⋅and this project aims Windows/OSX systems.
+    # ⋅
+    # ⋅*    0: normal exit code
+    # ⋅*       normal exit code after --help/--help2
+    # ⋅*       normal exit code after --checkup
+    # ⋅*       normal exit code after --downloadconfigfile
+    # ⋅*       normal exit code after --mymachine
+    # ⋅*       normal exit code (no data to handle)
+    # ⋅*       normal exit code (no serializer to handle)
+    # ⋅*    1: error, given config file can't be read (missing or ill-formed file)
+    # ⋅*    2: error, ill-formed --cmp string
+    # ⋅*    3: error, ill-formed --output string
+    # ⋅*    4: error, missing required module
+    # ⋅*    5: error: an inconsistency between the data has been detected
+    # ⋅*    6: error: can't open/create report file
+    # ⋅*    7: error, ill-formed --method string
+    # ⋅*    8: error, ill-formed --cache string
+    # ⋅*    9: error, ill-formed --exportresults string
+    # ⋅*   10: error, ill-formed --history string
+    # ⋅*   11: error, ill-formed --comparewith string
+    # ⋅*   12: a regression has been found by --comparewith
+    # ⋅*   13: error, ill-formed --stages string
+    # ⋅*   14: error, ill-formed --sandbox string
+    # ⋅*   15: error, ill-formed --budget string
+    # ⋅*  100: internal error, data can't be loaded
+    # ⋅*  101: internal error, an error occured while computing the results
+    # ⋅*  102: internal error, an error occured in main()
+    # ⋅*  103: internal error, can't initialize PLANNED_TRANSCODINGS
+    sys.exit(13)
+wisteria.globs.STAGES = STAGES
+if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+    msgdebug(f"From now wisteria.globs.STAGES is set to {wisteria.globs.STAGES}.")
+# some graphs depend on the stages:
+wisteria.globs.GRAPHS_DESCRIPTION = get_graphs_description()
+
+PARSING_SUCCESS, SANDBOX = parse_sandbox_argument(wisteria.globs.ARGS.sandbox)
+if not PARSING_SUCCESS:
+    msgerror("Ill-formed --sandbox string. The program has to stop.")
+    msginfo(help_cmdline_sandbox(details=True))
+    # (pimydoc)exit codes
+    # ⋅These exit codes try to take into account the standards, in particular this
+    # ⋅one: https://docs.python.org/3/library/sys.html#sys.exit
+    # ⋅
+    # ⋅Please note that `os` constants like `os.EX_OK` as defined in Python doc
+    # ⋅(see https://docs.python.org/3/library/os.html#process-management) are not
+    # ⋅used for this project; these constants are only defined for Linux systems
+    # ⋅and this project aims Windows/OSX systems.
+    # ⋅
+    # ⋅*    0: normal exit code
+    # ⋅*       normal exit code after --help/--help2
+    # ⋅*       normal exit code after --checkup
+    # ⋅*       normal exit code after --downloadconfigfile
+    # ⋅*       normal exit code after --mymachine
+    # ⋅*       normal exit code (no data to handle)
+    # ⋅*       normal exit code (no serializer to handle)
+    # ⋅*    1: error, given config file can't be read (missing or ill-formed file)
+    # ⋅*    2: error, ill-formed --cmp string
+    # ⋅*    3: error, ill-formed --output string
+    # ⋅*    4: error, missing required module
+    # ⋅*    5: error: an inconsistency between the data has been detected
+    # ⋅*    6: error: can't open/create report file
+    # ⋅*    7: error, ill-formed --method string
+    # ⋅*    8: error, ill-formed --cache string
+    # ⋅*    9: error, ill-formed --exportresults string
+    # ⋅*   10: error, ill-formed --history string
+    # ⋅*   11: error, ill-formed --comparewith string
+    # ⋅*   12: a regression has been found by --comparewith
+    # ⋅*   13: error, ill-formed --stages string
+    # ⋅*   14: error, ill-formed --sandbox string
+    # ⋅*   15: error, ill-formed --budget string
+    # ⋅*  100: internal error, data can't be loaded
+    # ⋅*  101: internal error, an error occured while computing the results
+    # ⋅*  102: internal error, an error occured in main()
+    # ⋅*  103: internal error, can't initialize PLANNED_TRANSCODINGS
+    sys.exit(14)
+wisteria.globs.SANDBOX = SANDBOX
+if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+    msgdebug(f"From now wisteria.globs.SANDBOX is set to {wisteria.globs.SANDBOX}.")
+
+PARSING_SUCCESS, BUDGET = parse_budget_argument(wisteria.globs.ARGS.budget)
+if not PARSING_SUCCESS:
+    msgerror("Ill-formed --budget string. The program has to stop.")
+    msginfo(help_cmdline_budget(details=True))
+    # (pimydoc)exit codes
+    # ⋅These exit codes try to take into account the standards, in particular this
+    # ⋅one: https://docs.python.org/3/library/sys.html#sys.exit
+    # ⋅
+    # ⋅Please note that `os` constants like `os.EX_OK` as defined in Python doc
+    # ⋅(see https://docs.python.org/3/library/os.html#process-management) are not
+    # ⋅used for this project; these constants are only defined for Linux systems
+    # ⋅and this project aims Windows/OSX systems.
+    # ⋅
+    # ⋅*    0: normal exit code
+    # ⋅*       normal exit code after --help/--help2
+    # ⋅*       normal exit code after --checkup
+    # ⋅*       normal exit code after --downloadconfigfile
+    # ⋅*       normal exit code after --mymachine
+    # ⋅*       normal exit code (no data to handle)
+    # ⋅*       normal exit code (no serializer to handle)
+    # ⋅*    1: error, given config file can't be read (missing or ill-formed file)
+    # ⋅*    2: error, ill-formed --cmp string
+    # ⋅*    3: error, ill-formed --output string
+    # ⋅*    4: error, missing required module
+    # ⋅*    5: error: an inconsistency between the data has been detected
+    # ⋅*    6: error: can't open/create report file
+    # ⋅*    7: error, ill-formed --method string
+    # ⋅*    8: error, ill-formed --cache string
+    # ⋅*    9: error, ill-formed --exportresults string
+    # ⋅*   10: error, ill-formed --history string
+    # ⋅*   11: error, ill-formed --comparewith string
+    # ⋅*   12: a regression has been found by --comparewith
+    # ⋅*   13: error, ill-formed --stages string
+    # ⋅*   14: error, ill-formed --sandbox string
+    # ⋅*   15: error, ill-formed --budget string
+    # ⋅*  100: internal error, data can't be loaded
+    # ⋅*  101: internal error, an error occured while computing the results
+    # ⋅*  102: internal error, an error occured in main()
+    # ⋅*  103: internal error, can't initialize PLANNED_TRANSCODINGS
+    sys.exit(15)
+wisteria.globs.BUDGET = BUDGET
+if wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
+    msgdebug(f"From now wisteria.globs.BUDGET is set to {wisteria.globs.BUDGET}.")
+
 # MEMOVERUSEif wisteria.globs.ARGS.verbosity == VERBOSITY_DEBUG:
 # MEMOVERUSE    msgdebug(f"--memoveruse has been set to '{wisteria.globs.ARGS.memoveruse}' .")
 
@@ -740,6 +1455,13 @@ def exit_handler():
                             # since the given path is relative.
                             exportedreportfile.write(f"![{title}]({os.path.basename(filename)})\n")
                             exportedreportfile.write("\n")
+                    # scaling graphs, see report section B4:
+                    for family in get_generated_families(wisteria.globs.DATA):
+                        filename = get_scaling_graph_filename(family)
+                        if os.path.exists(filename):
+                            exportedreportfile.write(f"![Scaling: {family}[N]]"
+                                                     f"({os.path.basename(filename)})\n")
+                            exportedreportfile.write("\n")
         except FileNotFoundError as err:
             msgerror("(ERRORID055) "
                      "Can't find a way to the exported report filename "
@@ -777,6 +1499,20 @@ def exit_handler():
         except PermissionError:
             pass
 
+    # temp files of the stages (see --stages, utils.py:get_stage_tmpfilename()) left
+    # by an interrupted job:
+    for stage_tmpfilename in glob.glob(glob.escape(wisteria.globs.TMPFILENAME)+".*.*"):
+        if ARGS.verbosity == VERBOSITY_DEBUG:
+            msgdebug(f"(exit_handler) About to remove the temp file "
+                     f"'{stage_tmpfilename}' "
+                     f"('{normpath(stage_tmpfilename)}')")
+
+        # The "PermissionError" exception may be raised on Windows system:
+        try:
+            os.remove(stage_tmpfilename)
+        except PermissionError:
+            pass
+
     # =============================================================================
     # (D/03) closing wisteria.globs.RICHFILECONSOLE_FILEOBJECT
     # =============================================================================
@@ -1022,6 +1758,15 @@ if wisteria.globs.ARGS.checkup:
     # ⋅*    4: error, missing required module
     # ⋅*    5: error: an inconsistency between the data has been detected
     # ⋅*    6: error: can't open/create report file
+    # ⋅*    7: error, ill-formed --method string
+    # ⋅*    8: error, ill-formed --cache string
+    # ⋅*    9: error, ill-formed --exportresults string
+    # ⋅*   10: error, ill-formed --history string
+    # ⋅*   11: error, ill-formed --comparewith string
+    # ⋅*   12: a regression has been found by --comparewith
+    # ⋅*   13: error, ill-formed --stages string
+    # ⋅*   14: error, ill-formed --sandbox string
+    # ⋅*   15: error, ill-formed --budget string
     # ⋅*  100: internal error, data can't be loaded
     # ⋅*  101: internal error, an error occured while computing the results
     # ⋅*  102: internal error, an error occured in main()
@@ -1061,6 +1806,15 @@ if wisteria.globs.ARGS.mymachine:
     # ⋅*    4: error, missing required module
     # ⋅*    5: error: an inconsistency between the data has been detected
     # ⋅*    6: error: can't open/create report file
+    # ⋅*    7: error, ill-formed --method string
+    # ⋅*    8: error, ill-formed --cache string
+    # ⋅*    9: error, ill-formed --exportresults string
+    # ⋅*   10: error, ill-formed --history string
+    # ⋅*   11: error, ill-formed --comparewith string
+    # ⋅*   12: a regression has been found by --comparewith
+    # ⋅*   13: error, ill-formed --stages string
+    # ⋅*   14: error, ill-formed --sandbox string
+    # ⋅*   15: error, ill-formed --budget string
     # ⋅*  100: internal error, data can't be loaded
     # ⋅*  101: internal error, an error occured while computing the results
     # ⋅*  102: internal error, an error occured in main()
@@ -1095,6 +1849,15 @@ if wisteria.globs.ARGS.downloadconfigfile:
     # ⋅*    4: error, missing required module
     # ⋅*    5: error: an inconsistency between the data has been detected
     # ⋅*    6: error: can't open/create report file
+    # ⋅*    7: error, ill-formed --method string
+    # ⋅*    8: error, ill-formed --cache string
+    # ⋅*    9: error, ill-formed --exportresults string
+    # ⋅*   10: error, ill-formed --history string
+    # ⋅*   11: error, ill-formed --comparewith string
+    # ⋅*   12: a regression has been found by --comparewith
+    # ⋅*   13: error, ill-formed --stages string
+    # ⋅*   14: error, ill-formed --sandbox string
+    # ⋅*   15: error, ill-formed --budget string
     # ⋅*  100: internal error, data can't be loaded
     # ⋅*  101: internal error, an error occured while computing the results
     # ⋅*  102: internal error, an error occured in main()
@@ -1136,6 +1899,15 @@ def main():
                 ⋅*    4: error, missing required module
                 ⋅*    5: error: an inconsistency between the data has been detected
                 ⋅*    6: error: can't open/create report file
+                ⋅*    7: error, ill-formed --method string
+                ⋅*    8: error, ill-formed --cache string
+                ⋅*    9: error, ill-formed --exportresults string
+                ⋅*   10: error, ill-formed --history string
+                ⋅*   11: error, ill-formed --comparewith string
+                ⋅*   12: a regression has been found by --comparewith
+                ⋅*   13: error, ill-formed --stages string
+                ⋅*   14: error, ill-formed --sandbox string
+                ⋅*   15: error, ill-formed --budget string
                 ⋅*  100: internal error, data can't be loaded
                 ⋅*  101: internal error, an error occured while computing the results
                 ⋅*  102: internal error, an error occured in main()
@@ -1187,6 +1959,15 @@ def main():
             # ⋅*    4: error, missing required module
             # ⋅*    5: error: an inconsistency between the data has been detected
             # ⋅*    6: error: can't open/create report file
+            # ⋅*    7: error, ill-formed --method string
+            # ⋅*    8: error, ill-formed --cache string
+            # ⋅*    9: error, ill-formed --exportresults string
+            # ⋅*   10: error, ill-formed --history string
+            # ⋅*   11: error, ill-formed --comparewith string
+            # ⋅*   12: a regression has been found by --comparewith
+            # ⋅*   13: error, ill-formed --stages string
+            # ⋅*   14: error, ill-formed --sandbox string
+            # ⋅*   15: error, ill-formed --budget string
             # ⋅*  100: internal error, data can't be loaded
             # ⋅*  101: internal error, an error occured while computing the results
             # ⋅*  102: internal error, an error occured in main()
@@ -1223,6 +2004,15 @@ def main():
                 # ⋅*    4: error, missing required module
                 # ⋅*    5: error: an inconsistency between the data has been detected
                 # ⋅*    6: error: can't open/create report file
+                # ⋅*    7: error, ill-formed --method string
+                # ⋅*    8: error, ill-formed --cache string
+                # ⋅*    9: error, ill-formed --exportresults string
+                # ⋅*   10: error, ill-formed --history string
+                # ⋅*   11: error, ill-formed --comparewith string
+                # ⋅*   12: a regression has been found by --comparewith
+                # ⋅*   13: error, ill-formed --stages string
+                # ⋅*   14: error, ill-formed --sandbox string
+                # ⋅*   15: error, ill-formed --budget string
                 # ⋅*  100: internal error, data can't be loaded
                 # ⋅*  101: internal error, an error occured while computing the results
                 # ⋅*  102: internal error, an error occured in main()
@@ -1253,12 +2043,24 @@ def main():
                 # ⋅*    4: error, missing required module
                 # ⋅*    5: error: an inconsistency between the data has been detected
                 # ⋅*    6: error: can't open/create report file
+                # ⋅*    7: error, ill-formed --method string
+                # ⋅*    8: error, ill-formed --cache string
+                # ⋅*    9: error, ill-formed --exportresults string
+                # ⋅*   10: error, ill-formed --history string
+                # ⋅*   11: error, ill-formed --comparewith string
+                # ⋅*   12: a regression has been found by --comparewith
+                # ⋅*   13: error, ill-formed --stages string
+                # ⋅*   14: error, ill-formed --sandbox string
+                # ⋅*   15: error, ill-formed --budget string
                 # ⋅*  100: internal error, data can't be loaded
                 # ⋅*  101: internal error, an error occured while computing the results
                 # ⋅*  102: internal error, an error occured in main()
                 # ⋅*  103: internal error, can't initialize PLANNED_TRANSCODINGS
                 return 5
 
+            # ---- generated data objects, see [data generators]
+            init_generated_data(config)
+
         # =========================================================================
         # (C/18.4) main(): PLANNED_TRANSCODINGS initialization
         # =========================================================================
@@ -1292,6 +2094,15 @@ def main():
             # ⋅*    4: error, missing required module
             # ⋅*    5: error: an inconsistency between the data has been detected
             # ⋅*    6: error: can't open/create report file
+            # ⋅*    7: error, ill-formed --method string
+            # ⋅*    8: error, ill-formed --cache string
+            # ⋅*    9: error, ill-formed --exportresults string
+            # ⋅*   10: error, ill-formed --history string
+            # ⋅*   11: error, ill-formed --comparewith string
+            # ⋅*   12: a regression has been found by --comparewith
+            # ⋅*   13: error, ill-formed --stages string
+            # ⋅*   14: error, ill-formed --sandbox string
+            # ⋅*   15: error, ill-formed --budget string
             # ⋅*  100: internal error, data can't be loaded
             # ⋅*  101: internal error, an error occured while computing the results
             # ⋅*  102: internal error, an error occured in main()
@@ -1322,6 +2133,15 @@ def main():
             # ⋅*    4: error, missing required module
             # ⋅*    5: error: an inconsistency between the data has been detected
             # ⋅*    6: error: can't open/create report file
+            # ⋅*    7: error, ill-formed --method string
+            # ⋅*    8: error, ill-formed --cache string
+            # ⋅*    9: error, ill-formed --exportresults string
+            # ⋅*   10: error, ill-formed --history string
+            # ⋅*   11: error, ill-formed --comparewith string
+            # ⋅*   12: a regression has been found by --comparewith
+            # ⋅*   13: error, ill-formed --stages string
+            # ⋅*   14: error, ill-formed --sandbox string
+            # ⋅*   15: error, ill-formed --budget string
             # ⋅*  100: internal error, data can't be loaded
             # ⋅*  101: internal error, an error occured while computing the results
             # ⋅*  102: internal error, an error occured in main()
@@ -1351,6 +2171,15 @@ def main():
             # ⋅*    4: error, missing required module
             # ⋅*    5: error: an inconsistency between the data has been detected
             # ⋅*    6: error: can't open/create report file
+            # ⋅*    7: error, ill-formed --method string
+            # ⋅*    8: error, ill-formed --cache string
+            # ⋅*    9: error, ill-formed --exportresults string
+            # ⋅*   10: error, ill-formed --history string
+            # ⋅*   11: error, ill-formed --comparewith string
+            # ⋅*   12: a regression has been found by --comparewith
+            # ⋅*   13: error, ill-formed --stages string
+            # ⋅*   14: error, ill-formed --sandbox string
+            # ⋅*   15: error, ill-formed --budget string
             # ⋅*  100: internal error, data can't be loaded
             # ⋅*  101: internal error, an error occured while computing the results
             # ⋅*  102: internal error, an error occured in main()
@@ -1372,11 +2201,56 @@ def main():
         results = compute_results__res[0]
 
         # =========================================================================
-        # (C/18.6) main(): report
+        # (C/18.6) main(): history
+        # =========================================================================
+        comparison = update_history(results)
+
+        # =========================================================================
+        # (C/18.7) main(): report
         # =========================================================================
         report(results,
                (serializer1, serializer2, cmpdata))
 
+        if comparison is not None and comparison.regressions:
+            msgwarning(f"{len(comparison.regressions)} regression(s) found by --comparewith, "
+                       "see report section B5.")
+            # (pimydoc)exit codes
+            # ⋅These exit codes try to take into account the standards, in particular this
+            # ⋅one: https://docs.python.org/3/library/sys.html#sys.exit
+            # ⋅
+            # ⋅Please note that `os` constants like `os.EX_OK` as defined in Python doc
+            # ⋅(see https://docs.python.org/3/library/os.html#process-management) are not
+            # ⋅used for this project; these constants are only defined for Linux systems
+            # ⋅and this project aims Windows/OSX systems.
+            # ⋅
+            # ⋅*    0: normal exit code
+            # ⋅*       normal exit code after --help/--help2
+            # ⋅*       normal exit code after --checkup
+            # ⋅*       normal exit code after --downloadconfigfile
+            # ⋅*       normal exit code after --mymachine
+            # ⋅*       normal exit code (no data to handle)
+            # ⋅*       normal exit code (no serializer to handle)
+            # ⋅*    1: error, given config file can't be read (missing or ill-formed file)
+            # ⋅*    2: error, ill-formed --cmp string
+            # ⋅*    3: error, ill-formed --output string
+            # ⋅*    4: error, missing required module
+            # ⋅*    5: error: an inconsistency between the data has been detected
+            # ⋅*    6: error: can't open/create report file
+            # ⋅*    7: error, ill-formed --method string
+            # ⋅*    8: error, ill-formed --cache string
+            # ⋅*    9: error, ill-formed --exportresults string
+            # ⋅*   10: error, ill-formed --history string
+            # ⋅*   11: error, ill-formed --comparewith string
+            # ⋅*   12: a regression has been found by --comparewith
+            # ⋅*   13: error, ill-formed --stages string
+            # ⋅*   14: error, ill-formed --sandbox string
+            # ⋅*   15: error, ill-formed --budget string
+            # ⋅*  100: internal error, data can't be loaded
+            # ⋅*  101: internal error, an error occured while computing the results
+            # ⋅*  102: internal error, an error occured in main()
+            # ⋅*  103: internal error, can't initialize PLANNED_TRANSCODINGS
+            return 12
+
         # (pimydoc)exit codes
         # ⋅These exit codes try to take into account the standards, in particular this
         # ⋅one: https://docs.python.org/3/library/sys.html#sys.exit
@@ -1399,6 +2273,15 @@ def main():
         # ⋅*    4: error, missing required module
         # ⋅*    5: error: an inconsistency between the data has been detected
         # ⋅*    6: error: can't open/create report file
+        # ⋅*    7: error, ill-formed --method string
+        # ⋅*    8: error, ill-formed --cache string
+        # ⋅*    9: error, ill-formed --exportresults string
+        # ⋅*   10: error, ill-formed --history string
+        # ⋅*   11: error, ill-formed --comparewith string
+        # ⋅*   12: a regression has been found by --comparewith
+        # ⋅*   13: error, ill-formed --stages string
+        # ⋅*   14: error, ill-formed --sandbox string
+        # ⋅*   15: error, ill-formed --budget string
         # ⋅*  100: internal error, data can't be loaded
         # ⋅*  101: internal error, an error occured while computing the results
         # ⋅*  102: internal error, an error occured in main()
@@ -1432,6 +2315,15 @@ def main():
         # ⋅*    4: error, missing required module
         # ⋅*    5: error: an inconsistency between the data has been detected
         # ⋅*    6: error: can't open/create report file
+        # ⋅*    7: error, ill-formed --method string
+        # ⋅*    8: error, ill-formed --cache string
+        # ⋅*    9: error, ill-formed --exportresults string
+        # ⋅*   10: error, ill-formed --history string
+        # ⋅*   11: error, ill-formed --comparewith string
+        # ⋅*   12: a regression has been found by --comparewith
+        # ⋅*   13: error, ill-formed --stages string
+        # ⋅*   14: error, ill-formed --sandbox string
+        # ⋅*   15: error, ill-formed --budget string
         # ⋅*  100: internal error, data can't be loaded
         # ⋅*  101: internal error, an error occured while computing the results
         # ⋅*  102: internal error, an error occured in main()